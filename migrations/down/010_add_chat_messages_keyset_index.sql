@@ -0,0 +1,3 @@
+-- Rollback migration 010: Remove chat message keyset pagination index
+
+DROP INDEX IF EXISTS ix_chat_messages_session_created_id;
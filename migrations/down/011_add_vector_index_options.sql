@@ -0,0 +1,8 @@
+-- Rollback migration 011: Remove vector index options from vector_rag_configs
+
+ALTER TABLE vector_rag_configs
+DROP COLUMN IF EXISTS on_disk_vectors,
+DROP COLUMN IF EXISTS hnsw_ef,
+DROP COLUMN IF EXISTS hnsw_ef_construct,
+DROP COLUMN IF EXISTS hnsw_m,
+DROP COLUMN IF EXISTS quantization;
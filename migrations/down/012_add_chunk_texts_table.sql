@@ -0,0 +1,3 @@
+-- Rollback migration 012: Remove chunk text side store
+
+DROP TABLE IF EXISTS chunk_texts;
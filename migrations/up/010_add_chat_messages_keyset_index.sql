@@ -0,0 +1,6 @@
+-- Composite index for keyset pagination of chat message history
+-- Serves "last N messages" and "N messages before a message" lookups
+-- (ORDER BY created_at, id within a session) without sorting or OFFSET scans
+
+CREATE INDEX IF NOT EXISTS ix_chat_messages_session_created_id
+ON chat_messages(chat_session_id, created_at, id);
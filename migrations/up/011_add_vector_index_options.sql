@@ -0,0 +1,23 @@
+-- Add vector index options to vector_rag_configs
+-- Quantization shrinks the vectors Qdrant keeps in RAM, HNSW settings trade
+-- index size and build time for recall, and on_disk_vectors moves the original
+-- float32 vectors out of RAM (quantized vectors stay in RAM for searching)
+
+-- Quantization mode: none, scalar (int8) or binary (rescored with original vectors)
+ALTER TABLE vector_rag_configs
+ADD COLUMN quantization VARCHAR(50) NOT NULL DEFAULT 'none';
+
+-- HNSW graph settings applied when the collection is created
+ALTER TABLE vector_rag_configs
+ADD COLUMN hnsw_m INTEGER NOT NULL DEFAULT 16;
+
+ALTER TABLE vector_rag_configs
+ADD COLUMN hnsw_ef_construct INTEGER NOT NULL DEFAULT 100;
+
+-- Search-time beam width (NULL uses the collection's ef_construct)
+ALTER TABLE vector_rag_configs
+ADD COLUMN hnsw_ef INTEGER;
+
+-- Store original vectors on disk instead of in RAM
+ALTER TABLE vector_rag_configs
+ADD COLUMN on_disk_vectors BOOLEAN NOT NULL DEFAULT false;
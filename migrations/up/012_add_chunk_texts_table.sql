@@ -0,0 +1,14 @@
+-- Side store for chunk text (CHUNK_TEXT_STORAGE=postgres)
+-- Chunk text is kept out of Qdrant payloads and fetched by chunk ID once the
+-- top-k chunks of a search are known
+
+CREATE TABLE IF NOT EXISTS chunk_texts (
+    chunk_id VARCHAR(255) PRIMARY KEY,
+    workspace_id VARCHAR(255) NOT NULL,
+    document_id VARCHAR(255) NOT NULL,
+    text TEXT NOT NULL
+);
+
+-- Serves document and workspace removal
+CREATE INDEX IF NOT EXISTS ix_chunk_texts_workspace_document
+ON chunk_texts(workspace_id, document_id);
@@ -3,6 +3,11 @@
 This module provides a single source of truth for all cache key formats
 used throughout the application. All cache keys follow a consistent
 colon-separated pattern: namespace:entity:id[:suffix]
+
+Keys derived from a workspace (its RAG configs and cached lists) also embed
+the workspace's cache generation: namespace:workspace:{id}:g{generation}:suffix.
+Bumping the generation (see Cache.bump_generation) makes every such key for
+the workspace unreachable at once; the orphaned entries expire with their TTL.
 """
 
 
@@ -16,9 +21,9 @@ class CacheKeys:
         """Cache key for all workspaces list.
 
         Returns:
-            Cache key in format: workspaces:all
+            Cache key in format: insighthub:workspaces:all
         """
-        return "workspaces:all"
+        return f"{cls.NAMESPACE}:workspaces:all"
 
     @classmethod
     def workspace(cls, workspace_id: int) -> str:
@@ -30,55 +35,71 @@ class CacheKeys:
         Returns:
             Cache key in format: insighthub:workspace:{workspace_id}
         """
-        return f"workspace:{workspace_id}"
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}"
 
     @classmethod
-    def workspace_vector_config(cls, workspace_id: int) -> str:
+    def workspace_generation(cls, workspace_id: int) -> str:
+        """Cache key holding a workspace's cache generation counter.
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            Cache key in format: insighthub:workspace:{workspace_id}:generation
+        """
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}:generation"
+
+    @classmethod
+    def workspace_vector_config(cls, workspace_id: int, generation: int) -> str:
         """Cache key for workspace Vector RAG config.
 
         Args:
             workspace_id: Workspace ID
+            generation: Current workspace cache generation
 
         Returns:
-            Cache key in format: insighthub:workspace:{workspace_id}:vector_rag_config
+            Cache key in format: insighthub:workspace:{workspace_id}:g{generation}:vector_rag_config
         """
-        return f"workspace:{workspace_id}:vector_rag_config"
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}:g{generation}:vector_rag_config"
 
     @classmethod
-    def workspace_graph_config(cls, workspace_id: int) -> str:
+    def workspace_graph_config(cls, workspace_id: int, generation: int) -> str:
         """Cache key for workspace Graph RAG config.
 
         Args:
             workspace_id: Workspace ID
+            generation: Current workspace cache generation
 
         Returns:
-            Cache key in format: insighthub:workspace:{workspace_id}:graph_rag_config
+            Cache key in format: insighthub:workspace:{workspace_id}:g{generation}:graph_rag_config
         """
-        return f"workspace:{workspace_id}:graph_rag_config"
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}:g{generation}:graph_rag_config"
 
     @classmethod
-    def workspace_documents(cls, workspace_id: int) -> str:
+    def workspace_documents(cls, workspace_id: int, generation: int) -> str:
         """Cache key for workspace documents list.
 
         Args:
             workspace_id: Workspace ID
+            generation: Current workspace cache generation
 
         Returns:
-            Cache key in format: insighthub:workspace:{workspace_id}:documents
+            Cache key in format: insighthub:workspace:{workspace_id}:g{generation}:documents
         """
-        return f"workspace:{workspace_id}:documents"
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}:g{generation}:documents"
 
     @classmethod
-    def workspace_chat_sessions(cls, workspace_id: int) -> str:
+    def workspace_chat_sessions(cls, workspace_id: int, generation: int) -> str:
         """Cache key for workspace chat sessions list.
 
         Args:
             workspace_id: Workspace ID
+            generation: Current workspace cache generation
 
         Returns:
-            Cache key in format: insighthub:workspace:{workspace_id}:chat_sessions
+            Cache key in format: insighthub:workspace:{workspace_id}:g{generation}:chat_sessions
         """
-        return f"workspace:{workspace_id}:chat_sessions"
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}:g{generation}:chat_sessions"
 
     @classmethod
     def document(cls, document_id: int) -> str:
@@ -90,7 +111,7 @@ class CacheKeys:
         Returns:
             Cache key in format: insighthub:document:{document_id}
         """
-        return f"document:{document_id}"
+        return f"{cls.NAMESPACE}:document:{document_id}"
 
     @classmethod
     def chat_session(cls, session_id: int) -> str:
@@ -102,7 +123,7 @@ class CacheKeys:
         Returns:
             Cache key in format: insighthub:chat_session:{session_id}
         """
-        return f"chat_session:{session_id}"
+        return f"{cls.NAMESPACE}:chat_session:{session_id}"
 
     @classmethod
     def chat_session_messages(cls, session_id: int) -> str:
@@ -114,7 +135,7 @@ class CacheKeys:
         Returns:
             Cache key in format: insighthub:session:{session_id}:chat_messages
         """
-        return f"session:{session_id}:chat_messages"
+        return f"{cls.NAMESPACE}:session:{session_id}:chat_messages"
 
     @classmethod
     def chat_message(cls, message_id: int) -> str:
@@ -126,4 +147,60 @@ class CacheKeys:
         Returns:
             Cache key in format: insighthub:chat_message:{message_id}
         """
-        return f"chat_message:{message_id}"
+        return f"{cls.NAMESPACE}:chat_message:{message_id}"
+
+    @classmethod
+    def cli_state(cls) -> str:
+        """Cache key for the CLI state row.
+
+        Returns:
+            Cache key in format: insighthub:cli_state
+        """
+        return f"{cls.NAMESPACE}:cli_state"
+
+    @classmethod
+    def default_rag_config(cls) -> str:
+        """Cache key for the default RAG config row.
+
+        Returns:
+            Cache key in format: insighthub:default_rag_config
+        """
+        return f"{cls.NAMESPACE}:default_rag_config"
+
+    @classmethod
+    def workspace_index_generation(cls, workspace_id: int | str) -> str:
+        """Cache key holding a workspace's vector index generation counter.
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            Cache key in format: insighthub:workspace:{workspace_id}:index_generation
+        """
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}:index_generation"
+
+    @classmethod
+    def retrieval_results(cls, workspace_id: int | str, generation: int, query_key: str) -> str:
+        """Cache key for the results of a vector retrieval.
+
+        Args:
+            workspace_id: Workspace ID
+            generation: Current workspace index generation
+            query_key: Digest of the query and its retrieval settings
+
+        Returns:
+            Cache key in format: insighthub:workspace:{workspace_id}:i{generation}:retrieval:{query_key}
+        """
+        return f"{cls.NAMESPACE}:workspace:{workspace_id}:i{generation}:retrieval:{query_key}"
+
+    @classmethod
+    def embedding(cls, content_key: str) -> str:
+        """Cache key for a content-addressed embedding.
+
+        Args:
+            content_key: Embedding key in format {model_name}:{sha256}
+
+        Returns:
+            Cache key in format: insighthub:embedding:{model_name}:{sha256}
+        """
+        return f"{cls.NAMESPACE}:embedding:{content_key}"
@@ -47,6 +47,7 @@ Examples:
   python -m src.cli workspace list              List all workspace
   python -m src.cli workspace create            Create a new workspace (interactive)
   python -m src.cli workspace select 1          Select workspace with ID 1
+  python -m src.cli workspace communities 1     Rebuild graph communities for workspace 1
 
   # Document management
   python -m src.cli document list               List document in current workspace
@@ -103,6 +104,10 @@ For help on a specific resource, use:
     ws_delete.add_argument("workspace_id", type=int, help="Workspace ID")
     ws_select = ws_subparsers.add_parser("select", help="Select a workspace")
     ws_select.add_argument("workspace_id", type=int, help="Workspace ID")
+    ws_communities = ws_subparsers.add_parser(
+        "communities", help="Rebuild graph communities for a Graph RAG workspace"
+    )
+    ws_communities.add_argument("workspace_id", type=int, help="Workspace ID")
 
     # ==================== DOCUMENT ====================
     doc_parser = subparsers.add_parser(
@@ -144,7 +149,9 @@ For help on a specific resource, use:
     chat_list.add_argument(
         "--workspace-id", type=int, help="Workspace ID (overrides selected workspace)"
     )
-    chat_create = chat_subparsers.add_parser("create", help="Create new chat session in current workspace (interactive)")
+    chat_create = chat_subparsers.add_parser(
+        "create", help="Create new chat session in current workspace (interactive)"
+    )
     chat_create.add_argument(
         "--workspace-id", type=int, help="Workspace ID (overrides selected workspace)"
     )
@@ -275,6 +282,8 @@ def route_command(
             workspace_commands.cmd_delete(ctx, args)
         elif args.action == "select":
             workspace_commands.cmd_select(ctx, args)
+        elif args.action == "communities":
+            workspace_commands.cmd_communities(ctx, args)
         else:
             print(f"Error: Unknown workspace action '{args.action}'\n")
             ws_parser.print_help()
@@ -60,11 +60,14 @@ class AppContext:
                 port=cache_config.redis_port,
                 db=cache_config.redis_db,
                 default_ttl=cache_config.redis_ttl,
+                codec=cache_config.codec,
             )
         else:
             cache = create_cache(
                 cache_type="memory",
                 default_ttl=cache_config.redis_ttl,
+                max_entries=cache_config.memory_max_entries,
+                max_bytes=cache_config.memory_max_bytes,
             )
 
         # Storage
@@ -128,6 +131,7 @@ class AppContext:
         # RAG Config Providers (graph provider needs llm_provider)
         vector_provider = VectorRagConfigProvider(
             workspace_data_access=self.workspace_data_access,
+            cache=cache,
         )
         graph_provider = GraphRagConfigProvider(
             workspace_data_access=self.workspace_data_access,
@@ -146,6 +150,7 @@ class AppContext:
             data_access=self.workspace_data_access,
             default_rag_config_service=self.default_rag_config_service,
             config_provider_factory=self.rag_config_provider_factory,
+            rag_store_manager=self.rag_store_manager,
         )
         self.document_service = DocumentService(
             data_access=self.document_data_access,
@@ -262,6 +267,7 @@ class AppContext:
 
     def cleanup(self) -> None:
         """Clean up resources on application shutdown."""
+        from src.infrastructure.http_session import close_http_sessions
         from src.infrastructure.logger import create_logger
         from src.infrastructure.sql_database import close_sql_database
 
@@ -271,4 +277,7 @@ class AppContext:
         # Close database connection
         close_sql_database()
 
+        # Close pooled HTTP connections to model servers
+        close_http_sessions()
+
         logger.info("Application cleanup complete")
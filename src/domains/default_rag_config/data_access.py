@@ -1,14 +1,9 @@
 """Default RAG config data access layer - coordinates cache and repository."""
 
-import json
-from datetime import UTC, datetime
 from typing import Optional
 
-from src.domains.default_rag_config.models import (
-    DefaultGraphRagConfig,
-    DefaultRagConfig,
-    DefaultVectorRagConfig,
-)
+from src.cache_keys import CacheKeys
+from src.domains.default_rag_config.models import DefaultRagConfig
 from src.domains.default_rag_config.repositories import DefaultRagConfigRepository
 from src.infrastructure.cache.cache import Cache
 from src.infrastructure.logger import create_logger
@@ -34,11 +29,8 @@ class DefaultRagConfigDataAccess:
             DefaultRagConfig if found, None otherwise
         """
         # Try cache first
-        cache_key = "default_rag_config:1"
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            cached_config = self._deserialize_cached_config(cached_json)
+        if self.cache:
+            cached_config = self.cache.get_model(CacheKeys.default_rag_config(), DefaultRagConfig)
             if cached_config is not None:
                 return cached_config
 
@@ -50,51 +42,6 @@ class DefaultRagConfigDataAccess:
 
         return config
 
-    def _deserialize_cached_config(self, cached_json: str) -> Optional[DefaultRagConfig]:
-        """Deserialize cached config from JSON.
-
-        Returns:
-            DefaultRagConfig if valid, None if deserialization fails
-        """
-        try:
-            data = json.loads(cached_json)
-            vector_config = DefaultVectorRagConfig(
-                embedding_algorithm=data["vector_config"]["embedding_algorithm"],
-                chunking_algorithm=data["vector_config"]["chunking_algorithm"],
-                rerank_algorithm=data["vector_config"]["rerank_algorithm"],
-                chunk_size=data["vector_config"]["chunk_size"],
-                chunk_overlap=data["vector_config"]["chunk_overlap"],
-                top_k=data["vector_config"]["top_k"],
-            )
-
-            graph_config = DefaultGraphRagConfig(
-                entity_extraction_algorithm=data["graph_config"]["entity_extraction_algorithm"],
-                relationship_extraction_algorithm=data["graph_config"][
-                    "relationship_extraction_algorithm"
-                ],
-                clustering_algorithm=data["graph_config"]["clustering_algorithm"],
-            )
-
-            return DefaultRagConfig(
-                id=data["id"],
-                rag_type=data["rag_type"],
-                vector_config=vector_config,
-                graph_config=graph_config,
-                created_at=(
-                    datetime.fromisoformat(data["created_at"])
-                    if data.get("created_at")
-                    else datetime.now(UTC)
-                ),
-                updated_at=(
-                    datetime.fromisoformat(data["updated_at"])
-                    if data.get("updated_at")
-                    else datetime.now(UTC)
-                ),
-            )
-        except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
-            logger.warning(f"Cache deserialization error for default RAG config: {e}")
-            return None
-
     def update(self, config: DefaultRagConfig) -> DefaultRagConfig:
         """Update the default RAG config.
         Args:
@@ -114,34 +61,12 @@ class DefaultRagConfigDataAccess:
         if not self.cache:
             return
 
-        cache_key = "default_rag_config:1"
-        cache_value = json.dumps(
-            {
-                "id": config.id,
-                "rag_type": config.rag_type,
-                "vector_config": {
-                    "embedding_algorithm": config.vector_config.embedding_algorithm,
-                    "chunking_algorithm": config.vector_config.chunking_algorithm,
-                    "rerank_algorithm": config.vector_config.rerank_algorithm,
-                    "chunk_size": config.vector_config.chunk_size,
-                    "chunk_overlap": config.vector_config.chunk_overlap,
-                    "top_k": config.vector_config.top_k,
-                },
-                "graph_config": {
-                    "entity_extraction_algorithm": config.graph_config.entity_extraction_algorithm,
-                    "relationship_extraction_algorithm": config.graph_config.relationship_extraction_algorithm,
-                    "clustering_algorithm": config.graph_config.clustering_algorithm,
-                },
-                "created_at": config.created_at.isoformat() if config.created_at else None,
-                "updated_at": config.updated_at.isoformat() if config.updated_at else None,
-            }
-        )
         self.cache.set(
-            cache_key, cache_value, ttl=600
+            CacheKeys.default_rag_config(), config, ttl=600
         )  # Cache for 10 minutes (config changes rarely)
 
     def _invalidate_cache(self) -> None:
         """Invalidate config cache."""
         if self.cache:
-            cache_key = "default_rag_config:1"
+            cache_key = CacheKeys.default_rag_config()
             self.cache.delete(cache_key)
@@ -42,6 +42,18 @@ def cmd_list(ctx: AppContext, args: argparse.Namespace) -> None:
             IO.print(f"  - {opt.value}: {opt.description}")
         IO.print("")
 
+        IO.print("Vector Quantization:")
+        for opt in response.quantization_options:
+            IO.print(f"  - {opt.value}: {opt.description}")
+        IO.print("")
+
+        IO.print("Vector Index Tuning (per workspace):")
+        IO.print("  - hnsw_m: Edges per node in the HNSW graph (default 16)")
+        IO.print("  - hnsw_ef_construct: Neighbours considered while indexing (default 100)")
+        IO.print("  - hnsw_ef: Search beam width (default: the collection's ef_construct)")
+        IO.print("  - on_disk_vectors: Keep original vectors on disk instead of RAM")
+        IO.print("")
+
         IO.print("Entity Extraction Algorithms:")
         for opt in response.entity_extraction_algorithms:
             IO.print(f"  - {opt.value}: {opt.description}")
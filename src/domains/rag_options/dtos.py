@@ -19,6 +19,7 @@ class RagOptionsResponse(BaseModel):
     chunking_algorithms: List[RagOption]
     embedding_algorithms: List[RagOption]
     rerank_algorithms: List[RagOption]
+    quantization_options: List[RagOption]
     entity_extraction_algorithms: List[RagOption]
     relationship_extraction_algorithms: List[RagOption]
     clustering_algorithms: List[RagOption]
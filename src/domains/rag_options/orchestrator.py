@@ -24,6 +24,7 @@ class RagOptionsOrchestrator:
             chunking,
             embedding,
             rerank,
+            quantization,
             entity_extraction,
             relationship_extraction,
             clustering,
@@ -34,6 +35,7 @@ class RagOptionsOrchestrator:
             chunking_algorithms=chunking,
             embedding_algorithms=embedding,
             rerank_algorithms=rerank,
+            quantization_options=quantization,
             entity_extraction_algorithms=entity_extraction,
             relationship_extraction_algorithms=relationship_extraction,
             clustering_algorithms=clustering,
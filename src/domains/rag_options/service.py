@@ -10,6 +10,7 @@ from src.infrastructure.rag.options import (
     get_graph_clustering_options,
     get_graph_entity_extraction_options,
     get_graph_relationship_extraction_options,
+    get_quantization_options,
     get_rag_type_options,
     get_reranking_options,
 )
@@ -30,17 +31,19 @@ class RagOptionsService:
         List[RagOption],
         List[RagOption],
         List[RagOption],
+        List[RagOption],
     ]:
         """Get all available RAG options.
 
         Returns:
-            Tuple of (rag_types, chunking, embedding, rerank, entity_extraction,
-                     relationship_extraction, clustering)
+            Tuple of (rag_types, chunking, embedding, rerank, quantization,
+                     entity_extraction, relationship_extraction, clustering)
         """
         rag_types = [RagOption(**opt) for opt in get_rag_type_options()]
         chunking = [RagOption(**opt) for opt in get_chunking_options()]
         embedding = [RagOption(**opt) for opt in get_embedding_options()]
         rerank = [RagOption(**opt) for opt in get_reranking_options()]
+        quantization = [RagOption(**opt) for opt in get_quantization_options()]
         entity_extraction = [RagOption(**opt) for opt in get_graph_entity_extraction_options()]
         relationship_extraction = [
             RagOption(**opt) for opt in get_graph_relationship_extraction_options()
@@ -52,6 +55,7 @@ class RagOptionsService:
             chunking,
             embedding,
             rerank,
+            quantization,
             entity_extraction,
             relationship_extraction,
             clustering,
@@ -1,9 +1,8 @@
 """State data access layer - coordinates cache and repository."""
 
-import json
-from datetime import datetime
 from typing import Optional
 
+from src.cache_keys import CacheKeys
 from src.domains.state.models import State
 from src.domains.state.repositories import StateRepository
 from src.infrastructure.cache.cache import Cache
@@ -32,11 +31,8 @@ class StateDataAccess:
             State if found, None otherwise
         """
         # Try cache first
-        cache_key = "cli_state:1"
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            cached_state = self._deserialize_cached_state(cached_json)
+        if self.cache:
+            cached_state = self.cache.get_model(CacheKeys.cli_state(), State)
             if cached_state is not None:
                 return cached_state
 
@@ -48,28 +44,6 @@ class StateDataAccess:
 
         return state
 
-    def _deserialize_cached_state(self, cached_json: str) -> Optional[State]:
-        """Deserialize cached state from JSON.
-
-        Returns:
-            State if valid, None if deserialization fails
-        """
-        try:
-            data = json.loads(cached_json)
-            return State(
-                id=data["id"],
-                current_workspace_id=data.get("current_workspace_id"),
-                current_session_id=data.get("current_session_id"),
-                updated_at=(
-                    datetime.fromisoformat(data["updated_at"])
-                    if data.get("updated_at")
-                    else datetime.utcnow()
-                ),
-            )
-        except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
-            logger.warning(f"Cache deserialization error for state: {e}")
-            return None
-
     def set_current_workspace(self, workspace_id: Optional[int]) -> None:
         """Set the current workspace ID.
 
@@ -97,21 +71,12 @@ class StateDataAccess:
         if not self.cache:
             return
 
-        cache_key = "cli_state:1"
-        cache_value = json.dumps(
-            {
-                "id": state.id,
-                "current_workspace_id": state.current_workspace_id,
-                "current_session_id": state.current_session_id,
-                "updated_at": state.updated_at.isoformat() if state.updated_at else None,
-            }
-        )
         self.cache.set(
-            cache_key, cache_value, ttl=60
+            CacheKeys.cli_state(), state, ttl=60
         )  # Cache for 1 minute (state changes frequently)
 
     def _invalidate_cache(self) -> None:
         """Invalidate state cache."""
         if self.cache:
-            cache_key = "cli_state:1"
+            cache_key = CacheKeys.cli_state()
             self.cache.delete(cache_key)
@@ -1,7 +1,5 @@
 """Chat message data access layer - coordinates cache and repository."""
 
-import json
-from datetime import datetime
 from typing import Optional
 
 from returns.result import Result
@@ -39,26 +37,10 @@ class ChatMessageDataAccess:
             ChatMessage if found, None otherwise
         """
         # Try cache first
-        cache_key = CacheKeys.chat_message(message_id)
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            try:
-                data = json.loads(cached_json)
-                return ChatMessage(
-                    id=data["id"],
-                    session_id=data["session_id"],
-                    role=data["role"],
-                    content=data["content"],
-                    extra_metadata=data.get("extra_metadata"),
-                    created_at=(
-                        datetime.fromisoformat(data["created_at"])
-                        if data.get("created_at")
-                        else datetime.utcnow()
-                    ),
-                )
-            except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
-                logger.warning(f"Cache deserialization error for chat message {message_id}: {e}")
+        if self.cache:
+            cached = self.cache.get_model(CacheKeys.chat_message(message_id), ChatMessage)
+            if cached:
+                return cached
 
         # Cache miss - fetch from database
         message = self.repository.get_by_id(message_id)
@@ -69,13 +51,14 @@ class ChatMessageDataAccess:
         return message
 
     def get_by_session(
-        self, session_id: int, pagination: Pagination
+        self, session_id: int, pagination: Pagination, include_total: bool = True
     ) -> PaginatedResult[ChatMessage]:
         """Get messages by session with caching.
 
         Args:
             session_id: Session ID
             pagination: Pagination parameters
+            include_total: Count all session messages (skip for cheaper paging)
 
         Returns:
             PaginatedResult of chat messages
@@ -83,54 +66,94 @@ class ChatMessageDataAccess:
         # Try cache first for cache-eligible queries (first page, reasonable size)
         if pagination.is_cache_eligible():
             cache_key = CacheKeys.chat_session_messages(session_id)
-            cached_json = self.cache.get(cache_key) if self.cache else None
+            cached_ids = self.cache.get(cache_key) if self.cache else None
 
-            if cached_json:
-                cached_result = self._try_get_cached_messages(cache_key, cached_json, pagination)
+            if isinstance(cached_ids, list):
+                cached_result = self._try_get_cached_messages(cache_key, cached_ids, pagination)
                 if cached_result is not None:
                     return cached_result
 
         # Cache miss or pagination - fetch from database
-        result = self.repository.get_by_session(session_id, pagination)
+        result = self.repository.get_by_session(session_id, pagination, include_total)
 
         # Cache the result for first page
         if self.cache and pagination.is_cache_eligible() and result.items:
-            cache_value = json.dumps([m.id for m in result.items])
             self.cache.set(
-                CacheKeys.chat_session_messages(session_id), cache_value, ttl=60
-            )  # Cache for 1 minute
+                CacheKeys.chat_session_messages(session_id),
+                [m.id for m in result.items],
+                ttl=60,  # Cache for 1 minute
+            )
             # Also cache individual messages
-            for message in result.items:
-                self._cache_message(message)
+            self._cache_messages(result.items)
 
         return result
 
+    def get_recent(self, session_id: int, limit: int) -> list[ChatMessage]:
+        """Get the last messages of a session, oldest first.
+
+        Args:
+            session_id: Session ID
+            limit: Maximum number of messages
+
+        Returns:
+            List of chat messages
+        """
+        return self.repository.get_recent(session_id, limit)
+
+    def get_before(self, session_id: int, message_id: int, limit: int) -> list[ChatMessage]:
+        """Get the messages of a session preceding a message, oldest first.
+
+        Args:
+            session_id: Session ID
+            message_id: Message to page back from (excluded)
+            limit: Maximum number of messages
+
+        Returns:
+            List of chat messages
+        """
+        return self.repository.get_before(session_id, message_id, limit)
+
     def _try_get_cached_messages(
-        self, cache_key: str, cached_json: str, pagination: Pagination
+        self, cache_key: str, message_ids: list[int], pagination: Pagination
     ) -> Optional[PaginatedResult[ChatMessage]]:
         """Try to retrieve messages from cache.
 
         Returns:
             PaginatedResult if all found, None if any missing or invalid
         """
-        try:
-            message_ids = json.loads(cached_json)
-            messages = []
-            skip, limit = pagination.offset_limit()
-            for msg_id in message_ids[:limit]:
-                msg = self.get_by_id(msg_id)
-                if not msg:
-                    if self.cache:
-                        self.cache.delete(cache_key)
-                    return None
-                messages.append(msg)
-            # Note: For cached results, we use the length as total_count
-            # This is a simplification since we only cache first page
-            return PaginatedResult(
-                items=messages, total_count=len(message_ids), skip=skip, limit=limit
+        skip, limit = pagination.offset_limit()
+        messages = self._get_many(message_ids[:limit])
+        if messages is None:
+            if self.cache:
+                self.cache.delete(cache_key)
+            return None
+
+        # Note: For cached results, we use the length as total_count
+        # This is a simplification since we only cache first page
+        return PaginatedResult(items=messages, total_count=len(message_ids), skip=skip, limit=limit)
+
+    def _get_many(self, message_ids: list[int]) -> Optional[list[ChatMessage]]:
+        """Get messages by ID in order, batching cache and database lookups.
+
+        Returns:
+            Messages in the order of message_ids, or None if any is missing
+        """
+        found: dict[int, ChatMessage] = {}
+        if self.cache:
+            cached = self.cache.get_models(
+                [CacheKeys.chat_message(msg_id) for msg_id in message_ids], ChatMessage
             )
-        except (json.JSONDecodeError, KeyError, ValueError):
+            found.update((message.id, message) for message in cached.values())
+
+        missing = [msg_id for msg_id in message_ids if msg_id not in found]
+        if missing:
+            loaded = self.repository.get_by_ids(missing)
+            self._cache_messages(loaded)
+            found.update((message.id, message) for message in loaded)
+
+        if any(msg_id not in found for msg_id in message_ids):
             return None
+        return [found[msg_id] for msg_id in message_ids]
 
     def create(
         self,
@@ -187,21 +210,21 @@ class ChatMessageDataAccess:
         Args:
             message: ChatMessage to cache
         """
-        if not self.cache:
+        self._cache_messages([message])
+
+    def _cache_messages(self, messages: list[ChatMessage]) -> None:
+        """Cache several messages in one batch.
+
+        Args:
+            messages: ChatMessages to cache
+        """
+        if not self.cache or not messages:
             return
 
-        cache_key = CacheKeys.chat_message(message.id)
-        cache_value = json.dumps(
-            {
-                "id": message.id,
-                "session_id": message.session_id,
-                "role": message.role,
-                "content": message.content,
-                "extra_metadata": message.extra_metadata,
-                "created_at": message.created_at.isoformat() if message.created_at else None,
-            }
+        self.cache.set_many(
+            {CacheKeys.chat_message(message.id): message for message in messages},
+            ttl=300,  # Cache for 5 minutes
         )
-        self.cache.set(cache_key, cache_value, ttl=300)  # Cache for 5 minutes
 
     def _invalidate_cache(self, message_id: int) -> None:
         """Invalidate message cache.
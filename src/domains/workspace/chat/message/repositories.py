@@ -77,37 +77,105 @@ class ChatMessageRepository:
             return ChatMessage(**result)
         return None
 
+    def get_by_ids(self, message_ids: list[int]) -> list[ChatMessage]:
+        """Get several messages by ID in one query (missing IDs are skipped)."""
+        if not message_ids:
+            return []
+
+        query = """
+            SELECT id, chat_session_id as session_id, role, content, created_at
+            FROM chat_messages WHERE id = ANY(%s)
+        """
+        try:
+            results = self.db.fetch_all(query, (list(message_ids),))
+        except DatabaseException as e:
+            logger.error(f"Database error getting chat messages by ids: {e}")
+            return []
+
+        return [ChatMessage(**result) for result in results]
+
     def get_by_session(
-        self, session_id: int, pagination: Pagination
+        self, session_id: int, pagination: Pagination, include_total: bool = True
     ) -> PaginatedResult[ChatMessage]:
-        """Get message for a session with pagination."""
+        """Get message for a session with pagination.
+
+        With include_total=False the COUNT(*) query is skipped; one extra row is
+        fetched instead so has_next_page stays accurate, and total_count only
+        counts up to the end of the current page (plus one if more exist).
+        """
         skip, limit = pagination.offset_limit()
 
-        # Get total count for session
-        count_query = "SELECT COUNT(*) as total FROM chat_messages WHERE chat_session_id = %s"
-        try:
-            count_result = self.db.fetch_one(count_query, (session_id,))
-            total_count = count_result["total"] if count_result else 0
-        except DatabaseException as e:
-            logger.error(f"Database error counting chat messages: {e}")
-            total_count = 0
+        total_count = 0
+        if include_total:
+            count_query = "SELECT COUNT(*) as total FROM chat_messages WHERE chat_session_id = %s"
+            try:
+                count_result = self.db.fetch_one(count_query, (session_id,))
+                total_count = count_result["total"] if count_result else 0
+            except DatabaseException as e:
+                logger.error(f"Database error counting chat messages: {e}")
 
         # Get paginated results
         query = """
             SELECT id, chat_session_id as session_id, role, content, created_at
             FROM chat_messages WHERE chat_session_id = %s
-            ORDER BY created_at ASC
+            ORDER BY created_at ASC, id ASC
             LIMIT %s OFFSET %s
         """
+        fetch_limit = limit if include_total else limit + 1
         try:
-            results = self.db.fetch_all(query, (session_id, limit, skip))
+            results = self.db.fetch_all(query, (session_id, fetch_limit, skip))
             items = [ChatMessage(**result) for result in results]
         except DatabaseException as e:
             logger.error(f"Database error getting chat messages: {e}")
             items = []
 
+        if not include_total:
+            total_count = skip + len(items)
+            items = items[:limit]
+
         return PaginatedResult(items=items, total_count=total_count, skip=skip, limit=limit)
 
+    def get_recent(self, session_id: int, limit: int) -> list[ChatMessage]:
+        """Get the last messages of a session, oldest first.
+
+        Uses the (chat_session_id, created_at, id) index, so the cost does not
+        grow with the length of the session.
+        """
+        query = """
+            SELECT id, chat_session_id as session_id, role, content, created_at
+            FROM chat_messages WHERE chat_session_id = %s
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
+        """
+        try:
+            results = self.db.fetch_all(query, (session_id, limit))
+        except DatabaseException as e:
+            logger.error(f"Database error getting recent chat messages: {e}")
+            return []
+
+        return [ChatMessage(**result) for result in reversed(results)]
+
+    def get_before(self, session_id: int, message_id: int, limit: int) -> list[ChatMessage]:
+        """Get the messages of a session that precede a message, oldest first.
+
+        Returns an empty list if the message does not exist.
+        """
+        query = """
+            SELECT id, chat_session_id as session_id, role, content, created_at
+            FROM chat_messages
+            WHERE chat_session_id = %s
+              AND (created_at, id) < (SELECT created_at, id FROM chat_messages WHERE id = %s)
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s
+        """
+        try:
+            results = self.db.fetch_all(query, (session_id, message_id, limit))
+        except DatabaseException as e:
+            logger.error(f"Database error getting chat messages before {message_id}: {e}")
+            return []
+
+        return [ChatMessage(**result) for result in reversed(results)]
+
     def delete(self, message_id: int) -> bool:
         """Delete message by ID."""
         query = "DELETE FROM chat_messages WHERE id = %s"
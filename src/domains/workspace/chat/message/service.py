@@ -1,5 +1,7 @@
 """Chat message service."""
 
+from collections import OrderedDict
+from threading import Lock
 from typing import Callable, Optional
 
 from returns.result import Failure, Result, Success
@@ -12,6 +14,7 @@ from src.infrastructure.llm.llm_provider import LlmProvider
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.rag_config_provider import RagConfigProviderFactory
 from src.infrastructure.rag.workflows.query.factory import QueryWorkflowFactory
+from src.infrastructure.rag.workflows.query.query_workflow import QueryWorkflow
 from src.infrastructure.store_manager import RAGStoreManager
 from src.infrastructure.types import (
     DatabaseError,
@@ -25,7 +28,15 @@ logger = create_logger(__name__)
 
 
 class ChatMessageService:
-    """Service for managing chat message."""
+    """Service for managing chat message.
+
+    Query workflows (with their embedder and reranker) are built once per
+    workspace and reused until the workspace's cache generation changes, which
+    happens whenever its RAG config is updated or the workspace is deleted.
+    """
+
+    # Workspaces whose compiled query workflows are kept warm
+    MAX_CACHED_WORKFLOWS = 32
 
     def __init__(
         self,
@@ -44,6 +55,10 @@ class ChatMessageService:
         self.config_provider_factory = config_provider_factory
         self.rag_store_manager = rag_store_manager
 
+        # workspace_id -> (cache generation, workflow, top_k), least recently used first
+        self._query_workflows: OrderedDict[int, tuple[int, QueryWorkflow, int]] = OrderedDict()
+        self._query_workflows_lock = Lock()
+
     def create_message(
         self,
         session_id: int,
@@ -176,12 +191,8 @@ class ChatMessageService:
 
         user_message = user_message_result.unwrap()
 
-        # Build conversation history (last 10 messages for context)
-        # Get a large enough page to include recent history
-        history_pagination = Pagination.create(skip=0, limit=100).unwrap()
-        all_messages_result = self.data_access.get_by_session(session_id, history_pagination)
-        all_messages = all_messages_result.items
-        history_messages = all_messages[-11:-1] if len(all_messages) > 1 else []
+        # Build conversation history (last 10 messages before this one for context)
+        history_messages = self.data_access.get_before(session_id, user_message.id, 10)
         conversation_history = [
             {"role": msg.role, "content": msg.content} for msg in history_messages
         ]
@@ -235,17 +246,11 @@ class ChatMessageService:
         if not workspace:
             return ""
 
-        # Use provider pattern to build query configuration
-        provider = self.config_provider_factory.get_provider(workspace.rag_type)
-        if not provider:
-            logger.warning(f"Unknown RAG type: {workspace.rag_type}")
+        compiled = self._get_query_workflow(workspace_id, workspace.rag_type)
+        if not compiled:
             return ""
 
-        rag_config = provider.build_query_settings(workspace_id)
-
-        # Create and execute query workflow
-        workflow = QueryWorkflowFactory.create(rag_config, self.rag_store_manager)
-        top_k = rag_config.get("top_k", 5)
+        workflow, top_k = compiled
         chunks = workflow.execute(
             query_text=query_text,
             top_k=top_k,
@@ -261,3 +266,43 @@ class ChatMessageService:
             context_parts.append(f"\n[{i}] {chunk.text}\n")
 
         return "".join(context_parts)
+
+    def _get_query_workflow(
+        self, workspace_id: int, rag_type: str
+    ) -> Optional[tuple[QueryWorkflow, int]]:
+        """Get the workspace's query workflow and top_k, building it on first use.
+
+        Args:
+            workspace_id: Workspace ID
+            rag_type: Workspace RAG type
+
+        Returns:
+            Tuple of (workflow, top_k), or None if the RAG type is unknown
+        """
+        generation = self.workspace_data_access.cache_generation(workspace_id)
+        if generation is not None:
+            with self._query_workflows_lock:
+                cached = self._query_workflows.get(workspace_id)
+                if cached and cached[0] == generation:
+                    self._query_workflows.move_to_end(workspace_id)
+                    return cached[1], cached[2]
+
+        # Use provider pattern to build query configuration
+        provider = self.config_provider_factory.get_provider(rag_type)
+        if not provider:
+            logger.warning(f"Unknown RAG type: {rag_type}")
+            return None
+
+        rag_config = provider.build_query_settings(workspace_id)
+        workflow = QueryWorkflowFactory.create(rag_config, self.rag_store_manager)
+        top_k = rag_config.get("top_k", 5)
+
+        # Without a cache there is no generation to detect config changes, so don't memoize
+        if generation is not None:
+            with self._query_workflows_lock:
+                self._query_workflows[workspace_id] = (generation, workflow, top_k)
+                self._query_workflows.move_to_end(workspace_id)
+                while len(self._query_workflows) > self.MAX_CACHED_WORKFLOWS:
+                    self._query_workflows.popitem(last=False)
+
+        return workflow, top_k
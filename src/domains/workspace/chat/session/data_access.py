@@ -1,7 +1,5 @@
 """Chat session data access layer - coordinates cache and repository."""
 
-import json
-from datetime import UTC, datetime
 from typing import Optional
 
 from returns.result import Result
@@ -39,30 +37,10 @@ class ChatSessionDataAccess:
             ChatSession if found, None otherwise
         """
         # Try cache first
-        cache_key = CacheKeys.chat_session(session_id)
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            try:
-                data = json.loads(cached_json)
-                return ChatSession(
-                    id=data["id"],
-                    workspace_id=data.get("workspace_id"),
-                    title=data.get("title"),
-                    rag_type=data["rag_type"],
-                    created_at=(
-                        datetime.fromisoformat(data["created_at"])
-                        if data.get("created_at")
-                        else datetime.now(UTC)
-                    ),
-                    updated_at=(
-                        datetime.fromisoformat(data["updated_at"])
-                        if data.get("updated_at")
-                        else datetime.now(UTC)
-                    ),
-                )
-            except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
-                logger.warning(f"Cache deserialization error for chat session {session_id}: {e}")
+        if self.cache:
+            cached = self.cache.get_model(CacheKeys.chat_session(session_id), ChatSession)
+            if cached:
+                return cached
 
         # Cache miss - fetch from database
         session = self.repository.get_by_id(session_id)
@@ -85,9 +63,7 @@ class ChatSessionDataAccess:
         # but we cache individual sessions that are fetched
         result = self.repository.get_all(pagination)
 
-        if self.cache:
-            for session in result.items:
-                self._cache_session(session)
+        self._cache_sessions(result.items)
 
         return result
 
@@ -105,11 +81,11 @@ class ChatSessionDataAccess:
         """
         # Try cache first for cache-eligible queries (first page, reasonable size)
         if pagination.is_cache_eligible():
-            cache_key = CacheKeys.workspace_chat_sessions(workspace_id)
-            cached_json = self.cache.get(cache_key) if self.cache else None
+            cache_key = self._workspace_sessions_key(workspace_id)
+            cached_ids = self.cache.get(cache_key) if self.cache else None
 
-            if cached_json:
-                cached_result = self._try_get_cached_sessions(cache_key, cached_json, pagination)
+            if isinstance(cached_ids, list):
+                cached_result = self._try_get_cached_sessions(cache_key, cached_ids, pagination)
                 if cached_result is not None:
                     return cached_result
 
@@ -118,42 +94,36 @@ class ChatSessionDataAccess:
 
         # Cache the result for first page
         if self.cache and pagination.is_cache_eligible() and result.items:
-            cache_value = json.dumps([s.id for s in result.items])
             self.cache.set(
-                CacheKeys.workspace_chat_sessions(workspace_id), cache_value, ttl=120
-            )  # Cache for 2 minutes
+                cache_key,
+                [s.id for s in result.items],
+                ttl=120,  # Cache for 2 minutes
+            )
             # Also cache individual sessions
-            for session in result.items:
-                self._cache_session(session)
+            self._cache_sessions(result.items)
 
         return result
 
     def _try_get_cached_sessions(
-        self, cache_key: str, cached_json: str, pagination: Pagination
+        self, cache_key: str, session_ids: list[int], pagination: Pagination
     ) -> Optional[PaginatedResult[ChatSession]]:
         """Try to retrieve sessions from cache.
 
         Returns:
             PaginatedResult if all found, None if any missing or invalid
         """
-        try:
-            session_ids = json.loads(cached_json)
-            sessions = []
-            skip, limit = pagination.offset_limit()
-            for sess_id in session_ids[:limit]:
-                sess = self.get_by_id(sess_id)
-                if not sess:
-                    if self.cache:
-                        self.cache.delete(cache_key)
-                    return None
-                sessions.append(sess)
-            # Note: For cached results, we use the length as total_count
-            # This is a simplification since we only cache first page
-            return PaginatedResult(
-                items=sessions, total_count=len(session_ids), skip=skip, limit=limit
-            )
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return None
+        sessions = []
+        skip, limit = pagination.offset_limit()
+        for sess_id in session_ids[:limit]:
+            sess = self.get_by_id(sess_id)
+            if not sess:
+                if self.cache:
+                    self.cache.delete(cache_key)
+                return None
+            sessions.append(sess)
+        # Note: For cached results, we use the length as total_count
+        # This is a simplification since we only cache first page
+        return PaginatedResult(items=sessions, total_count=len(session_ids), skip=skip, limit=limit)
 
     def create(
         self,
@@ -179,7 +149,7 @@ class ChatSessionDataAccess:
                 self._cache_session(session)
                 # Invalidate workspace sessions list
                 if workspace_id:
-                    self.cache.delete(CacheKeys.workspace_chat_sessions(workspace_id))
+                    self.cache.delete(self._workspace_sessions_key(workspace_id))
 
         return result
 
@@ -198,7 +168,7 @@ class ChatSessionDataAccess:
             self._invalidate_cache(session_id)
             # Invalidate workspace sessions list if session has workspace
             if session.workspace_id and self.cache:
-                self.cache.delete(CacheKeys.workspace_chat_sessions(session.workspace_id))
+                self.cache.delete(self._workspace_sessions_key(session.workspace_id))
         return session
 
     def delete(self, session_id: int) -> bool:
@@ -218,7 +188,7 @@ class ChatSessionDataAccess:
         if result:
             self._invalidate_cache(session_id)
             if workspace_id and self.cache:
-                self.cache.delete(CacheKeys.workspace_chat_sessions(workspace_id))
+                self.cache.delete(self._workspace_sessions_key(workspace_id))
         return result
 
     def _cache_session(self, session: ChatSession) -> None:
@@ -227,21 +197,31 @@ class ChatSessionDataAccess:
         Args:
             session: ChatSession to cache
         """
-        if not self.cache:
-            return
-
-        cache_key = CacheKeys.chat_session(session.id)
-        cache_value = json.dumps(
-            {
-                "id": session.id,
-                "workspace_id": session.workspace_id,
-                "title": session.title,
-                "rag_type": session.rag_type,
-                "created_at": session.created_at.isoformat() if session.created_at else None,
-                "updated_at": session.updated_at.isoformat() if session.updated_at else None,
-            }
+        if self.cache:
+            self.cache.set(
+                CacheKeys.chat_session(session.id), session, ttl=300
+            )  # Cache for 5 minutes
+
+    def _cache_sessions(self, sessions: list[ChatSession]) -> None:
+        """Cache several sessions in one batch.
+
+        Args:
+            sessions: ChatSessions to cache
+        """
+        if self.cache and sessions:
+            self.cache.set_many(
+                {CacheKeys.chat_session(session.id): session for session in sessions},
+                ttl=300,  # Cache for 5 minutes
+            )
+
+    def _workspace_sessions_key(self, workspace_id: int) -> str:
+        """Cache key for the workspace sessions list at the current workspace generation."""
+        generation = (
+            self.cache.get_generation(CacheKeys.workspace_generation(workspace_id))
+            if self.cache
+            else 0
         )
-        self.cache.set(cache_key, cache_value, ttl=300)  # Cache for 5 minutes
+        return CacheKeys.workspace_chat_sessions(workspace_id, generation)
 
     def _invalidate_cache(self, session_id: int) -> None:
         """Invalidate session cache.
@@ -10,6 +10,7 @@ from src.context import AppContext
 from src.domains.workspace.dtos import (
     CreateWorkspaceRequest,
     DeleteWorkspaceRequest,
+    RebuildCommunitiesRequest,
     SelectWorkspaceRequest,
     ShowWorkspaceRequest,
     UpdateWorkspaceRequest,
@@ -81,6 +82,11 @@ def cmd_create(ctx: AppContext, args: argparse.Namespace) -> None:
         embedding_algorithm = None
         top_k = None
         rerank_algorithm = None
+        quantization = None
+        hnsw_m = None
+        hnsw_ef_construct = None
+        hnsw_ef = None
+        on_disk_vectors = None
         entity_extraction = None
         relationship_extraction = None
         clustering = None
@@ -99,11 +105,17 @@ def cmd_create(ctx: AppContext, args: argparse.Namespace) -> None:
             IO.print("\nAvailable reranking algorithms:")
             for opt in options.rerank_algorithms:
                 IO.print(f"  - {opt.value}: {opt.description}")
+
+            IO.print("\nAvailable vector quantization:")
+            for opt in options.quantization_options:
+                IO.print(f"  - {opt.value}: {opt.description}")
             IO.print("")
 
             # Prompt for vector RAG configuration with defaults from default config
             default_chunking = default_config.vector_config.chunking_algorithm
-            chunking_algorithm = IO.input(f"Chunking algorithm [{default_chunking}]: ").strip() or None
+            chunking_algorithm = (
+                IO.input(f"Chunking algorithm [{default_chunking}]: ").strip() or None
+            )
 
             default_chunk_size = default_config.vector_config.chunk_size
             chunk_size_str = IO.input(f"Chunk size [{default_chunk_size}]: ").strip()
@@ -114,7 +126,9 @@ def cmd_create(ctx: AppContext, args: argparse.Namespace) -> None:
             chunk_overlap = int(chunk_overlap_str) if chunk_overlap_str else None
 
             default_embedding = default_config.vector_config.embedding_algorithm
-            embedding_algorithm = IO.input(f"Embedding algorithm [{default_embedding}]: ").strip() or None
+            embedding_algorithm = (
+                IO.input(f"Embedding algorithm [{default_embedding}]: ").strip() or None
+            )
 
             default_top_k = default_config.vector_config.top_k
             top_k_str = IO.input(f"Top K [{default_top_k}]: ").strip()
@@ -123,6 +137,20 @@ def cmd_create(ctx: AppContext, args: argparse.Namespace) -> None:
             default_reranking = default_config.vector_config.rerank_algorithm
             rerank_algorithm = IO.input(f"Rerank algorithm [{default_reranking}]: ").strip() or None
 
+            quantization = IO.input("Vector quantization [none]: ").strip() or None
+
+            on_disk_str = IO.input("Store vectors on disk (y/N): ").strip().lower()
+            on_disk_vectors = on_disk_str in ("y", "yes") if on_disk_str else None
+
+            hnsw_m_str = IO.input("HNSW m [16]: ").strip()
+            hnsw_m = int(hnsw_m_str) if hnsw_m_str else None
+
+            hnsw_ef_construct_str = IO.input("HNSW ef_construct [100]: ").strip()
+            hnsw_ef_construct = int(hnsw_ef_construct_str) if hnsw_ef_construct_str else None
+
+            hnsw_ef_str = IO.input("HNSW search ef [default]: ").strip()
+            hnsw_ef = int(hnsw_ef_str) if hnsw_ef_str else None
+
         else:  # graph
             # Show available options
             IO.print("\nAvailable entity extraction algorithms:")
@@ -164,6 +192,11 @@ def cmd_create(ctx: AppContext, args: argparse.Namespace) -> None:
             embedding_algorithm=embedding_algorithm,
             top_k=top_k,
             rerank_algorithm=rerank_algorithm,
+            quantization=quantization,
+            hnsw_m=hnsw_m,
+            hnsw_ef_construct=hnsw_ef_construct,
+            hnsw_ef=hnsw_ef,
+            on_disk_vectors=on_disk_vectors,
             entity_extraction_algorithm=entity_extraction,
             relationship_extraction_algorithm=relationship_extraction,
             clustering_algorithm=clustering,
@@ -229,6 +262,13 @@ def cmd_show(ctx: AppContext, args: argparse.Namespace) -> None:
                     IO.print(f"  Embedding Algorithm: {rag_config.embedding_algorithm}")
                     IO.print(f"  Top K: {rag_config.top_k}")
                     IO.print(f"  Rerank Algorithm: {rag_config.rerank_algorithm}")
+                    IO.print(f"  Quantization: {rag_config.quantization}")
+                    IO.print(f"  On-disk Vectors: {rag_config.on_disk_vectors}")
+                    IO.print(
+                        f"  HNSW: m={rag_config.hnsw_m}, "
+                        f"ef_construct={rag_config.hnsw_ef_construct}, "
+                        f"ef={rag_config.hnsw_ef or 'default'}"
+                    )
                 else:
                     IO.print("Vector RAG Configuration: Not configured")
             elif workspace.rag_type == "graph":
@@ -344,3 +384,24 @@ def cmd_select(ctx: AppContext, args: argparse.Namespace) -> None:
         IO.print_error(f"Error: {e}")
         logger.error(f"Failed to select workspace: {e}")
         sys.exit(1)
+
+
+def cmd_communities(ctx: AppContext, args: argparse.Namespace) -> None:
+    """Rebuild graph communities for a workspace."""
+    try:
+        # Create Request DTO with Pydantic validation
+        request = RebuildCommunitiesRequest(workspace_id=args.workspace_id)
+
+        # Call orchestrator
+        IO.print(f"Rebuilding communities for workspace {args.workspace_id}...")
+        result = ctx.workspace_orchestrator.rebuild_communities(request)
+        stored = ResultHandler.unwrap_or_exit(result, "rebuild communities")
+        IO.print(f"Stored {stored} communities")
+
+    except PydanticValidationError as e:
+        IO.print_error(f"Error: {e}")
+        sys.exit(1)
+    except Exception as e:
+        IO.print_error(f"Error: {e}")
+        logger.error(f"Failed to rebuild communities: {e}")
+        sys.exit(1)
@@ -1,7 +1,5 @@
 """Workspace data access layer - coordinates cache and repository."""
 
-import json
-from datetime import UTC, datetime
 from typing import Optional
 
 from returns.result import Failure, Result, Success
@@ -39,23 +37,10 @@ class WorkspaceDataAccess:
             Workspace if found, None otherwise
         """
         # Try cache first
-        cache_key = CacheKeys.workspace(workspace_id)
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            try:
-                data = json.loads(cached_json)
-                return Workspace(
-                    id=data["id"],
-                    name=data["name"],
-                    description=data["description"],
-                    rag_type=data["rag_type"],
-                    status=data["status"],
-                    created_at=datetime.fromisoformat(data["created_at"]),
-                    updated_at=datetime.fromisoformat(data["updated_at"]),
-                )
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning(f"Cache deserialization error for workspace {workspace_id}: {e}")
+        if self.cache:
+            cached = self.cache.get_model(CacheKeys.workspace(workspace_id), Workspace)
+            if cached:
+                return cached
 
         # Cache miss - fetch from database
         workspace = self.repository.get_by_id(workspace_id)
@@ -73,10 +58,10 @@ class WorkspaceDataAccess:
         """
         # Try cache first
         cache_key = CacheKeys.workspaces_all()
-        cached_json = self.cache.get(cache_key) if self.cache else None
+        cached_ids = self.cache.get(cache_key) if self.cache else None
 
-        if cached_json:
-            cached_workspaces = self._try_get_cached_workspaces(cache_key, cached_json)
+        if isinstance(cached_ids, list):
+            cached_workspaces = self._try_get_cached_workspaces(cache_key, cached_ids)
             if cached_workspaces is not None:
                 return cached_workspaces
 
@@ -85,35 +70,31 @@ class WorkspaceDataAccess:
 
         # Cache the result
         if self.cache and workspaces:
-            cache_value = json.dumps([ws.id for ws in workspaces])
-            self.cache.set(cache_key, cache_value, ttl=180)  # Cache for 3 minutes
+            self.cache.set(cache_key, [ws.id for ws in workspaces], ttl=180)  # Cache for 3 minutes
             # Also cache individual workspaces
-            for ws in workspaces:
-                self._cache_workspace(ws)
+            self.cache.set_many(
+                {CacheKeys.workspace(ws.id): ws for ws in workspaces}, ttl=300
+            )  # Cache for 5 minutes
 
         return workspaces
 
     def _try_get_cached_workspaces(
-        self, cache_key: str, cached_json: str
+        self, cache_key: str, workspace_ids: list[int]
     ) -> Optional[list[Workspace]]:
         """Try to retrieve workspaces from cache.
 
         Returns:
             List of workspaces if all found, None if any missing or invalid
         """
-        try:
-            workspace_ids = json.loads(cached_json)
-            workspaces = []
-            for ws_id in workspace_ids:
-                ws = self.get_by_id(ws_id)
-                if not ws:
-                    if self.cache:
-                        self.cache.delete(cache_key)
-                    return None
-                workspaces.append(ws)
-            return workspaces
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return None
+        workspaces = []
+        for ws_id in workspace_ids:
+            ws = self.get_by_id(ws_id)
+            if not ws:
+                if self.cache:
+                    self.cache.delete(cache_key)
+                return None
+            workspaces.append(ws)
+        return workspaces
 
     def create(
         self, name: str, description: Optional[str], rag_type: str, status: str = "provisioning"
@@ -167,7 +148,10 @@ class WorkspaceDataAccess:
 
         result = self.repository.update(workspace_id, **kwargs)
         if result:
-            self._invalidate_cache(workspace_id)
+            if self.cache:
+                self.cache.delete_many(
+                    [CacheKeys.workspace(workspace_id), CacheKeys.workspaces_all()]
+                )
             return True
         return False
 
@@ -194,34 +178,59 @@ class WorkspaceDataAccess:
         if not self.cache:
             return
 
-        cache_key = CacheKeys.workspace(workspace.id)
-        cache_value = json.dumps(
-            {
-                "id": workspace.id,
-                "name": workspace.name,
-                "description": workspace.description,
-                "rag_type": workspace.rag_type,
-                "status": workspace.status,
-                "created_at": workspace.created_at.isoformat(),
-                "updated_at": workspace.updated_at.isoformat(),
-            }
-        )
-        self.cache.set(cache_key, cache_value, ttl=300)  # Cache for 5 minutes
+        self.cache.set(CacheKeys.workspace(workspace.id), workspace, ttl=300)  # Cache for 5 minutes
 
     def _invalidate_cache(self, workspace_id: int) -> None:
-        """Invalidate workspace cache.
+        """Invalidate workspace cache, including every key scoped to the workspace.
 
         Args:
             workspace_id: Workspace ID to invalidate
         """
         if self.cache:
-            cache_key = CacheKeys.workspace(workspace_id)
-            self.cache.delete(cache_key)
-            # Also invalidate the all workspaces list cache
-            self.cache.delete(CacheKeys.workspaces_all())
-            # Invalidate RAG configs as well
-            self.cache.delete(CacheKeys.workspace_vector_config(workspace_id))
-            self.cache.delete(CacheKeys.workspace_graph_config(workspace_id))
+            self.cache.delete_many(
+                [
+                    CacheKeys.workspace(workspace_id),
+                    # Also invalidate the all workspaces list cache
+                    CacheKeys.workspaces_all(),
+                ]
+            )
+            self.invalidate_workspace_scope(workspace_id)
+
+    def invalidate_workspace_scope(self, workspace_id: int) -> None:
+        """Invalidate every cached entry scoped to a workspace in O(1).
+
+        Bumps the workspace's cache generation, so RAG configs, document and
+        chat session lists and anything else keyed by the generation are no
+        longer reachable. No keys are scanned or deleted.
+
+        Args:
+            workspace_id: Workspace ID
+        """
+        if self.cache:
+            self.cache.bump_generation(CacheKeys.workspace_generation(workspace_id))
+
+    def cache_generation(self, workspace_id: int) -> Optional[int]:
+        """Get the workspace's current cache generation.
+
+        Callers can memoize anything derived from the workspace's configuration
+        against this value; it changes whenever the workspace is reconfigured
+        or deleted.
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            Current generation, or None when there is no cache to track it
+        """
+        if not self.cache:
+            return None
+        return self._generation(workspace_id)
+
+    def _generation(self, workspace_id: int) -> int:
+        """Get the workspace's current cache generation."""
+        if not self.cache:
+            return 0
+        return self.cache.get_generation(CacheKeys.workspace_generation(workspace_id))
 
     def get_vector_rag_config(self, workspace_id: int) -> Optional[VectorRagConfig]:
         """Get vector RAG config for workspace with caching.
@@ -233,37 +242,13 @@ class WorkspaceDataAccess:
             VectorRagConfig if found, None otherwise
         """
         # Try cache first
-        cache_key = CacheKeys.workspace_vector_config(workspace_id)
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            try:
-                data = json.loads(cached_json)
-                return VectorRagConfig(
-                    workspace_id=data["workspace_id"],
-                    embedding_model_vector_size=data.get("embedding_model_vector_size", 384),
-                    distance_metric=data.get("distance_metric", "cosine"),
-                    embedding_algorithm=data["embedding_algorithm"],
-                    chunking_algorithm=data["chunking_algorithm"],
-                    rerank_algorithm=data["rerank_algorithm"],
-                    chunk_size=data["chunk_size"],
-                    chunk_overlap=data["chunk_overlap"],
-                    top_k=data["top_k"],
-                    created_at=(
-                        datetime.fromisoformat(data["created_at"])
-                        if data.get("created_at")
-                        else datetime.now(UTC)
-                    ),
-                    updated_at=(
-                        datetime.fromisoformat(data["updated_at"])
-                        if data.get("updated_at")
-                        else datetime.now(UTC)
-                    ),
-                )
-            except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
-                logger.warning(
-                    f"Cache deserialization error for vector RAG config {workspace_id}: {e}"
-                )
+        if self.cache:
+            cached = self.cache.get_model(
+                CacheKeys.workspace_vector_config(workspace_id, self._generation(workspace_id)),
+                VectorRagConfig,
+            )
+            if cached:
+                return cached
 
         # Cache miss - fetch from database
         config = self.repository.get_vector_rag_config(workspace_id)
@@ -283,41 +268,13 @@ class WorkspaceDataAccess:
             GraphRagConfig if found, None otherwise
         """
         # Try cache first
-        cache_key = CacheKeys.workspace_graph_config(workspace_id)
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            try:
-                data = json.loads(cached_json)
-                return GraphRagConfig(
-                    workspace_id=data["workspace_id"],
-                    entity_extraction_algorithm=data["entity_extraction_algorithm"],
-                    relationship_extraction_algorithm=data["relationship_extraction_algorithm"],
-                    clustering_algorithm=data["clustering_algorithm"],
-                    entity_types=data.get("entity_types", []),
-                    relationship_types=data.get("relationship_types", []),
-                    max_traversal_depth=data.get("max_traversal_depth", 2),
-                    top_k_entities=data.get("top_k_entities", 10),
-                    top_k_communities=data.get("top_k_communities", 3),
-                    include_entity_neighborhoods=data.get("include_entity_neighborhoods", True),
-                    community_min_size=data.get("community_min_size", 3),
-                    clustering_resolution=data.get("clustering_resolution", 1.0),
-                    clustering_max_level=data.get("clustering_max_level", 3),
-                    created_at=(
-                        datetime.fromisoformat(data["created_at"])
-                        if data.get("created_at")
-                        else datetime.now(UTC)
-                    ),
-                    updated_at=(
-                        datetime.fromisoformat(data["updated_at"])
-                        if data.get("updated_at")
-                        else datetime.now(UTC)
-                    ),
-                )
-            except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
-                logger.warning(
-                    f"Cache deserialization error for graph RAG config {workspace_id}: {e}"
-                )
+        if self.cache:
+            cached = self.cache.get_model(
+                CacheKeys.workspace_graph_config(workspace_id, self._generation(workspace_id)),
+                GraphRagConfig,
+            )
+            if cached:
+                return cached
 
         # Cache miss - fetch from database
         config = self.repository.get_graph_rag_config(workspace_id)
@@ -337,24 +294,10 @@ class WorkspaceDataAccess:
         if not self.cache:
             return
 
-        cache_key = CacheKeys.workspace_vector_config(workspace_id)
-        cache_value = json.dumps(
-            {
-                "workspace_id": config.workspace_id,
-                "embedding_model_vector_size": config.embedding_model_vector_size,
-                "distance_metric": config.distance_metric,
-                "embedding_algorithm": config.embedding_algorithm,
-                "chunking_algorithm": config.chunking_algorithm,
-                "rerank_algorithm": config.rerank_algorithm,
-                "chunk_size": config.chunk_size,
-                "chunk_overlap": config.chunk_overlap,
-                "top_k": config.top_k,
-                "created_at": config.created_at.isoformat() if config.created_at else None,
-                "updated_at": config.updated_at.isoformat() if config.updated_at else None,
-            }
-        )
         self.cache.set(
-            cache_key, cache_value, ttl=600
+            CacheKeys.workspace_vector_config(workspace_id, self._generation(workspace_id)),
+            config,
+            ttl=600,
         )  # Cache for 10 minutes (configs change less frequently)
 
     def _cache_graph_rag_config(self, workspace_id: int, config: GraphRagConfig) -> None:
@@ -367,28 +310,10 @@ class WorkspaceDataAccess:
         if not self.cache:
             return
 
-        cache_key = CacheKeys.workspace_graph_config(workspace_id)
-        cache_value = json.dumps(
-            {
-                "workspace_id": config.workspace_id,
-                "entity_extraction_algorithm": config.entity_extraction_algorithm,
-                "relationship_extraction_algorithm": config.relationship_extraction_algorithm,
-                "clustering_algorithm": config.clustering_algorithm,
-                "entity_types": config.entity_types,
-                "relationship_types": config.relationship_types,
-                "max_traversal_depth": config.max_traversal_depth,
-                "top_k_entities": config.top_k_entities,
-                "top_k_communities": config.top_k_communities,
-                "include_entity_neighborhoods": config.include_entity_neighborhoods,
-                "community_min_size": config.community_min_size,
-                "clustering_resolution": config.clustering_resolution,
-                "clustering_max_level": config.clustering_max_level,
-                "created_at": config.created_at.isoformat() if config.created_at else None,
-                "updated_at": config.updated_at.isoformat() if config.updated_at else None,
-            }
-        )
         self.cache.set(
-            cache_key, cache_value, ttl=600
+            CacheKeys.workspace_graph_config(workspace_id, self._generation(workspace_id)),
+            config,
+            ttl=600,
         )  # Cache for 10 minutes (configs change less frequently)
 
     def update_vector_rag_config(
@@ -404,10 +329,9 @@ class WorkspaceDataAccess:
         """
         result = self.repository.update_vector_rag_config(config)
 
-        # Invalidate cache on success
-        if isinstance(result, Success) and self.cache:
-            cache_key = CacheKeys.workspace_vector_config(config.workspace_id)
-            self.cache.delete(cache_key)
+        # Reconfiguring invalidates everything cached for the workspace
+        if isinstance(result, Success):
+            self.invalidate_workspace_scope(config.workspace_id)
 
         return result
 
@@ -424,10 +348,9 @@ class WorkspaceDataAccess:
         """
         result = self.repository.update_graph_rag_config(config)
 
-        # Invalidate cache on success
-        if isinstance(result, Success) and self.cache:
-            cache_key = CacheKeys.workspace_graph_config(config.workspace_id)
-            self.cache.delete(cache_key)
+        # Reconfiguring invalidates everything cached for the workspace
+        if isinstance(result, Success):
+            self.invalidate_workspace_scope(config.workspace_id)
 
         return result
 
@@ -442,10 +365,9 @@ class WorkspaceDataAccess:
         """
         success = self.repository.delete_vector_rag_config(workspace_id)
 
-        # Invalidate cache on success
-        if success and self.cache:
-            cache_key = CacheKeys.workspace_vector_config(workspace_id)
-            self.cache.delete(cache_key)
+        # Reconfiguring invalidates everything cached for the workspace
+        if success:
+            self.invalidate_workspace_scope(workspace_id)
 
         return success
 
@@ -460,9 +382,8 @@ class WorkspaceDataAccess:
         """
         success = self.repository.delete_graph_rag_config(workspace_id)
 
-        # Invalidate cache on success
-        if success and self.cache:
-            cache_key = CacheKeys.workspace_graph_config(workspace_id)
-            self.cache.delete(cache_key)
+        # Reconfiguring invalidates everything cached for the workspace
+        if success:
+            self.invalidate_workspace_scope(workspace_id)
 
         return success
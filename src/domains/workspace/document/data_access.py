@@ -1,8 +1,6 @@
 """Document data access layer - coordinates cache and repository."""
 
-import json
-from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from returns.result import Failure, Result, Success
 
@@ -39,27 +37,10 @@ class DocumentDataAccess:
             Document if found, None otherwise
         """
         # Try cache first
-        cache_key = CacheKeys.document(document_id)
-        cached_json = self.cache.get(cache_key) if self.cache else None
-
-        if cached_json:
-            try:
-                data = json.loads(cached_json)
-                return Document(
-                    id=data["id"],
-                    workspace_id=data["workspace_id"],
-                    filename=data["filename"],
-                    file_path=data["file_path"],
-                    file_size=data["file_size"],
-                    mime_type=data["mime_type"],
-                    content_hash=data["content_hash"],
-                    chunk_count=data["chunk_count"],
-                    status=data["status"],
-                    created_at=datetime.fromisoformat(data["created_at"]),
-                    updated_at=datetime.fromisoformat(data["updated_at"]),
-                )
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning(f"Cache deserialization error for document {document_id}: {e}")
+        if self.cache:
+            cached = self.cache.get_model(CacheKeys.document(document_id), Document)
+            if cached:
+                return cached
 
         # Cache miss - fetch from database
         document = self.repository.get_by_id(document_id)
@@ -79,11 +60,11 @@ class DocumentDataAccess:
             List of documents
         """
         # Try cache first for the document list
-        cache_key = CacheKeys.workspace_documents(workspace_id)
-        cached_json = self.cache.get(cache_key) if self.cache else None
+        cache_key = self._workspace_documents_key(workspace_id)
+        cached_ids = self.cache.get(cache_key) if self.cache else None
 
-        if cached_json:
-            cached_docs = self._try_get_cached_documents(workspace_id, cached_json)
+        if isinstance(cached_ids, list):
+            cached_docs = self._try_get_cached_documents(workspace_id, cached_ids)
             if cached_docs is not None:
                 return cached_docs
 
@@ -93,31 +74,48 @@ class DocumentDataAccess:
         # Cache the result
         if self.cache:
             self._cache_workspace_documents(workspace_id, documents)
-            for doc in documents:
-                self._cache_document(doc)
+            self._cache_documents(documents)
 
         return documents
 
     def _try_get_cached_documents(
-        self, workspace_id: int, cached_json: str
+        self, workspace_id: int, doc_ids: list[int]
     ) -> Optional[list[Document]]:
         """Try to retrieve documents from cache.
 
+        Cached documents are fetched with one multi-get; any that are not cached
+        are loaded with one database query and cached.
+
         Returns:
             List of documents if all found, None if any missing or invalid
         """
-        try:
-            doc_ids = json.loads(cached_json)
-            documents = []
-            for doc_id in doc_ids:
-                doc = self.get_by_id(doc_id)
-                if not doc:
-                    self._invalidate_workspace_documents_cache(workspace_id)
-                    return None
-                documents.append(doc)
-            return documents
-        except (json.JSONDecodeError, KeyError, ValueError):
+        documents = self._get_many(doc_ids)
+        if documents is None:
+            self._invalidate_workspace_documents_cache(workspace_id)
+        return documents
+
+    def _get_many(self, document_ids: list[int]) -> Optional[list[Document]]:
+        """Get documents by ID in order, batching cache and database lookups.
+
+        Returns:
+            Documents in the order of document_ids, or None if any is missing
+        """
+        found: dict[int, Document] = {}
+        if self.cache:
+            cached = self.cache.get_models(
+                [CacheKeys.document(doc_id) for doc_id in document_ids], Document
+            )
+            found.update((document.id, document) for document in cached.values())
+
+        missing = [doc_id for doc_id in document_ids if doc_id not in found]
+        if missing:
+            loaded = self.repository.get_by_ids(missing)
+            self._cache_documents(loaded)
+            found.update((document.id, document) for document in loaded)
+
+        if any(doc_id not in found for doc_id in document_ids):
             return None
+        return [found[doc_id] for doc_id in document_ids]
 
     def create(
         self,
@@ -172,8 +170,8 @@ class DocumentDataAccess:
         document_id: int,
         chunk_count: Optional[int] = None,
         status: Optional[str] = None,
-    ) -> bool:
-        """Update document.
+    ) -> Optional[Document]:
+        """Update document status and/or chunk count in one write.
 
         Args:
             document_id: Document ID
@@ -181,17 +179,20 @@ class DocumentDataAccess:
             status: Optional new status
 
         Returns:
-            True if updated successfully
+            Updated document, or None if not found or the update failed
         """
-        # Use update_status method which matches the signature
-        result = self.repository.update_status(
-            document_id=document_id,
-            status=status or "processing",
-            chunk_count=chunk_count,
-        )
-        if result:
+        fields: dict[str, Any] = {}
+        if chunk_count is not None:
+            fields["chunk_count"] = chunk_count
+        if status is not None:
+            fields["status"] = status
+
+        document = self.repository.update(document_id, **fields)
+        if document:
+            self._cache_document(document)
+        else:
             self._invalidate_cache(document_id)
-        return result
+        return document
 
     def delete(self, document_id: int) -> bool:
         """Delete document.
@@ -219,26 +220,21 @@ class DocumentDataAccess:
         Args:
             document: Document to cache
         """
-        if not self.cache:
+        self._cache_documents([document])
+
+    def _cache_documents(self, documents: list[Document]) -> None:
+        """Cache several documents in one batch.
+
+        Args:
+            documents: Documents to cache
+        """
+        if not self.cache or not documents:
             return
 
-        cache_key = CacheKeys.document(document.id)
-        cache_value = json.dumps(
-            {
-                "id": document.id,
-                "workspace_id": document.workspace_id,
-                "filename": document.filename,
-                "file_path": document.file_path,
-                "file_size": document.file_size,
-                "mime_type": document.mime_type,
-                "content_hash": document.content_hash,
-                "chunk_count": document.chunk_count,
-                "status": document.status,
-                "created_at": document.created_at.isoformat(),
-                "updated_at": document.updated_at.isoformat(),
-            }
+        self.cache.set_many(
+            {CacheKeys.document(document.id): document for document in documents},
+            ttl=300,  # Cache for 5 minutes
         )
-        self.cache.set(cache_key, cache_value, ttl=300)  # Cache for 5 minutes
 
     def _invalidate_cache(self, document_id: int) -> None:
         """Invalidate document cache.
@@ -260,9 +256,17 @@ class DocumentDataAccess:
         if not self.cache:
             return
 
-        cache_key = CacheKeys.workspace_documents(workspace_id)
-        cache_value = json.dumps([doc.id for doc in documents])
-        self.cache.set(cache_key, cache_value, ttl=180)  # Cache for 3 minutes
+        cache_key = self._workspace_documents_key(workspace_id)
+        self.cache.set(cache_key, [doc.id for doc in documents], ttl=180)  # Cache for 3 minutes
+
+    def _workspace_documents_key(self, workspace_id: int) -> str:
+        """Cache key for the workspace documents list at the current workspace generation."""
+        generation = (
+            self.cache.get_generation(CacheKeys.workspace_generation(workspace_id))
+            if self.cache
+            else 0
+        )
+        return CacheKeys.workspace_documents(workspace_id, generation)
 
     def _invalidate_workspace_documents_cache(self, workspace_id: int) -> None:
         """Invalidate workspace documents list cache.
@@ -271,5 +275,5 @@ class DocumentDataAccess:
             workspace_id: Workspace ID
         """
         if self.cache:
-            cache_key = CacheKeys.workspace_documents(workspace_id)
+            cache_key = self._workspace_documents_key(workspace_id)
             self.cache.delete(cache_key)
@@ -103,6 +103,27 @@ class DocumentRepository:
             return Document(**result)
         return None
 
+    def get_by_ids(self, document_ids: list[int]) -> list[Document]:
+        """Get several documents by ID in one query (missing IDs are skipped)."""
+        if not document_ids:
+            return []
+
+        query = """
+            SELECT
+                id, workspace_id, filename, original_filename,
+                size_bytes as file_size, mime_type, chunk_count, status,
+                error_message, file_hash as content_hash, storage_path as file_path,
+                created_at, updated_at
+            FROM documents WHERE id = ANY(%s)
+        """
+        try:
+            results = self.db.fetch_all(query, (list(document_ids),))
+        except DatabaseException as e:
+            logger.error(f"Database error getting documents by ids: {e}")
+            return []
+
+        return [Document(**result) for result in results]
+
     def get_by_content_hash(self, content_hash: str) -> Optional[Document]:
         """Get document by content hash."""
         query = """
@@ -145,57 +166,57 @@ class DocumentRepository:
 
         return [Document(**result) for result in results]
 
+    # Document fields that can be updated, mapped to their database columns
+    _UPDATABLE_COLUMNS = {
+        "filename": "filename",
+        "file_size": "size_bytes",
+        "mime_type": "mime_type",
+        "chunk_count": "chunk_count",
+        "status": "status",
+        "error_message": "error_message",
+    }
+
     def update(self, document_id: int, **kwargs) -> Optional[Document]:
-        """Update document fields."""
-        # Get current document
-        document = self.get_by_id(document_id)
-        if not document:
-            return None
+        """Update document fields in a single statement.
 
-        # Update fields
-        for key, value in kwargs.items():
-            if hasattr(document, key):
-                setattr(document, key, value)
+        Only the given fields are written. Returns the updated document, or None
+        if it does not exist or the update fails.
 
-        # Update in database (only DB fields)
-        query = """
+        Raises:
+            DatabaseException: If the update fails inside SqlDatabase.transaction()
+        """
+        columns = [
+            (self._UPDATABLE_COLUMNS[key], value)
+            for key, value in kwargs.items()
+            if key in self._UPDATABLE_COLUMNS
+        ]
+        if not columns:
+            return self.get_by_id(document_id)
+
+        assignments = ", ".join(f"{column} = %s" for column, _ in columns)
+        query = f"""
             UPDATE documents
-            SET filename = %s, size_bytes = %s, mime_type = %s, chunk_count = %s, status = %s
+            SET {assignments}
             WHERE id = %s
+            RETURNING
+                id, workspace_id, filename, original_filename,
+                size_bytes as file_size, mime_type, chunk_count, status,
+                error_message, file_hash as content_hash, storage_path as file_path,
+                created_at, updated_at
         """
         try:
-            self.db.execute(
-                query,
-                (
-                    document.filename,
-                    document.file_size,
-                    document.mime_type,
-                    document.chunk_count,
-                    document.status,
-                    document_id,
-                ),
-            )
+            result = self.db.fetch_one(query, tuple(value for _, value in columns) + (document_id,))
         except DatabaseException as e:
             logger.error(f"Database error updating document: {e}")
+            if self.db.in_transaction:
+                # The transaction is aborted; let it roll back instead of
+                # reporting the document as missing
+                raise
             return None
 
-        return document
-
-    def update_status(
-        self,
-        document_id: int,
-        status: str,
-        error: Optional[str] = None,
-        chunk_count: Optional[int] = None,
-    ) -> bool:
-        """Update document processing status."""
-        query = """
-            UPDATE documents
-            SET status = %s, chunk_count = COALESCE(%s, chunk_count)
-            WHERE id = %s
-        """
-        affected_rows = self.db.execute(query, (status, chunk_count, document_id))
-        return affected_rows > 0
+        if result:
+            return Document(**result)
+        return None
 
     def count_by_workspace(self, workspace_id: int, status_filter: Optional[str] = None) -> int:
         """Count document in workspace with optional status filter."""
@@ -114,16 +114,18 @@ class DocumentService:
             logger.error(f"Document processing failed: {process_result.failure().message}")
             return Failure(process_result.failure())
 
-        # Update status to ready
-        self.data_access.update(document.id, status=DocumentStatus.READY.value)
-        logger.info(f"Document processed successfully: document_id={document.id}")
+        chunks_indexed = process_result.unwrap()
 
-        # Reload document with updated status (data_access handles caching)
-        reloaded_document = self.data_access.get_by_id(document.id)
-        if not reloaded_document:
+        # Record the chunk count and mark the document ready in one statement
+        # (the updated row is returned, so no reload is needed)
+        ready_document = self.data_access.update(
+            document.id, chunk_count=chunks_indexed, status=DocumentStatus.READY.value
+        )
+        if not ready_document:
             return Failure(NotFoundError("document", document.id))
 
-        return Success(reloaded_document)
+        logger.info(f"Document processed successfully: document_id={document.id}")
+        return Success(ready_document)
 
     def _process_document(
         self,
@@ -137,7 +139,8 @@ class DocumentService:
             document: Document record
             file_content: File content as bytes
         Returns:
-            Result containing number of chunks indexed, or error
+            Result containing number of chunks indexed, or error (the caller
+            records the chunk count)
         """
         logger.info(f"Processing document {document.id} through RAG workflow")
 
@@ -174,14 +177,8 @@ class DocumentService:
             )
 
         chunks_indexed = result.unwrap()
-
-        # Update status: indexing complete (workflow finished successfully)
-        self.data_access.update(document.id, status=DocumentStatus.INDEXED.value)
         logger.info(f"Document {document.id}: {chunks_indexed} chunks indexed")
 
-        # Update chunk count
-        self.data_access.update(document.id, chunk_count=chunks_indexed)
-
         return Success(chunks_indexed)
 
     def _build_rag_config(self, workspace: Workspace) -> dict[str, Any]:
@@ -4,7 +4,12 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
-from src.infrastructure.rag.options import get_valid_rag_types, is_valid_rag_type
+from src.infrastructure.rag.options import (
+    get_valid_quantizations,
+    get_valid_rag_types,
+    is_valid_quantization,
+    is_valid_rag_type,
+)
 
 # ============================================================================
 # Request DTOs (User Input) - Pydantic models with validation
@@ -25,9 +30,16 @@ class CreateWorkspaceRequest(BaseModel):
     embedding_algorithm: Optional[str] = Field(None, description="Embedding algorithm")
     top_k: Optional[int] = Field(None, ge=1, description="Top K results")
     rerank_algorithm: Optional[str] = Field(None, description="Reranking algorithm")
+    quantization: Optional[str] = Field(None, description="Vector quantization")
+    hnsw_m: Optional[int] = Field(None, ge=4, description="HNSW edges per node")
+    hnsw_ef_construct: Optional[int] = Field(None, ge=4, description="HNSW build beam width")
+    hnsw_ef: Optional[int] = Field(None, ge=1, description="HNSW search beam width")
+    on_disk_vectors: Optional[bool] = Field(None, description="Store original vectors on disk")
 
     # Graph RAG configuration
-    entity_extraction_algorithm: Optional[str] = Field(None, description="Entity extraction algorithm")
+    entity_extraction_algorithm: Optional[str] = Field(
+        None, description="Entity extraction algorithm"
+    )
     relationship_extraction_algorithm: Optional[str] = Field(
         None, description="Relationship extraction algorithm"
     )
@@ -62,6 +74,17 @@ class CreateWorkspaceRequest(BaseModel):
             raise ValueError(f"Invalid rag_type. Must be one of: {', '.join(valid_types)}")
         return v
 
+    @field_validator("quantization")
+    @classmethod
+    def validate_quantization(cls, v: Optional[str]) -> Optional[str]:
+        """Validate vector quantization if provided."""
+        if v is None:
+            return None
+        if not is_valid_quantization(v):
+            valid_values = get_valid_quantizations()
+            raise ValueError(f"Invalid quantization. Must be one of: {', '.join(valid_values)}")
+        return v
+
     model_config = {"str_strip_whitespace": True, "validate_assignment": True}
 
 
@@ -115,6 +138,12 @@ class SelectWorkspaceRequest(BaseModel):
     workspace_id: int = Field(..., gt=0, description="Workspace ID to select")
 
 
+class RebuildCommunitiesRequest(BaseModel):
+    """Request DTO for rebuilding graph communities with validation."""
+
+    workspace_id: int = Field(..., gt=0, description="Workspace ID to rebuild communities for")
+
+
 # ============================================================================
 # Response DTOs (Service Output) - Pydantic models for consistent serialization
 # ============================================================================
@@ -149,6 +178,11 @@ class VectorRagConfigResponse(BaseModel):
     chunk_size: int
     chunk_overlap: int
     top_k: int
+    quantization: str
+    hnsw_m: int
+    hnsw_ef_construct: int
+    hnsw_ef: Optional[int]
+    on_disk_vectors: bool
 
     model_config = {"from_attributes": True}
 
@@ -76,6 +76,11 @@ class VectorRagConfigMapper:
             chunk_size=config.chunk_size,
             chunk_overlap=config.chunk_overlap,
             top_k=config.top_k,
+            quantization=config.quantization,
+            hnsw_m=config.hnsw_m,
+            hnsw_ef_construct=config.hnsw_ef_construct,
+            hnsw_ef=config.hnsw_ef,
+            on_disk_vectors=config.on_disk_vectors,
         )
 
 
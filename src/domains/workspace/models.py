@@ -100,6 +100,11 @@ class VectorRagConfig:
     chunk_size: int = 1000
     chunk_overlap: int = 200
     top_k: int = 5
+    quantization: str = "none"  # "none", "scalar" or "binary"
+    hnsw_m: int = 16
+    hnsw_ef_construct: int = 100
+    hnsw_ef: Optional[int] = None  # None uses the collection's ef_construct
+    on_disk_vectors: bool = False
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
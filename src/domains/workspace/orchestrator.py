@@ -11,6 +11,7 @@ from returns.result import Failure, Result, Success
 from src.domains.workspace.dtos import (
     CreateWorkspaceRequest,
     DeleteWorkspaceRequest,
+    RebuildCommunitiesRequest,
     SelectWorkspaceRequest,
     ShowWorkspaceRequest,
     UpdateWorkspaceRequest,
@@ -23,6 +24,7 @@ from src.domains.workspace.service import WorkspaceService
 from src.domains.workspace.validation import (
     validate_create_workspace,
     validate_delete_workspace,
+    validate_rebuild_communities,
     validate_select_workspace,
     validate_show_workspace,
     validate_update_workspace,
@@ -86,6 +88,11 @@ class WorkspaceOrchestrator:
             embedding_algorithm=validated_request.embedding_algorithm,
             top_k=validated_request.top_k,
             rerank_algorithm=validated_request.rerank_algorithm,
+            quantization=validated_request.quantization,
+            hnsw_m=validated_request.hnsw_m,
+            hnsw_ef_construct=validated_request.hnsw_ef_construct,
+            hnsw_ef=validated_request.hnsw_ef,
+            on_disk_vectors=validated_request.on_disk_vectors,
             # Graph RAG config
             entity_extraction_algorithm=validated_request.entity_extraction_algorithm,
             relationship_extraction_algorithm=validated_request.relationship_extraction_algorithm,
@@ -214,6 +221,32 @@ class WorkspaceOrchestrator:
         # Map to response
         return Success(WorkspaceMapper.to_response(workspace))
 
+    def rebuild_communities(
+        self,
+        request: RebuildCommunitiesRequest,
+    ) -> Result[int, ValidationError | NotFoundError | WorkflowError]:
+        """Orchestrate a full community rebuild for a Graph RAG workspace.
+
+        Args:
+            request: Rebuild communities request DTO
+
+        Returns:
+            Result with number of communities stored or error
+        """
+        # Validate
+        validation_result = validate_rebuild_communities(request)
+        if isinstance(validation_result, Failure):
+            return Failure(validation_result.failure())
+
+        validated_request = validation_result.unwrap()
+
+        # Call service
+        service_result = self.service.rebuild_communities(validated_request.workspace_id)
+        if isinstance(service_result, Failure):
+            return Failure(service_result.failure())
+
+        return Success(service_result.unwrap())
+
     def get_workspace_rag_config(self, workspace_id: int) -> Result[tuple[Any, Any], NotFoundError]:
         """Get workspace and its RAG configuration.
 
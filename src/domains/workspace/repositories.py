@@ -144,6 +144,7 @@ class WorkspaceRepository:
             SELECT workspace_id, chunk_size, chunk_overlap, chunking_algorithm,
                    embedding_algorithm, top_k, embedding_model_vector_size,
                    distance_metric, rerank_algorithm,
+                   quantization, hnsw_m, hnsw_ef_construct, hnsw_ef, on_disk_vectors,
                    created_at, updated_at
             FROM vector_rag_configs
             WHERE workspace_id = %s
@@ -165,6 +166,11 @@ class WorkspaceRepository:
                 distance_metric=result["distance_metric"],
                 top_k=result["top_k"],
                 rerank_algorithm=result["rerank_algorithm"],
+                quantization=result["quantization"],
+                hnsw_m=result["hnsw_m"],
+                hnsw_ef_construct=result["hnsw_ef_construct"],
+                hnsw_ef=result["hnsw_ef"],
+                on_disk_vectors=result["on_disk_vectors"],
                 created_at=result["created_at"],
                 updated_at=result["updated_at"],
             )
@@ -224,9 +230,11 @@ class WorkspaceRepository:
             INSERT INTO vector_rag_configs (
                 workspace_id, embedding_model_vector_size, distance_metric,
                 embedding_algorithm, chunking_algorithm, rerank_algorithm,
-                chunk_size, chunk_overlap, top_k, created_at, updated_at
+                chunk_size, chunk_overlap, top_k,
+                quantization, hnsw_m, hnsw_ef_construct, hnsw_ef, on_disk_vectors,
+                created_at, updated_at
             )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         now = datetime.now(UTC)
         try:
@@ -242,6 +250,11 @@ class WorkspaceRepository:
                     config.chunk_size,
                     config.chunk_overlap,
                     config.top_k,
+                    config.quantization,
+                    config.hnsw_m,
+                    config.hnsw_ef_construct,
+                    config.hnsw_ef,
+                    config.on_disk_vectors,
                     now,
                     now,
                 ),
@@ -306,7 +319,9 @@ class WorkspaceRepository:
             UPDATE vector_rag_configs
             SET embedding_model_vector_size = %s, distance_metric = %s,
                 embedding_algorithm = %s, chunking_algorithm = %s, rerank_algorithm = %s,
-                chunk_size = %s, chunk_overlap = %s, top_k = %s, updated_at = %s
+                chunk_size = %s, chunk_overlap = %s, top_k = %s,
+                quantization = %s, hnsw_m = %s, hnsw_ef_construct = %s, hnsw_ef = %s,
+                on_disk_vectors = %s, updated_at = %s
             WHERE workspace_id = %s
         """
         now = datetime.now(UTC)
@@ -322,6 +337,11 @@ class WorkspaceRepository:
                     config.chunk_size,
                     config.chunk_overlap,
                     config.top_k,
+                    config.quantization,
+                    config.hnsw_m,
+                    config.hnsw_ef_construct,
+                    config.hnsw_ef,
+                    config.on_disk_vectors,
                     now,
                     config.workspace_id,
                 ),
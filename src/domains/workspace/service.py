@@ -9,9 +9,18 @@ from src.domains.default_rag_config.service import DefaultRagConfigService
 from src.domains.workspace.data_access import WorkspaceDataAccess
 from src.domains.workspace.models import GraphRagConfig, VectorRagConfig, Workspace, WorkspaceStatus
 from src.infrastructure.logger import create_logger
-from src.infrastructure.rag.rag_config_provider import RagConfigProviderFactory
+from src.infrastructure.rag.options import get_default_quantization
+from src.infrastructure.rag.rag_config_provider import (
+    RagConfigProviderFactory,
+    VectorRagConfigProvider,
+)
+from src.infrastructure.rag.steps.graph_rag.clustering import (
+    CommunityDetectorFactory,
+    refresh_communities,
+)
 from src.infrastructure.rag.workflows.create_resources import CreateResourcesWorkflowFactory
 from src.infrastructure.rag.workflows.remove_resources import RemoveResourcesWorkflowFactory
+from src.infrastructure.store_manager import RAGStoreManager
 from src.infrastructure.types import DatabaseError, NotFoundError, WorkflowError
 
 logger = create_logger(__name__)
@@ -29,6 +38,7 @@ class WorkspaceService:
         data_access: WorkspaceDataAccess,
         default_rag_config_service: DefaultRagConfigService,
         config_provider_factory: RagConfigProviderFactory,
+        rag_store_manager: RAGStoreManager,
     ):
         """Initialize service with data access and default config service.
 
@@ -36,10 +46,12 @@ class WorkspaceService:
             data_access: Workspace data access layer (handles cache + repository)
             default_rag_config_service: Service for default RAG configuration
             config_provider_factory: Factory for RAG config providers
+            rag_store_manager: RAG store manager (needed for graph maintenance)
         """
         self.data_access = data_access
         self.default_rag_config_service = default_rag_config_service
         self.config_provider_factory = config_provider_factory
+        self.rag_store_manager = rag_store_manager
 
     def create_workspace(
         self,
@@ -53,6 +65,11 @@ class WorkspaceService:
         embedding_algorithm: Optional[str] = None,
         top_k: Optional[int] = None,
         rerank_algorithm: Optional[str] = None,
+        quantization: Optional[str] = None,
+        hnsw_m: Optional[int] = None,
+        hnsw_ef_construct: Optional[int] = None,
+        hnsw_ef: Optional[int] = None,
+        on_disk_vectors: Optional[bool] = None,
         # Graph RAG config (optional overrides)
         entity_extraction_algorithm: Optional[str] = None,
         relationship_extraction_algorithm: Optional[str] = None,
@@ -70,6 +87,11 @@ class WorkspaceService:
             embedding_algorithm: Optional override for embedding algorithm
             top_k: Optional override for top K
             rerank_algorithm: Optional override for rerank algorithm
+            quantization: Optional vector quantization ("none", "scalar", "binary")
+            hnsw_m: Optional HNSW edges per node
+            hnsw_ef_construct: Optional HNSW build beam width
+            hnsw_ef: Optional HNSW search beam width
+            on_disk_vectors: Optionally store original vectors on disk
             entity_extraction_algorithm: Optional override for entity extraction
             relationship_extraction_algorithm: Optional override for relationship extraction
             clustering_algorithm: Optional override for clustering algorithm
@@ -84,6 +106,21 @@ class WorkspaceService:
         if not default_config:
             return Failure(WorkflowError("Default RAG configuration not found", "create_workspace"))
 
+        # A shared collection's index is built once for all workspaces, so
+        # per-workspace index options would be stored but never take effect
+        if rag_type == "vector" and self._uses_shared_collection():
+            index_option = _overridden_index_option(
+                quantization, hnsw_m, hnsw_ef_construct, on_disk_vectors
+            )
+            if index_option:
+                return Failure(
+                    WorkflowError(
+                        f"{index_option} cannot be set per workspace when "
+                        "QDRANT_COLLECTION_MODE=shared",
+                        workflow="create_workspace",
+                    )
+                )
+
         # Create workspace in database via data access layer
         workspace_result = self.data_access.create(
             name, description, rag_type, status=WorkspaceStatus.PROVISIONING.value
@@ -112,6 +149,11 @@ class WorkspaceService:
                 chunk_size=chunk_size or default_config.vector_config.chunk_size,
                 chunk_overlap=chunk_overlap or default_config.vector_config.chunk_overlap,
                 top_k=top_k or default_config.vector_config.top_k,
+                quantization=quantization or get_default_quantization(),
+                hnsw_m=hnsw_m or VectorRagConfig.hnsw_m,
+                hnsw_ef_construct=hnsw_ef_construct or VectorRagConfig.hnsw_ef_construct,
+                hnsw_ef=hnsw_ef,
+                on_disk_vectors=bool(on_disk_vectors),
             )
             vector_config_result = self.data_access.repository.create_vector_rag_config(
                 new_vector_config
@@ -230,6 +272,43 @@ class WorkspaceService:
         logger.info(f"RAG resources provisioned for workspace {workspace.id}")
         return Success(None)
 
+    def _uses_shared_collection(self) -> bool:
+        """Whether vector workspaces share one Qdrant collection."""
+        provider = self.config_provider_factory.get_provider("vector")
+        return isinstance(provider, VectorRagConfigProvider) and provider.uses_shared_collection()
+
+    def _apply_vector_index_settings(self, workspace_id: int) -> Result[None, WorkflowError]:
+        """Apply a workspace's stored vector index settings to its existing collection.
+
+        Args:
+            workspace_id: Workspace whose collection is updated
+
+        Returns:
+            Result with None on success or WorkflowError on failure
+        """
+        provider = self.config_provider_factory.get_provider("vector")
+        if not provider:
+            return Failure(
+                WorkflowError("Unknown RAG type: vector", workflow="apply_vector_index_settings")
+            )
+
+        # Provisioning an existing per-workspace collection updates its index settings
+        workflow = CreateResourcesWorkflowFactory.create(
+            provider.build_provisioning_settings(workspace_id)
+        )
+        result = workflow.execute(str(workspace_id))
+
+        if isinstance(result, Failure):
+            return Failure(
+                WorkflowError(
+                    f"Failed to apply vector index settings: {result.failure().message}",
+                    workflow="apply_vector_index_settings",
+                )
+            )
+
+        logger.info(f"Vector index settings applied for workspace {workspace_id}")
+        return Success(None)
+
     def get_workspace(self, workspace_id: int) -> Optional[Workspace]:
         """Get workspace by ID with caching (handled by data access layer)."""
         return self.data_access.get_by_id(workspace_id)
@@ -338,19 +417,103 @@ class WorkspaceService:
         logger.info(f"RAG resources deallocated for workspace {workspace.id}")
         return Success(None)
 
+    def rebuild_communities(self, workspace_id: int) -> Result[int, NotFoundError | WorkflowError]:
+        """Recompute communities for a whole Graph RAG workspace.
+
+        Used after a batch of uploads when GRAPH_COMMUNITY_DETECTION is
+        "deferred", or to repartition from scratch after incremental updates.
+
+        Args:
+            workspace_id: ID of the workspace
+
+        Returns:
+            Result with number of communities stored or error
+        """
+        workspace = self.data_access.get_by_id(workspace_id)
+        if not workspace:
+            return Failure(NotFoundError("workspace", workspace_id))
+
+        if workspace.rag_type != "graph":
+            return Failure(
+                WorkflowError(
+                    f"Workspace {workspace_id} uses {workspace.rag_type} RAG, not graph RAG",
+                    workflow="rebuild_communities",
+                )
+            )
+
+        provider = self.config_provider_factory.get_provider(workspace.rag_type)
+        if not provider:
+            return Failure(
+                WorkflowError(
+                    f"Unknown RAG type: {workspace.rag_type}",
+                    workflow="rebuild_communities",
+                )
+            )
+
+        rag_config = provider.build_indexing_settings(workspace.id)
+        logger.info(f"Rebuilding communities for workspace {workspace.id}")
+
+        try:
+            graph_store = self.rag_store_manager.get_graph_store(rag_config)
+            detector = CommunityDetectorFactory.create(
+                rag_config.get("clustering_algorithm", "leiden"),
+                resolution=rag_config.get("clustering_resolution", 1.0),
+                max_level=rag_config.get("clustering_max_level", 3),
+            )
+            stored = refresh_communities(
+                detector,
+                graph_store,
+                str(workspace.id),
+                community_min_size=rag_config.get("community_min_size", 3),
+            )
+        except Exception as e:
+            return Failure(
+                WorkflowError(
+                    f"Community detection failed: {str(e)}",
+                    workflow="rebuild_communities",
+                )
+            )
+
+        return Success(stored)
+
     def update_workspace_vector_rag_config(
         self, config: VectorRagConfig
-    ) -> Result[VectorRagConfig, DatabaseError]:
+    ) -> Result[VectorRagConfig, DatabaseError | WorkflowError]:
         """
         Update vector RAG configuration for a workspace.
 
+        Changed quantization, HNSW or on-disk settings are applied to the
+        workspace's collection. A shared collection's index is common to all
+        workspaces, so those settings cannot be changed per workspace.
+
         Args:
             config: Updated vector RAG configuration
 
         Returns:
-            Result with updated config or DatabaseError
+            Result with updated config, DatabaseError or WorkflowError
         """
-        return self.data_access.update_vector_rag_config(config)
+        # Compare against the stored row: a cached config may be the object being updated
+        current = self.data_access.repository.get_vector_rag_config(config.workspace_id)
+        index_changed = current is not None and _index_settings(current) != _index_settings(config)
+
+        if index_changed and self._uses_shared_collection():
+            return Failure(
+                WorkflowError(
+                    "Vector index settings cannot be changed per workspace when "
+                    "QDRANT_COLLECTION_MODE=shared",
+                    workflow="update_vector_rag_config",
+                )
+            )
+
+        result = self.data_access.update_vector_rag_config(config)
+        if isinstance(result, Failure) or not index_changed:
+            return result
+
+        apply_result = self._apply_vector_index_settings(config.workspace_id)
+        if isinstance(apply_result, Failure):
+            return Failure(apply_result.failure())
+
+        return result
 
     def update_workspace_graph_rag_config(
         self, config: GraphRagConfig
@@ -384,3 +547,26 @@ class WorkspaceService:
         else:
             logger.error(f"Invalid RAG type: {rag_type}")
             return False
+
+
+def _index_settings(config: VectorRagConfig) -> tuple[str, int, int, bool]:
+    """Collection-level index settings of a vector RAG config."""
+    return (config.quantization, config.hnsw_m, config.hnsw_ef_construct, config.on_disk_vectors)
+
+
+def _overridden_index_option(
+    quantization: Optional[str],
+    hnsw_m: Optional[int],
+    hnsw_ef_construct: Optional[int],
+    on_disk_vectors: Optional[bool],
+) -> Optional[str]:
+    """Name of the first collection-level index option overridden, if any."""
+    if quantization not in (None, "none"):
+        return "quantization"
+    if hnsw_m is not None:
+        return "hnsw_m"
+    if hnsw_ef_construct is not None:
+        return "hnsw_ef_construct"
+    if on_disk_vectors:
+        return "on_disk_vectors"
+    return None
@@ -10,6 +10,7 @@ from returns.result import Failure, Result, Success
 from src.domains.workspace.dtos import (
     CreateWorkspaceRequest,
     DeleteWorkspaceRequest,
+    RebuildCommunitiesRequest,
     SelectWorkspaceRequest,
     ShowWorkspaceRequest,
     UpdateWorkspaceRequest,
@@ -45,6 +46,11 @@ def validate_create_workspace(
                 embedding_algorithm=request.embedding_algorithm,
                 top_k=request.top_k,
                 rerank_algorithm=request.rerank_algorithm,
+                quantization=request.quantization,
+                hnsw_m=request.hnsw_m,
+                hnsw_ef_construct=request.hnsw_ef_construct,
+                hnsw_ef=request.hnsw_ef,
+                on_disk_vectors=request.on_disk_vectors,
                 # Graph RAG config
                 entity_extraction_algorithm=request.entity_extraction_algorithm,
                 relationship_extraction_algorithm=request.relationship_extraction_algorithm,
@@ -139,3 +145,18 @@ def validate_select_workspace(
     """
     # Pydantic Field(gt=0) already validates workspace_id > 0
     return Success(request)
+
+
+def validate_rebuild_communities(
+    request: RebuildCommunitiesRequest,
+) -> Result[RebuildCommunitiesRequest, ValidationError]:
+    """Validate rebuild communities input.
+
+    Args:
+        request: Request DTO (already validated by Pydantic)
+
+    Returns:
+        Result with RebuildCommunitiesRequest or ValidationError
+    """
+    # Pydantic Field(gt=0) already validates workspace_id > 0
+    return Success(request)
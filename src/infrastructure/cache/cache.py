@@ -1,8 +1,26 @@
-from typing import Any, Optional
+import copy
+import time
+from typing import Any, Optional, TypeVar
+
+from src.infrastructure.cache.codecs import model_from_cache
+from src.infrastructure.logger import create_logger
+
+logger = create_logger(__name__)
+
+T = TypeVar("T")
+
+# TTL for generation counters in caches that can only store expiring entries;
+# far longer than any entry keyed by a generation
+GENERATION_TTL = 30 * 24 * 3600
 
 
 class Cache:
-    """Abstract cache interface."""
+    """Abstract cache interface.
+
+    Values may be plain data, datetimes or dataclass models. Models come back
+    from ``get`` as dicts of their fields when the cache stores encoded bytes;
+    use ``get_model``/``get_models`` to get typed models from any cache.
+    """
 
     def get(self, key: str) -> Any:
         """Get value from cache."""
@@ -12,14 +30,104 @@ class Cache:
         """Set value in cache with optional TTL."""
         raise NotImplementedError
 
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from cache.
+
+        Returns:
+            Mapping of each key found to its value; missing keys are omitted
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in cache with the same optional TTL."""
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    def get_model(self, key: str, model_type: type[T]) -> Optional[T]:
+        """Get a dataclass model from cache.
+
+        Returns:
+            Model if cached and valid, None otherwise
+        """
+        return self._to_model(key, self.get(key), model_type)
+
+    def get_models(self, keys: list[str], model_type: type[T]) -> dict[str, T]:
+        """Get several dataclass models from cache in one batch.
+
+        Returns:
+            Mapping of each key found to its model; missing or invalid entries are omitted
+        """
+        models = {}
+        for key, value in self.get_many(keys).items():
+            model = self._to_model(key, value, model_type)
+            if model is not None:
+                models[key] = model
+        return models
+
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
         raise NotImplementedError
 
+    def delete_many(self, keys: list[str]) -> int:
+        """Delete several values from cache.
+
+        Returns:
+            Number of keys deleted
+        """
+        return sum(1 for key in keys if self.delete(key))
+
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         raise NotImplementedError
 
+    def get_generation(self, key: str) -> int:
+        """Get the current value of a generation counter, creating it if missing.
+
+        Generation counters are embedded in other cache keys so a whole group
+        of entries can be invalidated by bumping one counter. A new counter
+        starts from the current time in nanoseconds rather than zero, so a
+        counter that was lost (evicted, cleared) never reuses a generation
+        whose entries may still be cached.
+
+        Returns:
+            Current generation
+        """
+        value = self.get(key)
+        if isinstance(value, int):
+            return value
+        generation = time.time_ns()
+        self.set(key, generation, ttl=GENERATION_TTL)
+        return generation
+
+    def bump_generation(self, key: str) -> int:
+        """Advance a generation counter, invalidating every key built from it.
+
+        Returns:
+            New generation
+        """
+        generation = self.get_generation(key) + 1
+        self.set(key, generation, ttl=GENERATION_TTL)
+        return generation
+
     def clear(self) -> None:
         """Clear all cache entries."""
         raise NotImplementedError
+
+    @staticmethod
+    def _to_model(key: str, value: Any, model_type: type[T]) -> Optional[T]:
+        """Convert a cached value to a model, returning None if it is missing or invalid."""
+        if value is None:
+            return None
+        if isinstance(value, model_type):
+            # Caches holding objects return a copy so callers can't mutate the entry
+            return copy.copy(value)
+        try:
+            return model_from_cache(model_type, value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid cached {model_type.__name__} at {key}: {e}")
+            return None
@@ -0,0 +1,211 @@
+"""Value codecs for caches that store bytes.
+
+A codec turns cache values into bytes and back. Values may be plain data
+(str, int, float, bool, None, lists and dicts), datetimes, enums and
+dataclass models; models are stored as dicts of their fields and rebuilt with
+``model_from_cache``. Nothing is pickled, so a cache entry can never execute
+code when it is read.
+"""
+
+import dataclasses
+import json
+import typing
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Optional, TypeVar, Union, cast
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+T = TypeVar("T")
+
+CACHE_CODECS = ("json", "msgpack")
+
+# JSON tag for datetimes, which JSON cannot represent natively
+_DATETIME_TAG = "$datetime"
+
+# msgpack extension type code for datetimes (ISO 8601 text)
+_MSGPACK_DATETIME_EXT = 1
+
+
+class CacheCodec(ABC):
+    """Encodes cache values to bytes and decodes them back."""
+
+    name: str
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encode a value for storage."""
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode a stored value.
+
+        Raises:
+            ValueError: If the data is not valid for this codec
+        """
+        pass
+
+
+class JsonCodec(CacheCodec):
+    """UTF-8 JSON with tagged datetimes."""
+
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value as JSON."""
+        return json.dumps(value, default=self._default, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a JSON value."""
+        return json.loads(data, object_hook=self._object_hook)
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return {_DATETIME_TAG: value.isoformat()}
+        return _to_plain(value)
+
+    @staticmethod
+    def _object_hook(obj: dict[str, Any]) -> Any:
+        if len(obj) == 1 and _DATETIME_TAG in obj:
+            return datetime.fromisoformat(obj[_DATETIME_TAG])
+        return obj
+
+
+class MsgpackCodec(CacheCodec):
+    """Compact binary msgpack encoding with datetimes as an extension type."""
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if not MSGPACK_AVAILABLE:
+            raise ImportError(
+                "The msgpack cache codec requires msgpack. Install with: pip install msgpack"
+            )
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value as msgpack."""
+        return msgpack.packb(value, default=self._default, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a msgpack value."""
+        try:
+            return msgpack.unpackb(data, raw=False, ext_hook=self._ext_hook, strict_map_key=False)
+        except (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as e:
+            raise ValueError(f"Invalid msgpack data: {e}") from e
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return msgpack.ExtType(_MSGPACK_DATETIME_EXT, value.isoformat().encode("utf-8"))
+        return _to_plain(value)
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == _MSGPACK_DATETIME_EXT:
+            return datetime.fromisoformat(data.decode("utf-8"))
+        return msgpack.ExtType(code, data)
+
+
+def create_codec(name: str = "json") -> CacheCodec:
+    """
+    Create a cache codec by name.
+
+    Args:
+        name: Codec name ("json" or "msgpack")
+
+    Returns:
+        CacheCodec instance
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the codec's library is not installed
+    """
+    if name == "json":
+        return JsonCodec()
+    if name == "msgpack":
+        return MsgpackCodec()
+    raise ValueError(f"Unknown cache codec: {name}. Must be one of {', '.join(CACHE_CODECS)}")
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert dataclass models and enums to encodable values (one level)."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot encode {type(value).__name__} for the cache")
+
+
+def model_from_cache(model_type: type[T], data: dict[str, Any]) -> T:
+    """
+    Rebuild a dataclass model from a decoded cache dict.
+
+    Nested dataclass fields are rebuilt recursively. Keys that are not fields
+    of the model are ignored, so entries written by an older model still load
+    as long as every required field is present.
+
+    Args:
+        model_type: Dataclass to build
+        data: Decoded field values
+
+    Returns:
+        Model instance
+
+    Raises:
+        TypeError: If a required field is missing or data is not a dict
+    """
+    if not isinstance(data, dict):
+        raise TypeError(f"Expected a dict for {model_type.__name__}, got {type(data).__name__}")
+
+    values = {}
+    for name, nested_type, is_list in _field_types(cast(type, model_type)):
+        if name not in data:
+            continue
+        value = data[name]
+        if nested_type is not None:
+            if is_list and isinstance(value, list):
+                value = [
+                    model_from_cache(nested_type, item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            elif isinstance(value, dict):
+                value = model_from_cache(nested_type, value)
+        values[name] = value
+    return model_type(**values)
+
+
+@lru_cache(maxsize=None)
+def _field_types(model_type: type) -> tuple[tuple[str, Optional[type], bool], ...]:
+    """Init fields of a dataclass as (name, nested model type, is list of models)."""
+    hints = typing.get_type_hints(model_type)
+    result = []
+    for f in dataclasses.fields(model_type):
+        if not f.init:
+            continue
+        hint = hints.get(f.name)
+        # Unwrap Optional[X] / X | None
+        if typing.get_origin(hint) in (Union, UnionType):
+            args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+            hint = args[0] if len(args) == 1 else None
+        is_list = typing.get_origin(hint) is list
+        if is_list:
+            item_types = typing.get_args(hint)
+            hint = item_types[0] if item_types else None
+        nested = hint if isinstance(hint, type) and dataclasses.is_dataclass(hint) else None
+        result.append((f.name, nested, is_list))
+    return tuple(result)
@@ -1,6 +1,7 @@
 """Cache infrastructure factory."""
 
 from src.infrastructure.cache.cache import Cache
+from src.infrastructure.cache.codecs import create_codec
 from src.infrastructure.cache.in_memory_cache import InMemoryCache
 from src.infrastructure.cache.redis_cache import RedisCache
 
@@ -11,16 +12,29 @@ def create_cache(cache_type: str = "memory", **kwargs) -> Cache:
 
     Args:
         cache_type: Type of cache ("memory" or "redis")
-        **kwargs: Additional arguments for cache initialization
+        **kwargs: Additional arguments for cache initialization; options that
+            do not apply to the chosen cache type are ignored. For Redis,
+            ``codec`` may be a codec name ("json" or "msgpack").
 
     Returns:
         Cache instance
     """
     if cache_type == "redis":
-        return RedisCache(**kwargs)
+        redis_options = (
+            "host",
+            "port",
+            "db",
+            "password",
+            "default_ttl",
+            "codec",
+            "max_connections",
+        )
+        redis_kwargs = {key: kwargs[key] for key in redis_options if key in kwargs}
+        if isinstance(redis_kwargs.get("codec"), str):
+            redis_kwargs["codec"] = create_codec(redis_kwargs["codec"])
+        return RedisCache(**redis_kwargs)
     else:
-        # InMemoryCache only accepts default_ttl
-        in_memory_kwargs = {}
-        if "default_ttl" in kwargs:
-            in_memory_kwargs["default_ttl"] = kwargs["default_ttl"]
+        # InMemoryCache stores objects directly, so it takes no codec
+        in_memory_options = ("default_ttl", "max_entries", "max_bytes", "sweep_interval")
+        in_memory_kwargs = {key: kwargs[key] for key in in_memory_options if key in kwargs}
         return InMemoryCache(**in_memory_kwargs)
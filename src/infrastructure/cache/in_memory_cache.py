@@ -1,4 +1,8 @@
+import copy
+import dataclasses
+import sys
 import time
+from collections import OrderedDict
 from threading import Lock
 from typing import Any, Optional
 
@@ -6,56 +10,237 @@ from src.infrastructure.cache.cache import Cache
 
 
 class InMemoryCache(Cache):
-    """Simple in-memory cache implementation."""
+    """In-memory cache with TTL expiry and LRU eviction.
 
-    def __init__(self, default_ttl: int = 3600):
-        self._cache: dict[str, dict[str, Any]] = {}
+    Values are kept as Python objects (dataclass models are copied on the way
+    in and out), so reads cost no decoding.
+
+    The cache is bounded by entry count and by approximate size in bytes. When
+    either bound is exceeded the least recently used entries are evicted.
+    Expired entries are dropped when read and by a sweep that runs at most
+    once per ``sweep_interval`` seconds during normal reads and writes.
+    """
+
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_entries: int = 10000,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        sweep_interval: float = 60.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            default_ttl: TTL in seconds for entries set without one
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum approximate size of keys and values in bytes
+                (None for no size bound)
+            sweep_interval: Minimum seconds between expired-entry sweeps
+
+        Raises:
+            ValueError: If a bound is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        # Ordered from least to most recently used
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
         self._lock = Lock()
 
+        # Generation counters live outside the LRU so they are never evicted
+        self._generations: dict[str, int] = {}
+
+        self._bytes = 0
+        self._last_sweep = time.time()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
     def get(self, key: str) -> Any:
         """Get value from cache."""
+        now = time.time()
         with self._lock:
-            if key not in self._cache:
-                return None
-
-            entry = self._cache[key]
-            if time.time() > entry["expires_at"]:
-                del self._cache[key]
-                return None
-
-            return entry["value"]
+            self._maybe_sweep(now)
+            return self._get_live(key, now)
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache with optional TTL."""
         ttl = ttl or self._default_ttl
-        expires_at = time.time() + ttl
+        now = time.time()
 
         with self._lock:
-            self._cache[key] = {"value": value, "expires_at": expires_at}
+            self._maybe_sweep(now)
+            self._store(key, value, now + ttl)
+            self._evict()
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from cache under one lock acquisition."""
+        now = time.time()
+        values = {}
+        with self._lock:
+            self._maybe_sweep(now)
+            for key in keys:
+                value = self._get_live(key, now)
+                if value is not None:
+                    values[key] = value
+        return values
+
+    def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in cache under one lock acquisition."""
+        ttl = ttl or self._default_ttl
+        now = time.time()
+
+        with self._lock:
+            self._maybe_sweep(now)
+            for key, value in items.items():
+                self._store(key, value, now + ttl)
+            self._evict()
 
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 return True
             return False
 
+    def delete_many(self, keys: list[str]) -> int:
+        """Delete several values from cache under one lock acquisition."""
+        deleted = 0
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._remove(key)
+                    deleted += 1
+        return deleted
+
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return False
 
-            entry = self._cache[key]
             if time.time() > entry["expires_at"]:
-                del self._cache[key]
+                self._remove(key)
+                self._expirations += 1
                 return False
 
             return True
 
+    def get_generation(self, key: str) -> int:
+        """Get the current value of a generation counter, creating it if missing."""
+        with self._lock:
+            return self._generations.setdefault(key, time.time_ns())
+
+    def bump_generation(self, key: str) -> int:
+        """Advance a generation counter, invalidating every key built from it."""
+        with self._lock:
+            generation = self._generations.get(key, time.time_ns()) + 1
+            self._generations[key] = generation
+            return generation
+
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._generations.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions (capacity),
+            expirations, current entries and bytes, and the configured bounds
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries": len(self._cache),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _get_live(self, key: str, now: float) -> Any:
+        """Get an unexpired value and mark it most recently used (lock held)."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if now > entry["expires_at"]:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry["value"]
+
+    def _store(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert or replace an entry as most recently used (lock held)."""
+        if key in self._cache:
+            self._remove(key)
+
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            value = copy.copy(value)
+
+        size = sys.getsizeof(key) + _approximate_size(value)
+        self._cache[key] = {"value": value, "expires_at": expires_at, "size": size}
+        self._bytes += size
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its size (lock held)."""
+        entry = self._cache.pop(key)
+        self._bytes -= entry["size"]
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until both bounds hold (lock held)."""
+        while self._cache and (
+            len(self._cache) > self._max_entries
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._evictions += 1
+
+    def _maybe_sweep(self, now: float) -> None:
+        """Drop all expired entries if the sweep interval has elapsed (lock held)."""
+        if now - self._last_sweep < self._sweep_interval:
+            return
+
+        self._last_sweep = now
+        expired = [key for key, entry in self._cache.items() if now > entry["expires_at"]]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+
+
+def _approximate_size(value: Any, depth: int = 2) -> int:
+    """Approximate memory used by a value, following containers a few levels deep."""
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = vars(value)
+    if isinstance(value, dict):
+        size += sum(_approximate_size(item, depth - 1) for item in value.values())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(_approximate_size(item, depth - 1) for item in value)
+    return size
@@ -1,21 +1,62 @@
-from typing import Any, Optional, Protocol, cast
+import threading
+import time
+from typing import Any, Iterator, Optional, Protocol, cast
 
+from src.cache_keys import CacheKeys
 from src.infrastructure.cache.cache import Cache
+from src.infrastructure.cache.codecs import CacheCodec, JsonCodec
 
 
 class RedisClient(Protocol):
     """Protocol for Redis client interface."""
 
     def ping(self) -> object: ...
-    def get(self, key: str) -> Optional[str]: ...
-    def setex(self, key: str, time: int, value: str) -> object: ...
-    def delete(self, key: str) -> int: ...
+    def get(self, key: str) -> Optional[bytes]: ...
+    def mget(self, keys: list[str]) -> list[Optional[bytes]]: ...
+    def set(self, key: str, value: int, nx: bool = False) -> object: ...
+    def setex(self, key: str, time: int, value: bytes) -> object: ...
+    def delete(self, *keys: str) -> int: ...
+    def unlink(self, *keys: str) -> int: ...
     def exists(self, key: str) -> int: ...
-    def flushdb(self) -> object: ...
+    def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> Iterator: ...
+    def pipeline(self, transaction: bool = True) -> Any: ...
+
+
+# Connection pools shared by every RedisCache in the process, keyed by server
+_pools: dict[tuple[str, int, int, Optional[str]], Any] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_connection_pool(
+    host: str, port: int, db: int, password: Optional[str], max_connections: int
+) -> Any:
+    """Get the shared connection pool for a Redis server, creating it on first use."""
+    import redis
+
+    key = (host, port, db, password)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = redis.ConnectionPool(
+                host=host, port=port, db=db, password=password, max_connections=max_connections
+            )
+            _pools[key] = pool
+        return pool
 
 
 class RedisCache(Cache):
-    """Redis cache implementation."""
+    """Redis cache implementation.
+
+    Values are encoded with a CacheCodec (JSON by default). All RedisCache
+    instances for the same server share one connection pool.
+
+    ``clear`` only removes keys under the cache's namespace, so the Redis
+    database can be shared with other applications. Generation counters are
+    plain Redis integers without a TTL.
+    """
+
+    # Keys deleted per UNLINK while clearing the namespace
+    _CLEAR_BATCH_SIZE = 500
 
     def __init__(
         self,
@@ -24,14 +65,18 @@ class RedisCache(Cache):
         db: int = 0,
         password: Optional[str] = None,
         default_ttl: int = 3600,
+        codec: Optional[CacheCodec] = None,
+        max_connections: int = 50,
+        namespace: str = CacheKeys.NAMESPACE,
     ):
         self._client: Optional[RedisClient] = None
+        self._codec = codec or JsonCodec()
+        self._namespace = namespace
         try:
             import redis
 
-            client = redis.Redis(
-                host=host, port=port, db=db, password=password, decode_responses=True
-            )
+            pool = _get_connection_pool(host, port, db, password, max_connections)
+            client = redis.Redis(connection_pool=pool)
             client.ping()  # Test connection
             self._client = cast(RedisClient, client)
             self._available = True
@@ -46,7 +91,7 @@ class RedisCache(Cache):
         if not self._available or not self._client:
             return None
         try:
-            return self._client.get(key)
+            return self._decode(self._client.get(key))
         except Exception:
             return None
 
@@ -57,7 +102,37 @@ class RedisCache(Cache):
 
         ttl = ttl or self._default_ttl
         try:
-            self._client.setex(key, ttl, str(value))
+            self._client.setex(key, ttl, self._codec.encode(value))
+        except Exception:
+            pass
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from cache in one MGET round trip."""
+        if not self._available or not self._client or not keys:
+            return {}
+        try:
+            raw_values = self._client.mget(keys)
+        except Exception:
+            return {}
+
+        values = {}
+        for key, raw in zip(keys, raw_values):
+            value = self._decode(raw)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set_many(self, items: dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in cache with one pipelined round trip."""
+        if not self._available or not self._client or not items:
+            return
+
+        ttl = ttl or self._default_ttl
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, self._codec.encode(value))
+            pipe.execute()
         except Exception:
             pass
 
@@ -70,6 +145,15 @@ class RedisCache(Cache):
         except Exception:
             return False
 
+    def delete_many(self, keys: list[str]) -> int:
+        """Delete several values from cache with one DEL command."""
+        if not self._available or not self._client or not keys:
+            return 0
+        try:
+            return int(self._client.delete(*keys))
+        except Exception:
+            return 0
+
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         if not self._available or not self._client:
@@ -79,11 +163,62 @@ class RedisCache(Cache):
         except Exception:
             return False
 
+    def get_generation(self, key: str) -> int:
+        """Get the current value of a generation counter, creating it if missing."""
+        if not self._available or not self._client:
+            return 0
+        try:
+            raw = self._client.get(key)
+            if raw is None:
+                pipe = self._client.pipeline(transaction=False)
+                pipe.set(key, time.time_ns(), nx=True)
+                pipe.get(key)
+                raw = pipe.execute()[1]
+            return int(raw)
+        except Exception:
+            return 0
+
+    def bump_generation(self, key: str) -> int:
+        """Advance a generation counter atomically with INCR."""
+        if not self._available or not self._client:
+            return 0
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            # Seed a missing counter from the clock so it never reuses a generation
+            pipe.set(key, time.time_ns(), nx=True)
+            pipe.incr(key)
+            return int(pipe.execute()[1])
+        except Exception:
+            return 0
+
     def clear(self) -> None:
-        """Clear all cache entries."""
+        """Clear all cache entries under this cache's namespace.
+
+        Keys are found with incremental SCAN and removed with UNLINK in
+        batches, so other data in the Redis database is left alone and the
+        server is never blocked by FLUSHDB or KEYS.
+        """
         if not self._available or not self._client:
             return
         try:
-            self._client.flushdb()
+            batch: list[str] = []
+            for key in self._client.scan_iter(
+                match=f"{self._namespace}:*", count=self._CLEAR_BATCH_SIZE
+            ):
+                batch.append(key)
+                if len(batch) >= self._CLEAR_BATCH_SIZE:
+                    self._client.unlink(*batch)
+                    batch = []
+            if batch:
+                self._client.unlink(*batch)
         except Exception:
             pass
+
+    def _decode(self, raw: Optional[bytes]) -> Any:
+        """Decode a stored value, treating undecodable entries as missing."""
+        if raw is None:
+            return None
+        try:
+            return self._codec.decode(raw)
+        except (ValueError, UnicodeDecodeError):
+            return None
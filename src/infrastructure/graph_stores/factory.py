@@ -47,8 +47,11 @@ class GraphStoreFactory:
             uri = config.get("uri", "bolt://localhost:7687")
             username = config.get("username", "neo4j")
             password = config.get("password", "password")
+            batch_size = config.get("batch_size", 1000)
 
             logger.info(f"Creating Neo4j graph store with URI: {uri}")
-            return Neo4jGraphStore(uri=uri, username=username, password=password)
+            return Neo4jGraphStore(
+                uri=uri, username=username, password=password, batch_size=batch_size
+            )
 
         raise ValueError(f"Unknown graph store type: {store_type}")
@@ -60,6 +60,19 @@ class GraphStore(ABC):
         """
         pass
 
+    @abstractmethod
+    def clear_communities(
+        self, workspace_id: str, community_ids: Optional[list[str]] = None
+    ) -> None:
+        """Delete communities and their memberships before communities are stored again.
+
+        Args:
+            workspace_id: Workspace identifier for data isolation
+            community_ids: Communities to delete (None deletes every community
+                of the workspace)
+        """
+        pass
+
     @abstractmethod
     def get_entity_by_id(self, entity_id: str, workspace_id: str) -> Optional[Entity]:
         """Retrieve a single entity by its ID.
@@ -183,14 +196,28 @@ class GraphStore(ABC):
         pass
 
     @abstractmethod
-    def export_subgraph(self, workspace_id: str) -> tuple[list[Entity], list[Relationship]]:
-        """Export the entire graph for a workspace.
+    def ensure_schema(self) -> None:
+        """Provision the indexes the store's queries rely on.
+
+        Note:
+            Implementation should be idempotent; it is invoked when a workspace
+            is provisioned rather than every time a store is created.
+        """
+        pass
+
+    @abstractmethod
+    def export_subgraph(
+        self, workspace_id: str, entity_ids: Optional[list[str]] = None
+    ) -> tuple[list[Entity], list[Relationship]]:
+        """Export the graph for a workspace, or the part spanned by some entities.
 
         Args:
             workspace_id: Workspace identifier for data isolation
+            entity_ids: Entities to export, with the relationships between them
+                (None exports the entire workspace graph)
 
         Returns:
-            Tuple of (entities, relationships) for the entire workspace graph
+            Tuple of (entities, relationships)
         """
         pass
 
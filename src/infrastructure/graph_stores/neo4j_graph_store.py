@@ -5,7 +5,9 @@ for storing and querying knowledge graphs in Graph RAG.
 """
 
 import json
-from typing import Optional
+import re
+from collections import defaultdict
+from typing import Any, Optional
 
 from neo4j import Driver, GraphDatabase
 
@@ -25,6 +27,18 @@ from src.infrastructure.types.graph import (
 
 logger = create_logger(__name__)
 
+# Full-text index backing find_entities; workspace_id is indexed too so the
+# Lucene query itself is scoped to one workspace
+ENTITY_TEXT_INDEX = "entity_text_workspace_fulltext"
+
+# Relationship types are interpolated into Cypher, so only plain identifiers are allowed
+_RELATION_TYPE_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _lucene_phrase(text: str) -> str:
+    """Quote text as a Lucene phrase, escaping backslashes and quotes."""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
 
 class Neo4jGraphStore(GraphStore):
     """Neo4j implementation of the graph store.
@@ -33,16 +47,22 @@ class Neo4jGraphStore(GraphStore):
     relationships, and communities. It supports workspace-based isolation.
     """
 
-    def __init__(self, uri: str, username: str, password: str):
+    def __init__(self, uri: str, username: str, password: str, batch_size: int = 1000):
         """Initialize Neo4j graph store.
 
         Args:
             uri: Neo4j connection URI (e.g., "bolt://localhost:7687")
             username: Neo4j username
             password: Neo4j password
+            batch_size: Number of rows sent per UNWIND write transaction
         """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
         self.uri = uri
+        self.batch_size = batch_size
         self.driver: Driver = GraphDatabase.driver(uri, auth=(username, password))
+        self._apoc_available: Optional[bool] = None
         logger.info(f"Connected to Neo4j at {uri}")
 
     def close(self) -> None:
@@ -56,6 +76,21 @@ class Neo4jGraphStore(GraphStore):
         with self.driver.session() as session:
             session.run(query, parameters)
 
+    def _execute_write_batches(self, query: str, rows: list[dict], parameters: dict) -> None:
+        """Execute an UNWIND write query over rows in batches.
+
+        All batches share one session; each batch runs in its own managed write
+        transaction (retried by the driver on transient errors) with the batch
+        passed as the ``$rows`` parameter.
+        """
+
+        def run_batch(tx, batch: list[dict]) -> None:
+            tx.run(query, {**parameters, "rows": batch}).consume()
+
+        with self.driver.session() as session:
+            for start in range(0, len(rows), self.batch_size):
+                session.execute_write(run_batch, rows[start : start + self.batch_size])
+
     def _execute_read(self, query: str, parameters: dict) -> list:
         """Execute a read query and return results."""
         with self.driver.session() as session:
@@ -102,138 +137,213 @@ class Neo4jGraphStore(GraphStore):
         except Exception as e:
             logger.warning(f"Index creation skipped or failed: {e}")
 
+    def ensure_schema(self) -> None:
+        """Create workspace-scoped lookup indexes and the entity full-text index.
+
+        Every entity and community lookup matches on (workspace_id, id), so these
+        composite indexes turn label scans into index seeks. Called when a
+        workspace is provisioned, not on every store construction.
+        """
+        self.create_index("Entity", ["workspace_id", "id"])
+        self.create_index("Community", ["workspace_id", "id"])
+
+        query = f"""
+        CREATE FULLTEXT INDEX {ENTITY_TEXT_INDEX} IF NOT EXISTS
+        FOR (n:Entity)
+        ON EACH [n.text, n.workspace_id]
+        """
+        try:
+            self._execute_write(query, {})
+            logger.info("Created full-text index on Entity(text)")
+        except Exception as e:
+            logger.warning(f"Full-text index creation skipped or failed: {e}")
+
     def upsert_entities(self, entities: list[Entity], workspace_id: str) -> None:
-        """Upsert entities into Neo4j."""
+        """Upsert entities into Neo4j in batched UNWIND transactions."""
         if not entities:
             return
 
-        for entity in entities:
-            query = """
-            MERGE (e:Entity {id: $id, workspace_id: $workspace_id})
-            SET e.text = $text,
-                e.type = $type,
-                e.confidence = $confidence,
-                e.metadata = $metadata,
-                e.document_ids = CASE
-                    WHEN e.document_ids IS NULL THEN [$document_id]
-                    WHEN NOT $document_id IN e.document_ids THEN e.document_ids + $document_id
-                    ELSE e.document_ids
-                END
-            """
-            parameters = {
+        query = """
+        UNWIND $rows AS row
+        MERGE (e:Entity {id: row.id, workspace_id: $workspace_id})
+        SET e.text = row.text,
+            e.type = row.type,
+            e.confidence = row.confidence,
+            e.metadata = row.metadata,
+            e.document_ids = CASE
+                WHEN e.document_ids IS NULL THEN [row.document_id]
+                WHEN NOT row.document_id IN e.document_ids THEN e.document_ids + row.document_id
+                ELSE e.document_ids
+            END
+        """
+        rows = [
+            {
                 "id": entity.id,
-                "workspace_id": workspace_id,
                 "text": entity.text,
                 "type": entity.type.value,
                 "confidence": entity.confidence,
                 "metadata": json.dumps(dict(entity.metadata)),  # Serialize to JSON string
                 "document_id": entity.metadata.get("document_id", ""),
             }
-            self._execute_write(query, parameters)
+            for entity in entities
+        ]
+        self._execute_write_batches(query, rows, {"workspace_id": workspace_id})
 
         logger.info(f"Upserted {len(entities)} entities for workspace {workspace_id}")
 
     def upsert_relationships(self, relationships: list[Relationship], workspace_id: str) -> None:
-        """Upsert relationships into Neo4j.
+        """Upsert relationships into Neo4j in batched UNWIND transactions.
 
-        Note: This requires APOC plugin for dynamic relationship types.
-        If APOC is not available, relationships will be created with a generic type
-        and the actual type stored as a property.
+        With APOC, all relationships are merged in one pass via
+        apoc.merge.relationship. Without it, relationships are grouped by
+        relation_type and each group is merged with a static relationship type.
+        APOC availability is probed once per store instance.
         """
         if not relationships:
             return
 
+        rows_by_type: dict[str, list[dict]] = defaultdict(list)
         for rel in relationships:
-            # Try using APOC for dynamic relationship types
+            rows_by_type[rel.relation_type.value].append(
+                {
+                    "id": rel.id,
+                    "source_id": rel.source_entity_id,
+                    "target_id": rel.target_entity_id,
+                    "relation_type": rel.relation_type.value,
+                    "confidence": rel.confidence,
+                    "context": rel.context,
+                    "metadata": json.dumps(dict(rel.metadata)),  # Serialize to JSON string
+                }
+            )
+        parameters = {"workspace_id": workspace_id}
+
+        if self._has_apoc():
             query = """
-            MATCH (source:Entity {id: $source_id, workspace_id: $workspace_id})
-            MATCH (target:Entity {id: $target_id, workspace_id: $workspace_id})
+            UNWIND $rows AS row
+            MATCH (source:Entity {id: row.source_id, workspace_id: $workspace_id})
+            MATCH (target:Entity {id: row.target_id, workspace_id: $workspace_id})
             CALL apoc.merge.relationship(
                 source,
-                $relation_type,
-                {id: $id},
+                row.relation_type,
+                {id: row.id},
                 {
-                    confidence: $confidence,
-                    context: $context,
-                    metadata: $metadata
+                    confidence: row.confidence,
+                    context: row.context,
+                    metadata: row.metadata
                 },
                 target,
                 {}
             ) YIELD rel
-            RETURN rel
-            """
-
-            # Fallback query if APOC is not available
-            fallback_query = """
-            MATCH (source:Entity {id: $source_id, workspace_id: $workspace_id})
-            MATCH (target:Entity {id: $target_id, workspace_id: $workspace_id})
-            MERGE (source)-[r:RELATED {id: $id}]->(target)
-            SET r.type = $relation_type,
-                r.confidence = $confidence,
-                r.context = $context,
-                r.metadata = $metadata
+            RETURN count(rel)
             """
+            all_rows = [row for rows in rows_by_type.values() for row in rows]
+            self._execute_write_batches(query, all_rows, parameters)
+        else:
+            for relation_type, rows in rows_by_type.items():
+                if not _RELATION_TYPE_PATTERN.match(relation_type):
+                    raise ValueError(f"Invalid relationship type: {relation_type!r}")
+                query = f"""
+                UNWIND $rows AS row
+                MATCH (source:Entity {{id: row.source_id, workspace_id: $workspace_id}})
+                MATCH (target:Entity {{id: row.target_id, workspace_id: $workspace_id}})
+                MERGE (source)-[r:{relation_type} {{id: row.id}}]->(target)
+                SET r.confidence = row.confidence,
+                    r.context = row.context,
+                    r.metadata = row.metadata
+                """
+                self._execute_write_batches(query, rows, parameters)
 
-            parameters = {
-                "id": rel.id,
-                "source_id": rel.source_entity_id,
-                "target_id": rel.target_entity_id,
-                "relation_type": rel.relation_type.value,
-                "confidence": rel.confidence,
-                "context": rel.context,
-                "metadata": json.dumps(dict(rel.metadata)),  # Serialize to JSON string
-                "workspace_id": workspace_id,
-            }
+        logger.info(f"Upserted {len(relationships)} relationships for workspace {workspace_id}")
 
+    def _has_apoc(self) -> bool:
+        """Check (once per instance) whether apoc.merge.relationship is installed."""
+        if self._apoc_available is None:
+            query = """
+            SHOW PROCEDURES YIELD name
+            WHERE name = 'apoc.merge.relationship'
+            RETURN count(*) AS count
+            """
             try:
-                self._execute_write(query, parameters)
+                results = self._execute_read(query, {})
+                self._apoc_available = bool(results and results[0]["count"] > 0)
             except Exception as e:
-                logger.warning(f"APOC not available, using fallback relationship creation: {e}")
-                self._execute_write(fallback_query, parameters)
+                logger.debug(f"Could not list Neo4j procedures: {e}")
+                self._apoc_available = False
 
-        logger.info(f"Upserted {len(relationships)} relationships for workspace {workspace_id}")
+            strategy = "APOC" if self._apoc_available else "static relationship types"
+            logger.info(f"Neo4j relationship upserts will use {strategy}")
+
+        return self._apoc_available
 
     def upsert_communities(self, communities: list[Community], workspace_id: str) -> None:
-        """Upsert communities into Neo4j."""
+        """Upsert communities and their entity memberships in batched UNWIND transactions."""
         if not communities:
             return
 
-        for community in communities:
-            # Create or update community node
-            query = """
-            MERGE (c:Community {id: $id, workspace_id: $workspace_id})
-            SET c.level = $level,
-                c.summary = $summary,
-                c.score = $score,
-                c.metadata = $metadata
-            """
-            parameters = {
+        # Create or update community nodes
+        query = """
+        UNWIND $rows AS row
+        MERGE (c:Community {id: row.id, workspace_id: $workspace_id})
+        SET c.level = row.level,
+            c.summary = row.summary,
+            c.score = row.score,
+            c.metadata = row.metadata
+        """
+        rows = [
+            {
                 "id": community.id,
-                "workspace_id": workspace_id,
                 "level": community.level,
                 "summary": community.summary,
                 "score": community.score,
                 "metadata": json.dumps(dict(community.metadata)),  # Serialize to JSON string
             }
-            self._execute_write(query, parameters)
+            for community in communities
+        ]
+        parameters = {"workspace_id": workspace_id}
+        self._execute_write_batches(query, rows, parameters)
 
-            # Link community to its member entities
-            if community.entity_ids:
-                link_query = """
-                MATCH (c:Community {id: $community_id, workspace_id: $workspace_id})
-                MATCH (e:Entity {workspace_id: $workspace_id})
-                WHERE e.id IN $entity_ids
-                MERGE (e)-[:BELONGS_TO]->(c)
-                """
-                link_parameters = {
-                    "community_id": community.id,
-                    "workspace_id": workspace_id,
-                    "entity_ids": community.entity_ids,
-                }
-                self._execute_write(link_query, link_parameters)
+        # Link communities to their member entities
+        link_query = """
+        UNWIND $rows AS row
+        MATCH (c:Community {id: row.community_id, workspace_id: $workspace_id})
+        MATCH (e:Entity {workspace_id: $workspace_id})
+        WHERE e.id IN row.entity_ids
+        MERGE (e)-[:BELONGS_TO]->(c)
+        """
+        link_rows = [
+            {"community_id": community.id, "entity_ids": community.entity_ids}
+            for community in communities
+            if community.entity_ids
+        ]
+        if link_rows:
+            self._execute_write_batches(link_query, link_rows, parameters)
 
         logger.info(f"Upserted {len(communities)} communities for workspace {workspace_id}")
 
+    def clear_communities(
+        self, workspace_id: str, community_ids: Optional[list[str]] = None
+    ) -> None:
+        """Delete communities and their memberships, all of them or the given ones."""
+        parameters = {"workspace_id": workspace_id}
+        if community_ids is None:
+            query = """
+            MATCH (c:Community {workspace_id: $workspace_id})
+            DETACH DELETE c
+            """
+            self._execute_write(query, parameters)
+            logger.info(f"Cleared all communities for workspace {workspace_id}")
+            return
+
+        query = """
+        UNWIND $rows AS row
+        MATCH (c:Community {id: row.id, workspace_id: $workspace_id})
+        DETACH DELETE c
+        """
+        self._execute_write_batches(
+            query, [{"id": community_id} for community_id in community_ids], parameters
+        )
+        logger.info(f"Cleared {len(community_ids)} communities for workspace {workspace_id}")
+
     def get_entity_by_id(self, entity_id: str, workspace_id: str) -> Optional[Entity]:
         """Retrieve a single entity by its ID."""
         query = """
@@ -251,20 +361,48 @@ class Neo4jGraphStore(GraphStore):
         return self._node_to_entity(node)
 
     def find_entities(self, query: str, workspace_id: str, limit: int) -> list[Entity]:
-        """Find entities matching the query string using text search."""
-        cypher_query = """
-        MATCH (e:Entity {workspace_id: $workspace_id})
-        WHERE toLower(e.text) CONTAINS toLower($query)
+        """Find entities whose text contains the query (case-insensitive).
+
+        Entities containing the query as whole words are found through the
+        workspace-scoped full-text index, ranked by relevance score and then
+        confidence. If that finds nothing (e.g. "Micro" for "Microsoft") or the
+        index is unavailable, falls back to a case-insensitive CONTAINS scan.
+        """
+        if not query.strip():
+            return []
+
+        # Quote user text as Lucene phrases so it is never parsed as syntax
+        lucene_query = (
+            f"text:{_lucene_phrase(query)} AND workspace_id:{_lucene_phrase(workspace_id)}"
+        )
+        fulltext_query = f"""
+        CALL db.index.fulltext.queryNodes('{ENTITY_TEXT_INDEX}', $lucene_query) YIELD node AS e, score
+        WHERE e.workspace_id = $workspace_id
         RETURN e
-        ORDER BY e.confidence DESC
+        ORDER BY score DESC, e.confidence DESC
         LIMIT $limit
         """
-        parameters = {"query": query, "workspace_id": workspace_id, "limit": limit}
-        results = self._execute_read(cypher_query, parameters)
+        parameters = {"lucene_query": lucene_query, "workspace_id": workspace_id, "limit": limit}
 
-        entities = []
-        for record in results:
-            entities.append(self._node_to_entity(record["e"]))
+        try:
+            results = self._execute_read(fulltext_query, parameters)
+        except Exception as e:
+            logger.warning(f"Full-text entity search failed, falling back to scan: {e}")
+            results = []
+
+        if not results:
+            scan_query = """
+            MATCH (e:Entity {workspace_id: $workspace_id})
+            WHERE toLower(e.text) CONTAINS toLower($query)
+            RETURN e
+            ORDER BY e.confidence DESC
+            LIMIT $limit
+            """
+            results = self._execute_read(
+                scan_query, {"query": query, "workspace_id": workspace_id, "limit": limit}
+            )
+
+        entities = [self._node_to_entity(record["e"]) for record in results]
 
         logger.info(f"Found {len(entities)} entities matching '{query}'")
         return entities
@@ -407,22 +545,32 @@ class Neo4jGraphStore(GraphStore):
 
         logger.info(f"Deleted all graph data for workspace {workspace_id}")
 
-    def export_subgraph(self, workspace_id: str) -> tuple[list[Entity], list[Relationship]]:
-        """Export the entire graph for a workspace."""
-        # Get all entities
-        entities_query = """
-        MATCH (e:Entity {workspace_id: $workspace_id})
+    def export_subgraph(
+        self, workspace_id: str, entity_ids: Optional[list[str]] = None
+    ) -> tuple[list[Entity], list[Relationship]]:
+        """Export the graph for a workspace, or only the given entities and their edges."""
+        parameters: dict[str, Any] = {"workspace_id": workspace_id}
+        entity_filter = ""
+        relationship_filter = ""
+        if entity_ids is not None:
+            parameters["entity_ids"] = entity_ids
+            entity_filter = "WHERE e.id IN $entity_ids"
+            relationship_filter = "WHERE source.id IN $entity_ids AND target.id IN $entity_ids"
+
+        entities_query = f"""
+        MATCH (e:Entity {{workspace_id: $workspace_id}})
+        {entity_filter}
         RETURN e
         """
-        entity_results = self._execute_read(entities_query, {"workspace_id": workspace_id})
+        entity_results = self._execute_read(entities_query, parameters)
         entities = [self._node_to_entity(record["e"]) for record in entity_results]
 
-        # Get all relationships
-        rels_query = """
-        MATCH (source:Entity {workspace_id: $workspace_id})-[r]->(target:Entity {workspace_id: $workspace_id})
+        rels_query = f"""
+        MATCH (source:Entity {{workspace_id: $workspace_id}})-[r]->(target:Entity {{workspace_id: $workspace_id}})
+        {relationship_filter}
         RETURN r, source.id AS source_id, target.id AS target_id
         """
-        rel_results = self._execute_read(rels_query, {"workspace_id": workspace_id})
+        rel_results = self._execute_read(rels_query, parameters)
         relationships = [
             self._rel_to_relationship(record["r"], record.get("source_id"), record.get("target_id"))
             for record in rel_results
@@ -459,8 +607,11 @@ class Neo4jGraphStore(GraphStore):
             json.loads(metadata_str) if isinstance(metadata_str, str) else metadata_str
         )
 
-        # Handle both APOC dynamic types and fallback RELATED type
+        # Relationship types are stored as the Neo4j type; edges written by older
+        # versions without APOC use the generic RELATED type with a "type" property
         rel_type_str = rel.type if hasattr(rel, "type") else rel.get("type", "RELATED_TO")
+        if rel_type_str == "RELATED":
+            rel_type_str = rel.get("type", "RELATED_TO")
 
         # Try to convert to RelationType enum, fallback to RELATED_TO if not recognized
         try:
@@ -0,0 +1,150 @@
+"""Shared, pooled HTTP sessions for model-serving backends.
+
+Every call through the module-level ``requests`` functions opens a fresh TCP
+connection. Providers that talk to the same server (Ollama LLM, Ollama
+embeddings, Hugging Face inference) instead share one keep-alive session per
+base URL, with a bounded connection pool and retries on transient failures.
+Retrying POST after the request was sent is opt-in, so only endpoints that are
+safe to repeat (embeddings) pay for duplicated work; LLM generation is not
+resent.
+"""
+
+from threading import Lock
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.infrastructure.logger import create_logger
+
+logger = create_logger(__name__)
+
+# Status codes worth retrying: the server is overloaded or restarting
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_http_session(
+    pool_size: int = 10,
+    max_retries: int = 3,
+    backoff_factor: float = 0.5,
+    backoff_jitter: float = 0.5,
+    retry_post: bool = False,
+) -> requests.Session:
+    """
+    Create a requests session with a bounded keep-alive pool and retries.
+
+    Retries cover connection errors, read timeouts, and 429/5xx responses,
+    sleeping ``backoff_factor * 2**(attempt - 1)`` seconds plus up to
+    ``backoff_jitter`` seconds of random jitter between attempts. Read timeouts
+    and error responses are only retried for idempotent methods unless
+    ``retry_post`` is set; connection errors are retried for every method since
+    the request never reached the server. After the last attempt the final
+    response is returned as-is so callers can keep using ``raise_for_status``.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        max_retries: Maximum number of retries per request (0 disables retries)
+        backoff_factor: Base delay in seconds for exponential backoff
+        backoff_jitter: Maximum random jitter in seconds added to each delay
+        retry_post: Also retry POST on read timeouts and 429/5xx responses;
+            only for endpoints where a repeated request is harmless
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=None if retry_post else Retry.DEFAULT_ALLOWED_METHODS,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_jitter,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Sessions shared process-wide, keyed by (scheme://host:port, retry_post)
+_sessions: dict[tuple[str, bool], requests.Session] = {}
+_sessions_lock = Lock()
+
+
+def get_http_session(base_url: str, retry_post: bool = False) -> requests.Session:
+    """
+    Get the shared session for a server, creating it on first use.
+
+    Pool size and retry policy come from HTTP_POOL_SIZE, HTTP_MAX_RETRIES and
+    HTTP_BACKOFF_FACTOR.
+
+    Args:
+        base_url: Any URL on the target server
+        retry_post: Retry POST requests after they were sent; set only for
+            endpoints that are safe to repeat, such as embeddings
+
+    Returns:
+        Shared requests.Session for the server's origin and retry policy
+    """
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    key = (origin, retry_post)
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            from src.config import config
+
+            session = create_http_session(
+                pool_size=config.http_pool_size,
+                max_retries=config.http_max_retries,
+                backoff_factor=config.http_backoff_factor,
+                retry_post=retry_post,
+            )
+            _sessions[key] = session
+            logger.debug(f"Created HTTP session for {origin}")
+        return session
+
+
+def http_timeout(
+    read_timeout: float, connect_timeout: Optional[float] = None
+) -> tuple[float, float]:
+    """
+    Build an explicit (connect, read) timeout tuple.
+
+    Args:
+        read_timeout: Seconds to wait for the server to send a response
+        connect_timeout: Seconds to wait for the TCP connection
+            (defaults to HTTP_CONNECT_TIMEOUT)
+
+    Returns:
+        Timeout tuple accepted by requests
+    """
+    if connect_timeout is None:
+        from src.config import config
+
+        connect_timeout = config.http_connect_timeout
+    return (connect_timeout, read_timeout)
+
+
+def close_http_sessions() -> None:
+    """
+    Close all shared sessions and their pooled connections.
+
+    This should be called during application shutdown.
+    """
+    with _sessions_lock:
+        for session in _sessions.values():
+            try:
+                session.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP session: {e}")
+        _sessions.clear()
@@ -7,6 +7,7 @@ from typing import Optional
 import requests
 from returns.result import Failure, Result, Success
 
+from src.infrastructure.http_session import get_http_session, http_timeout
 from src.infrastructure.rag.steps.vector_rag.embedding.vector_embedder import (
     EmbeddingError,
     VectorEmbeddingEncoder,
@@ -37,6 +38,7 @@ class HuggingFaceEmbeddingProvider(VectorEmbeddingEncoder):
         self.api_key = api_key or os.getenv("HUGGINGFACE_API_KEY", "")
         self.model_name = model_name
         self.api_url = api_url or f"https://api-inference.huggingface.co/models/{model_name}"
+        self._session = get_http_session(self.api_url, retry_post=True)
 
     def encode(self, texts: Iterable[str]) -> Result[list[list[float]], EmbeddingError]:
         """
@@ -65,7 +67,9 @@ class HuggingFaceEmbeddingProvider(VectorEmbeddingEncoder):
                 "options": {"wait_for_model": True},
             }  # wait_for_model can be slow
 
-            response = requests.post(self.api_url, headers=headers, json=payload, timeout=60)
+            response = self._session.post(
+                self.api_url, headers=headers, json=payload, timeout=http_timeout(60)
+            )
             response.raise_for_status()
 
             embeddings = response.json()
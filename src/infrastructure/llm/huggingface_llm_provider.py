@@ -6,6 +6,8 @@ from typing import Optional
 
 import requests
 
+from src.infrastructure.http_session import get_http_session, http_timeout
+
 from .llm_provider import LlmProvider
 
 
@@ -29,6 +31,7 @@ class HuggingFaceLlmProvider(LlmProvider):
         self.api_key = api_key or os.getenv("HUGGINGFACE_API_KEY", "")
         self.model_name = model_name
         self.api_url = api_url or f"https://api-inference.huggingface.co/models/{model_name}"
+        self._session = get_http_session(self.api_url)
 
     def generate_response(self, prompt: str) -> str:
         """
@@ -54,7 +57,9 @@ class HuggingFaceLlmProvider(LlmProvider):
                 },
             }
 
-            response = requests.post(self.api_url, headers=headers, json=payload, timeout=60)
+            response = self._session.post(
+                self.api_url, headers=headers, json=payload, timeout=http_timeout(60)
+            )
             response.raise_for_status()
 
             result = response.json()
@@ -6,6 +6,8 @@ from typing import Optional
 
 import requests
 
+from src.infrastructure.http_session import get_http_session, http_timeout
+
 from .llm_provider import LlmProvider
 
 
@@ -33,6 +35,7 @@ class OllamaLlmProvider(LlmProvider):
         """
         self.base_url = base_url.rstrip("/")
         self.model_name = model_name
+        self._session = get_http_session(self.base_url)
 
     def generate_response(self, prompt: str) -> str:
         """
@@ -45,14 +48,14 @@ class OllamaLlmProvider(LlmProvider):
             Generated response text
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model_name,
                     "prompt": prompt,
                     "stream": False,
                 },
-                timeout=60,
+                timeout=http_timeout(60),
             )
             response.raise_for_status()
 
@@ -106,7 +109,7 @@ class OllamaLlmProvider(LlmProvider):
             Dictionary with health status
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=http_timeout(5))
             response.raise_for_status()
             return {
                 "status": "healthy",
@@ -163,14 +166,14 @@ class OllamaLlmProvider(LlmProvider):
 
     def _make_stream_request(self, prompt: str):
         """Make streaming request to Ollama API."""
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/api/generate",
             json={
                 "model": self.model_name,
                 "prompt": prompt,
                 "stream": True,
             },
-            timeout=60,
+            timeout=http_timeout(60),
             stream=True,
         )
         response.raise_for_status()
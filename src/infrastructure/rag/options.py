@@ -8,6 +8,7 @@ validation, and configuration all use the same set of available options.
 from src.infrastructure.rag.steps.general.chunking.factory import get_available_chunkers
 from src.infrastructure.rag.steps.vector_rag.embedding.factory import get_available_embedders
 from src.infrastructure.rag.steps.vector_rag.reranking.factory import get_available_rerankers
+from src.infrastructure.vector_stores.factory import get_available_quantizations
 
 
 # RAG Type Options
@@ -58,6 +59,15 @@ def get_reranking_options() -> list[dict[str, str]]:
     return get_available_rerankers()
 
 
+def get_quantization_options() -> list[dict[str, str]]:
+    """Get available vector quantization options.
+
+    Returns:
+        List of dicts with 'value', 'label', and 'description' keys
+    """
+    return get_available_quantizations()
+
+
 def get_graph_entity_extraction_options() -> list[dict[str, str]]:
     """Get available entity extraction algorithm options for graph RAG.
 
@@ -119,6 +129,11 @@ def get_default_reranking_algorithm() -> str:
     return "none"  # No reranking by default
 
 
+def get_default_quantization() -> str:
+    """Get default vector quantization."""
+    return "none"  # Full-precision vectors by default
+
+
 def get_default_entity_extraction_algorithm() -> str:
     """Get default entity extraction algorithm."""
     options = get_graph_entity_extraction_options()
@@ -167,6 +182,17 @@ def is_valid_reranking_algorithm(algorithm: str) -> bool:
     return algorithm in valid_values
 
 
+def is_valid_quantization(quantization: str) -> bool:
+    """Check if vector quantization is valid."""
+    valid_values = [opt["value"] for opt in get_quantization_options()]
+    return quantization in valid_values
+
+
+def get_valid_quantizations() -> list[str]:
+    """Get list of valid vector quantization values."""
+    return [opt["value"] for opt in get_quantization_options()]
+
+
 def is_valid_entity_extraction_algorithm(algorithm: str) -> bool:
     """Check if entity extraction algorithm is valid."""
     valid_values = [opt["value"] for opt in get_graph_entity_extraction_options()]
@@ -6,6 +6,7 @@ from typing import Any, Optional
 from src.config import config
 from src.domains.workspace.data_access import WorkspaceDataAccess
 from src.domains.workspace.models import GraphRagConfig, VectorRagConfig
+from src.infrastructure.cache.cache import Cache
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.options import (
     get_default_chunking_algorithm,
@@ -15,7 +16,12 @@ from src.infrastructure.rag.options import (
     get_default_relationship_extraction_algorithm,
     get_default_reranking_algorithm,
 )
+from src.infrastructure.rag.steps.vector_rag.embedding.embedding_cache import (
+    get_embedding_cache_store,
+)
+from src.infrastructure.rag.steps.vector_rag.retrieval_cache import create_retrieval_cache
 from src.infrastructure.types.common import WorkspaceContext
+from src.infrastructure.vector_stores.chunk_text_store import get_chunk_text_store
 
 logger = create_logger(__name__)
 
@@ -79,18 +85,92 @@ class RagConfigProvider(ABC):
 class VectorRagConfigProvider(RagConfigProvider):
     """Provider for Vector RAG configuration."""
 
-    def __init__(self, workspace_data_access: WorkspaceDataAccess):
+    def __init__(self, workspace_data_access: WorkspaceDataAccess, cache: Optional[Cache] = None):
         """Initialize vector RAG config provider.
 
         Args:
             workspace_data_access: Workspace data access layer
+            cache: Application cache that also holds retrieval results (optional)
         """
         self.workspace_data_access = workspace_data_access
+        self.retrieval_cache = create_retrieval_cache(cache)
 
     def get_config_model(self, workspace_id: int) -> Optional[VectorRagConfig]:
         """Get vector RAG config model."""
         return self.workspace_data_access.get_vector_rag_config(workspace_id)
 
+    def uses_shared_collection(self) -> bool:
+        """Whether all workspaces store their vectors in one shared collection.
+
+        A shared collection's quantization, HNSW and on-disk settings are common
+        to every workspace in it and cannot be chosen per workspace.
+        """
+        return config.vector_store.qdrant_collection_mode == "shared"
+
+    def _collection_settings(self, workspace_ctx: WorkspaceContext) -> dict[str, Any]:
+        """Collection holding the workspace's vectors and how it is partitioned.
+
+        In per_workspace mode the collection only holds this workspace, so its
+        workspace_id is the collection's scope; in shared mode every workspace
+        shares one collection keyed by a workspace_id tenant index.
+        """
+        if self.uses_shared_collection():
+            return {
+                "collection_name": config.vector_store.qdrant_collection_name,
+                "tenant_field": "workspace_id",
+            }
+        return {
+            "collection_name": workspace_ctx.collection_name,
+            "scope": {"workspace_id": str(workspace_ctx.id)},
+        }
+
+    def _index_settings(self, vector_config: Optional[VectorRagConfig]) -> dict[str, Any]:
+        """Settings a new collection for the workspace is created with.
+
+        The shared collection's index is built once for every workspace in it,
+        so per-workspace index options only apply to per-workspace collections.
+        """
+        if not vector_config:
+            return {"vector_size": 384, "distance": "cosine"}
+        settings: dict[str, Any] = {
+            "vector_size": vector_config.embedding_model_vector_size,
+            "distance": vector_config.distance_metric,
+        }
+        if not self.uses_shared_collection():
+            settings.update(
+                {
+                    "quantization": vector_config.quantization,
+                    "hnsw_m": vector_config.hnsw_m,
+                    "hnsw_ef_construct": vector_config.hnsw_ef_construct,
+                    "on_disk_vectors": vector_config.on_disk_vectors,
+                }
+            )
+        return settings
+
+    def _vector_store_config(
+        self, workspace_ctx: WorkspaceContext, vector_config: Optional[VectorRagConfig]
+    ) -> dict[str, Any]:
+        """Vector store settings for the workspace.
+
+        They include the collection's index settings, so a store that has to
+        create a missing collection builds it the way provisioning would.
+        """
+        payload_fields = config.vector_store.qdrant_payload_fields
+        if payload_fields is not None and config.vector_store.chunk_text_storage == "payload":
+            payload_fields = [*payload_fields, "text"]
+        return {
+            "host": config.vector_store.qdrant_host,
+            "port": config.vector_store.qdrant_port,
+            "grpc_port": config.vector_store.qdrant_grpc_port,
+            "prefer_grpc": config.vector_store.qdrant_prefer_grpc,
+            "upsert_batch_size": config.vector_store.qdrant_upsert_batch_size,
+            "upsert_parallel": config.vector_store.qdrant_upsert_parallel,
+            "upsert_wait": config.vector_store.qdrant_upsert_wait,
+            "payload_fields": payload_fields,
+            **self._collection_settings(workspace_ctx),
+            **self._index_settings(vector_config),
+        }
+
     def build_query_settings(self, workspace_id: int) -> dict[str, Any]:
         """Build vector query settings."""
         workspace_ctx = WorkspaceContext(id=workspace_id)
@@ -99,14 +179,22 @@ class VectorRagConfigProvider(RagConfigProvider):
         base_settings = {
             "rag_type": "vector",
             "embedder_type": get_default_embedding_algorithm(),
-            "embedder_config": {"base_url": config.llm.ollama_base_url},
-            "vector_store_type": "qdrant",
-            "vector_store_config": {
-                "host": config.vector_store.qdrant_host,
-                "port": config.vector_store.qdrant_port,
-                "collection_name": workspace_ctx.collection_name,
+            "embedder_config": {
+                "base_url": config.llm.ollama_base_url,
+                "cache_store": get_embedding_cache_store(),
             },
+            "vector_store_type": "qdrant",
+            "vector_store_config": self._vector_store_config(workspace_ctx, vector_config),
+            "retrieval_cache": self.retrieval_cache,
+            "chunk_text_store": get_chunk_text_store(),
             "enable_reranking": False,
+            "reranker_config": {
+                "model_name": config.cross_encoder_model,
+                "batch_size": config.cross_encoder_batch_size,
+                "max_length": config.cross_encoder_max_length,
+                "backend": config.cross_encoder_backend,
+                "quantize": config.cross_encoder_quantize,
+            },
             "top_k": 5,
         }
 
@@ -117,6 +205,7 @@ class VectorRagConfigProvider(RagConfigProvider):
                     "enable_reranking": vector_config.rerank_algorithm != "none",
                     "reranker_type": vector_config.rerank_algorithm,
                     "top_k": vector_config.top_k,
+                    "hnsw_ef": vector_config.hnsw_ef,
                 }
             )
 
@@ -138,13 +227,14 @@ class VectorRagConfigProvider(RagConfigProvider):
             "embedder_type": get_default_embedding_algorithm(),
             "embedder_config": {
                 "base_url": config.llm.ollama_base_url,
+                "batch_size": config.worker.batch_size,
+                "concurrency": config.worker.worker_concurrency,
+                "cache_store": get_embedding_cache_store(),
             },
             "vector_store_type": "qdrant",
-            "vector_store_config": {
-                "host": config.vector_store.qdrant_host,
-                "port": config.vector_store.qdrant_port,
-                "collection_name": workspace_ctx.collection_name,
-            },
+            "vector_store_config": self._vector_store_config(workspace_ctx, vector_config),
+            "retrieval_cache": self.retrieval_cache,
+            "chunk_text_store": get_chunk_text_store(),
             "enable_reranking": False,
             "reranker_type": get_default_reranking_algorithm(),
         }
@@ -168,23 +258,18 @@ class VectorRagConfigProvider(RagConfigProvider):
     def build_provisioning_settings(self, workspace_id: int) -> dict[str, Any]:
         """Build vector provisioning settings."""
         vector_config = self.get_config_model(workspace_id)
+        collection_settings = self._collection_settings(WorkspaceContext(id=workspace_id))
 
         # Get default vector config for provisioning
         base_settings = {
             "rag_type": "vector",
             "qdrant_url": f"http://{config.vector_store.qdrant_host}:{config.vector_store.qdrant_port}",
-            "vector_size": 384,  # Default embedding size
-            "distance": "cosine",
+            "collection_name": collection_settings["collection_name"],
+            "tenant_field": collection_settings.get("tenant_field"),
+            "chunk_text_store": get_chunk_text_store(),
+            **self._index_settings(vector_config),
         }
 
-        if vector_config:
-            base_settings.update(
-                {
-                    "vector_size": vector_config.embedding_model_vector_size,
-                    "distance": vector_config.distance_metric,
-                }
-            )
-
         return base_settings
 
 
@@ -217,6 +302,7 @@ class GraphRagConfigProvider(RagConfigProvider):
                 "uri": config.graph_store.neo4j_url,
                 "username": config.graph_store.neo4j_user,
                 "password": config.graph_store.neo4j_password,
+                "batch_size": config.graph_store.neo4j_batch_size,
                 "database": workspace_ctx.collection_name,
             },
             "max_traversal_depth": 2,
@@ -263,6 +349,7 @@ class GraphRagConfigProvider(RagConfigProvider):
                 "uri": config.graph_store.neo4j_url,
                 "username": config.graph_store.neo4j_user,
                 "password": config.graph_store.neo4j_password,
+                "batch_size": config.graph_store.neo4j_batch_size,
                 "database": workspace_ctx.collection_name,
             },
             "entity_extraction_type": get_default_entity_extraction_algorithm(),
@@ -285,6 +372,9 @@ class GraphRagConfigProvider(RagConfigProvider):
             "clustering_resolution": 1.0,
             "clustering_max_level": 3,
             "community_min_size": 3,
+            "community_detection": config.graph_community_detection,
+            "extraction_n_process": config.graph_extraction_processes,
+            "extraction_batch_size": config.graph_extraction_batch_size,
         }
 
         if graph_config:
@@ -318,6 +408,7 @@ class GraphRagConfigProvider(RagConfigProvider):
                 "uri": config.graph_store.neo4j_url,
                 "username": config.graph_store.neo4j_user,
                 "password": config.graph_store.neo4j_password,
+                "batch_size": config.graph_store.neo4j_batch_size,
             },
         }
 
@@ -4,10 +4,16 @@ This package provides interfaces and implementations for detecting communities
 in knowledge graphs as part of the Graph RAG pipeline.
 """
 
+from src.infrastructure.rag.steps.graph_rag.clustering.community_refresh import (
+    COMMUNITY_DETECTION_MODES,
+    refresh_communities,
+)
 from src.infrastructure.rag.steps.graph_rag.clustering.detector import CommunityDetector
 from src.infrastructure.rag.steps.graph_rag.clustering.factory import CommunityDetectorFactory
 
 __all__ = [
+    "COMMUNITY_DETECTION_MODES",
     "CommunityDetector",
     "CommunityDetectorFactory",
+    "refresh_communities",
 ]
@@ -0,0 +1,65 @@
+"""Community maintenance for Graph RAG workspaces.
+
+Detects communities with a CommunityDetector and stores those meeting the
+minimum size, either after each upload or on demand for a whole workspace.
+"""
+
+from typing import Optional
+
+from src.infrastructure.graph_stores.graph_store import GraphStore
+from src.infrastructure.logger import create_logger
+from src.infrastructure.rag.steps.graph_rag.clustering.detector import CommunityDetector
+
+logger = create_logger(__name__)
+
+# When communities are recomputed after an upload
+COMMUNITY_DETECTION_MODES = ("incremental", "full", "deferred")
+
+
+def refresh_communities(
+    detector: CommunityDetector,
+    graph_store: GraphStore,
+    workspace_id: str,
+    community_min_size: int = 3,
+    changed_entity_ids: Optional[list[str]] = None,
+) -> int:
+    """Detect communities for a workspace and store them.
+
+    Args:
+        detector: Community detection algorithm
+        graph_store: Graph store holding the workspace graph
+        workspace_id: Workspace identifier
+        community_min_size: Minimum number of entities for a community to be stored
+        changed_entity_ids: Entities added since the last detection (enables
+            incremental detection for detectors that support it; None recomputes
+            the whole workspace)
+
+    Returns:
+        Number of new or changed communities stored
+    """
+    communities, replaced_ids = detector.detect_community_changes(
+        graph_store, workspace_id, changed_entity_ids
+    )
+
+    # Community IDs derive from their members, so a community whose members
+    # changed is a new node: delete the communities it replaces before storing
+    # it. A full run replaces the whole partition; an incremental run only the
+    # communities whose member set changed.
+    if replaced_ids is None:
+        graph_store.clear_communities(workspace_id)
+    elif replaced_ids:
+        graph_store.clear_communities(workspace_id, replaced_ids)
+
+    # Filter to communities meeting minimum size
+    valid_communities = [c for c in communities if len(c.entity_ids) >= community_min_size]
+
+    if not valid_communities:
+        logger.info("No communities meeting minimum size threshold")
+        return 0
+
+    graph_store.upsert_communities(valid_communities, workspace_id)
+    logger.info(
+        f"Detected and stored {len(valid_communities)} communities "
+        f"(filtered from {len(communities)} total)"
+    )
+    return len(valid_communities)
@@ -5,6 +5,7 @@ of related entities in knowledge graphs.
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from src.infrastructure.graph_stores.graph_store import GraphStore
 from src.infrastructure.types.graph import Community
@@ -18,12 +19,20 @@ class CommunityDetector(ABC):
     """
 
     @abstractmethod
-    def detect_communities(self, graph_store: GraphStore, workspace_id: str) -> list[Community]:
+    def detect_communities(
+        self,
+        graph_store: GraphStore,
+        workspace_id: str,
+        changed_entity_ids: Optional[list[str]] = None,
+    ) -> list[Community]:
         """Detect communities in the graph.
 
         Args:
             graph_store: Graph store containing the entities and relationships
             workspace_id: Workspace identifier for data isolation
+            changed_entity_ids: Entities added or updated since the last detection.
+                Implementations that support incremental detection may keep the
+                stored membership of untouched entities; others recompute fully.
 
         Returns:
             List of detected communities
@@ -34,6 +43,29 @@ class CommunityDetector(ABC):
         """
         pass
 
+    def detect_community_changes(
+        self,
+        graph_store: GraphStore,
+        workspace_id: str,
+        changed_entity_ids: Optional[list[str]] = None,
+    ) -> tuple[list[Community], Optional[list[str]]]:
+        """Detect the communities that differ from the stored ones.
+
+        The default recomputes every community and replaces all stored ones.
+        Incremental implementations return only the communities whose member
+        set changed, with the stored communities they replace.
+
+        Args:
+            graph_store: Graph store containing the entities and relationships
+            workspace_id: Workspace identifier for data isolation
+            changed_entity_ids: Entities added or updated since the last detection
+
+        Returns:
+            Tuple of (new or changed communities, IDs of stored communities to
+            delete, or None to delete every stored community)
+        """
+        return self.detect_communities(graph_store, workspace_id, changed_entity_ids), None
+
     @abstractmethod
     def generate_summary(self, community: Community, graph_store: GraphStore) -> str:
         """Generate a summary for a community.
@@ -19,7 +19,7 @@ from src.infrastructure.graph_stores.graph_store import GraphStore
 from src.infrastructure.llm.llm_provider import LlmProvider
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.graph_rag.clustering.detector import CommunityDetector
-from src.infrastructure.types.graph import Community, CommunityMetadata
+from src.infrastructure.types.graph import Community, CommunityMetadata, Entity, Relationship
 
 logger = create_logger(__name__)
 
@@ -65,33 +65,100 @@ class LeidenDetector(CommunityDetector):
             f"Initialized Leiden detector with resolution={resolution}, max_level={max_level}"
         )
 
-    def detect_communities(self, graph_store: GraphStore, workspace_id: str) -> list[Community]:
-        """Detect communities using the Leiden algorithm."""
-        # Export the graph from the graph store
-        entities, relationships = graph_store.export_subgraph(workspace_id)
+    def detect_communities(
+        self,
+        graph_store: GraphStore,
+        workspace_id: str,
+        changed_entity_ids: Optional[list[str]] = None,
+    ) -> list[Community]:
+        """Detect communities using the Leiden algorithm.
+
+        When changed_entity_ids is given and the workspace already has stored
+        communities, only the changed entities' neighbourhood and the stored
+        communities touching it are loaded. Leiden is seeded with that membership
+        and only the changed entities, their neighbours and entities without a
+        community are allowed to move, so only communities of that region are
+        returned. Otherwise the whole graph is partitioned from scratch.
+        """
+        communities, _ = self._detect(graph_store, workspace_id, changed_entity_ids)
+        return communities
+
+    def detect_community_changes(
+        self,
+        graph_store: GraphStore,
+        workspace_id: str,
+        changed_entity_ids: Optional[list[str]] = None,
+    ) -> tuple[list[Community], Optional[list[str]]]:
+        """Detect communities, comparing an incremental run with the seeded membership.
+
+        Communities whose member set is unchanged are left out, as are the
+        stored communities they match; everything else is returned for
+        replacement.
+        """
+        communities, stored = self._detect(graph_store, workspace_id, changed_entity_ids)
+        if stored is None:
+            return communities, None
+
+        stored_ids = {frozenset(c.entity_ids): c.id for c in stored}
+        detected = {frozenset(c.entity_ids) for c in communities}
+        changed = [c for c in communities if frozenset(c.entity_ids) not in stored_ids]
+        replaced = [
+            community_id for members, community_id in stored_ids.items() if members not in detected
+        ]
+        logger.info(
+            f"{len(changed)} communities changed, replacing {len(replaced)} stored communities"
+        )
+        return changed, replaced
+
+    def _detect(
+        self,
+        graph_store: GraphStore,
+        workspace_id: str,
+        changed_entity_ids: Optional[list[str]],
+    ) -> tuple[list[Community], Optional[list[Community]]]:
+        """Run Leiden over the workspace or, incrementally, the changed region.
+
+        Returns:
+            Tuple of (detected communities, stored communities the run was seeded
+            with, or None for a full run)
+        """
+        region = None
+        if changed_entity_ids:
+            region = self._load_region(graph_store, workspace_id, changed_entity_ids)
+
+        if region is None:
+            stored = None
+            entities, relationships = graph_store.export_subgraph(workspace_id)
+        else:
+            entities, relationships, stored = region
 
         if not entities or not relationships:
             logger.warning("Empty graph, no communities to detect")
-            return []
+            return [], stored
 
         # Build igraph from entities and relationships
         graph = self._build_igraph(entities, relationships)
 
         if graph.vcount() == 0:
             logger.warning("Graph has no vertices")
-            return []
+            return [], stored
 
         # Run Leiden algorithm
         try:
-            partition = leidenalg.find_partition(
-                graph,
-                leidenalg.RBConfigurationVertexPartition,
-                resolution_parameter=self.resolution,
-                n_iterations=-1,  # Run until convergence
-            )
+            if stored is None:
+                partition = leidenalg.find_partition(
+                    graph,
+                    leidenalg.RBConfigurationVertexPartition,
+                    resolution_parameter=self.resolution,
+                    n_iterations=-1,  # Run until convergence
+                )
+            else:
+                partition = self._refine_partition(
+                    graph, self._seed_membership(entities, stored), set(changed_entity_ids or [])
+                )
         except Exception as e:
             logger.error(f"Leiden algorithm failed: {e}")
-            return []
+            return [], stored
 
         # Convert partition to Community objects
         communities = self._partition_to_communities(partition, entities, workspace_id, level=0)
@@ -103,7 +170,106 @@ class LeidenDetector(CommunityDetector):
         communities.sort(key=lambda c: c.score, reverse=True)
 
         logger.info(f"Detected {len(communities)} communities using Leiden algorithm")
-        return communities
+        return communities, stored
+
+    def _load_region(
+        self, graph_store: GraphStore, workspace_id: str, changed_entity_ids: list[str]
+    ) -> Optional[tuple[list[Entity], list[Relationship], list[Community]]]:
+        """Load the part of the graph an incremental run can change.
+
+        The region is the changed entities, their direct neighbours and every
+        member of the stored communities those belong to. Edges leaving the
+        region are not loaded; its vertices outside the neighbourhood stay fixed.
+
+        Args:
+            graph_store: Graph store holding the graph and previous communities
+            workspace_id: Workspace identifier
+            changed_entity_ids: Entities added or updated since the last detection
+
+        Returns:
+            Tuple of (entities, relationships, stored communities), or None if
+            the neighbourhood has no stored communities yet
+        """
+        neighbourhood = graph_store.traverse_graph(changed_entity_ids, workspace_id, max_depth=1)
+        region_ids = set(changed_entity_ids) | {entity.id for entity in neighbourhood.entities}
+
+        stored = graph_store.get_communities(sorted(region_ids), workspace_id)
+        if not stored:
+            return None
+
+        for community in stored:
+            region_ids.update(community.entity_ids)
+
+        entities, relationships = graph_store.export_subgraph(workspace_id, sorted(region_ids))
+        logger.info(
+            f"Loaded {len(entities)} entities around {len(changed_entity_ids)} changed entities"
+        )
+        return entities, relationships, stored
+
+    def _seed_membership(self, entities: list[Entity], stored: list[Community]) -> list[int]:
+        """Build a Leiden membership vector from the stored communities.
+
+        Args:
+            entities: List of Entity objects, in vertex order
+            stored: Stored communities of those entities
+
+        Returns:
+            Membership list (one community index per vertex)
+        """
+        # Communities come back highest score first; an entity keeps the first one seen
+        community_of: dict[str, int] = {}
+        for index, community in enumerate(stored):
+            for entity_id in community.entity_ids:
+                community_of.setdefault(entity_id, index)
+
+        # Entities without a stored community start as singletons
+        next_index = len(stored)
+        membership = []
+        for entity in entities:
+            if entity.id in community_of:
+                membership.append(community_of[entity.id])
+            else:
+                membership.append(next_index)
+                next_index += 1
+        return membership
+
+    def _refine_partition(self, graph: ig.Graph, initial_membership: list[int], changed: set[str]):
+        """Re-optimize a seeded partition, moving only the affected vertices.
+
+        Args:
+            graph: igraph Graph with vertex names set to entity IDs
+            initial_membership: Previous membership vector
+            changed: IDs of entities added or updated since the last detection
+
+        Returns:
+            Optimized Leiden partition
+        """
+        stored_sizes: dict[int, int] = {}
+        for community_index in initial_membership:
+            stored_sizes[community_index] = stored_sizes.get(community_index, 0) + 1
+
+        affected: set[int] = set()
+        for vertex in graph.vs:
+            if vertex["name"] in changed or stored_sizes[initial_membership[vertex.index]] == 1:
+                affected.add(vertex.index)
+                affected.update(graph.neighbors(vertex.index))
+
+        partition = leidenalg.RBConfigurationVertexPartition(
+            graph,
+            initial_membership=initial_membership,
+            resolution_parameter=self.resolution,
+        )
+        optimiser = leidenalg.Optimiser()
+        optimiser.optimise_partition(
+            partition,
+            n_iterations=-1,  # Run until convergence
+            is_membership_fixed=[index not in affected for index in range(graph.vcount())],
+        )
+
+        logger.info(
+            f"Re-optimized {len(affected)} of {graph.vcount()} vertices from stored communities"
+        )
+        return partition
 
     def generate_summary(self, community: Community, graph_store: GraphStore) -> str:
         """Generate a summary for a community."""
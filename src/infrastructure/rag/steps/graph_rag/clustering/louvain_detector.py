@@ -59,8 +59,17 @@ class LouvainDetector(CommunityDetector):
 
         logger.info(f"Initialized Louvain detector with resolution={resolution}")
 
-    def detect_communities(self, graph_store: GraphStore, workspace_id: str) -> list[Community]:
-        """Detect communities using the Louvain algorithm."""
+    def detect_communities(
+        self,
+        graph_store: GraphStore,
+        workspace_id: str,
+        changed_entity_ids: Optional[list[str]] = None,
+    ) -> list[Community]:
+        """Detect communities using the Louvain algorithm.
+
+        Louvain cannot be seeded with a previous partition, so the whole
+        workspace graph is always recomputed and changed_entity_ids is ignored.
+        """
         # Export the graph from the graph store
         entities, relationships = graph_store.export_subgraph(workspace_id)
 
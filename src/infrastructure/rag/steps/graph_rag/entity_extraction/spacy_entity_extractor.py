@@ -7,13 +7,17 @@ import hashlib
 import unicodedata
 from typing import Optional
 
-import spacy
 from spacy.language import Language
+from spacy.tokens import Doc
 
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.graph_rag.entity_extraction.entity_extractor import (
     EntityExtractor,
 )
+from src.infrastructure.rag.steps.graph_rag.spacy_models import (
+    get_spacy_model,
+    get_spacy_model_name,
+)
 from src.infrastructure.types.graph import Entity, EntityMetadata, EntityType
 
 logger = create_logger(__name__)
@@ -58,22 +62,38 @@ class SpacyEntityExtractor(EntityExtractor):
         Note:
             For better performance, use "en_core_web_trf" transformer model.
             Install with: python -m spacy download en_core_web_trf
+
+            The loaded pipeline is cached process-wide, so constructing an
+            extractor per upload or query does not reload the model.
         """
-        self.model_name = model_name
         self.entity_types = entity_types
         self.min_confidence = min_confidence
 
-        try:
-            self.nlp: Language = spacy.load(model_name)
-            logger.info(f"Loaded spaCy model: {model_name}")
-        except OSError:
-            logger.warning(f"Model {model_name} not found, falling back to en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
-            self.model_name = "en_core_web_sm"
+        # Shared with every other extractor using the same model
+        self.nlp: Language = get_spacy_model(model_name)
+        self.model_name = get_spacy_model_name(self.nlp)
 
     def extract_entities(self, text: str) -> list[Entity]:
         """Extract entities from text using spaCy NER."""
-        doc = self.nlp(text)
+        entities = self.extract_entities_from_doc(self.nlp(text))
+        logger.debug(f"Extracted {len(entities)} entities from text")
+        return entities
+
+    def extract_entities_batch(self, texts: list[str]) -> list[list[Entity]]:
+        """Extract entities from multiple texts using spaCy's pipe for efficiency."""
+        results = [self.extract_entities_from_doc(doc) for doc in self.nlp.pipe(texts)]
+        logger.info(f"Extracted entities from {len(texts)} texts in batch")
+        return results
+
+    def extract_entities_from_doc(self, doc: Doc) -> list[Entity]:
+        """Extract entities from a document already processed by this extractor's pipeline.
+
+        Args:
+            doc: spaCy Doc produced by ``self.nlp``
+
+        Returns:
+            List of extracted entities
+        """
         entities = []
 
         for ent in doc.ents:
@@ -114,52 +134,8 @@ class SpacyEntityExtractor(EntityExtractor):
                 )
             )
 
-        logger.debug(f"Extracted {len(entities)} entities from text")
         return entities
 
-    def extract_entities_batch(self, texts: list[str]) -> list[list[Entity]]:
-        """Extract entities from multiple texts using spaCy's pipe for efficiency."""
-        results = []
-
-        # Use spaCy's nlp.pipe for efficient batch processing
-        for doc in self.nlp.pipe(texts):
-            entities = []
-            for ent in doc.ents:
-                entity_type = self._map_label_to_type(ent.label_)
-                if entity_type is None:
-                    continue
-
-                if self.entity_types and entity_type not in self.entity_types:
-                    continue
-
-                confidence = self._get_confidence(ent)
-                if confidence < self.min_confidence:
-                    continue
-
-                normalized_text = self._normalize_text(ent.text)
-                entity_id = self._generate_entity_id(normalized_text, entity_type)
-
-                metadata: EntityMetadata = {
-                    "source_text": ent.text,
-                    "extraction_method": "spacy",
-                    "confidence_source": self.model_name,
-                }
-
-                entities.append(
-                    Entity(
-                        id=entity_id,
-                        text=normalized_text,
-                        type=entity_type,
-                        confidence=confidence,
-                        metadata=metadata,
-                    )
-                )
-
-            results.append(entities)
-
-        logger.info(f"Extracted entities from {len(texts)} texts in batch")
-        return results
-
     def _map_label_to_type(self, label: str) -> Optional[EntityType]:
         """Map spaCy NER label to EntityType enum."""
         return self.LABEL_MAPPING.get(label)
@@ -6,14 +6,17 @@ to identify subject-verb-object triples.
 
 from typing import Optional
 
-import spacy
 from spacy.language import Language
-from spacy.tokens import Token
+from spacy.tokens import Doc, Token
 
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.graph_rag.relationship_extraction.relationship_extractor import (
     RelationshipExtractor,
 )
+from src.infrastructure.rag.steps.graph_rag.spacy_models import (
+    get_spacy_model,
+    get_spacy_model_name,
+)
 from src.infrastructure.types.graph import Entity, Relationship, RelationshipMetadata, RelationType
 
 logger = create_logger(__name__)
@@ -67,27 +70,52 @@ class DependencyParserExtractor(RelationshipExtractor):
             relationship_types: List of relationship types to extract (None = all types)
             min_confidence: Minimum confidence threshold for relationships
         """
-        self.model_name = model_name
         self.relationship_types = relationship_types
         self.min_confidence = min_confidence
 
-        try:
-            self.nlp: Language = spacy.load(model_name)
-            logger.info(f"Loaded spaCy model for dependency parsing: {model_name}")
-        except OSError:
-            logger.warning(f"Model {model_name} not found, falling back to en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
-            self.model_name = "en_core_web_sm"
+        # Shared with the entity extractor when both use the same model
+        self.nlp: Language = get_spacy_model(model_name)
+        self.model_name = get_spacy_model_name(self.nlp)
 
     def extract_relationships(self, text: str, entities: list[Entity]) -> list[Relationship]:
         """Extract relationships using dependency parsing."""
         if not entities:
             return []
 
+        return self.extract_relationships_from_doc(self.nlp(text), entities)
+
+    def extract_relationships_batch(
+        self, texts: list[str], entities_batch: list[list[Entity]]
+    ) -> list[list[Relationship]]:
+        """Extract relationships from multiple texts using spaCy's pipe."""
+        results: list[list[Relationship]] = [[] for _ in texts]
+
+        # Only parse texts that have entities to relate
+        indices = [i for i, entities in enumerate(entities_batch) if entities]
+        docs = self.nlp.pipe(texts[i] for i in indices)
+        for i, doc in zip(indices, docs):
+            results[i] = self.extract_relationships_from_doc(doc, entities_batch[i])
+
+        logger.info(f"Extracted relationships from {len(texts)} texts in batch")
+        return results
+
+    def extract_relationships_from_doc(
+        self, doc: Doc, entities: list[Entity]
+    ) -> list[Relationship]:
+        """Extract relationships from a document already parsed by this extractor's pipeline.
+
+        Args:
+            doc: spaCy Doc produced by ``self.nlp`` (must include the dependency parse)
+            entities: Entities found in the document
+
+        Returns:
+            List of extracted relationships
+        """
+        if not entities:
+            return []
+
         # Create entity lookup by text for fast matching
         entity_map = {entity.text.lower(): entity for entity in entities}
-
-        doc = self.nlp(text)
         relationships = []
 
         # Extract subject-verb-object triples
@@ -123,19 +151,6 @@ class DependencyParserExtractor(RelationshipExtractor):
         logger.debug(f"Extracted {len(relationships)} relationships using dependency parsing")
         return relationships
 
-    def extract_relationships_batch(
-        self, texts: list[str], entities_batch: list[list[Entity]]
-    ) -> list[list[Relationship]]:
-        """Extract relationships from multiple texts using spaCy's pipe."""
-        results = []
-
-        for text, entities in zip(texts, entities_batch):
-            relationships = self.extract_relationships(text, entities)
-            results.append(relationships)
-
-        logger.info(f"Extracted relationships from {len(texts)} texts in batch")
-        return results
-
     def _find_subject(self, verb: Token) -> Optional[Token]:
         """Find the subject of a verb token."""
         for child in verb.children:
@@ -0,0 +1,96 @@
+"""Combined spaCy entity and relationship extraction.
+
+Running the entity extractor and the dependency parser separately tokenizes,
+tags and parses every chunk twice. This stage runs the shared pipeline once
+per chunk and feeds the same Doc to both extractors.
+"""
+
+from src.infrastructure.logger import create_logger
+from src.infrastructure.rag.steps.graph_rag.entity_extraction.spacy_entity_extractor import (
+    SpacyEntityExtractor,
+)
+from src.infrastructure.rag.steps.graph_rag.relationship_extraction.dependency_parser_extractor import (
+    DependencyParserExtractor,
+)
+from src.infrastructure.types.graph import Entity, Relationship
+
+logger = create_logger(__name__)
+
+
+class SpacyGraphExtractor:
+    """Extracts entities and relationships from one spaCy pass over each text.
+
+    Both extractors must use the same pipeline, which is the case whenever
+    they are created with the same model (see spacy_models.get_spacy_model).
+
+    Example:
+        extractor = SpacyGraphExtractor(
+            SpacyEntityExtractor(),
+            DependencyParserExtractor(),
+            n_process=4,
+        )
+        entities_batch, relationships_batch = extractor.extract_batch(chunk_texts)
+    """
+
+    def __init__(
+        self,
+        entity_extractor: SpacyEntityExtractor,
+        relationship_extractor: DependencyParserExtractor,
+        n_process: int = 1,
+        batch_size: int = 64,
+    ) -> None:
+        """Initialize the combined extractor.
+
+        Args:
+            entity_extractor: spaCy NER entity extractor
+            relationship_extractor: Dependency parser relationship extractor
+            n_process: Number of worker processes for nlp.pipe
+            batch_size: Number of texts per nlp.pipe batch
+
+        Raises:
+            ValueError: If the extractors use different pipelines or the
+                process/batch settings are not positive
+        """
+        if entity_extractor.nlp is not relationship_extractor.nlp:
+            raise ValueError(
+                "Entity and relationship extractors must share one spaCy pipeline "
+                f"({entity_extractor.model_name} != {relationship_extractor.model_name})"
+            )
+        if n_process <= 0:
+            raise ValueError(f"n_process must be positive, got {n_process}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        self.entity_extractor = entity_extractor
+        self.relationship_extractor = relationship_extractor
+        self.nlp = entity_extractor.nlp
+        self.n_process = n_process
+        self.batch_size = batch_size
+
+    def extract_batch(
+        self, texts: list[str]
+    ) -> tuple[list[list[Entity]], list[list[Relationship]]]:
+        """Extract entities and relationships from multiple texts.
+
+        Args:
+            texts: Texts to process
+
+        Returns:
+            Tuple of (entities per text, relationships per text), in input order
+        """
+        entities_batch: list[list[Entity]] = []
+        relationships_batch: list[list[Relationship]] = []
+
+        docs = self.nlp.pipe(texts, n_process=self.n_process, batch_size=self.batch_size)
+        for doc in docs:
+            entities = self.entity_extractor.extract_entities_from_doc(doc)
+            relationships = self.relationship_extractor.extract_relationships_from_doc(
+                doc, entities
+            )
+            entities_batch.append(entities)
+            relationships_batch.append(relationships)
+
+        logger.info(
+            f"Extracted entities and relationships from {len(texts)} texts in one spaCy pass"
+        )
+        return entities_batch, relationships_batch
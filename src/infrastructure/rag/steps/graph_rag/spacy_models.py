@@ -0,0 +1,79 @@
+"""Process-wide registry of loaded spaCy pipelines.
+
+Loading a spaCy model reads it from disk and builds every pipeline component,
+which dominates the cost of constructing an extractor. Workflows build new
+extractors for every upload and query, so pipelines are loaded once per
+process and shared by every extractor that asks for the same model.
+"""
+
+from collections.abc import Iterable
+from threading import Lock
+
+import spacy
+from spacy.language import Language
+
+from src.infrastructure.logger import create_logger
+
+logger = create_logger(__name__)
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+# Loaded pipelines keyed by (requested model name, excluded components)
+_models: dict[tuple[str, tuple[str, ...]], Language] = {}
+_models_lock = Lock()
+
+
+def get_spacy_model(model_name: str = DEFAULT_SPACY_MODEL, exclude: Iterable[str] = ()) -> Language:
+    """
+    Get a shared spaCy pipeline, loading it on first use.
+
+    Extractors that request the same model and components receive the same
+    Language object. If the model is not installed, the default model is
+    loaded instead (use get_spacy_model_name for the model actually loaded).
+
+    Args:
+        model_name: Name of the spaCy model (e.g. "en_core_web_sm")
+        exclude: Pipeline components to leave out when loading
+
+    Returns:
+        Loaded spaCy Language pipeline
+
+    Raises:
+        OSError: If neither the requested nor the default model is installed
+    """
+    key = (model_name, tuple(sorted(exclude)))
+
+    with _models_lock:
+        nlp = _models.get(key)
+        if nlp is None:
+            try:
+                nlp = spacy.load(model_name, exclude=list(key[1]))
+                logger.info(f"Loaded spaCy model: {model_name}")
+            except OSError:
+                if model_name == DEFAULT_SPACY_MODEL:
+                    raise
+                logger.warning(
+                    f"Model {model_name} not found, falling back to {DEFAULT_SPACY_MODEL}"
+                )
+                nlp = spacy.load(DEFAULT_SPACY_MODEL, exclude=list(key[1]))
+            _models[key] = nlp
+        return nlp
+
+
+def get_spacy_model_name(nlp: Language) -> str:
+    """
+    Get the package name of a loaded pipeline (e.g. "en_core_web_sm").
+
+    Args:
+        nlp: Loaded spaCy Language pipeline
+
+    Returns:
+        Model package name
+    """
+    return f"{nlp.meta.get('lang', 'xx')}_{nlp.meta.get('name', 'unknown')}"
+
+
+def clear_spacy_models() -> None:
+    """Drop all cached pipelines so the next request reloads them."""
+    with _models_lock:
+        _models.clear()
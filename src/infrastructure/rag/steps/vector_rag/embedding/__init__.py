@@ -1,9 +1,21 @@
 """Vector RAG embedding implementations."""
 
+from .cached_embedding_encoder import CachedEmbeddingEncoder
+from .concurrent_embedding_encoder import ConcurrentEmbeddingEncoder
+from .embedding_cache import (
+    EmbeddingCacheStore,
+    KeyValueEmbeddingCacheStore,
+    SqliteEmbeddingCacheStore,
+)
 from .ollama_vector_embedder import OllamaVectorEmbeddingEncoder
 from .vector_embedder import VectorEmbeddingEncoder
 
 __all__ = [
     "VectorEmbeddingEncoder",
     "OllamaVectorEmbeddingEncoder",
+    "ConcurrentEmbeddingEncoder",
+    "CachedEmbeddingEncoder",
+    "EmbeddingCacheStore",
+    "SqliteEmbeddingCacheStore",
+    "KeyValueEmbeddingCacheStore",
 ]
@@ -0,0 +1,159 @@
+"""Embedding encoder that serves repeated texts from an embedding cache."""
+
+from collections.abc import Iterable
+from threading import Lock
+
+from returns.result import Failure, Result, Success
+
+from src.infrastructure.logger import create_logger
+from src.infrastructure.types.common import HealthStatus
+
+from .embedding_cache import EmbeddingCacheStore, embedding_cache_key
+from .vector_embedder import EmbeddingError, PartialEmbeddings, VectorEmbeddingEncoder
+
+logger = create_logger(__name__)
+
+
+class CachedEmbeddingEncoder(VectorEmbeddingEncoder):
+    """
+    Wraps any VectorEmbeddingEncoder with a content-addressed embedding cache.
+
+    Texts are looked up by (model name, SHA-256 of normalized text). Only cache
+    misses are sent to the wrapped encoder, each distinct text at most once per
+    call, and the new embeddings are written back to the store.
+
+    Cache backend errors never fail an encode call; the encoder falls back to
+    the wrapped provider.
+
+    Example:
+        encoder = CachedEmbeddingEncoder(
+            OllamaVectorEmbeddingEncoder(model="nomic-embed-text", base_url=url, timeout=30),
+            SqliteEmbeddingCacheStore(".cache/embeddings.sqlite3"),
+        )
+        result = encoder.encode(chunk_texts)
+        encoder.get_stats()  # {"hits": ..., "misses": ...}
+    """
+
+    def __init__(self, encoder: VectorEmbeddingEncoder, store: EmbeddingCacheStore) -> None:
+        """
+        Initialize the cached encoder.
+
+        Args:
+            encoder: Encoder used for cache misses
+            store: Embedding cache backend
+        """
+        self._encoder = encoder
+        self._store = store
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = Lock()
+
+    def encode(self, texts: Iterable[str]) -> Result[list[list[float]], EmbeddingError]:
+        """
+        Encode texts, embedding only those not already cached.
+
+        Args:
+            texts: Iterable of text strings to encode
+
+        Returns:
+            Result containing embeddings in input order, or EmbeddingError on failure
+        """
+        return self.encode_partial(texts).bind(PartialEmbeddings.to_result)
+
+    def encode_partial(self, texts: Iterable[str]) -> Result[PartialEmbeddings, EmbeddingError]:
+        """
+        Encode texts not already cached, keeping per-text failures of the misses.
+
+        Only successfully embedded texts are written to the cache.
+
+        Args:
+            texts: Iterable of text strings to encode
+
+        Returns:
+            Result containing embeddings in input order with per-text failures,
+            or EmbeddingError if the misses could not be encoded at all
+        """
+        texts_list = list(texts)
+        if not texts_list:
+            return Success(PartialEmbeddings(embeddings=[]))
+
+        model_name = self._encoder.get_model_name()
+        keys = [embedding_cache_key(model_name, text) for text in texts_list]
+
+        try:
+            cached = self._store.get_many(list(dict.fromkeys(keys)))
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, bypassing cache: {e}")
+            cached = {}
+
+        # Deduplicate misses so each distinct text is embedded once.
+        miss_texts: dict[str, str] = {}
+        for key, text in zip(keys, texts_list):
+            if key not in cached and key not in miss_texts:
+                miss_texts[key] = text
+
+        with self._stats_lock:
+            self._hits += len(texts_list) - len(miss_texts)
+            self._misses += len(miss_texts)
+
+        failed: dict[str, EmbeddingError] = {}
+        if miss_texts:
+            result = self._encoder.encode_partial(list(miss_texts.values()))
+            if isinstance(result, Failure):
+                return Failure(result.failure())
+
+            partial = result.unwrap()
+            miss_keys = list(miss_texts.keys())
+            failed = {miss_keys[index]: error for index, error in partial.failures.items()}
+            computed = {
+                key: embedding
+                for key, embedding in zip(miss_keys, partial.embeddings)
+                if embedding is not None
+            }
+            try:
+                self._store.set_many(computed)
+            except Exception as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+            cached.update(computed)
+
+        return Success(
+            PartialEmbeddings(
+                embeddings=[cached.get(key) for key in keys],
+                failures={index: failed[key] for index, key in enumerate(keys) if key in failed},
+            )
+        )
+
+    def encode_one(self, text: str) -> Result[list[float], EmbeddingError]:
+        """
+        Encode a single text into a vector.
+
+        Args:
+            text: Text string to encode
+
+        Returns:
+            Result containing vector embedding, or EmbeddingError on failure
+        """
+        return self.encode([text]).map(lambda embeddings: embeddings[0])
+
+    def get_dimension(self) -> int:
+        """Get the dimension of the wrapped encoder's vectors."""
+        return self._encoder.get_dimension()
+
+    def get_model_name(self) -> str:
+        """Get the name of the wrapped encoder's model."""
+        return self._encoder.get_model_name()
+
+    def health_check(self) -> HealthStatus:
+        """Check the health of the wrapped encoder."""
+        return self._encoder.health_check()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache hit/miss counters.
+
+        Returns:
+            Dictionary with hits, misses, and any backend statistics
+        """
+        with self._stats_lock:
+            stats = {"hits": self._hits, "misses": self._misses}
+        return {**stats, **self._store.get_stats()}
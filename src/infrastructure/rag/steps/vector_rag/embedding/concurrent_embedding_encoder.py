@@ -0,0 +1,171 @@
+"""Concurrent embedding encoder that runs batches of another encoder in parallel."""
+
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from returns.result import Failure, Result, Success
+
+from src.infrastructure.logger import create_logger
+from src.infrastructure.types.common import HealthStatus
+
+from .vector_embedder import EmbeddingError, PartialEmbeddings, VectorEmbeddingEncoder
+
+logger = create_logger(__name__)
+
+
+class ConcurrentEmbeddingEncoder(VectorEmbeddingEncoder):
+    """
+    Wraps any VectorEmbeddingEncoder and keeps several batches in flight.
+
+    Input texts are split into batches of ``batch_size`` and handed to the wrapped
+    encoder on a thread pool. At most ``max_concurrency`` batches are outstanding
+    at any time; the next batch is only submitted once the oldest one finishes,
+    so memory stays bounded regardless of document size and results come back
+    in input order.
+
+    Example:
+        encoder = ConcurrentEmbeddingEncoder(
+            OllamaVectorEmbeddingEncoder(model="nomic-embed-text", base_url=url, timeout=30),
+            batch_size=32,
+            max_concurrency=4,
+        )
+        result = encoder.encode(chunk_texts)
+    """
+
+    def __init__(
+        self,
+        encoder: VectorEmbeddingEncoder,
+        batch_size: int = 32,
+        max_concurrency: int = 2,
+    ) -> None:
+        """
+        Initialize the concurrent encoder.
+
+        Args:
+            encoder: Encoder used to embed each batch
+            batch_size: Number of texts per batch handed to the wrapped encoder
+            max_concurrency: Maximum number of batches in flight at once
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+
+        self._encoder = encoder
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+
+    def encode(self, texts: Iterable[str]) -> Result[list[list[float]], EmbeddingError]:
+        """
+        Encode texts with up to ``max_concurrency`` batches running in parallel.
+
+        Args:
+            texts: Iterable of text strings to encode
+
+        Returns:
+            Result containing embeddings in input order, or the first EmbeddingError
+        """
+        return self.encode_partial(texts).bind(PartialEmbeddings.to_result)
+
+    def encode_partial(self, texts: Iterable[str]) -> Result[PartialEmbeddings, EmbeddingError]:
+        """
+        Encode texts in parallel batches, keeping per-text failures of each batch.
+
+        Args:
+            texts: Iterable of text strings to encode
+
+        Returns:
+            Result containing embeddings in input order with per-text failures,
+            or the first EmbeddingError that failed a whole batch
+        """
+        texts_list = list(texts)
+        if not texts_list:
+            return Success(PartialEmbeddings(embeddings=[]))
+
+        batches = [
+            texts_list[i : i + self._batch_size]
+            for i in range(0, len(texts_list), self._batch_size)
+        ]
+        if len(batches) == 1 or self._max_concurrency == 1:
+            return self._encode_sequential(batches)
+
+        partial = PartialEmbeddings(embeddings=[])
+        in_flight: deque[Future[Result[PartialEmbeddings, EmbeddingError]]] = deque()
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="embedding"
+        ) as executor:
+            try:
+                for batch in batches:
+                    if len(in_flight) >= self._max_concurrency:
+                        failure = self._collect(in_flight.popleft(), partial)
+                        if failure is not None:
+                            return failure
+                    in_flight.append(executor.submit(self._encoder.encode_partial, batch))
+
+                while in_flight:
+                    failure = self._collect(in_flight.popleft(), partial)
+                    if failure is not None:
+                        return failure
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+        logger.debug(
+            "Encoded texts concurrently",
+            extra={"texts": len(texts_list), "batches": len(batches)},
+        )
+        return Success(partial)
+
+    def encode_one(self, text: str) -> Result[list[float], EmbeddingError]:
+        """
+        Encode a single text into a vector.
+
+        Args:
+            text: Text string to encode
+
+        Returns:
+            Result containing vector embedding, or EmbeddingError on failure
+        """
+        return self._encoder.encode_one(text)
+
+    def get_dimension(self) -> int:
+        """Get the dimension of the wrapped encoder's vectors."""
+        return self._encoder.get_dimension()
+
+    def get_model_name(self) -> str:
+        """Get the name of the wrapped encoder's model."""
+        return self._encoder.get_model_name()
+
+    def health_check(self) -> HealthStatus:
+        """Check the health of the wrapped encoder."""
+        return self._encoder.health_check()
+
+    def _encode_sequential(
+        self, batches: list[list[str]]
+    ) -> Result[PartialEmbeddings, EmbeddingError]:
+        """Encode batches one after another on the calling thread."""
+        partial = PartialEmbeddings(embeddings=[])
+        for batch in batches:
+            result = self._encoder.encode_partial(batch)
+            if isinstance(result, Failure):
+                return Failure(result.failure())
+            partial.extend(result.unwrap())
+        return Success(partial)
+
+    @staticmethod
+    def _collect(
+        future: "Future[Result[PartialEmbeddings, EmbeddingError]]",
+        partial: PartialEmbeddings,
+    ) -> "Failure[EmbeddingError] | None":
+        """Wait for a batch, append its results, and return a Failure if it failed."""
+        try:
+            result = future.result()
+        except Exception as e:
+            return Failure(EmbeddingError(f"Embedding batch failed: {e}", code="BATCH_ERROR"))
+
+        if isinstance(result, Failure):
+            return Failure(result.failure())
+        partial.extend(result.unwrap())
+        return None
@@ -0,0 +1,308 @@
+"""Content-addressed storage for previously computed embeddings.
+
+Embeddings are keyed by the embedding model name and the SHA-256 of the
+normalized input text, so identical chunks (re-uploads, shared boilerplate)
+are only sent to the embedding provider once.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from array import array
+from threading import Lock
+from typing import Optional
+
+from src.cache_keys import CacheKeys
+from src.infrastructure.cache.cache import Cache
+from src.infrastructure.logger import create_logger
+
+logger = create_logger(__name__)
+
+
+def embedding_cache_key(model_name: str, text: str) -> str:
+    """
+    Build the content-addressed key for a (model, text) pair.
+
+    Text is NFC-normalized, stripped, and has runs of whitespace collapsed so
+    that formatting-only differences share one cache entry.
+
+    Args:
+        model_name: Name of the embedding model
+        text: Input text
+
+    Returns:
+        Key in format '{model_name}:{sha256 hex}'
+    """
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return f"{model_name}:{digest}"
+
+
+class EmbeddingCacheStore(ABC):
+    """Interface for persistent embedding storage backends."""
+
+    @abstractmethod
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """
+        Look up embeddings for several keys.
+
+        Args:
+            keys: Content-addressed embedding keys
+
+        Returns:
+            Mapping of key to embedding for the keys that were found
+        """
+        pass
+
+    @abstractmethod
+    def set_many(self, embeddings: dict[str, list[float]]) -> None:
+        """
+        Store embeddings for several keys.
+
+        Args:
+            embeddings: Mapping of key to embedding
+        """
+        pass
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get backend statistics.
+
+        Returns:
+            Dictionary of counters (backend specific)
+        """
+        return {}
+
+
+class SqliteEmbeddingCacheStore(EmbeddingCacheStore):
+    """
+    On-disk embedding store backed by SQLite.
+
+    Vectors are stored as packed float32 blobs. The store is bounded to
+    ``max_entries`` rows; when the bound is exceeded the least recently used
+    rows are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100_000) -> None:
+        """
+        Open (or create) the SQLite embedding store.
+
+        Args:
+            path: Database file path (":memory:" for a non-persistent store)
+            max_entries: Maximum number of embeddings kept on disk
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self._max_entries = max_entries
+        self._evictions = 0
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+        )
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up embeddings and refresh their LRU timestamp."""
+        if not keys:
+            return {}
+
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            # SQLite limits bound parameters per statement; stay well below it.
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+        return found
+
+    def set_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Store embeddings and evict the least recently used rows over the bound."""
+        if not embeddings:
+            return
+
+        now = time.time()
+        rows = [(key, array("f", vector).tobytes(), now) for key, vector in embeddings.items()]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    rows,
+                )
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+                overflow = count - self._max_entries
+                if overflow > 0:
+                    self._conn.execute(
+                        """
+                        DELETE FROM embeddings WHERE key IN (
+                            SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?
+                        )
+                        """,
+                        (overflow,),
+                    )
+                    self._evictions += overflow
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get_stats(self) -> dict[str, int]:
+        """Get entry and eviction counts."""
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return {"entries": count, "max_entries": self._max_entries, "evictions": self._evictions}
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class KeyValueEmbeddingCacheStore(EmbeddingCacheStore):
+    """
+    Embedding store on top of the application Cache (Redis or in-memory).
+
+    Size is bounded by the cache itself: entries expire after ``ttl`` seconds,
+    and Redis evicts according to its ``maxmemory-policy`` (e.g. allkeys-lru).
+    """
+
+    def __init__(self, cache: Cache, ttl: Optional[int] = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            cache: Cache instance used for storage
+            ttl: Entry time-to-live in seconds (defaults to the cache's default TTL)
+        """
+        self._cache = cache
+        self._ttl = ttl
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up embeddings in the cache with one batched read."""
+        cache_keys = {CacheKeys.embedding(key): key for key in keys}
+        found: dict[str, list[float]] = {}
+        for cache_key, cached in self._cache.get_many(list(cache_keys)).items():
+            key = cache_keys[cache_key]
+            if isinstance(cached, list):
+                found[key] = cached
+            else:
+                logger.warning(f"Discarding undecodable cached embedding {key}")
+        return found
+
+    def set_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Store embeddings in the cache with one batched write."""
+        self._cache.set_many(
+            {CacheKeys.embedding(key): vector for key, vector in embeddings.items()},
+            ttl=self._ttl,
+        )
+
+
+def create_embedding_cache_store(
+    store_type: str,
+    path: str = ".cache/embeddings.sqlite3",
+    max_entries: int = 100_000,
+    cache: Optional[Cache] = None,
+    ttl: Optional[int] = None,
+) -> Optional[EmbeddingCacheStore]:
+    """
+    Create an embedding cache store.
+
+    Args:
+        store_type: "sqlite", "cache" (application cache, e.g. Redis), or "none"
+        path: SQLite database path (sqlite only)
+        max_entries: Maximum number of entries (sqlite only)
+        cache: Cache instance (cache only)
+        ttl: Entry time-to-live in seconds (cache only)
+
+    Returns:
+        EmbeddingCacheStore instance, or None when caching is disabled
+
+    Raises:
+        ValueError: If store_type is not supported or required parameters are missing
+    """
+    if store_type == "none":
+        return None
+    if store_type == "sqlite":
+        return SqliteEmbeddingCacheStore(path=path, max_entries=max_entries)
+    if store_type == "cache":
+        if cache is None:
+            raise ValueError("cache is required for the 'cache' embedding cache store")
+        return KeyValueEmbeddingCacheStore(cache=cache, ttl=ttl)
+    raise ValueError(f"Unsupported embedding cache type: {store_type}")
+
+
+# Process-wide store shared by all embedders (created lazily from config)
+_store_instance: Optional[EmbeddingCacheStore] = None
+_store_initialized = False
+_store_lock = Lock()
+
+
+def get_embedding_cache_store() -> Optional[EmbeddingCacheStore]:
+    """
+    Get the process-wide embedding cache store configured by EMBEDDING_CACHE_TYPE.
+
+    Returns:
+        EmbeddingCacheStore instance, or None when caching is disabled
+    """
+    global _store_instance, _store_initialized
+    with _store_lock:
+        if not _store_initialized:
+            from src.config import config
+            from src.infrastructure.cache.factory import create_cache
+
+            cache: Optional[Cache] = None
+            if config.embedding_cache_type == "cache":
+                cache_config = config.cache
+                cache = create_cache(
+                    cache_type=cache_config.cache_type,
+                    host=cache_config.redis_host,
+                    port=cache_config.redis_port,
+                    db=cache_config.redis_db,
+                    default_ttl=cache_config.redis_ttl,
+                    codec=cache_config.codec,
+                    max_entries=cache_config.memory_max_entries,
+                    max_bytes=cache_config.memory_max_bytes,
+                )
+
+            _store_instance = create_embedding_cache_store(
+                config.embedding_cache_type,
+                path=config.embedding_cache_path,
+                max_entries=config.embedding_cache_max_entries,
+                cache=cache,
+            )
+            _store_initialized = True
+            if _store_instance is not None:
+                logger.info(f"Embedding cache initialized ({config.embedding_cache_type})")
+        return _store_instance
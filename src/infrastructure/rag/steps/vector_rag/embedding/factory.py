@@ -1,8 +1,12 @@
 """Factory for creating embedding encoder instances."""
 
 from enum import Enum
+from typing import Optional
 
+from .cached_embedding_encoder import CachedEmbeddingEncoder
+from .concurrent_embedding_encoder import ConcurrentEmbeddingEncoder
 from .dummy_embedding_provider import DummyEmbeddingProvider
+from .embedding_cache import EmbeddingCacheStore
 from .ollama_vector_embedder import OllamaVectorEmbeddingEncoder
 from .vector_embedder import VectorEmbeddingEncoder
 
@@ -23,14 +27,20 @@ class EmbedderFactory:
 
         Args:
             embedder_type: Type of embedder to create
-            **kwargs: Additional configuration (base_url, timeout)
+            **kwargs: Additional configuration
+                (base_url, timeout, batch_size, concurrency, cache_store)
 
         Returns:
             VectorEmbeddingEncoder instance
         """
         base_url = kwargs.get("base_url", "http://localhost:11434")
         timeout = kwargs.get("timeout", 30)
-        return create_embedder_from_config(embedder_type, base_url, timeout)
+        batch_size = kwargs.get("batch_size", 32)
+        concurrency = kwargs.get("concurrency", 1)
+        cache_store = kwargs.get("cache_store")
+        return create_embedder_from_config(
+            embedder_type, base_url, timeout, batch_size, concurrency, cache_store
+        )
 
 
 AVAILABLE_EMBEDDERS = {
@@ -65,6 +75,9 @@ def create_embedder_from_config(
     embedding_algorithm: str,
     base_url: str,
     timeout: int = 30,
+    batch_size: int = 32,
+    concurrency: int = 1,
+    cache_store: Optional[EmbeddingCacheStore] = None,
 ) -> VectorEmbeddingEncoder:
     """
     Create an embedding encoder instance based on algorithm configuration.
@@ -73,6 +86,9 @@ def create_embedder_from_config(
         embedding_algorithm: Algorithm/model type ("nomic-embed-text", "all-MiniLM-L6-v2", "dummy", etc.)
         base_url: Ollama server URL
         timeout: Request timeout in seconds (default 30)
+        batch_size: Number of texts sent per embedding request (default 32)
+        concurrency: Number of embedding requests kept in flight (default 1, sequential)
+        cache_store: Optional embedding cache; when set only cache misses reach Ollama
 
     Returns:
         VectorEmbeddingEncoder instance
@@ -82,8 +98,19 @@ def create_embedder_from_config(
         return DummyEmbeddingProvider(dimension=384)
 
     # All other embedding algorithms currently use Ollama infrastructure
-    return OllamaVectorEmbeddingEncoder(
+    encoder: VectorEmbeddingEncoder = OllamaVectorEmbeddingEncoder(
         model=embedding_algorithm,
         base_url=base_url,
         timeout=timeout,
+        batch_size=batch_size,
     )
+
+    if concurrency > 1:
+        encoder = ConcurrentEmbeddingEncoder(
+            encoder, batch_size=batch_size, max_concurrency=concurrency
+        )
+
+    if cache_store is not None:
+        encoder = CachedEmbeddingEncoder(encoder, cache_store)
+
+    return encoder
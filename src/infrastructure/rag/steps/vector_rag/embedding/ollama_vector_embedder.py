@@ -6,13 +6,18 @@ from typing import Optional
 import requests
 from returns.result import Failure, Result, Success
 
+from src.infrastructure.http_session import get_http_session, http_timeout
 from src.infrastructure.logger import create_logger
 from src.infrastructure.types.common import HealthStatus
 
-from .vector_embedder import EmbeddingError, VectorEmbeddingEncoder
+from .vector_embedder import EmbeddingError, PartialEmbeddings, VectorEmbeddingEncoder
 
 logger = create_logger(__name__)
 
+# Ollama reports over-long inputs as "input length exceeds the context length",
+# with status 400 on recent versions and 500 on older ones
+CONTEXT_LENGTH_ERROR = "context length"
+
 
 class OllamaVectorEmbeddingEncoder(VectorEmbeddingEncoder):
     """
@@ -44,6 +49,7 @@ class OllamaVectorEmbeddingEncoder(VectorEmbeddingEncoder):
         model: str,
         base_url: str,
         timeout: int,
+        batch_size: int = 32,
     ) -> None:
         """
         Initialize Ollama embeddings.
@@ -52,35 +58,60 @@ class OllamaVectorEmbeddingEncoder(VectorEmbeddingEncoder):
             model: Name of the embedding model (e.g., "nomic-embed-text")
             base_url: Ollama server URL
             timeout: Request timeout in seconds
+            batch_size: Maximum number of texts sent per /api/embed request
         """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
         self._model = model
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._batch_size = batch_size
         self._dimension: Optional[int] = None
+        self._session = get_http_session(self._base_url, retry_post=True)
 
     def encode(self, texts: Iterable[str]) -> Result[list[list[float]], EmbeddingError]:
         """
         Batch encode multiple texts into vectors.
 
+        Texts are sent to Ollama in batches of ``batch_size``. If any text is
+        rejected, the whole call fails; use ``encode_partial`` to keep the rest.
+
         Args:
             texts: Iterable of text strings to encode
 
         Returns:
-            Result containing list of embedding vectors, or EmbeddingError on failure
+            Result containing list of embedding vectors (in input order),
+            or EmbeddingError on failure
         """
-        texts_list = list(texts)
-        if not texts_list:
-            return Success([])
+        return self.encode_partial(texts).bind(PartialEmbeddings.to_result)
+
+    def encode_partial(self, texts: Iterable[str]) -> Result[PartialEmbeddings, EmbeddingError]:
+        """
+        Batch encode texts, reporting rejected texts by index.
+
+        Texts are sent to Ollama in batches of ``batch_size``. If a batch is
+        rejected, it is split in half and retried so a single problematic text
+        is isolated and reported instead of failing its neighbours.
+
+        Args:
+            texts: Iterable of text strings to encode
 
-        embeddings: list[list[float]] = []
+        Returns:
+            Result containing embeddings (in input order) and per-text failures,
+            or EmbeddingError if Ollama could not be reached
+        """
+        texts_list = list(texts)
+        partial = PartialEmbeddings(embeddings=[])
 
-        for text in texts_list:
-            result = self.encode_one(text)
+        for start in range(0, len(texts_list), self._batch_size):
+            batch = texts_list[start : start + self._batch_size]
+            result = self._encode_with_split(batch, offset=start)
             if isinstance(result, Failure):
                 return Failure(result.failure())
-            embeddings.append(result.unwrap())
+            partial.extend(result.unwrap())
 
-        return Success(embeddings)
+        return Success(partial)
 
     def encode_one(self, text: str) -> Result[list[float], EmbeddingError]:
         """
@@ -92,30 +123,97 @@ class OllamaVectorEmbeddingEncoder(VectorEmbeddingEncoder):
         Returns:
             Result containing embedding vector, or EmbeddingError on failure
         """
+        result = self._encode_batch([text])
+        return result.map(lambda embeddings: embeddings[0])
+
+    def _encode_with_split(
+        self, texts: list[str], offset: int
+    ) -> Result[PartialEmbeddings, EmbeddingError]:
+        """
+        Encode a batch, halving it on rejection until the failing text is isolated.
+
+        Only INPUT_REJECTED errors are split. Connection errors, timeouts and
+        server errors are returned as-is, since splitting the batch would only
+        multiply the number of failing requests.
+
+        Args:
+            texts: Texts in this batch
+            offset: Index of the first text within the original input (for logging)
+
+        Returns:
+            Result containing the batch's embeddings in order with the isolated
+            failures, or EmbeddingError if Ollama could not be reached
+        """
+        result = self._encode_batch(texts)
+        if not isinstance(result, Failure):
+            return Success(PartialEmbeddings(embeddings=list(result.unwrap())))
+
+        error = result.failure()
+        if error.code != "INPUT_REJECTED":
+            return Failure(error)
+        if len(texts) == 1:
+            logger.warning(
+                "Ollama rejected text, skipping it",
+                extra={"index": offset, "error": str(error)},
+            )
+            return Success(PartialEmbeddings(embeddings=[None], failures={0: error}))
+
+        logger.warning(
+            "Ollama embedding batch failed, splitting",
+            extra={"batch_size": len(texts), "offset": offset, "error": str(error)},
+        )
+        middle = len(texts) // 2
+        left = self._encode_with_split(texts[:middle], offset)
+        if isinstance(left, Failure):
+            return left
+        right = self._encode_with_split(texts[middle:], offset + middle)
+        if isinstance(right, Failure):
+            return right
+
+        partial = left.unwrap()
+        partial.extend(right.unwrap())
+        return Success(partial)
+
+    def _encode_batch(self, texts: list[str]) -> Result[list[list[float]], EmbeddingError]:
+        """
+        Send a single /api/embed request for a batch of texts.
+
+        Args:
+            texts: Texts to encode in one request
+
+        Returns:
+            Result containing one embedding per text, or EmbeddingError on failure;
+            a 4xx or context-length response has code INPUT_REJECTED
+        """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self._base_url}/api/embed",
                 json={
                     "model": self._model,
-                    "input": text,
+                    "input": texts,
                 },
-                timeout=self._timeout,
+                timeout=http_timeout(self._timeout),
             )
             response.raise_for_status()
 
             result = response.json()
             # Ollama 0.13+ returns embeddings as array of arrays
-            embeddings_list = result.get("embeddings", result.get("embedding", []))
-            embedding: list[float] = (
-                embeddings_list[0]
-                if embeddings_list and isinstance(embeddings_list[0], list)
-                else embeddings_list
-            )
+            embeddings: list[list[float]] = result.get("embeddings", [])
+            if not embeddings and result.get("embedding"):
+                embeddings = [result["embedding"]]
+
+            if len(embeddings) != len(texts):
+                return Failure(
+                    EmbeddingError(
+                        f"Ollama returned {len(embeddings)} embeddings for {len(texts)} texts",
+                        code="RESPONSE_ERROR",
+                    )
+                )
 
-            if self._dimension is None and embedding:
-                self._dimension = len(embedding)
+            if self._dimension is None and embeddings[0]:
+                self._dimension = len(embeddings[0])
 
-            return Success(embedding)
+            return Success(embeddings)
 
         except requests.exceptions.ConnectionError as e:
             logger.error("Connection failed to Ollama", extra={"error": str(e)})
@@ -127,6 +225,10 @@ class OllamaVectorEmbeddingEncoder(VectorEmbeddingEncoder):
             return Failure(EmbeddingError(f"Request timeout: {e}", code="TIMEOUT_ERROR"))
         except requests.exceptions.HTTPError as e:
             logger.error("HTTP error from Ollama", extra={"error": str(e)})
+            status = e.response.status_code if e.response is not None else 0
+            body = e.response.text if e.response is not None else ""
+            if 400 <= status < 500 or CONTEXT_LENGTH_ERROR in body:
+                return Failure(EmbeddingError(f"Input rejected: {e}", code="INPUT_REJECTED"))
             return Failure(EmbeddingError(f"HTTP error: {e}", code="HTTP_ERROR"))
         except requests.exceptions.RequestException as e:
             logger.error("Failed to get embedding from Ollama", extra={"error": str(e)})
@@ -165,7 +267,7 @@ class OllamaVectorEmbeddingEncoder(VectorEmbeddingEncoder):
             Dictionary with health status
         """
         try:
-            response = requests.get(f"{self._base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self._base_url}/api/tags", timeout=http_timeout(5))
             response.raise_for_status()
 
             models_data = response.json().get("models", [])
@@ -2,8 +2,10 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Optional
 
-from returns.result import Result
+from returns.result import Failure, Result, Success
 
 from src.infrastructure.types.common import HealthStatus
 
@@ -27,6 +29,37 @@ class EmbeddingError(Exception):
         return f"[{self.code}] {self.message}"
 
 
+@dataclass
+class PartialEmbeddings:
+    """
+    Embeddings for a batch of texts, some of which may have failed.
+
+    Attributes:
+        embeddings: One vector per input text, or None where the text failed
+        failures: Error for each failed text, keyed by its index in the input
+    """
+
+    embeddings: list[Optional[list[float]]]
+    failures: dict[int, EmbeddingError] = field(default_factory=dict)
+
+    def extend(self, other: "PartialEmbeddings") -> None:
+        """Append another batch's results, shifting its failure indices."""
+        offset = len(self.embeddings)
+        self.embeddings.extend(other.embeddings)
+        for index, error in other.failures.items():
+            self.failures[offset + index] = error
+
+    def to_result(self) -> Result[list[list[float]], EmbeddingError]:
+        """All embeddings, or the first failure if any text failed."""
+        if self.failures:
+            index = min(self.failures)
+            error = self.failures[index]
+            return Failure(
+                EmbeddingError(f"Text at index {index}: {error.message}", code=error.code)
+            )
+        return Success([embedding for embedding in self.embeddings if embedding is not None])
+
+
 class VectorEmbeddingEncoder(ABC):
     """
     Interface for generating vector embeddings from text.
@@ -50,6 +83,24 @@ class VectorEmbeddingEncoder(ABC):
         """
         pass
 
+    def encode_partial(self, texts: Iterable[str]) -> Result[PartialEmbeddings, EmbeddingError]:
+        """
+        Encode multiple texts, reporting texts that fail instead of failing the batch.
+
+        Encoders that cannot isolate failing texts fail the whole batch, which is
+        the default.
+
+        Args:
+            texts: Iterable of text strings to encode
+
+        Returns:
+            Result containing the embeddings and per-text failures, or
+            EmbeddingError if the batch could not be encoded at all
+        """
+        return self.encode(list(texts)).map(
+            lambda embeddings: PartialEmbeddings(embeddings=list(embeddings))
+        )
+
     @abstractmethod
     def encode_one(self, text: str) -> Result[list[float], EmbeddingError]:
         """
@@ -26,6 +26,10 @@ class BM25Reranker(Reranker):
         self.k1 = k1
         self.b = b
 
+    def get_identity(self) -> str:
+        """Identify the reranker and its BM25 parameters."""
+        return f"{type(self).__name__}(k1={self.k1}, b={self.b})"
+
     def rerank(
         self, query: str, texts: List[str], scores: List[float]
     ) -> Result[List[Tuple[str, float]], str]:
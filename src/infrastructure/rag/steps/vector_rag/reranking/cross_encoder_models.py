@@ -0,0 +1,110 @@
+"""Process-wide registry of loaded cross-encoder models.
+
+Loading a cross-encoder reads a transformer from disk, which takes far longer
+than scoring a handful of passages. Query workflows build new rerankers, so
+models are loaded once per process and shared by every reranker that asks for
+the same model, backend and quantization.
+"""
+
+from threading import Lock
+from typing import Any
+
+from src.infrastructure.logger import create_logger
+
+try:
+    from sentence_transformers import CrossEncoder
+
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    CrossEncoder = None
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = create_logger(__name__)
+
+DEFAULT_CROSS_ENCODER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+CROSS_ENCODER_BACKENDS = ("torch", "onnx")
+
+# Loaded models keyed by (model name, backend, quantize, max length)
+_models: dict[tuple[str, str, bool, int], Any] = {}
+_models_lock = Lock()
+
+
+def get_cross_encoder(
+    model_name: str = DEFAULT_CROSS_ENCODER_MODEL,
+    backend: str = "torch",
+    quantize: bool = False,
+    max_length: int = 512,
+) -> Any:
+    """
+    Get a shared cross-encoder, loading it on first use.
+
+    Args:
+        model_name: HuggingFace model name
+        backend: Inference backend, "torch" or "onnx" (ONNX Runtime, requires
+            sentence-transformers with backend support and optimum)
+        quantize: Apply dynamic int8 quantization to the model's linear layers
+            (torch backend, CPU inference)
+        max_length: Maximum tokens per query/passage pair; longer pairs are truncated
+
+    Returns:
+        Loaded sentence_transformers CrossEncoder
+
+    Raises:
+        ImportError: If sentence-transformers (or the backend's dependencies) is not installed
+        ValueError: If the backend is unknown
+    """
+    if not SENTENCE_TRANSFORMERS_AVAILABLE or CrossEncoder is None:
+        raise ImportError(
+            "sentence-transformers is required for cross-encoder reranking. "
+            "Install with: pip install sentence-transformers"
+        )
+    if backend not in CROSS_ENCODER_BACKENDS:
+        raise ValueError(
+            f"Unknown cross-encoder backend: {backend}. "
+            f"Must be one of {', '.join(CROSS_ENCODER_BACKENDS)}"
+        )
+
+    key = (model_name, backend, quantize, max_length)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model = _load(model_name, backend, quantize, max_length)
+            _models[key] = model
+        return model
+
+
+def _load(model_name: str, backend: str, quantize: bool, max_length: int) -> Any:
+    """Load a cross-encoder with the requested backend and quantization."""
+    if backend == "onnx":
+        try:
+            model = CrossEncoder(model_name, max_length=max_length, backend="onnx")
+        except TypeError as e:
+            raise ImportError(
+                "The ONNX cross-encoder backend requires sentence-transformers>=4 and optimum. "
+                "Install with: pip install 'sentence-transformers[onnx]'"
+            ) from e
+    else:
+        model = CrossEncoder(model_name, max_length=max_length, device="cpu" if quantize else None)
+        if quantize:
+            import torch
+
+            model.model = torch.quantization.quantize_dynamic(
+                model.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+    # Never exceed the positions the model was trained with
+    model_max_length = getattr(model.tokenizer, "model_max_length", max_length)
+    model.max_length = min(max_length, model_max_length)
+
+    logger.info(
+        f"Loaded cross-encoder model: {model_name} "
+        f"({backend}{', int8' if quantize else ''}, max_length={model.max_length})"
+    )
+    return model
+
+
+def clear_cross_encoder_models() -> None:
+    """Drop all cached models so the next request reloads them."""
+    with _models_lock:
+        _models.clear()
@@ -4,15 +4,16 @@ from typing import List, Optional, Tuple
 
 from returns.result import Failure, Result, Success
 
+from .cross_encoder_models import (
+    DEFAULT_CROSS_ENCODER_MODEL,
+    SENTENCE_TRANSFORMERS_AVAILABLE,
+    get_cross_encoder,
+)
 from .reranker import Reranker
 
-try:
-    from sentence_transformers import CrossEncoder
-
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    CrossEncoder = None
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+# Passages are clipped to this many characters per token of max_length before
+# tokenization, so very long chunks are not fully tokenized only to be truncated
+_CHARS_PER_TOKEN = 8
 
 
 class CrossEncoderReranker(Reranker):
@@ -20,29 +21,57 @@ class CrossEncoderReranker(Reranker):
     Reranker using cross-encoder models for improved relevance scoring.
 
     Cross-encoders jointly encode query and document, providing
-    more accurate relevance scores than bi-encoders.
+    more accurate relevance scores than bi-encoders. Models are shared
+    process-wide (see cross_encoder_models), so constructing a reranker is cheap.
     """
 
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"):
+    def __init__(
+        self,
+        model_name: str = DEFAULT_CROSS_ENCODER_MODEL,
+        batch_size: int = 32,
+        max_length: int = 512,
+        backend: str = "torch",
+        quantize: bool = False,
+    ):
         """
         Initialize the cross-encoder reranker.
 
         Args:
             model_name: HuggingFace model name for cross-encoder
+            batch_size: Query/passage pairs scored per forward pass
+            max_length: Maximum tokens per pair; longer passages are truncated
+            backend: Inference backend ("torch" or "onnx")
+            quantize: Use dynamic int8 quantization for CPU inference (torch backend)
         """
-        if not SENTENCE_TRANSFORMERS_AVAILABLE or CrossEncoder is None:
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError(
                 "sentence-transformers is required for CrossEncoderReranker. "
                 "Install with: pip install sentence-transformers"
             )
 
         self.model_name = model_name
-        self._model: Optional[CrossEncoder] = None
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.backend = backend
+        self.quantize = quantize
+        self._model: Optional[object] = None
+
+    def get_identity(self) -> str:
+        """Identify the model and the settings that change its scores."""
+        return (
+            f"{type(self).__name__}(model_name={self.model_name}, max_length={self.max_length}, "
+            f"backend={self.backend}, quantize={self.quantize})"
+        )
 
     def _load_model(self) -> None:
-        """Lazy load the cross-encoder model."""
-        if self._model is None and CrossEncoder is not None:
-            self._model = CrossEncoder(self.model_name)
+        """Get the shared cross-encoder model, loading it on first use in the process."""
+        if self._model is None:
+            self._model = get_cross_encoder(
+                self.model_name,
+                backend=self.backend,
+                quantize=self.quantize,
+                max_length=self.max_length,
+            )
 
     def rerank(
         self, query: str, texts: List[str], scores: List[float]
@@ -58,23 +87,30 @@ class CrossEncoderReranker(Reranker):
         Returns:
             Reranked list ordered by cross-encoder scores
         """
+        if not texts:
+            return Success([])
+
         try:
             self._load_model()
 
             if self._model is None:
                 return Failure("Cross-encoder model not loaded")
 
-            # Create query-document pairs
-            pairs = [[query, text] for text in texts]
+            # Create query-document pairs; the tokenizer truncates each pair to
+            # max_length tokens, and clipping first avoids tokenizing huge chunks
+            max_chars = self.max_length * _CHARS_PER_TOKEN
+            pairs = [[query, text[:max_chars]] for text in texts]
 
             # Get cross-encoder scores
-            ce_scores = self._model.predict(pairs)
+            ce_scores = self._model.predict(  # type: ignore[attr-defined]
+                pairs, batch_size=self.batch_size, show_progress_bar=False
+            )
 
             # Combine with original scores (weighted average)
             combined_scores = []
             for ce_score, orig_score in zip(ce_scores, scores):
                 # Weight cross-encoder more heavily (0.7) than original (0.3)
-                combined = 0.7 * ce_score + 0.3 * orig_score
+                combined = 0.7 * float(ce_score) + 0.3 * orig_score
                 combined_scores.append(combined)
 
             # Sort by combined score (descending)
@@ -2,6 +2,9 @@
 
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.vector_rag.reranking.bm25_reranker import BM25Reranker
+from src.infrastructure.rag.steps.vector_rag.reranking.cross_encoder_models import (
+    DEFAULT_CROSS_ENCODER_MODEL,
+)
 from src.infrastructure.rag.steps.vector_rag.reranking.cross_encoder_reranker import (
     CrossEncoderReranker,
 )
@@ -42,8 +45,13 @@ def create_reranker(reranker_type: str, **kwargs) -> Reranker:
     if reranker_type == "none":
         return NoReranker()
     elif reranker_type == "cross-encoder":
-        model_name = kwargs.get("model_name", "cross-encoder/ms-marco-MiniLM-L-6-v2")
-        return CrossEncoderReranker(model_name=model_name)
+        return CrossEncoderReranker(
+            model_name=kwargs.get("model_name", DEFAULT_CROSS_ENCODER_MODEL),
+            batch_size=kwargs.get("batch_size", 32),
+            max_length=kwargs.get("max_length", 512),
+            backend=kwargs.get("backend", "torch"),
+            quantize=kwargs.get("quantize", False),
+        )
     elif reranker_type == "bm25":
         k1 = kwargs.get("k1", 1.5)
         b = kwargs.get("b", 0.75)
@@ -30,3 +30,15 @@ class Reranker(ABC):
             Reranked list of (text, score) tuples, ordered by relevance
         """
         pass
+
+    def get_identity(self) -> str:
+        """
+        Identify the reranker and the settings that change its ordering.
+
+        Used in retrieval cache keys, so rerankers configured differently
+        don't share cached results.
+
+        Returns:
+            Reranker name with its distinguishing settings
+        """
+        return type(self).__name__
@@ -24,6 +24,10 @@ class ReciprocalRankFusionReranker(Reranker):
         """
         self.k = k
 
+    def get_identity(self) -> str:
+        """Identify the reranker and its RRF parameter."""
+        return f"{type(self).__name__}(k={self.k})"
+
     def rerank(
         self, query: str, texts: List[str], scores: List[float]
     ) -> Result[List[Tuple[str, float]], str]:
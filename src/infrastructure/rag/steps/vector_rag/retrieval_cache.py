@@ -0,0 +1,150 @@
+"""Per-workspace cache of vector retrieval results.
+
+Repeated questions in a workspace skip both query embedding and the vector
+search. Results are keyed by the workspace, embedding model, normalized query
+text, top_k, reranker and search filters, under the workspace's index
+generation. Add and remove document workflows bump the generation, so cached
+results never outlive a change to the workspace's index.
+"""
+
+import copy
+import hashlib
+import json
+import unicodedata
+from typing import Optional
+
+from src.cache_keys import CacheKeys
+from src.infrastructure.cache.cache import Cache
+from src.infrastructure.cache.codecs import model_from_cache
+from src.infrastructure.logger import create_logger
+from src.infrastructure.types.common import FilterDict
+from src.infrastructure.types.rag import ChunkData
+
+logger = create_logger(__name__)
+
+
+def normalize_query(query_text: str) -> str:
+    """
+    Normalize query text for cache lookups.
+
+    Text is NFC-normalized, case-folded, and has runs of whitespace collapsed
+    so that trivially different phrasings of the same question share one entry.
+
+    Args:
+        query_text: Raw query text
+
+    Returns:
+        Normalized query text
+    """
+    return " ".join(unicodedata.normalize("NFC", query_text).casefold().split())
+
+
+class RetrievalCache:
+    """Caches retrieval results per workspace, invalidated by index generation."""
+
+    def __init__(self, cache: Cache, ttl: int = 300) -> None:
+        """
+        Initialize the retrieval cache.
+
+        Args:
+            cache: Application cache holding results and generation counters
+            ttl: Seconds a cached result stays valid
+        """
+        self._cache = cache
+        self._ttl = ttl
+
+    def make_key(
+        self,
+        workspace_id: str,
+        model_name: str,
+        query_text: str,
+        top_k: int,
+        reranker: str,
+        filters: Optional[FilterDict] = None,
+    ) -> str:
+        """
+        Build the cache key for a query at the workspace's current index generation.
+
+        Args:
+            workspace_id: Workspace identifier
+            model_name: Embedding model used for the query
+            query_text: User's query text
+            top_k: Number of results requested
+            reranker: Reranker name ("none" when results are not reranked)
+            filters: Search filters
+
+        Returns:
+            Cache key
+        """
+        generation = self._cache.get_generation(CacheKeys.workspace_index_generation(workspace_id))
+        parts = [model_name, normalize_query(query_text), top_k, reranker, filters or {}]
+        digest = hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return CacheKeys.retrieval_results(workspace_id, generation, digest)
+
+    def get(self, key: str) -> Optional[list[ChunkData]]:
+        """
+        Get cached results.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached chunks, or None on a miss
+        """
+        value = self._cache.get(key)
+        if not isinstance(value, list):
+            return None
+        try:
+            return [
+                (
+                    copy.copy(item)
+                    if isinstance(item, ChunkData)
+                    else model_from_cache(ChunkData, item)
+                )
+                for item in value
+            ]
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid cached retrieval results at {key}: {e}")
+            return None
+
+    def set(self, key: str, chunks: list[ChunkData]) -> None:
+        """
+        Cache results.
+
+        Args:
+            key: Key from make_key
+            chunks: Retrieved chunks
+        """
+        self._cache.set(key, chunks, ttl=self._ttl)
+
+    def invalidate(self, workspace_id: str) -> None:
+        """
+        Invalidate every cached result for a workspace in O(1).
+
+        Args:
+            workspace_id: Workspace identifier
+        """
+        self._cache.bump_generation(CacheKeys.workspace_index_generation(workspace_id))
+
+
+def create_retrieval_cache(cache: Optional[Cache]) -> Optional[RetrievalCache]:
+    """
+    Create the retrieval cache configured by RETRIEVAL_CACHE_TTL.
+
+    Results are stored in the application's own cache, so they share its
+    backend and Redis connection settings.
+
+    Args:
+        cache: Application cache, or None if there is none
+
+    Returns:
+        RetrievalCache instance, or None when retrieval caching is disabled
+    """
+    from src.config import config
+
+    if cache is None or config.retrieval_cache_ttl <= 0:
+        return None
+    logger.info(f"Retrieval cache initialized (ttl={config.retrieval_cache_ttl}s)")
+    return RetrievalCache(cache, ttl=config.retrieval_cache_ttl)
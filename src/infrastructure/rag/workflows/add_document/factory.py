@@ -1,5 +1,7 @@
 """Factory for creating add document workflows."""
 
+from typing import TYPE_CHECKING, Optional
+
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.general.chunking.factory import ChunkerFactory
 from src.infrastructure.rag.steps.general.parsing.factory import ParserFactory
@@ -10,6 +12,15 @@ from src.infrastructure.rag.workflows.add_document.vector_rag_add_document_workf
 )
 from src.infrastructure.store_manager import RAGStoreManager
 
+if TYPE_CHECKING:
+    from src.infrastructure.rag.steps.graph_rag.entity_extraction.entity_extractor import (
+        EntityExtractor,
+    )
+    from src.infrastructure.rag.steps.graph_rag.relationship_extraction.relationship_extractor import (
+        RelationshipExtractor,
+    )
+    from src.infrastructure.rag.steps.graph_rag.spacy_graph_extractor import SpacyGraphExtractor
+
 logger = create_logger(__name__)
 
 
@@ -29,6 +40,8 @@ class AddDocumentWorkflowFactory:
                 - embedder_config: {base_url, model_name, ...}
                 - vector_store_type: "qdrant", etc.
                 - vector_store_config: {host, port, collection, ...}
+                - retrieval_cache: RetrievalCache to invalidate (optional)
+                - chunk_text_store: ChunkTextStore holding chunk text (optional)
             rag_store_manager: RAG store manager
         Returns:
             AddDocumentWorkflow implementation
@@ -77,6 +90,8 @@ class AddDocumentWorkflowFactory:
             chunker=chunker,
             embedder=embedder,
             vector_store=vector_store,
+            retrieval_cache=config.get("retrieval_cache"),
+            chunk_text_store=config.get("chunk_text_store"),
         )
 
         logger.info("Vector RAG add document workflow created successfully")
@@ -121,6 +136,18 @@ class AddDocumentWorkflowFactory:
             **config.get("relationship_extraction_config", {}),
         )
 
+        # Share one spaCy pass between NER and dependency parsing when both use
+        # the same spaCy pipeline (spaCy is only imported when both are spaCy-based)
+        graph_extractor = None
+        if (
+            config.get("entity_extraction_type", "spacy") == "spacy"
+            and config.get("relationship_extraction_type", "dependency-parsing")
+            == "dependency-parsing"
+        ):
+            graph_extractor = AddDocumentWorkflowFactory._create_spacy_graph_extractor(
+                entity_extractor, relationship_extractor, config
+            )
+
         # Get graph store from manager
         graph_store = rag_store_manager.get_graph_store(config)
         logger.debug("Retrieved graph store from manager")
@@ -136,7 +163,42 @@ class AddDocumentWorkflowFactory:
             clustering_resolution=config.get("clustering_resolution", 1.0),
             clustering_max_level=config.get("clustering_max_level", 3),
             community_min_size=config.get("community_min_size", 3),
+            community_detection=config.get("community_detection", "incremental"),
+            graph_extractor=graph_extractor,
         )
 
         logger.info("Graph RAG add document workflow created successfully")
         return workflow
+
+    @staticmethod
+    def _create_spacy_graph_extractor(
+        entity_extractor: "EntityExtractor",
+        relationship_extractor: "RelationshipExtractor",
+        config: dict,
+    ) -> "Optional[SpacyGraphExtractor]":
+        """Create the combined spaCy extractor if both extractors share one pipeline."""
+        from src.infrastructure.rag.steps.graph_rag.entity_extraction.spacy_entity_extractor import (
+            SpacyEntityExtractor,
+        )
+        from src.infrastructure.rag.steps.graph_rag.relationship_extraction.dependency_parser_extractor import (
+            DependencyParserExtractor,
+        )
+        from src.infrastructure.rag.steps.graph_rag.spacy_graph_extractor import (
+            SpacyGraphExtractor,
+        )
+
+        if not (
+            isinstance(entity_extractor, SpacyEntityExtractor)
+            and isinstance(relationship_extractor, DependencyParserExtractor)
+            and entity_extractor.nlp is relationship_extractor.nlp
+        ):
+            return None
+
+        graph_extractor = SpacyGraphExtractor(
+            entity_extractor,
+            relationship_extractor,
+            n_process=config.get("extraction_n_process", 1),
+            batch_size=config.get("extraction_batch_size", 64),
+        )
+        logger.debug("Created combined spaCy entity/relationship extractor")
+        return graph_extractor
@@ -6,9 +6,10 @@ This workflow orchestrates the full Graph RAG document ingestion process:
 3. Extract entities from chunks
 4. Extract relationships between entities
 5. Index entities and relationships in graph store
+6. Detect communities (incrementally, fully, or deferred to an explicit rebuild)
 """
 
-from typing import BinaryIO, Optional
+from typing import TYPE_CHECKING, BinaryIO, Optional
 
 from returns.result import Failure, Result, Success
 
@@ -16,6 +17,10 @@ from src.infrastructure.graph_stores.graph_store import GraphStore
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.general.chunking.document_chunker import Chunker
 from src.infrastructure.rag.steps.general.parsing.factory import ParserFactory
+from src.infrastructure.rag.steps.graph_rag.clustering.community_refresh import (
+    COMMUNITY_DETECTION_MODES,
+    refresh_communities,
+)
 from src.infrastructure.rag.steps.graph_rag.entity_extraction.entity_extractor import (
     EntityExtractor,
 )
@@ -27,6 +32,10 @@ from src.infrastructure.rag.workflows.add_document.add_document_workflow import
     AddDocumentWorkflowError,
 )
 from src.infrastructure.types.common import MetadataDict
+from src.infrastructure.types.graph import Relationship
+
+if TYPE_CHECKING:
+    from src.infrastructure.rag.steps.graph_rag.spacy_graph_extractor import SpacyGraphExtractor
 
 logger = create_logger(__name__)
 
@@ -49,6 +58,8 @@ class GraphRagAddDocumentWorkflow(AddDocumentWorkflow):
         clustering_resolution: float = 1.0,
         clustering_max_level: int = 3,
         community_min_size: int = 3,
+        community_detection: str = "incremental",
+        graph_extractor: Optional["SpacyGraphExtractor"] = None,
     ) -> None:
         """
         Initialize the Graph RAG add document workflow.
@@ -63,7 +74,16 @@ class GraphRagAddDocumentWorkflow(AddDocumentWorkflow):
             clustering_resolution: Resolution parameter for clustering
             clustering_max_level: Maximum hierarchy level for clustering
             community_min_size: Minimum size for valid communities
+            community_detection: "incremental" to re-optimize around the new entities,
+                "full" to recompute the whole workspace, or "deferred" to skip
+                detection until it is run for the workspace on demand
+            graph_extractor: Optional combined spaCy stage; when set, entities and
+                relationships come from a single pipeline pass per chunk instead of
+                the two extractors running separately
         """
+        if community_detection not in COMMUNITY_DETECTION_MODES:
+            raise ValueError(f"Unsupported community detection mode: {community_detection}")
+
         self.parser_factory = parser_factory
         self.chunker = chunker
         self.entity_extractor = entity_extractor
@@ -73,6 +93,8 @@ class GraphRagAddDocumentWorkflow(AddDocumentWorkflow):
         self.clustering_resolution = clustering_resolution
         self.clustering_max_level = clustering_max_level
         self.community_min_size = community_min_size
+        self.community_detection = community_detection
+        self.graph_extractor = graph_extractor
 
     def execute(
         self,
@@ -127,10 +149,16 @@ class GraphRagAddDocumentWorkflow(AddDocumentWorkflow):
         # Step 3: Extract entities from all chunks
         logger.info(f"[GraphRagAddDocumentWorkflow] Extracting entities from {len(chunks)} chunks")
 
+        chunk_texts = [chunk.text for chunk in chunks]
+        relationships_batches: Optional[list[list[Relationship]]] = None
         try:
-            # Extract entities from each chunk
-            chunk_texts = [chunk.text for chunk in chunks]
-            all_entities_batches = self.entity_extractor.extract_entities_batch(chunk_texts)
+            if self.graph_extractor is not None:
+                # One spaCy pass yields both entities and dependency-based relationships
+                all_entities_batches, relationships_batches = self.graph_extractor.extract_batch(
+                    chunk_texts
+                )
+            else:
+                all_entities_batches = self.entity_extractor.extract_entities_batch(chunk_texts)
 
             # Flatten and add document/chunk metadata
             all_entities = []
@@ -164,18 +192,24 @@ class GraphRagAddDocumentWorkflow(AddDocumentWorkflow):
         logger.info("[GraphRagAddDocumentWorkflow] Extracting relationships")
 
         try:
-            # Extract relationships from each chunk with its entities
-            all_relationships = []
-            for chunk, entities in zip(chunks, all_entities_batches):
-                if entities:  # Only process chunks with entities
-                    relationships = self.relationship_extractor.extract_relationships(
-                        chunk.text, entities
+            if relationships_batches is None:
+                # Extract relationships from each chunk with its entities
+                relationships_batches = [
+                    (
+                        self.relationship_extractor.extract_relationships(chunk.text, entities)
+                        if entities  # Only process chunks with entities
+                        else []
                     )
-                    # Add document metadata
-                    for rel in relationships:
-                        rel.metadata["document_id"] = document_id
-                        rel.metadata["chunk_id"] = chunk.id
-                    all_relationships.extend(relationships)
+                    for chunk, entities in zip(chunks, all_entities_batches)
+                ]
+
+            all_relationships = []
+            for chunk, relationships in zip(chunks, relationships_batches):
+                # Add document metadata
+                for rel in relationships:
+                    rel.metadata["document_id"] = document_id
+                    rel.metadata["chunk_id"] = chunk.id
+                all_relationships.extend(relationships)
 
             logger.debug(f"Extracted {len(all_relationships)} relationships")
 
@@ -214,6 +248,12 @@ class GraphRagAddDocumentWorkflow(AddDocumentWorkflow):
             )
 
         # Step 7: Detect communities (run after indexing)
+        if self.community_detection == "deferred":
+            logger.info(
+                f"[GraphRagAddDocumentWorkflow] Community detection deferred for workspace {workspace_id}"
+            )
+            return Success(len(unique_entities))
+
         logger.info(
             f"[GraphRagAddDocumentWorkflow] Detecting communities for workspace {workspace_id}"
         )
@@ -229,23 +269,20 @@ class GraphRagAddDocumentWorkflow(AddDocumentWorkflow):
                 max_level=self.clustering_max_level,
             )
 
-            # Detect communities across entire workspace graph
-            communities = detector.detect_communities(self.graph_store, workspace_id)
-
-            # Filter to communities meeting minimum size
-            valid_communities = [
-                c for c in communities if len(c.entity_ids) >= self.community_min_size
-            ]
-
-            # Upsert communities to graph store
-            if valid_communities:
-                self.graph_store.upsert_communities(valid_communities, workspace_id)
-                logger.info(
-                    f"Detected and stored {len(valid_communities)} communities "
-                    f"(filtered from {len(communities)} total)"
-                )
-            else:
-                logger.info("No communities meeting minimum size threshold")
+            # Incremental mode only lets this document's entities (and their
+            # neighbours) change community; full mode repartitions everything
+            changed_entity_ids = (
+                [entity.id for entity in unique_entities]
+                if self.community_detection == "incremental"
+                else None
+            )
+            refresh_communities(
+                detector,
+                self.graph_store,
+                workspace_id,
+                community_min_size=self.community_min_size,
+                changed_entity_ids=changed_entity_ids,
+            )
 
         except Exception as e:
             # Don't fail the entire workflow if community detection fails
@@ -5,6 +5,9 @@ This workflow orchestrates the full Vector RAG document ingestion process:
 2. Chunk document into segments
 3. Embed chunks into vectors
 4. Index vectors in vector store
+
+Indexing invalidates cached retrieval results for the workspace. With a chunk
+text store, chunk text is written there and left out of the vector payloads.
 """
 
 from typing import BinaryIO, Optional
@@ -15,12 +18,14 @@ from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.general.chunking.document_chunker import Chunker
 from src.infrastructure.rag.steps.general.parsing.factory import ParserFactory
 from src.infrastructure.rag.steps.vector_rag.embedding.vector_embedder import VectorEmbeddingEncoder
+from src.infrastructure.rag.steps.vector_rag.retrieval_cache import RetrievalCache
 from src.infrastructure.rag.workflows.add_document.add_document_workflow import (
     AddDocumentWorkflow,
     AddDocumentWorkflowError,
 )
 from src.infrastructure.types.common import MetadataDict
-from src.infrastructure.vector_stores import VectorStore
+from src.infrastructure.types.document import Chunk
+from src.infrastructure.vector_stores import ChunkTextStore, VectorStore
 
 logger = create_logger(__name__)
 
@@ -39,6 +44,8 @@ class VectorRagAddDocumentWorkflow(AddDocumentWorkflow):
         chunker: Chunker,
         embedder: VectorEmbeddingEncoder,
         vector_store: VectorStore,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        chunk_text_store: Optional[ChunkTextStore] = None,
     ) -> None:
         """
         Initialize the consume workflow.
@@ -48,11 +55,15 @@ class VectorRagAddDocumentWorkflow(AddDocumentWorkflow):
             chunker: Document chunker implementation
             embedder: Vector embedding encoder
             vector_store: Vector store for indexing
+            retrieval_cache: Optional retrieval cache to invalidate after indexing
+            chunk_text_store: Optional store holding chunk text instead of the payloads
         """
         self.parser_factory = parser_factory
         self.chunker = chunker
         self.embedder = embedder
         self.vector_store = vector_store
+        self.retrieval_cache = retrieval_cache
+        self.chunk_text_store = chunk_text_store
 
     def execute(
         self,
@@ -112,18 +123,18 @@ class VectorRagAddDocumentWorkflow(AddDocumentWorkflow):
             logger.warning(f"[ConsumeWorkflow] No chunks created for document {document_id}")
             return Success(0)
 
-        # Step 3: Embed chunks
+        # Step 3: Embed chunks (chunks whose text the embedder rejects are skipped)
         logger.info(f"[ConsumeWorkflow] Embedding {len(chunks)} chunks")
         embed_result = self._embed_chunks(chunks)
         if isinstance(embed_result, Failure):
             return embed_result
-        embeddings = embed_result.unwrap()
+        chunks, embeddings = embed_result.unwrap()
 
         # Step 4: Index in vector store
         logger.info(f"[ConsumeWorkflow] Indexing {len(chunks)} chunks in vector store")
         try:
             chunk_ids = [chunk.id for chunk in chunks]
-            payloads = [
+            payloads: list[MetadataDict] = [
                 {
                     "document_id": document_id,
                     "workspace_id": workspace_id,
@@ -134,6 +145,14 @@ class VectorRagAddDocumentWorkflow(AddDocumentWorkflow):
                 for chunk in chunks
             ]
 
+            # Text goes to the side store first so indexed chunks always have it
+            if self.chunk_text_store:
+                self.chunk_text_store.put(
+                    workspace_id, document_id, {chunk.id: chunk.text for chunk in chunks}
+                )
+                for payload in payloads:
+                    del payload["text"]
+
             self.vector_store.add(
                 vectors=embeddings,
                 ids=chunk_ids,
@@ -152,12 +171,22 @@ class VectorRagAddDocumentWorkflow(AddDocumentWorkflow):
                     step="index",
                 )
             )
-
-    def _embed_chunks(self, chunks: list) -> Result[list, AddDocumentWorkflowError]:
-        """Embed chunks and return embeddings or error."""
+        finally:
+            # A failed upsert may still have written some points
+            if self.retrieval_cache:
+                self.retrieval_cache.invalidate(workspace_id)
+
+    def _embed_chunks(
+        self, chunks: list[Chunk]
+    ) -> Result[tuple[list[Chunk], list[list[float]]], AddDocumentWorkflowError]:
+        """Embed chunks and return the embedded chunks with their embeddings, or error.
+
+        Chunks the embedder rejects individually are left out and logged; the
+        document only fails if no chunk could be embedded.
+        """
         try:
             chunk_texts = [chunk.text for chunk in chunks]
-            result = self.embedder.encode(chunk_texts)
+            result = self.embedder.encode_partial(chunk_texts)
 
             if isinstance(result, Failure):
                 error = result.failure()
@@ -168,9 +197,30 @@ class VectorRagAddDocumentWorkflow(AddDocumentWorkflow):
                     )
                 )
 
-            embeddings = result.unwrap()
-            logger.info(f"[ConsumeWorkflow] Generated {len(embeddings)} embeddings")
-            return Success(embeddings)
+            partial = result.unwrap()
+            for index, error in sorted(partial.failures.items()):
+                logger.warning(
+                    f"[ConsumeWorkflow] Skipping chunk {chunks[index].id}: {error.message}"
+                )
+
+            embedded = [
+                (chunk, embedding)
+                for chunk, embedding in zip(chunks, partial.embeddings)
+                if embedding is not None
+            ]
+            if not embedded:
+                first_error = partial.failures[min(partial.failures)]
+                return Failure(
+                    AddDocumentWorkflowError(
+                        f"Failed to embed chunks: {first_error.message}",
+                        step="embed",
+                    )
+                )
+
+            logger.info(f"[ConsumeWorkflow] Generated {len(embedded)} embeddings")
+            return Success(
+                ([chunk for chunk, _ in embedded], [embedding for _, embedding in embedded])
+            )
 
         except Exception as e:
             return Failure(
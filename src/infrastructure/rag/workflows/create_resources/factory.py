@@ -24,6 +24,11 @@ class CreateResourcesWorkflowFactory:
                 - qdrant_url: Qdrant server URL (for vector RAG)
                 - vector_size: Vector dimension (for vector RAG)
                 - distance: Distance metric (for vector RAG)
+                - collection_name: Collection to create (for vector RAG, optional)
+                - tenant_field: Tenant field of a shared collection (for vector RAG, optional)
+                - quantization: "none", "scalar" or "binary" (for vector RAG, optional)
+                - hnsw_m, hnsw_ef_construct: HNSW graph settings (for vector RAG, optional)
+                - on_disk_vectors: Store original vectors on disk (for vector RAG, optional)
 
         Returns:
             CreateRagResourcesWorkflow implementation
@@ -53,6 +58,12 @@ class CreateResourcesWorkflowFactory:
             qdrant_url=qdrant_url,
             vector_size=vector_size,
             distance=distance,
+            collection_name=config.get("collection_name"),
+            tenant_field=config.get("tenant_field"),
+            quantization=config.get("quantization", "none"),
+            hnsw_m=config.get("hnsw_m"),
+            hnsw_ef_construct=config.get("hnsw_ef_construct"),
+            on_disk_vectors=config.get("on_disk_vectors", False),
         )
         logger.info("Vector RAG create resources workflow created successfully")
         return workflow
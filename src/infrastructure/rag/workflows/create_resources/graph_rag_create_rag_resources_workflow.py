@@ -20,7 +20,7 @@ class GraphRagCreateRagResourcesWorkflow(CreateRagResourcesWorkflow):
 
     Pipeline:
     1. Create Neo4j constraints for entity uniqueness
-    2. Create indexes for workspace isolation and entity types
+    2. Create indexes for workspace isolation, entity text search and entity types
     3. Create indexes for community lookup
     4. Return success status
     """
@@ -61,10 +61,11 @@ class GraphRagCreateRagResourcesWorkflow(CreateRagResourcesWorkflow):
             # Step 2: Create workspace isolation indexes
             # Note: We don't create a unique constraint on Entity.id alone because
             # the same entity (same id) can exist in multiple workspaces.
-            # The MERGE uses (id, workspace_id) together for uniqueness.
+            # The MERGE uses (workspace_id, id) together for uniqueness, which
+            # ensure_schema indexes along with Community lookups and entity text.
             logger.info("Creating workspace isolation indexes")
+            self.graph_store.ensure_schema()
             self.graph_store.create_index("Entity", ["workspace_id"])
-            self.graph_store.create_index("Entity", ["id", "workspace_id"])
 
             # Step 3: Create entity type indexes
             logger.info("Creating entity type indexes")
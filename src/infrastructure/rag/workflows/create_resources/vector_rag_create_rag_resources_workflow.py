@@ -10,6 +10,11 @@ from src.infrastructure.rag.workflows.create_resources.create_rag_resources_work
     CreateRagResourcesWorkflowError,
 )
 from src.infrastructure.types.common import WorkspaceContext
+from src.infrastructure.vector_stores.qdrant_vector_store import (
+    collection_hnsw_config,
+    collection_quantization_config,
+    ensure_payload_indexes,
+)
 
 if TYPE_CHECKING:
     from qdrant_client import QdrantClient
@@ -31,25 +36,49 @@ class VectorRagCreateRagResourcesWorkflow(CreateRagResourcesWorkflow):
     Vector RAG implementation of workspace provisioning workflow.
 
     Pipeline:
-    1. Create Qdrant collection for the workspace
-    2. Configure vector dimensions and distance metric
-    3. Set up any required indexes
+    1. Create Qdrant collection for the workspace (or the shared collection)
+    2. Configure vector dimensions, distance metric, quantization and HNSW index;
+       an existing per-workspace collection is updated to the configured index settings
+    3. Create payload indexes on document_id and workspace_id
     4. Return success status
     """
 
-    def __init__(self, qdrant_url: str, vector_size: int = 768, distance: str = "cosine"):
+    def __init__(
+        self,
+        qdrant_url: str,
+        vector_size: int = 768,
+        distance: str = "cosine",
+        collection_name: Optional[str] = None,
+        tenant_field: Optional[str] = None,
+        quantization: str = "none",
+        hnsw_m: Optional[int] = None,
+        hnsw_ef_construct: Optional[int] = None,
+        on_disk_vectors: bool = False,
+    ):
         """Initialize workflow with Qdrant connection parameters.
 
         Args:
             qdrant_url: Qdrant server URL
             vector_size: Dimension of vectors to store (default: 768 for nomic-embed-text)
             distance: Distance metric to use (cosine, euclidean, dot)
+            collection_name: Collection to create (default: the workspace's own collection)
+            tenant_field: Field partitioning a collection shared by workspaces
+            quantization: Vector quantization ("none", "scalar" or "binary")
+            hnsw_m: HNSW edges per node (default: Qdrant's)
+            hnsw_ef_construct: HNSW build beam width (default: Qdrant's)
+            on_disk_vectors: Keep original vectors on disk; quantized vectors stay in RAM
         """
         if not QDRANT_AVAILABLE:
             raise ImportError("Qdrant client not installed. Please run: pip install qdrant-client")
 
         self.qdrant_url = qdrant_url
         self.vector_size = vector_size
+        self.collection_name = collection_name
+        self.tenant_field = tenant_field
+        self.quantization = quantization
+        self.quantization_config = collection_quantization_config(quantization)
+        self.hnsw_config = collection_hnsw_config(tenant_field, hnsw_m, hnsw_ef_construct)
+        self.on_disk_vectors = on_disk_vectors
 
         # Map distance string to Qdrant Distance enum
         distance_map = {
@@ -81,7 +110,8 @@ class VectorRagCreateRagResourcesWorkflow(CreateRagResourcesWorkflow):
 
             # Create Qdrant collection using WorkspaceContext for naming
             workspace_ctx = WorkspaceContext(id=int(workspace_id))
-            self._create_qdrant_collection(workspace_ctx.collection_name, vector_size, distance)
+            collection_name = self.collection_name or workspace_ctx.collection_name
+            self._create_qdrant_collection(collection_name, vector_size, distance)
 
             logger.info(f"Workspace {workspace_id} provisioned successfully")
 
@@ -122,22 +152,58 @@ class VectorRagCreateRagResourcesWorkflow(CreateRagResourcesWorkflow):
 
             if collection_name in collection_names:
                 logger.info(f"Collection {collection_name} already exists, skipping creation")
-                return
-
-            # Create collection
-            client.create_collection(
-                collection_name=collection_name,
-                vectors_config=qdrant_models.VectorParams(
-                    size=vector_size,
-                    distance=distance,
-                ),
-            )
+                if self.tenant_field:
+                    self._check_shared_vector_size(client, collection_name, vector_size)
+                else:
+                    self._update_index_settings(client, collection_name)
+            else:
+                client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=qdrant_models.VectorParams(
+                        size=vector_size,
+                        distance=distance,
+                        on_disk=self.on_disk_vectors,
+                    ),
+                    hnsw_config=self.hnsw_config,
+                    quantization_config=self.quantization_config,
+                )
+                logger.info(f"Created Qdrant collection: {collection_name}")
 
-            logger.info(f"Created Qdrant collection: {collection_name}")
+            ensure_payload_indexes(client, collection_name, self.tenant_field)
 
         except Exception as e:
             raise Exception(f"Failed to create Qdrant collection: {e}") from e
 
+    def _update_index_settings(self, client: "QdrantClient", collection_name: str) -> None:
+        """Apply the workspace's quantization, HNSW and on-disk settings to its collection.
+
+        Qdrant rebuilds the affected index segments in the background. The shared
+        collection is left alone: its settings belong to every workspace in it.
+        """
+        client.update_collection(
+            collection_name=collection_name,
+            vectors_config={"": qdrant_models.VectorParamsDiff(on_disk=self.on_disk_vectors)},
+            hnsw_config=self.hnsw_config,
+            quantization_config=(
+                self.quantization_config
+                if self.quantization != "none"
+                else qdrant_models.Disabled.DISABLED
+            ),
+        )
+        logger.info(f"Updated index settings of Qdrant collection: {collection_name}")
+
+    def _check_shared_vector_size(
+        self, client: "QdrantClient", collection_name: str, vector_size: int
+    ) -> None:
+        """Ensure a workspace's vectors fit the shared collection they will be stored in."""
+        vectors = client.get_collection(collection_name).config.params.vectors
+        existing_size = getattr(vectors, "size", None)
+        if existing_size is not None and existing_size != vector_size:
+            raise ValueError(
+                f"Shared collection {collection_name} stores {existing_size}-dimensional "
+                f"vectors, but the workspace embeds {vector_size}-dimensional vectors"
+            )
+
     def _parse_config(
         self, config: Optional[dict[str, str | int | float | bool]]
     ) -> tuple[int, "Distance"]:
@@ -28,6 +28,9 @@ class QueryWorkflowFactory:
                 - enable_reranking: bool (optional)
                 - reranker_type: str (optional)
                 - reranker_config: dict (optional)
+                - retrieval_cache: RetrievalCache for repeated queries (optional)
+                - hnsw_ef: HNSW search beam width (optional)
+                - chunk_text_store: ChunkTextStore holding chunk text (optional)
             rag_store_manager: RAG store manager
         Returns:
             QueryWorkflow implementation
@@ -70,6 +73,9 @@ class QueryWorkflowFactory:
             embedder=embedder,
             vector_store=vector_store,
             reranker=reranker,
+            retrieval_cache=config.get("retrieval_cache"),
+            hnsw_ef=config.get("hnsw_ef"),
+            chunk_text_store=config.get("chunk_text_store"),
         )
 
         logger.info("Vector RAG query workflow created successfully")
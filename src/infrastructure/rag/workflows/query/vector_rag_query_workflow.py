@@ -3,8 +3,12 @@
 This workflow orchestrates the full Vector RAG query process:
 1. Embed query text
 2. Search vector store
-3. Rerank results (optional)
-4. Return context
+3. Load chunk text from the chunk text store (optional)
+4. Rerank results (optional)
+5. Return context
+
+When a retrieval cache is configured and the query is scoped to a workspace
+(a workspace_id filter), repeated queries are answered from the cache.
 """
 
 from typing import Optional
@@ -14,11 +18,12 @@ from returns.result import Failure
 from src.infrastructure.logger import create_logger
 from src.infrastructure.rag.steps.vector_rag.embedding.vector_embedder import VectorEmbeddingEncoder
 from src.infrastructure.rag.steps.vector_rag.reranking.reranker import Reranker
+from src.infrastructure.rag.steps.vector_rag.retrieval_cache import RetrievalCache
 from src.infrastructure.rag.workflows.query.query_workflow import QueryWorkflow, QueryWorkflowError
 from src.infrastructure.types.common import FilterDict
 from src.infrastructure.types.document import Chunk
 from src.infrastructure.types.rag import ChunkData
-from src.infrastructure.vector_stores import VectorStore
+from src.infrastructure.vector_stores import ChunkTextStore, VectorStore
 
 logger = create_logger(__name__)
 
@@ -36,6 +41,9 @@ class VectorRagQueryWorkflow(QueryWorkflow):
         embedder: VectorEmbeddingEncoder,
         vector_store: VectorStore,
         reranker: Optional[Reranker] = None,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        hnsw_ef: Optional[int] = None,
+        chunk_text_store: Optional[ChunkTextStore] = None,
     ) -> None:
         """
         Initialize the query workflow.
@@ -44,10 +52,16 @@ class VectorRagQueryWorkflow(QueryWorkflow):
             embedder: Vector embedding encoder
             vector_store: Vector store for search
             reranker: Optional reranker for result refinement
+            retrieval_cache: Optional cache of results for repeated queries
+            hnsw_ef: Optional HNSW search beam width (higher is more accurate but slower)
+            chunk_text_store: Optional store holding chunk text left out of the payloads
         """
         self.embedder = embedder
         self.vector_store = vector_store
         self.reranker = reranker
+        self.retrieval_cache = retrieval_cache
+        self.hnsw_ef = hnsw_ef
+        self.chunk_text_store = chunk_text_store
 
     def execute(
         self,
@@ -69,6 +83,42 @@ class VectorRagQueryWorkflow(QueryWorkflow):
         Raises:
             QueryWorkflowError: If any step fails
         """
+        cache_key = self._retrieval_cache_key(query_text, top_k, filters)
+        if cache_key and self.retrieval_cache:
+            cached = self.retrieval_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"[QueryWorkflow] Returning {len(cached)} cached chunks for query")
+                return cached
+
+        chunk_data = self._retrieve(query_text, top_k, filters)
+
+        if cache_key and self.retrieval_cache:
+            self.retrieval_cache.set(cache_key, chunk_data)
+        return chunk_data
+
+    def _retrieval_cache_key(
+        self, query_text: str, top_k: int, filters: Optional[FilterDict]
+    ) -> Optional[str]:
+        """Build the retrieval cache key, or None if the query can't be cached."""
+        if not self.retrieval_cache or not filters or "workspace_id" not in filters:
+            return None
+        try:
+            return self.retrieval_cache.make_key(
+                workspace_id=str(filters["workspace_id"]),
+                model_name=self.embedder.get_model_name(),
+                query_text=query_text,
+                top_k=top_k,
+                reranker=self.reranker.get_identity() if self.reranker else "none",
+                filters=filters,
+            )
+        except Exception as e:
+            logger.warning(f"[QueryWorkflow] Retrieval cache unavailable: {e}")
+            return None
+
+    def _retrieve(
+        self, query_text: str, top_k: int, filters: Optional[FilterDict]
+    ) -> list[ChunkData]:
+        """Embed, search and rerank without the retrieval cache."""
         # Step 1: Embed query
         logger.info(f"[QueryWorkflow] Embedding query: {query_text[:50]}...")
         try:
@@ -96,18 +146,23 @@ class VectorRagQueryWorkflow(QueryWorkflow):
                 query_embedding=query_vector,
                 top_k=search_k,
                 filters=filters,
+                hnsw_ef=self.hnsw_ef,
             )
             logger.info(f"[QueryWorkflow] Found {len(results)} results from vector store")
         except Exception as e:
             raise QueryWorkflowError(f"Failed to search vector store: {e}", step="search") from e
 
-        # Step 3: Rerank results (if reranker provided)
+        # Step 3: Load chunk text (if stored outside the vector store)
+        if self.chunk_text_store and results:
+            self._load_chunk_texts(results)
+
+        # Step 4: Rerank results (if reranker provided)
         if self.reranker and results:
             results = self._apply_reranking(query_text, results, top_k)
         else:
             results = results[:top_k]
 
-        # Step 4: Convert to ChunkData
+        # Step 5: Convert to ChunkData
         chunk_data: list[ChunkData] = []
         for chunk, score in results:
             chunk_data.append(
@@ -123,6 +178,23 @@ class VectorRagQueryWorkflow(QueryWorkflow):
         logger.info(f"[QueryWorkflow] Returning {len(chunk_data)} chunks for query")
         return chunk_data
 
+    def _load_chunk_texts(self, results: list[tuple[Chunk, float]]) -> None:
+        """Fill in the text of retrieved chunks with one chunk text store lookup."""
+        if not self.chunk_text_store:
+            return
+
+        missing = [chunk for chunk, _ in results if not chunk.text]
+        if not missing:
+            return
+        try:
+            texts = self.chunk_text_store.get_many([chunk.id for chunk in missing])
+        except Exception as e:
+            raise QueryWorkflowError(f"Failed to load chunk text: {e}", step="load_text") from e
+
+        for chunk in missing:
+            chunk.text = texts.get(chunk.id, "")
+        logger.info(f"[QueryWorkflow] Loaded text for {len(texts)}/{len(missing)} chunks")
+
     def _apply_reranking(
         self, query_text: str, results: list[tuple[Chunk, float]], top_k: int
     ) -> list[tuple[Chunk, float]]:
@@ -26,6 +26,8 @@ class RemoveDocumentWorkflowFactory:
                 - rag_type: "vector" or "graph"
                 - vector_store_type: "qdrant", etc.
                 - vector_store_config: {host, port, collection, ...}
+                - retrieval_cache: RetrievalCache to invalidate (optional)
+                - chunk_text_store: ChunkTextStore holding chunk text (optional)
             rag_store_manager: RAG store manager
         Returns:
             RemoveDocumentWorkflow implementation
@@ -52,7 +54,11 @@ class RemoveDocumentWorkflowFactory:
         vector_store = rag_store_manager.get_vector_store(config)
         logger.debug("Retrieved vector store from manager")
 
-        workflow = VectorRagRemoveDocumentWorkflow(vector_store=vector_store)
+        workflow = VectorRagRemoveDocumentWorkflow(
+            vector_store=vector_store,
+            retrieval_cache=config.get("retrieval_cache"),
+            chunk_text_store=config.get("chunk_text_store"),
+        )
         logger.info("Vector RAG remove document workflow created successfully")
         return workflow
 
@@ -1,14 +1,17 @@
 """Vector RAG implementation of remove document workflow."""
 
+from typing import Optional
+
 from returns.result import Failure, Result, Success
 
 from src.infrastructure.logger import create_logger
+from src.infrastructure.rag.steps.vector_rag.retrieval_cache import RetrievalCache
 from src.infrastructure.rag.workflows.remove_document.remove_document_workflow import (
     RemoveDocumentWorkflow,
     RemoveDocumentWorkflowError,
 )
 from src.infrastructure.types.common import FilterDict
-from src.infrastructure.vector_stores import VectorStore
+from src.infrastructure.vector_stores import ChunkTextStore, VectorStore
 
 logger = create_logger(__name__)
 
@@ -20,16 +23,27 @@ class VectorRagRemoveDocumentWorkflow(RemoveDocumentWorkflow):
     Pipeline:
     1. Build a metadata filter for the document and workspace.
     2. Call the vector store's delete method with the filter.
-    3. Return the number of deleted chunks.
+    3. Delete the document's chunk text from the chunk text store, if any.
+    4. Invalidate cached retrieval results for the workspace.
+    5. Return the number of deleted chunks.
     """
 
-    def __init__(self, vector_store: VectorStore):
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        chunk_text_store: Optional[ChunkTextStore] = None,
+    ):
         """Initialize workflow with a vector store.
 
         Args:
             vector_store: Vector store for chunk storage
+            retrieval_cache: Optional retrieval cache to invalidate after removal
+            chunk_text_store: Optional store holding the chunks' text
         """
         self.vector_store = vector_store
+        self.retrieval_cache = retrieval_cache
+        self.chunk_text_store = chunk_text_store
 
     def execute(
         self,
@@ -51,6 +65,10 @@ class VectorRagRemoveDocumentWorkflow(RemoveDocumentWorkflow):
             filters: FilterDict = {"document_id": document_id, "workspace_id": workspace_id}
             chunks_deleted = self.vector_store.delete(filters)
 
+            # Text is deleted after the points so no indexed chunk is left without it
+            if self.chunk_text_store:
+                self.chunk_text_store.delete_document(workspace_id, document_id)
+
             logger.info(f"Removed {chunks_deleted} chunks for document {document_id}")
 
             return Success(chunks_deleted)
@@ -63,3 +81,6 @@ class VectorRagRemoveDocumentWorkflow(RemoveDocumentWorkflow):
                     step="document_removal",
                 )
             )
+        finally:
+            if self.retrieval_cache:
+                self.retrieval_cache.invalidate(workspace_id)
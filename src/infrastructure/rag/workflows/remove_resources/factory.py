@@ -22,6 +22,9 @@ class RemoveResourcesWorkflowFactory:
             rag_config: RAG configuration dictionary containing:
                 - rag_type: "vector" or "graph"
                 - qdrant_url: Qdrant server URL (for vector RAG)
+                - collection_name: Collection holding the workspace (for vector RAG, optional)
+                - tenant_field: Tenant field of a shared collection (for vector RAG, optional)
+                - chunk_text_store: ChunkTextStore holding chunk text (for vector RAG, optional)
 
         Returns:
             RemoveRagResourcesWorkflow implementation
@@ -45,7 +48,12 @@ class RemoveResourcesWorkflowFactory:
 
         qdrant_url = config.get("qdrant_url", "http://localhost:6333")
 
-        workflow = VectorRagRemoveRagResourcesWorkflow(qdrant_url=qdrant_url)
+        workflow = VectorRagRemoveRagResourcesWorkflow(
+            qdrant_url=qdrant_url,
+            collection_name=config.get("collection_name"),
+            tenant_field=config.get("tenant_field"),
+            chunk_text_store=config.get("chunk_text_store"),
+        )
         logger.info("Vector RAG remove resources workflow created successfully")
         return workflow
 
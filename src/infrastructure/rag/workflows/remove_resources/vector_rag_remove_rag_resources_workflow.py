@@ -1,6 +1,6 @@
 """Vector RAG implementation of remove RAG resources workflow."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from returns.result import Failure, Result, Success
 
@@ -10,6 +10,7 @@ from src.infrastructure.rag.workflows.remove_resources.remove_rag_resources_work
     RemoveRagResourcesWorkflowError,
 )
 from src.infrastructure.types.common import WorkspaceContext
+from src.infrastructure.vector_stores import ChunkTextStore
 
 if TYPE_CHECKING:
     from qdrant_client import QdrantClient
@@ -18,6 +19,7 @@ logger = create_logger(__name__)
 
 try:
     import qdrant_client
+    import qdrant_client.http.models as qdrant_models
 
     QDRANT_AVAILABLE = True
 except ImportError:
@@ -30,20 +32,33 @@ class VectorRagRemoveRagResourcesWorkflow(RemoveRagResourcesWorkflow):
 
     Pipeline:
     1. Connect to Qdrant
-    2. Delete workspace collection
-    3. Return success status
+    2. Delete workspace collection (or the workspace's points in a shared collection)
+    3. Delete the workspace's chunk text from the chunk text store, if any
+    4. Return success status
     """
 
-    def __init__(self, qdrant_url: str):
+    def __init__(
+        self,
+        qdrant_url: str,
+        collection_name: Optional[str] = None,
+        tenant_field: Optional[str] = None,
+        chunk_text_store: Optional[ChunkTextStore] = None,
+    ):
         """Initialize workflow with Qdrant connection parameters.
 
         Args:
             qdrant_url: Qdrant server URL
+            collection_name: Collection holding the workspace (default: its own collection)
+            tenant_field: Field partitioning a collection shared by workspaces
+            chunk_text_store: Optional store holding the workspace's chunk text
         """
         if not QDRANT_AVAILABLE:
             raise ImportError("Qdrant client not installed. Please run: pip install qdrant-client")
 
         self.qdrant_url = qdrant_url
+        self.collection_name = collection_name
+        self.tenant_field = tenant_field
+        self.chunk_text_store = chunk_text_store
 
     def execute(
         self,
@@ -62,7 +77,15 @@ class VectorRagRemoveRagResourcesWorkflow(RemoveRagResourcesWorkflow):
 
             # Delete Qdrant collection using WorkspaceContext for naming
             workspace_ctx = WorkspaceContext(id=int(workspace_id))
-            self._delete_qdrant_collection(workspace_ctx.collection_name)
+            if self.tenant_field and self.collection_name:
+                self._delete_workspace_points(self.collection_name, workspace_id)
+            else:
+                self._delete_qdrant_collection(
+                    self.collection_name or workspace_ctx.collection_name
+                )
+
+            if self.chunk_text_store:
+                self.chunk_text_store.delete_workspace(workspace_id)
 
             logger.info(f"Workspace {workspace_id} RAG resources removed successfully")
 
@@ -103,3 +126,37 @@ class VectorRagRemoveRagResourcesWorkflow(RemoveRagResourcesWorkflow):
         except Exception as e:
             logger.warning(f"Failed to delete Qdrant collection: {e}")
             # Don't raise exception - workspace deletion should continue
+
+    def _delete_workspace_points(self, collection_name: str, workspace_id: str) -> None:
+        """Delete a workspace's points from a shared collection.
+
+        Args:
+            collection_name: Name of the shared collection
+            workspace_id: Workspace whose points are deleted
+        """
+        try:
+            client: QdrantClient = qdrant_client.QdrantClient(url=self.qdrant_url)
+
+            if not client.collection_exists(collection_name):
+                logger.info(f"Collection {collection_name} does not exist, skipping deletion")
+                return
+
+            client.delete(
+                collection_name=collection_name,
+                points_selector=qdrant_models.FilterSelector(
+                    filter=qdrant_models.Filter(
+                        must=[
+                            qdrant_models.FieldCondition(
+                                key=str(self.tenant_field),
+                                match=qdrant_models.MatchValue(value=str(workspace_id)),
+                            )
+                        ]
+                    )
+                ),
+                wait=True,
+            )
+            logger.info(f"Deleted workspace {workspace_id} points from {collection_name}")
+
+        except Exception as e:
+            logger.warning(f"Failed to delete workspace points: {e}")
+            # Don't raise exception - workspace deletion should continue
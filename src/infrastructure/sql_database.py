@@ -1,9 +1,14 @@
-"""PostgreSQL database module - single database implementation."""
+"""PostgreSQL database module - single pooled database implementation."""
 
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Optional
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 
 from src.infrastructure.logger import create_logger
 
@@ -28,27 +33,225 @@ class DatabaseException(Exception):
 
 
 class SqlDatabase:
-    """PostgreSQL database implementation."""
+    """PostgreSQL database implementation backed by a thread-safe connection pool.
 
-    def __init__(self, db_url: str):
+    Every call checks a connection out of the pool, so concurrent ingestion and
+    chat work run on separate connections. When all connections are in use,
+    callers wait up to ``pool_timeout`` seconds for one to be returned.
+
+    Calls are autocommitted unless they run inside ``transaction()``, which
+    pins one connection to the calling thread until the block exits.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        min_connections: int = 1,
+        max_connections: int = 10,
+        pool_timeout: float = 30.0,
+        health_check_idle_seconds: float = 30.0,
+    ):
         """
-        Initialize PostgreSQL database connection.
+        Initialize the PostgreSQL connection pool.
 
         Args:
             db_url: PostgreSQL connection string
+            min_connections: Connections opened up front and kept in the pool
+            max_connections: Maximum number of simultaneously open connections
+            pool_timeout: Seconds to wait for a free connection before failing
+            health_check_idle_seconds: Connections idle for longer than this are
+                pinged on checkout and replaced if the ping fails
 
         Raises:
             DatabaseException: If connection fails
+            ValueError: If the pool bounds are invalid
         """
+        if min_connections < 0 or max_connections <= 0 or min_connections > max_connections:
+            raise ValueError(f"Invalid pool bounds: min={min_connections}, max={max_connections}")
+
         self.db_url = db_url
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.health_check_idle_seconds = health_check_idle_seconds
+
+        # psycopg2 pools raise instead of blocking when exhausted; the semaphore
+        # makes callers wait for a free connection.
+        self._slots = threading.BoundedSemaphore(max_connections)
+        # Connection of the transaction open on the current thread, if any
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._last_used: dict[int, float] = {}
+        self._in_use = 0
+        self._checkouts = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._timeouts = 0
+        self._reconnects = 0
+
         try:
-            self.conn = psycopg2.connect(db_url)
-            self.conn.autocommit = True
-            logger.debug("Database connection established")
+            self.pool = psycopg2.pool.ThreadedConnectionPool(
+                min_connections, max_connections, db_url
+            )
+            # Fail fast on bad credentials even when no connections are pre-opened
+            with self._connection():
+                pass
+            logger.debug(
+                f"Database connection pool established (min={min_connections}, max={max_connections})"
+            )
         except psycopg2.Error as e:
             logger.error(f"Failed to connect to database: {e}")
             raise DatabaseException(str(e), operation="connect", original_error=e) from e
 
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Check a healthy autocommit connection out of the pool for one operation.
+
+        Inside transaction() the thread's transaction connection is reused.
+
+        Raises:
+            DatabaseException: If no connection becomes available within pool_timeout
+        """
+        transaction_conn = getattr(self._local, "conn", None)
+        if transaction_conn is not None:
+            yield transaction_conn
+            return
+
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=self.pool_timeout):
+            with self._stats_lock:
+                self._timeouts += 1
+            raise DatabaseException(
+                f"No connection available within {self.pool_timeout}s "
+                f"(max_connections={self.max_connections})",
+                operation="checkout",
+            )
+
+        conn = None
+        broken = False
+        try:
+            waited = time.monotonic() - started
+            conn = self._checkout()
+            with self._stats_lock:
+                self._in_use += 1
+                self._checkouts += 1
+                self._wait_time_total += waited
+                self._wait_time_max = max(self._wait_time_max, waited)
+
+            try:
+                yield conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                # Connection-level failure: don't hand this connection out again
+                broken = True
+                raise
+        finally:
+            if conn is not None:
+                with self._stats_lock:
+                    self._in_use -= 1
+                    self._last_used[id(conn)] = time.monotonic()
+                self._release(conn, discard=broken or bool(conn.closed))
+            self._slots.release()
+
+    def _checkout(self) -> Any:
+        """Get a healthy connection from the pool, replacing unusable ones.
+
+        After a database restart every idle pooled connection may be stale, so
+        up to max_connections + 1 connections are checked before giving up.
+
+        Raises:
+            DatabaseException: If no healthy connection could be obtained
+        """
+        for _ in range(self.max_connections + 1):
+            conn = self.pool.getconn()
+            if self._is_healthy(conn):
+                conn.autocommit = True
+                return conn
+            logger.warning("Discarding stale database connection and reconnecting")
+            self._release(conn, discard=True)
+            with self._stats_lock:
+                self._reconnects += 1
+        raise DatabaseException(
+            f"No healthy connection after {self.max_connections + 1} attempts",
+            operation="checkout",
+        )
+
+    def _is_healthy(self, conn: Any) -> bool:
+        """Check a pooled connection, pinging it only if it has been idle for a while."""
+        if conn.closed:
+            return False
+
+        last_used = self._last_used.get(id(conn))
+        if last_used is None or time.monotonic() - last_used < self.health_check_idle_seconds:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _release(self, conn: Any, discard: bool = False) -> None:
+        """Return a connection to the pool, closing it if discard is set."""
+        if discard:
+            with self._stats_lock:
+                self._last_used.pop(id(conn), None)
+        try:
+            self.pool.putconn(conn, close=discard)
+        except psycopg2.pool.PoolError as e:
+            logger.warning(f"Failed to return connection to pool: {e}")
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the calling thread is inside a transaction() block."""
+        return getattr(self._local, "conn", None) is not None
+
+    @contextmanager
+    def transaction(self) -> Iterator["SqlDatabase"]:
+        """Run every call made on this thread inside the block as one transaction.
+
+        Commits when the block exits normally and rolls back if it raises.
+        Nested blocks join the outermost transaction.
+
+        Example:
+            with db.transaction():
+                db.execute("UPDATE documents SET status = %s WHERE id = %s", ("ready", 1))
+                db.execute("DELETE FROM chat_messages WHERE session_id = %s", (2,))
+
+        Raises:
+            DatabaseException: If no connection is available or the commit fails
+        """
+        if self.in_transaction:
+            yield self
+            return
+
+        with self._connection() as conn:
+            conn.autocommit = False
+            self._local.conn = conn
+            try:
+                yield self
+            except BaseException:
+                self._local.conn = None
+                try:
+                    conn.rollback()
+                except psycopg2.Error as e:
+                    logger.warning(f"Database rollback failed: {e}")
+                raise
+            else:
+                self._local.conn = None
+                try:
+                    conn.commit()
+                except psycopg2.Error as e:
+                    logger.error(f"Database commit failed: {e}")
+                    raise DatabaseException(str(e), operation="commit", original_error=e) from e
+            finally:
+                self._local.conn = None
+                if not conn.closed:
+                    try:
+                        conn.autocommit = True
+                    except psycopg2.Error as e:
+                        logger.warning(f"Failed to restore autocommit: {e}")
+
     def execute(self, query: str, params: Optional[tuple[Any, ...]] = None) -> int:
         """Execute a query and return rows affected.
 
@@ -56,9 +259,11 @@ class SqlDatabase:
             DatabaseException: If the database operation fails
         """
         try:
-            with self.conn.cursor() as cursor:
+            with self._connection() as conn, conn.cursor() as cursor:
                 cursor.execute(query, params)
                 return cursor.rowcount if cursor.rowcount else 0
+        except DatabaseException:
+            raise
         except psycopg2.Error as e:
             logger.error(f"Database execute failed: {e}")
             raise DatabaseException(str(e), operation="execute", original_error=e) from e
@@ -75,10 +280,15 @@ class SqlDatabase:
             DatabaseException: If the database operation fails
         """
         try:
-            with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with (
+                self._connection() as conn,
+                conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor,
+            ):
                 cursor.execute(query, params)
                 result = cursor.fetchone()
                 return dict(result) if result else None
+        except DatabaseException:
+            raise
         except psycopg2.Error as e:
             logger.error(f"Database fetch_one failed: {e}")
             raise DatabaseException(str(e), operation="fetch_one", original_error=e) from e
@@ -95,10 +305,15 @@ class SqlDatabase:
             DatabaseException: If the database operation fails
         """
         try:
-            with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with (
+                self._connection() as conn,
+                conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor,
+            ):
                 cursor.execute(query, params)
                 results = cursor.fetchall()
                 return [dict(row) for row in results]
+        except DatabaseException:
+            raise
         except psycopg2.Error as e:
             logger.error(f"Database fetch_all failed: {e}")
             raise DatabaseException(str(e), operation="fetch_all", original_error=e) from e
@@ -108,13 +323,13 @@ class SqlDatabase:
 
     def health_check(self) -> bool:
         """
-        Check if database connection is healthy.
+        Check if the database is reachable through the pool.
 
         Returns:
             bool: True if connection is healthy, False otherwise
         """
         try:
-            with self.conn.cursor() as cursor:
+            with self._connection() as conn, conn.cursor() as cursor:
                 cursor.execute("SELECT 1")
                 result = cursor.fetchone()
                 return result is not None and result[0] == 1
@@ -122,34 +337,65 @@ class SqlDatabase:
             logger.error(f"Database health check failed: {e}")
             return False
 
+    def get_pool_stats(self) -> dict[str, float]:
+        """
+        Get connection pool metrics.
+
+        Returns:
+            Dictionary with pool bounds, connections in use, checkout count,
+            total/max wait time in seconds, checkout timeouts and reconnects
+        """
+        with self._stats_lock:
+            return {
+                "min_connections": self.min_connections,
+                "max_connections": self.max_connections,
+                "in_use": self._in_use,
+                "checkouts": self._checkouts,
+                "wait_time_total": self._wait_time_total,
+                "wait_time_max": self._wait_time_max,
+                "timeouts": self._timeouts,
+                "reconnects": self._reconnects,
+            }
+
     def close(self) -> None:
-        """Close the database connection."""
-        if self.conn:
+        """Close all pooled database connections."""
+        if self.pool and not self.pool.closed:
             try:
-                self.conn.close()
-                logger.debug("Database connection closed")
+                self.pool.closeall()
+                logger.debug("Database connection pool closed")
             except Exception as e:
-                logger.warning(f"Error closing database connection: {e}")
+                logger.warning(f"Error closing database connection pool: {e}")
 
 
-# Singleton instance (single-threaded application)
+# Singleton instance shared by all threads (the pool handles concurrency)
 _db_instance: Optional[SqlDatabase] = None
+_db_lock = threading.Lock()
 
 
 def get_sql_database() -> SqlDatabase:
     """
-    Get the singleton PostgreSQL database connection.
+    Get the singleton PostgreSQL database.
+
+    Pool bounds come from DATABASE_POOL_MIN_SIZE, DATABASE_POOL_MAX_SIZE and
+    DATABASE_POOL_TIMEOUT.
 
     Returns:
         SqlDatabase instance
     """
     global _db_instance
-    if _db_instance is None:
-        from src.config import config
+    with _db_lock:
+        if _db_instance is None:
+            from src.config import config
 
-        _db_instance = SqlDatabase(config.database_url)
-        logger.info("Database connection initialized")
-    return _db_instance
+            db_config = config.database
+            _db_instance = SqlDatabase(
+                db_config.url,
+                min_connections=db_config.pool_min_size,
+                max_connections=db_config.pool_max_size,
+                pool_timeout=db_config.pool_timeout,
+            )
+            logger.info("Database connection pool initialized")
+        return _db_instance
 
 
 def close_sql_database() -> None:
@@ -159,11 +405,12 @@ def close_sql_database() -> None:
     This should be called during application shutdown.
     """
     global _db_instance
-    if _db_instance is not None:
-        try:
-            _db_instance.close()
-            logger.info("Database connection closed")
-        except Exception as e:
-            logger.error(f"Error closing database connection: {e}")
-        finally:
-            _db_instance = None
+    with _db_lock:
+        if _db_instance is not None:
+            try:
+                _db_instance.close()
+                logger.info("Database connection closed")
+            except Exception as e:
+                logger.error(f"Error closing database connection: {e}")
+            finally:
+                _db_instance = None
@@ -1,7 +1,9 @@
 """Vector store implementations for Vector RAG."""
 
+from .chunk_text_store import ChunkTextStore, get_chunk_text_store
 from .factory import VectorStoreFactory, create_vector_store
 from .qdrant_vector_store import QdrantVectorStore
+from .sql_chunk_text_store import SqlChunkTextStore
 from .vector_store import VectorStore, VectorStoreException
 
 __all__ = [
@@ -10,4 +12,7 @@ __all__ = [
     "QdrantVectorStore",
     "VectorStoreFactory",
     "create_vector_store",
+    "ChunkTextStore",
+    "SqlChunkTextStore",
+    "get_chunk_text_store",
 ]
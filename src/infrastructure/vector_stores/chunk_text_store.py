@@ -0,0 +1,103 @@
+"""Side store for chunk text kept out of vector store payloads.
+
+Storing every chunk's text in the vector index makes the index larger and
+every search response heavier, although only the final top-k texts are ever
+read. With a chunk text store, indexing writes chunk text here instead of into
+the payload, and the query workflow fetches the texts of the retrieved chunks
+in one bulk lookup.
+"""
+
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Optional
+
+from src.infrastructure.logger import create_logger
+
+logger = create_logger(__name__)
+
+CHUNK_TEXT_STORAGE_TYPES = ("payload", "postgres")
+
+
+class ChunkTextStore(ABC):
+    """Interface for storing chunk text by chunk ID."""
+
+    @abstractmethod
+    def put(self, workspace_id: str, document_id: str, texts: dict[str, str]) -> None:
+        """
+        Store (or replace) the text of a document's chunks.
+
+        Args:
+            workspace_id: Workspace the document belongs to
+            document_id: Document the chunks belong to
+            texts: Chunk text keyed by chunk ID
+        """
+        pass
+
+    @abstractmethod
+    def get_many(self, chunk_ids: list[str]) -> dict[str, str]:
+        """
+        Get the text of several chunks at once.
+
+        Args:
+            chunk_ids: Chunk IDs to look up
+
+        Returns:
+            Chunk text keyed by chunk ID (missing chunks are omitted)
+        """
+        pass
+
+    @abstractmethod
+    def delete_document(self, workspace_id: str, document_id: str) -> int:
+        """
+        Delete the text of a document's chunks.
+
+        Args:
+            workspace_id: Workspace the document belongs to
+            document_id: Document whose chunks are deleted
+
+        Returns:
+            Number of chunks deleted
+        """
+        pass
+
+    @abstractmethod
+    def delete_workspace(self, workspace_id: str) -> int:
+        """
+        Delete the text of every chunk in a workspace.
+
+        Args:
+            workspace_id: Workspace whose chunks are deleted
+
+        Returns:
+            Number of chunks deleted
+        """
+        pass
+
+
+# Process-wide chunk text store shared by all workflows (created lazily from config)
+_chunk_text_store: Optional[ChunkTextStore] = None
+_chunk_text_store_initialized = False
+_chunk_text_store_lock = Lock()
+
+
+def get_chunk_text_store() -> Optional[ChunkTextStore]:
+    """
+    Get the process-wide chunk text store configured by CHUNK_TEXT_STORAGE.
+
+    Returns:
+        ChunkTextStore instance, or None when chunk text is stored in payloads
+    """
+    global _chunk_text_store, _chunk_text_store_initialized
+    with _chunk_text_store_lock:
+        if not _chunk_text_store_initialized:
+            from src.config import config
+
+            if config.chunk_text_storage == "postgres":
+                from src.infrastructure.sql_database import get_sql_database
+
+                from .sql_chunk_text_store import SqlChunkTextStore
+
+                _chunk_text_store = SqlChunkTextStore(get_sql_database())
+                logger.info("Chunk text store initialized (postgres)")
+            _chunk_text_store_initialized = True
+        return _chunk_text_store
@@ -3,6 +3,8 @@
 from enum import Enum
 from typing import Optional
 
+from src.infrastructure.types.common import FilterDict
+
 from .qdrant_vector_store import QdrantVectorStore
 from .vector_store import VectorStore
 
@@ -22,7 +24,10 @@ class VectorStoreFactory:
 
         Args:
             store_type: Type of vector store to create
-            **kwargs: Additional configuration (url, collection_name, vector_size, api_key)
+            **kwargs: Additional configuration (url, collection_name, vector_size, distance,
+                api_key, port, grpc_port, prefer_grpc, upsert_batch_size, upsert_parallel,
+                upsert_wait, scope, tenant_field, payload_fields, quantization, hnsw_m,
+                hnsw_ef_construct, on_disk_vectors)
 
         Returns:
             VectorStore instance
@@ -35,7 +40,21 @@ class VectorStoreFactory:
             url=kwargs.get("url") or kwargs.get("host", "localhost"),
             collection_name=kwargs.get("collection_name", "document"),
             vector_size=kwargs.get("vector_size", 768),
+            distance=kwargs.get("distance", "cosine"),
             api_key=kwargs.get("api_key"),
+            port=kwargs.get("port"),
+            grpc_port=kwargs.get("grpc_port", 6334),
+            prefer_grpc=kwargs.get("prefer_grpc", False),
+            upsert_batch_size=kwargs.get("upsert_batch_size", 256),
+            upsert_parallel=kwargs.get("upsert_parallel", 1),
+            upsert_wait=kwargs.get("upsert_wait", True),
+            scope=kwargs.get("scope"),
+            tenant_field=kwargs.get("tenant_field"),
+            payload_fields=kwargs.get("payload_fields"),
+            quantization=kwargs.get("quantization", "none"),
+            hnsw_m=kwargs.get("hnsw_m"),
+            hnsw_ef_construct=kwargs.get("hnsw_ef_construct"),
+            on_disk_vectors=kwargs.get("on_disk_vectors", False),
         )
 
     @staticmethod
@@ -60,6 +79,23 @@ AVAILABLE_VECTOR_STORES = {
 }
 
 
+AVAILABLE_QUANTIZATIONS = {
+    "none": {
+        "label": "None",
+        "description": "Store full float32 vectors",
+    },
+    "scalar": {
+        "label": "Scalar (int8)",
+        "description": "int8 vectors in RAM, 4x smaller with minimal accuracy loss",
+    },
+    "binary": {
+        "label": "Binary",
+        "description": "1-bit vectors in RAM, 32x smaller; results are rescored "
+        "with the original vectors",
+    },
+}
+
+
 def get_available_vector_stores() -> list[dict[str, str]]:
     """Get list of available vector store implementations."""
     return [
@@ -72,12 +108,38 @@ def get_available_vector_stores() -> list[dict[str, str]]:
     ]
 
 
+def get_available_quantizations() -> list[dict[str, str]]:
+    """Get list of available vector quantization modes."""
+    return [
+        {
+            "value": key,
+            "label": info["label"],
+            "description": info["description"],
+        }
+        for key, info in AVAILABLE_QUANTIZATIONS.items()
+    ]
+
+
 def create_vector_store(
     store_type: str,
     url: Optional[str] = None,
     collection_name: Optional[str] = None,
     vector_size: Optional[int] = None,
+    distance: str = "cosine",
     api_key: Optional[str] = None,
+    port: Optional[int] = None,
+    grpc_port: int = 6334,
+    prefer_grpc: bool = False,
+    upsert_batch_size: int = 256,
+    upsert_parallel: int = 1,
+    upsert_wait: bool = True,
+    scope: Optional[FilterDict] = None,
+    tenant_field: Optional[str] = None,
+    payload_fields: Optional[list[str]] = None,
+    quantization: str = "none",
+    hnsw_m: Optional[int] = None,
+    hnsw_ef_construct: Optional[int] = None,
+    on_disk_vectors: bool = False,
 ) -> VectorStore:
     """
     Create a vector store instance based on configuration.
@@ -87,7 +149,21 @@ def create_vector_store(
         url: Store URL (required for qdrant)
         collection_name: Collection/index name (required for qdrant)
         vector_size: Dimension of vectors (required for qdrant)
+        distance: Distance metric of a collection the store creates (qdrant)
         api_key: API key for authentication (optional)
+        port: REST port when not part of the URL (optional)
+        grpc_port: gRPC port (qdrant)
+        prefer_grpc: Use gRPC for data operations (qdrant)
+        upsert_batch_size: Points per upsert request (qdrant)
+        upsert_parallel: Threads sending upsert batches concurrently (qdrant)
+        upsert_wait: Wait for every upsert batch to be applied (qdrant)
+        scope: Payload values shared by every point in the collection (optional)
+        tenant_field: Field partitioning a collection shared by tenants (optional)
+        payload_fields: Payload fields returned by searches (default: all) (qdrant)
+        quantization: Quantization of a collection the store creates (qdrant)
+        hnsw_m: HNSW edges per node of a collection the store creates (qdrant)
+        hnsw_ef_construct: HNSW build beam width of a collection the store creates (qdrant)
+        on_disk_vectors: Keep original vectors on disk in a collection the store creates (qdrant)
 
     Returns:
         VectorStore instance
@@ -130,7 +206,21 @@ def create_vector_store(
             url=url,
             collection_name=collection_name,
             vector_size=vector_size,
+            distance=distance,
             api_key=api_key,
+            port=port,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
+            upsert_batch_size=upsert_batch_size,
+            upsert_parallel=upsert_parallel,
+            upsert_wait=upsert_wait,
+            scope=scope,
+            tenant_field=tenant_field,
+            payload_fields=payload_fields,
+            quantization=quantization,
+            hnsw_m=hnsw_m,
+            hnsw_ef_construct=hnsw_ef_construct,
+            on_disk_vectors=on_disk_vectors,
         )
 
     raise ValueError(f"Unsupported vector store type: {store_type}")
@@ -1,6 +1,7 @@
 """Qdrant implementation of VectorStore interface."""
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.infrastructure.logger import create_logger
@@ -11,7 +12,15 @@ from .vector_store import VectorStore, VectorStoreException
 
 if TYPE_CHECKING:
     from qdrant_client import QdrantClient
-    from qdrant_client.http.models import Filter
+    from qdrant_client.http.models import (
+        Filter,
+        HnswConfigDiff,
+        KeywordIndexParams,
+        PayloadSchemaType,
+        PayloadSelectorInclude,
+        QuantizationConfig,
+        QuantizationSearchParams,
+    )
 
 logger = create_logger(__name__)
 
@@ -25,6 +34,108 @@ except ImportError:
     QDRANT_AVAILABLE = False
 
 
+# Payload fields every chunk carries and that search and delete filter on;
+# indexed so filtered operations don't scan the whole collection
+INDEXED_PAYLOAD_FIELDS = ("document_id", "workspace_id")
+
+# Payload fields a search always returns when payload_fields restricts the rest
+REQUIRED_PAYLOAD_FIELDS = ("_original_id", "document_id", "chunk_id")
+
+
+def ensure_payload_indexes(
+    client: "QdrantClient", collection_name: str, tenant_field: Optional[str] = None
+) -> None:
+    """
+    Create keyword payload indexes for the filtered chunk fields if missing.
+
+    Args:
+        client: Qdrant client
+        collection_name: Collection to index
+        tenant_field: Field partitioning a shared collection by tenant; its index
+            is created with is_tenant so Qdrant co-locates each tenant's points
+    """
+    existing = client.get_collection(collection_name).payload_schema or {}
+    for field_name in INDEXED_PAYLOAD_FIELDS:
+        if field_name in existing:
+            continue
+        field_schema: "PayloadSchemaType | KeywordIndexParams" = (
+            qdrant_models.KeywordIndexParams(
+                type=qdrant_models.KeywordIndexType.KEYWORD, is_tenant=True
+            )
+            if field_name == tenant_field
+            else qdrant_models.PayloadSchemaType.KEYWORD
+        )
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=field_schema,
+            wait=True,
+        )
+        logger.info(f"Created payload index on {field_name} in {collection_name}")
+
+
+def collection_hnsw_config(
+    tenant_field: Optional[str] = None,
+    m: Optional[int] = None,
+    ef_construct: Optional[int] = None,
+) -> "Optional[HnswConfigDiff]":
+    """
+    HNSW settings for a new collection.
+
+    A collection shared by tenants is always searched with a tenant filter, so
+    it builds per-tenant graphs (payload_m) instead of one global graph (m=0).
+
+    Args:
+        tenant_field: Field partitioning a shared collection by tenant, if any
+        m: Edges per node in the graph
+        ef_construct: Neighbours considered while building the graph
+
+    Returns:
+        HNSW config, or None for Qdrant's defaults
+    """
+    if tenant_field:
+        return qdrant_models.HnswConfigDiff(payload_m=m or 16, m=0, ef_construct=ef_construct)
+    if m is None and ef_construct is None:
+        return None
+    return qdrant_models.HnswConfigDiff(m=m, ef_construct=ef_construct)
+
+
+def collection_quantization_config(quantization: str = "none") -> "Optional[QuantizationConfig]":
+    """
+    Quantization settings for a new collection.
+
+    Quantized vectors are kept in RAM for the search itself; the original
+    float32 vectors can then live on disk and are only read for rescoring.
+
+    Args:
+        quantization: "none", "scalar" (int8) or "binary" (1 bit per dimension)
+
+    Returns:
+        Quantization config, or None to store only float32 vectors
+
+    Raises:
+        ValueError: If the quantization mode is unknown
+    """
+    if quantization == "none":
+        return None
+    if quantization == "scalar":
+        return qdrant_models.ScalarQuantization(
+            scalar=qdrant_models.ScalarQuantizationConfig(
+                type=qdrant_models.ScalarType.INT8, quantile=0.99, always_ram=True
+            )
+        )
+    if quantization == "binary":
+        return qdrant_models.BinaryQuantization(
+            binary=qdrant_models.BinaryQuantizationConfig(always_ram=True)
+        )
+    raise ValueError(f"Unknown quantization: {quantization}. Must be none, scalar or binary")
+
+
+# Binary quantization loses too much precision to rank on its own: fetch this
+# many times more candidates and rescore them with the original vectors
+BINARY_OVERSAMPLING = 2.0
+
+
 class QdrantVectorStore(VectorStore):
     """
     Qdrant implementation of VectorStore.
@@ -32,6 +143,16 @@ class QdrantVectorStore(VectorStore):
     Provides vector storage and similarity search using the Qdrant vector database.
     Supports filtering, batch operations, and metadata storage.
 
+    Vectors are upserted in column-oriented batches, optionally from several threads.
+    When upsert_wait is False, batches are sent without waiting for them to be
+    applied and only the final batch waits, so add() still returns with every
+    point searchable.
+
+    A per-workspace collection is created with a scope ({"workspace_id": ...});
+    search conditions the scope already guarantees are dropped. A collection
+    shared by all workspaces is created with tenant_field="workspace_id"
+    instead, which indexes that field as Qdrant's tenant key.
+
     Example:
         store = QdrantVectorStore(
             url="http://localhost:6333",
@@ -49,6 +170,19 @@ class QdrantVectorStore(VectorStore):
         vector_size: int = 384,
         distance: str = "cosine",
         api_key: Optional[str] = None,
+        port: Optional[int] = None,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = False,
+        upsert_batch_size: int = 256,
+        upsert_parallel: int = 1,
+        upsert_wait: bool = True,
+        scope: Optional[FilterDict] = None,
+        tenant_field: Optional[str] = None,
+        payload_fields: Optional[List[str]] = None,
+        quantization: str = "none",
+        hnsw_m: Optional[int] = None,
+        hnsw_ef_construct: Optional[int] = None,
+        on_disk_vectors: bool = False,
     ) -> None:
         """
         Initialize Qdrant vector store.
@@ -59,14 +193,40 @@ class QdrantVectorStore(VectorStore):
             vector_size: Dimension of vectors to store
             distance: Distance metric ("cosine", "euclidean", "dot")
             api_key: Optional API key for Qdrant Cloud
+            port: REST port, if not part of the URL
+            grpc_port: gRPC port
+            prefer_grpc: Use gRPC instead of REST for data operations
+            upsert_batch_size: Points per upsert request
+            upsert_parallel: Threads sending upsert batches concurrently
+            upsert_wait: Wait for every batch to be applied (otherwise only the last)
+            scope: Payload values shared by every point in the collection
+            tenant_field: Field partitioning a collection shared by several tenants
+            payload_fields: Payload fields returned by searches (default: all)
+            quantization: Quantization of a collection this store creates
+                ("none", "scalar" or "binary")
+            hnsw_m: HNSW edges per node of a collection this store creates
+            hnsw_ef_construct: HNSW build beam width of a collection this store creates
+            on_disk_vectors: Keep original vectors on disk in a collection this store creates
         """
         if not QDRANT_AVAILABLE:
             raise ImportError("Qdrant client not installed. Please run: pip install qdrant-client")
+        if upsert_batch_size <= 0:
+            raise ValueError(f"upsert_batch_size must be positive, got {upsert_batch_size}")
 
         self.url = url
         self.collection_name = collection_name
         self.vector_size = vector_size
         self.api_key = api_key
+        self.upsert_batch_size = upsert_batch_size
+        self.upsert_parallel = max(1, upsert_parallel)
+        self.upsert_wait = upsert_wait
+        self.scope = scope or {}
+        self.tenant_field = tenant_field
+        self.payload_fields = payload_fields
+        self.on_disk_vectors = on_disk_vectors
+        self._quantization_config = collection_quantization_config(quantization)
+        self._hnsw_config = collection_hnsw_config(tenant_field, hnsw_m, hnsw_ef_construct)
+        self._quantization_search: Optional[QuantizationSearchParams] = None
 
         # Map distance string to Qdrant Distance enum
         distance_map = {
@@ -77,7 +237,13 @@ class QdrantVectorStore(VectorStore):
         self._distance = distance_map.get(distance.lower(), qdrant_models.Distance.COSINE)
 
         # Initialize client
-        self._client: QdrantClient = qdrant_client.QdrantClient(url=url, api_key=api_key)
+        self._client: QdrantClient = qdrant_client.QdrantClient(
+            url=url,
+            port=port,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
+            api_key=api_key,
+        )
 
         # Ensure collection exists
         self._ensure_collection()
@@ -85,7 +251,12 @@ class QdrantVectorStore(VectorStore):
         logger.info(f"Connected to Qdrant at {url}, collection: {collection_name}")
 
     def _ensure_collection(self) -> None:
-        """Create collection if it doesn't exist."""
+        """
+        Create collection and its payload indexes if they don't exist.
+
+        A missing collection is created with the same quantization, HNSW and
+        on-disk settings that workspace provisioning would have used.
+        """
         try:
             collections = self._client.get_collections().collections
             collection_names = [c.name for c in collections]
@@ -96,9 +267,23 @@ class QdrantVectorStore(VectorStore):
                     vectors_config=qdrant_models.VectorParams(
                         size=self.vector_size,
                         distance=self._distance,
+                        on_disk=self.on_disk_vectors,
                     ),
+                    hnsw_config=self._hnsw_config,
+                    quantization_config=self._quantization_config,
                 )
                 logger.info(f"Created collection: {self.collection_name}")
+
+            ensure_payload_indexes(self._client, self.collection_name, self.tenant_field)
+
+            # Binary-quantized collections are searched with oversampling and rescoring
+            quantization = self._client.get_collection(
+                self.collection_name
+            ).config.quantization_config
+            if isinstance(quantization, qdrant_models.BinaryQuantization):
+                self._quantization_search = qdrant_models.QuantizationSearchParams(
+                    rescore=True, oversampling=BINARY_OVERSAMPLING
+                )
         except Exception as e:
             logger.error(f"Failed to ensure collection exists: {e}")
             raise VectorStoreException(
@@ -163,6 +348,16 @@ class QdrantVectorStore(VectorStore):
 
         return qdrant_models.Filter(must=conditions)
 
+    def _without_scope(self, filters: Optional[FilterDict]) -> Optional[FilterDict]:
+        """Drop filter conditions that every point in the collection already satisfies."""
+        if not filters or not self.scope:
+            return filters
+        return {
+            key: value
+            for key, value in filters.items()
+            if key not in self.scope or str(self.scope[key]) != str(value)
+        }
+
     def add(self, vectors: List[List[float]], ids: List[str], payloads: List[MetadataDict]) -> None:
         """
         Add vectors to the vector store.
@@ -186,35 +381,55 @@ class QdrantVectorStore(VectorStore):
             )
 
         try:
-            points = []
-            for id_, vector, payload in zip(ids, vectors, payloads):
-                point_id = self._string_to_uuid(id_)
-                # Store original ID in metadata for retrieval
-                payload_with_id = {**payload, "_original_id": id_}
-                points.append(
-                    qdrant_models.PointStruct(
-                        id=point_id,
-                        vector=vector,
-                        payload=payload_with_id,
-                    )
-                )
-
-            # Batch upsert in chunks of 100
-            batch_size = 100
-            for i in range(0, len(points), batch_size):
-                batch = points[i : i + batch_size]
+            point_ids = [self._string_to_uuid(id_) for id_ in ids]
+            # Store original ID in metadata for retrieval
+            point_payloads = [
+                {**payload, "_original_id": id_} for id_, payload in zip(ids, payloads)
+            ]
+
+            def upsert(start: int, wait: bool) -> None:
+                end = start + self.upsert_batch_size
                 self._client.upsert(
                     collection_name=self.collection_name,
-                    points=batch,
+                    points=qdrant_models.Batch(
+                        ids=point_ids[start:end],  # type: ignore[arg-type]
+                        vectors=vectors[start:end],
+                        payloads=point_payloads[start:end],
+                    ),
+                    wait=wait,
                 )
 
+            # The last batch always waits: once it is applied, so are the earlier ones
+            starts = list(range(0, len(point_ids), self.upsert_batch_size))
+            *leading, last = starts
+            if self.upsert_parallel > 1 and len(leading) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.upsert_parallel, len(leading))
+                ) as pool:
+                    list(pool.map(lambda start: upsert(start, self.upsert_wait), leading))
+            else:
+                for start in leading:
+                    upsert(start, self.upsert_wait)
+            upsert(last, True)
+
             logger.info(f"Added {len(vectors)} vectors to vector store")
         except Exception as e:
             logger.error(f"Failed to add {len(vectors)} vectors: {e}")
             raise VectorStoreException(str(e), operation="add", original_error=e) from e
 
+    def _payload_selector(self) -> "bool | PayloadSelectorInclude":
+        """Payload to return with search results: all of it, or the selected fields."""
+        if self.payload_fields is None:
+            return True
+        fields = list(dict.fromkeys([*REQUIRED_PAYLOAD_FIELDS, *self.payload_fields]))
+        return qdrant_models.PayloadSelectorInclude(include=fields)
+
     def search(
-        self, query_embedding: List[float], top_k: int = 5, filters: Optional[FilterDict] = None
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        filters: Optional[FilterDict] = None,
+        hnsw_ef: Optional[int] = None,
     ) -> List[Tuple[Chunk, float]]:
         """
         Search for similar chunks in the vector store.
@@ -223,6 +438,7 @@ class QdrantVectorStore(VectorStore):
             query_embedding: The embedding of the query
             top_k: The number of similar chunks to return
             filters: Optional metadata filters
+            hnsw_ef: HNSW search beam width (default: the collection's ef_construct)
 
         Returns:
             A list of tuples, where each tuple contains a chunk and its similarity score
@@ -231,14 +447,20 @@ class QdrantVectorStore(VectorStore):
             VectorStoreException: If searching fails
         """
         try:
-            qdrant_filter = self._build_filter(filters)
+            qdrant_filter = self._build_filter(self._without_scope(filters))
+            search_params = None
+            if hnsw_ef is not None or self._quantization_search is not None:
+                search_params = qdrant_models.SearchParams(
+                    hnsw_ef=hnsw_ef, quantization=self._quantization_search
+                )
 
             results = self._client.query_points(
                 collection_name=self.collection_name,
                 query=query_embedding,
                 limit=top_k,
                 query_filter=qdrant_filter,
-                with_payload=True,
+                search_params=search_params,
+                with_payload=self._payload_selector(),
                 with_vectors=False,
             ).points
 
@@ -328,37 +550,21 @@ class QdrantVectorStore(VectorStore):
             return 0
 
         try:
-            # Scroll through all points matching the filter to get their IDs
-            point_ids = []
-            offset = None
-            while True:
-                scroll_result, next_offset = self._client.scroll(
-                    collection_name=self.collection_name,
-                    scroll_filter=qdrant_filter,
-                    limit=256,  # Batch size
-                    offset=offset,
-                    with_payload=False,
-                    with_vectors=False,
-                )
-                if not scroll_result:
-                    break
-
-                point_ids.extend([point.id for point in scroll_result])
-
-                if next_offset is None:
-                    break
-                offset = next_offset
-
-            if not point_ids:
+            # Count and delete server-side; both use the payload indexes
+            deleted_count = self._client.count(
+                collection_name=self.collection_name,
+                count_filter=qdrant_filter,
+                exact=True,
+            ).count
+            if not deleted_count:
                 return 0
 
-            # Delete the collected point IDs in batches
             self._client.delete(
                 collection_name=self.collection_name,
-                points_selector=qdrant_models.PointIdsList(points=point_ids),
+                points_selector=qdrant_models.FilterSelector(filter=qdrant_filter),
+                wait=True,
             )
 
-            deleted_count = len(point_ids)
             logger.info(f"Deleted {deleted_count} points matching filter.")
             return deleted_count
 
@@ -0,0 +1,65 @@
+"""PostgreSQL implementation of ChunkTextStore."""
+
+from src.infrastructure.logger import create_logger
+from src.infrastructure.sql_database import SqlDatabase
+
+from .chunk_text_store import ChunkTextStore
+
+logger = create_logger(__name__)
+
+
+class SqlChunkTextStore(ChunkTextStore):
+    """
+    Chunk text stored in the chunk_texts table.
+
+    Writes and lookups are single statements regardless of the number of
+    chunks: inserts unnest parallel arrays and lookups use = ANY.
+    """
+
+    def __init__(self, db: SqlDatabase) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            db: Database holding the chunk_texts table
+        """
+        self.db = db
+
+    def put(self, workspace_id: str, document_id: str, texts: dict[str, str]) -> None:
+        """Store (or replace) the text of a document's chunks."""
+        if not texts:
+            return
+
+        query = """
+            INSERT INTO chunk_texts (chunk_id, workspace_id, document_id, text)
+            SELECT chunk_id, %s, %s, text
+            FROM unnest(%s::text[], %s::text[]) AS t(chunk_id, text)
+            ON CONFLICT (chunk_id) DO UPDATE
+            SET workspace_id = EXCLUDED.workspace_id,
+                document_id = EXCLUDED.document_id,
+                text = EXCLUDED.text
+        """
+        self.db.execute(
+            query,
+            (str(workspace_id), str(document_id), list(texts.keys()), list(texts.values())),
+        )
+        logger.debug(f"Stored text for {len(texts)} chunks of document {document_id}")
+
+    def get_many(self, chunk_ids: list[str]) -> dict[str, str]:
+        """Get the text of several chunks at once."""
+        if not chunk_ids:
+            return {}
+
+        query = "SELECT chunk_id, text FROM chunk_texts WHERE chunk_id = ANY(%s)"
+        rows = self.db.fetch_all(query, (list(chunk_ids),))
+        return {row["chunk_id"]: row["text"] for row in rows}
+
+    def delete_document(self, workspace_id: str, document_id: str) -> int:
+        """Delete the text of a document's chunks."""
+        query = "DELETE FROM chunk_texts WHERE workspace_id = %s AND document_id = %s"
+        return self.db.execute(query, (str(workspace_id), str(document_id)))
+
+    def delete_workspace(self, workspace_id: str) -> int:
+        """Delete the text of every chunk in a workspace."""
+        query = "DELETE FROM chunk_texts WHERE workspace_id = %s"
+        return self.db.execute(query, (str(workspace_id),))
@@ -44,7 +44,11 @@ class VectorStore(ABC):
 
     @abstractmethod
     def search(
-        self, query_embedding: List[float], top_k: int = 5, filters: Optional[FilterDict] = None
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        filters: Optional[FilterDict] = None,
+        hnsw_ef: Optional[int] = None,
     ) -> List[Tuple[Chunk, float]]:
         """
         Search for similar chunks in the vector store.
@@ -53,6 +57,7 @@ class VectorStore(ABC):
             query_embedding: The embedding of the query
             top_k: The number of similar chunks to return
             filters: Optional filters for the search
+            hnsw_ef: Optional HNSW search beam width (ignored by stores without HNSW)
 
         Returns:
             A list of tuples, where each tuple contains a chunk and its similarity score.
@@ -14,6 +14,8 @@ from pathlib import Path
 
 import pytest
 
+from tests.e2e.conftest import get_workspace_create_input
+
 
 @pytest.mark.e2e
 class TestGraphRagComprehensive:
@@ -283,7 +285,7 @@ class TestGraphRagComprehensive:
         """Test creating vector workspace then graph workspace in same session."""
         # Create vector workspace
         vector_result = self.run_cli(
-            "workspace", "create", input_text="Vector Workspace\n\nvector\n\n\n\n\n\n\n"
+            "workspace", "create", input_text=get_workspace_create_input("Vector Workspace")
         )
         assert vector_result.returncode == 0
         assert (
@@ -15,6 +15,8 @@ from pathlib import Path
 
 import pytest
 
+from tests.e2e.conftest import get_workspace_create_input
+
 
 @pytest.mark.e2e
 class TestVectorRAGConfigWorkflows:
@@ -61,7 +63,9 @@ class TestVectorRAGConfigWorkflows:
         ws_result = self.run_cli(
             "workspace",
             "create",
-            input_text="Sentence Nomic Test\nSentence chunking with nomic\nvector\n\n\n\n\n\n",
+            input_text=get_workspace_create_input(
+                "Sentence Nomic Test", "Sentence chunking with nomic"
+            ),
         )
         assert ws_result.returncode == 0
 
@@ -109,7 +113,7 @@ class TestVectorRAGConfigWorkflows:
         ws_result = self.run_cli(
             "workspace",
             "create",
-            input_text="Character Chunking Test\n\nvector\n\n\n\n\n\n",
+            input_text=get_workspace_create_input("Character Chunking Test"),
         )
         assert ws_result.returncode == 0
 
@@ -155,7 +159,7 @@ class TestVectorRAGConfigWorkflows:
         ws_result = self.run_cli(
             "workspace",
             "create",
-            input_text="Semantic Chunking Test\n\nvector\n\n\n\n\n\n",
+            input_text=get_workspace_create_input("Semantic Chunking Test"),
         )
         assert ws_result.returncode == 0
 
@@ -203,7 +207,7 @@ class TestVectorRAGConfigWorkflows:
         ws_result = self.run_cli(
             "workspace",
             "create",
-            input_text="Token Chunking Test\n\nvector\n\n\n\n\n\n",
+            input_text=get_workspace_create_input("Token Chunking Test"),
         )
         assert ws_result.returncode == 0
 
@@ -247,7 +251,7 @@ class TestVectorRAGConfigWorkflows:
         ws_result = self.run_cli(
             "workspace",
             "create",
-            input_text="BM25 Reranking Test\n\nvector\n\n\n\n\n\nbm25\n",
+            input_text=get_workspace_create_input("BM25 Reranking Test", rerank_algorithm="bm25"),
         )
         assert ws_result.returncode == 0
 
@@ -293,7 +297,9 @@ class TestVectorRAGConfigWorkflows:
         ws_result = self.run_cli(
             "workspace",
             "create",
-            input_text="CrossEncoder Test\n\nvector\n\n\n\n\n\ncross-encoder\n",
+            input_text=get_workspace_create_input(
+                "CrossEncoder Test", rerank_algorithm="cross-encoder"
+            ),
         )
         assert ws_result.returncode == 0
 
@@ -339,7 +345,7 @@ class TestVectorRAGConfigWorkflows:
         ws_result = self.run_cli(
             "workspace",
             "create",
-            input_text="RRF Test\n\nvector\n\n\n\n\n\nrrf\n",
+            input_text=get_workspace_create_input("RRF Test", rerank_algorithm="rrf"),
         )
         assert ws_result.returncode == 0
 
@@ -405,7 +411,9 @@ Python is one of the most popular programming languages worldwide.
             ws_result = self.run_cli(
                 "workspace",
                 "create",
-                input_text="Markdown Chunking Test\n\nvector\nmarkdown\n\n\n\n\n",
+                input_text=get_workspace_create_input(
+                    "Markdown Chunking Test", chunking_algorithm="markdown"
+                ),
             )
             assert ws_result.returncode == 0
 
@@ -476,7 +484,9 @@ Python is one of the most popular programming languages worldwide.
             ws_result = self.run_cli(
                 "workspace",
                 "create",
-                input_text="HTML Chunking Test\n\nvector\nhtml\n\n\n\n\n",
+                input_text=get_workspace_create_input(
+                    "HTML Chunking Test", chunking_algorithm="html"
+                ),
             )
             assert ws_result.returncode == 0
 
@@ -560,7 +570,9 @@ if __name__ == "__main__":
             ws_result = self.run_cli(
                 "workspace",
                 "create",
-                input_text="Code Chunking Test\n\nvector\ncode\n\n\n\n\n",
+                input_text=get_workspace_create_input(
+                    "Code Chunking Test", chunking_algorithm="code"
+                ),
             )
             assert ws_result.returncode == 0
 
@@ -914,7 +926,7 @@ class TestRAGConfigSwitching:
         vector_ws = self.run_cli(
             "workspace",
             "create",
-            input_text="Vector Workspace\n\nvector\n\n\n\n\n\n",
+            input_text=get_workspace_create_input("Vector Workspace"),
         )
         assert vector_ws.returncode == 0
 
@@ -368,6 +368,8 @@ def cleanup_resources():
     try:
         import redis
 
+        from src.cache_keys import CacheKeys
+
         redis_client = redis.Redis(
             host=config.redis_host,
             port=config.redis_port,
@@ -377,7 +379,7 @@ def cleanup_resources():
         # Delete CLI state cache if workspaces were deleted
         if new_workspaces:
             try:
-                redis_client.delete("cli_state:1")
+                redis_client.delete(CacheKeys.cli_state())
             except Exception:
                 pass
 
@@ -428,6 +430,11 @@ def get_workspace_create_input(
     embedding_algorithm: str = "",
     top_k: str = "",
     rerank_algorithm: str = "",
+    quantization: str = "",
+    on_disk_vectors: str = "",
+    hnsw_m: str = "",
+    hnsw_ef_construct: str = "",
+    hnsw_ef: str = "",
     # Graph RAG defaults (empty string means use default)
     entity_extraction_algorithm: str = "",
     relationship_extraction_algorithm: str = "",
@@ -445,6 +452,11 @@ def get_workspace_create_input(
         embedding_algorithm: Embedding algorithm (empty = default)
         top_k: Top K (empty = default)
         rerank_algorithm: Rerank algorithm (empty = default)
+        quantization: Vector quantization (empty = default)
+        on_disk_vectors: Store vectors on disk, "y" or "n" (empty = default)
+        hnsw_m: HNSW m (empty = default)
+        hnsw_ef_construct: HNSW ef_construct (empty = default)
+        hnsw_ef: HNSW search ef (empty = default)
         entity_extraction_algorithm: Entity extraction algorithm (empty = default)
         relationship_extraction_algorithm: Relationship extraction algorithm (empty = default)
         clustering_algorithm: Clustering algorithm (empty = default)
@@ -465,6 +477,11 @@ def get_workspace_create_input(
                 embedding_algorithm,
                 top_k,
                 rerank_algorithm,
+                quantization,
+                on_disk_vectors,
+                hnsw_m,
+                hnsw_ef_construct,
+                hnsw_ef,
             ]
         )
     elif rag_type == "graph":
@@ -0,0 +1,72 @@
+"""Integration tests for ChatMessageRepository keyset pagination."""
+
+import pytest
+
+from src.domains.workspace.chat.message.repositories import ChatMessageRepository
+from src.domains.workspace.chat.session.repositories import ChatSessionRepository
+from src.infrastructure.sql_database import SqlDatabase
+from src.infrastructure.types import Pagination
+
+
+@pytest.mark.integration
+class TestChatMessageRepositoryIntegration:
+    """Integration tests for chat message history queries."""
+
+    @pytest.fixture(scope="function")
+    def repository(self, db_session: SqlDatabase) -> ChatMessageRepository:
+        """Fixture to create a ChatMessageRepository."""
+        return ChatMessageRepository(db_session)
+
+    @pytest.fixture(scope="function")
+    def session_with_messages(
+        self, db_session: SqlDatabase, repository: ChatMessageRepository, setup_workspace
+    ) -> tuple[int, list[int]]:
+        """Fixture creating a session with five messages; returns (session_id, message_ids)."""
+        session = (
+            ChatSessionRepository(db_session)
+            .create(title="History", workspace_id=setup_workspace.id)
+            .unwrap()
+        )
+        message_ids = [
+            repository.create(session.id, "user", f"message {i}").unwrap().id for i in range(5)
+        ]
+        return session.id, message_ids
+
+    def test_get_recent_returns_last_messages_oldest_first(
+        self, repository: ChatMessageRepository, session_with_messages
+    ):
+        """Test that get_recent returns the last N messages in chronological order."""
+        session_id, message_ids = session_with_messages
+
+        messages = repository.get_recent(session_id, 3)
+
+        assert [m.id for m in messages] == message_ids[-3:]
+
+    def test_get_before_excludes_the_anchor_message(
+        self, repository: ChatMessageRepository, session_with_messages
+    ):
+        """Test that get_before pages back from a message without including it."""
+        session_id, message_ids = session_with_messages
+
+        messages = repository.get_before(session_id, message_ids[3], 2)
+
+        assert [m.id for m in messages] == message_ids[1:3]
+        assert repository.get_before(session_id, message_ids[0], 2) == []
+
+    def test_get_by_session_without_total(
+        self, repository: ChatMessageRepository, session_with_messages
+    ):
+        """Test that skipping the count still reports whether another page exists."""
+        session_id, message_ids = session_with_messages
+
+        first_page = repository.get_by_session(
+            session_id, Pagination.create(skip=0, limit=2).unwrap(), include_total=False
+        )
+        last_page = repository.get_by_session(
+            session_id, Pagination.create(skip=4, limit=2).unwrap(), include_total=False
+        )
+
+        assert [m.id for m in first_page.items] == message_ids[:2]
+        assert first_page.has_next_page is True
+        assert [m.id for m in last_page.items] == message_ids[4:]
+        assert last_page.has_next_page is False
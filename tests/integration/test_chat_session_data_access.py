@@ -3,6 +3,7 @@
 import pytest
 from returns.result import Success
 
+from src.cache_keys import CacheKeys
 from src.domains.workspace.chat.session.data_access import ChatSessionDataAccess
 from src.domains.workspace.chat.session.repositories import ChatSessionRepository
 from src.infrastructure.cache.redis_cache import RedisCache
@@ -54,7 +55,7 @@ class TestChatSessionDataAccessIntegration:
         assert retrieved_session.id == created_session.id
         assert retrieved_session.title == "Test Session"
         assert data_access_with_cache.cache is not None
-        assert data_access_with_cache.cache.exists(f"chat_session:{created_session.id}")
+        assert data_access_with_cache.cache.exists(CacheKeys.chat_session(created_session.id))
 
     def test_get_sessions_by_workspace(
         self, data_access_with_cache: ChatSessionDataAccess, setup_workspace
@@ -102,7 +103,7 @@ class TestChatSessionDataAccessIntegration:
         created_session = create_result.unwrap()
         _ = data_access_with_cache.get_by_id(created_session.id)
         assert data_access_with_cache.cache is not None
-        assert data_access_with_cache.cache.exists(f"chat_session:{created_session.id}")
+        assert data_access_with_cache.cache.exists(CacheKeys.chat_session(created_session.id))
 
         # Act
         deleted = data_access_with_cache.delete(created_session.id)
@@ -110,5 +111,5 @@ class TestChatSessionDataAccessIntegration:
         # Assert
         assert deleted is True
         assert data_access_with_cache.cache is not None
-        assert not data_access_with_cache.cache.exists(f"chat_session:{created_session.id}")
+        assert not data_access_with_cache.cache.exists(CacheKeys.chat_session(created_session.id))
         assert data_access_with_cache.get_by_id(created_session.id) is None
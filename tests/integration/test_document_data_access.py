@@ -3,10 +3,11 @@
 import pytest
 from returns.result import Success
 
+from src.cache_keys import CacheKeys
 from src.domains.workspace.document.data_access import DocumentDataAccess
 from src.domains.workspace.document.repositories import DocumentRepository
 from src.infrastructure.cache.redis_cache import RedisCache
-from src.infrastructure.sql_database import SqlDatabase
+from src.infrastructure.sql_database import DatabaseException, SqlDatabase
 
 
 @pytest.mark.integration
@@ -60,7 +61,7 @@ class TestDocumentDataAccessIntegration:
         assert retrieved_document.id == created_document.id
         assert retrieved_document.filename == "test.txt"
         assert data_access_with_cache.cache is not None
-        assert data_access_with_cache.cache.exists(f"document:{created_document.id}")
+        assert data_access_with_cache.cache.exists(CacheKeys.document(created_document.id))
 
     def test_get_documents_by_workspace(
         self, data_access_with_cache: DocumentDataAccess, setup_workspace
@@ -119,12 +120,46 @@ class TestDocumentDataAccessIntegration:
         )
 
         # Assert
-        assert updated is True
+        assert updated is not None
+        assert updated.chunk_count == 5
+        assert updated.status == "completed"
         retrieved_document = data_access_with_cache.get_by_id(created_document.id)
         assert retrieved_document is not None
         assert retrieved_document.chunk_count == 5
         assert retrieved_document.status == "completed"
 
+    def test_update_error_propagates_inside_transaction(
+        self,
+        data_access_with_cache: DocumentDataAccess,
+        db_session: SqlDatabase,
+        setup_workspace,
+    ):
+        """Test that a failed update aborts a transaction instead of returning None."""
+        # Arrange
+        create_result = data_access_with_cache.create(
+            workspace_id=setup_workspace.id,
+            filename="test.txt",
+            file_path="/path/to/test.txt",
+            file_size=123,
+            mime_type="text/plain",
+            content_hash="abc",
+            chunk_count=1,
+            status="processing",
+        )
+        created_document = create_result.unwrap()
+        repository = data_access_with_cache.repository
+
+        # Act / Assert
+        assert repository.update(created_document.id, chunk_count="not a number") is None
+        with pytest.raises(DatabaseException):
+            with db_session.transaction():
+                repository.update(created_document.id, status="ready")
+                repository.update(created_document.id, chunk_count="not a number")
+
+        retrieved_document = repository.get_by_id(created_document.id)
+        assert retrieved_document is not None
+        assert retrieved_document.status == "processing"
+
     def test_delete_document(self, data_access_with_cache: DocumentDataAccess, setup_workspace):
         """Test deleting a document."""
         # Arrange
@@ -142,7 +177,7 @@ class TestDocumentDataAccessIntegration:
         created_document = create_result.unwrap()
         _ = data_access_with_cache.get_by_id(created_document.id)
         assert data_access_with_cache.cache is not None
-        assert data_access_with_cache.cache.exists(f"document:{created_document.id}")
+        assert data_access_with_cache.cache.exists(CacheKeys.document(created_document.id))
 
         # Act
         deleted = data_access_with_cache.delete(created_document.id)
@@ -150,5 +185,5 @@ class TestDocumentDataAccessIntegration:
         # Assert
         assert deleted is True
         assert data_access_with_cache.cache is not None
-        assert not data_access_with_cache.cache.exists(f"document:{created_document.id}")
+        assert not data_access_with_cache.cache.exists(CacheKeys.document(created_document.id))
         assert data_access_with_cache.get_by_id(created_document.id) is None
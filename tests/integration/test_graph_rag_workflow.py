@@ -66,6 +66,7 @@ class TestGraphRagWorkflowIntegration:
         store.create_index("Entity", ["workspace_id"])
         store.create_index("Entity", ["workspace_id", "type"])
         store.create_index("Community", ["workspace_id", "level"])
+        store.ensure_schema()
 
         yield store
 
@@ -38,6 +38,7 @@ class TestNeo4jGraphStoreIntegration:
         # Ensure initial constraints/indexes for basic ops
         store.create_constraint("Entity", "id")
         store.create_index("Entity", ["workspace_id"])
+        store.ensure_schema()
 
         yield store
 
@@ -225,6 +226,61 @@ class TestNeo4jGraphStoreIntegration:
             linked_entity_ids = {r["e.id"] for r in result}
             assert linked_entity_ids == {"c_e1", "c_e2"}
 
+    def test_clear_communities(self, graph_store: Neo4jGraphStore):
+        """Test deleting the given communities and their memberships, then all of them."""
+        # Arrange
+        entities = [
+            Entity(
+                id=f"cc_e{i}",
+                text=f"Entity {i}",
+                type=EntityType.PERSON,
+                confidence=1.0,
+                metadata={"document_id": "doc1"},
+            )
+            for i in range(3)
+        ]
+        workspace_id = "ws1"
+        graph_store.upsert_entities(entities, workspace_id)
+        graph_store.upsert_communities(
+            [
+                Community(
+                    id="cc_old",
+                    workspace_id=workspace_id,
+                    entity_ids=["cc_e0", "cc_e1"],
+                    level=0,
+                    summary="",
+                    score=0.5,
+                    metadata={},
+                ),
+                Community(
+                    id="cc_kept",
+                    workspace_id=workspace_id,
+                    entity_ids=["cc_e2"],
+                    level=0,
+                    summary="",
+                    score=0.5,
+                    metadata={},
+                ),
+            ],
+            workspace_id,
+        )
+
+        # Act
+        graph_store.clear_communities(workspace_id, ["cc_old"])
+
+        # Assert
+        found = graph_store.get_communities(["cc_e0", "cc_e1", "cc_e2"], workspace_id)
+        assert [c.id for c in found] == ["cc_kept"]
+        with graph_store.driver.session() as session:
+            result = session.run(
+                "MATCH (c:Community {workspace_id: $workspace_id}) RETURN c.id AS id",
+                workspace_id=workspace_id,
+            )
+            assert {r["id"] for r in result} == {"cc_kept"}
+
+        graph_store.clear_communities(workspace_id)
+        assert graph_store.get_communities(["cc_e2"], workspace_id) == []
+
     def test_find_entities(self, graph_store: Neo4jGraphStore):
         """Test finding entities by text query."""
         # Arrange
@@ -326,6 +382,11 @@ class TestNeo4jGraphStoreIntegration:
         assert any(e.id == "es_e1" for e in entities)
         assert any(r.id == "es_rel1" for r in relationships)
 
+        # Only the given entities and the relationships between them
+        entities, relationships = graph_store.export_subgraph(workspace_id, ["es_e1"])
+        assert [e.id for e in entities] == ["es_e1"]
+        assert relationships == []
+
     def test_traverse_graph(self, graph_store: Neo4jGraphStore):
         """Test graph traversal functionality."""
         # Arrange
@@ -476,3 +537,156 @@ class TestNeo4jGraphStoreIntegration:
         # Assert
         assert len(subgraph.entities) == 0
         assert len(subgraph.relationships) == 0
+
+    def test_bulk_upsert_spans_multiple_batches(self, graph_store: Neo4jGraphStore):
+        """Test that upserts larger than batch_size write every row."""
+        # Arrange
+        graph_store.batch_size = 4
+        workspace_id = "ws_bulk"
+        entities = [
+            Entity(
+                id=f"bulk_e{i}",
+                text=f"Bulk {i}",
+                type=EntityType.CONCEPT,
+                confidence=0.5,
+                metadata={"document_id": "doc1"},
+            )
+            for i in range(10)
+        ]
+        relationships = [
+            Relationship(
+                id=f"bulk_rel{i}",
+                source_entity_id=f"bulk_e{i}",
+                target_entity_id=f"bulk_e{i + 1}",
+                relation_type=RelationType.RELATED_TO,
+                confidence=0.5,
+                context="bulk",
+                metadata={},
+            )
+            for i in range(9)
+        ]
+
+        # Act
+        graph_store.upsert_entities(entities, workspace_id)
+        graph_store.upsert_relationships(relationships, workspace_id)
+
+        # Assert
+        exported_entities, exported_relationships = graph_store.export_subgraph(workspace_id)
+        assert len(exported_entities) == 10
+        assert len(exported_relationships) == 9
+
+    def test_upsert_relationships_preserves_relation_types(self, graph_store: Neo4jGraphStore):
+        """Test that mixed relationship types round-trip with or without APOC."""
+        # Arrange
+        workspace_id = "ws_types"
+        entities = [
+            Entity(
+                id=f"rt_e{i}",
+                text=f"Typed {i}",
+                type=EntityType.ORGANIZATION,
+                confidence=1.0,
+                metadata={"document_id": "doc1"},
+            )
+            for i in range(3)
+        ]
+        graph_store.upsert_entities(entities, workspace_id)
+        relationships = [
+            Relationship(
+                id="rt_rel1",
+                source_entity_id="rt_e0",
+                target_entity_id="rt_e1",
+                relation_type=RelationType.PART_OF,
+                confidence=0.9,
+                context="part",
+                metadata={},
+            ),
+            Relationship(
+                id="rt_rel2",
+                source_entity_id="rt_e1",
+                target_entity_id="rt_e2",
+                relation_type=RelationType.LOCATED_IN,
+                confidence=0.8,
+                context="located",
+                metadata={},
+            ),
+        ]
+
+        # Act
+        graph_store.upsert_relationships(relationships, workspace_id)
+        graph_store.upsert_relationships(relationships, workspace_id)
+
+        # Assert
+        _, exported = graph_store.export_subgraph(workspace_id)
+        types_by_id = {r.id: r.relation_type for r in exported}
+        assert types_by_id == {
+            "rt_rel1": RelationType.PART_OF,
+            "rt_rel2": RelationType.LOCATED_IN,
+        }
+
+    def test_ensure_schema_creates_lookup_and_fulltext_indexes(self, graph_store: Neo4jGraphStore):
+        """Test that the store provisions its workspace-scoped and full-text indexes."""
+        # Act - already called by the fixture; calling again must be idempotent
+        graph_store.ensure_schema()
+
+        # Assert
+        with graph_store.driver.session() as session:
+            names = {record["name"] for record in session.run("SHOW INDEXES YIELD name")}
+        assert "entity_workspace_id_id_index" in names
+        assert "community_workspace_id_id_index" in names
+        assert "entity_text_workspace_fulltext" in names
+
+    def test_find_entities_is_scoped_to_workspace(self, graph_store: Neo4jGraphStore):
+        """Test that full-text entity search only returns the requested workspace."""
+        # Arrange
+        graph_store.upsert_entities(
+            [
+                Entity(
+                    id="ft_e1",
+                    text="Acme Corporation",
+                    type=EntityType.ORGANIZATION,
+                    confidence=0.9,
+                    metadata={"document_id": "doc1"},
+                )
+            ],
+            "ws_ft1",
+        )
+        graph_store.upsert_entities(
+            [
+                Entity(
+                    id="ft_e2",
+                    text="Acme Corporation Europe",
+                    type=EntityType.ORGANIZATION,
+                    confidence=0.9,
+                    metadata={"document_id": "doc2"},
+                )
+            ],
+            "ws_ft2",
+        )
+
+        # Act
+        found = graph_store.find_entities("acme corporation", "ws_ft1", limit=10)
+
+        # Assert
+        assert [e.id for e in found] == ["ft_e1"]
+
+    def test_find_entities_matches_partial_words(self, graph_store: Neo4jGraphStore):
+        """Test that a query that is only part of a word still finds the entity."""
+        # Arrange
+        graph_store.upsert_entities(
+            [
+                Entity(
+                    id="pw_e1",
+                    text="Microsoft",
+                    type=EntityType.ORGANIZATION,
+                    confidence=0.9,
+                    metadata={"document_id": "doc1"},
+                )
+            ],
+            "ws_pw",
+        )
+
+        # Act
+        found = graph_store.find_entities("Micro", "ws_pw", limit=5)
+
+        # Assert
+        assert [e.id for e in found] == ["pw_e1"]
@@ -4,11 +4,20 @@ import re
 from collections.abc import Generator
 
 import pytest
+import qdrant_client.http.models as qdrant_models
+from qdrant_client import QdrantClient
 from testcontainers.core.wait_strategies import LogMessageWaitStrategy
 from testcontainers.qdrant import QdrantContainer
 
+from src.infrastructure.rag.workflows.create_resources.vector_rag_create_rag_resources_workflow import (
+    VectorRagCreateRagResourcesWorkflow,
+)
 from src.infrastructure.types.common import MetadataDict
-from src.infrastructure.vector_stores.qdrant_vector_store import QdrantVectorStore
+from src.infrastructure.vector_stores.qdrant_vector_store import (
+    QdrantVectorStore,
+    collection_hnsw_config,
+    collection_quantization_config,
+)
 
 
 @pytest.mark.integration
@@ -77,6 +86,26 @@ class TestQdrantVectorStoreIntegration:
         # Assert
         assert len(results) == 2
 
+    def test_add_parallel_batches(self, qdrant_store: QdrantVectorStore):
+        """Test that parallel, non-waiting batches are all searchable after add returns."""
+        # Arrange
+        qdrant_store.upsert_batch_size = 3
+        qdrant_store.upsert_parallel = 4
+        qdrant_store.upsert_wait = False
+        vectors = [[float(i), 1.0, 0.5, 0.25] for i in range(1, 21)]
+        ids = [f"id_{i}" for i in range(1, 21)]
+        payloads: list[MetadataDict] = [
+            {"text": f"item {i}", "document_id": "doc1"} for i in range(1, 21)
+        ]
+
+        # Act
+        qdrant_store.add(vectors, ids, payloads)
+        results = qdrant_store.search([20.0, 1.0, 0.5, 0.25], top_k=20)
+
+        # Assert
+        assert len(results) == 20
+        assert {chunk.id for chunk, _ in results} == set(ids)
+
     def test_delete_by_filter(self, qdrant_store: QdrantVectorStore):
         """Test deleting vectors based on a metadata filter."""
         # Arrange
@@ -103,6 +132,27 @@ class TestQdrantVectorStoreIntegration:
         assert len(results) == 1
         assert results[0][0].id == "doc_b_chunk_1"
 
+    def test_delete_without_matches(self, qdrant_store: QdrantVectorStore):
+        """Test that deleting with a filter that matches nothing deletes nothing."""
+        # Arrange
+        qdrant_store.add([[0.1, 0.1, 0.1, 0.1]], ["chunk_1"], [{"document_id": "doc_a"}])
+
+        # Act
+        deleted_count = qdrant_store.delete({"document_id": "missing"})
+
+        # Assert
+        assert deleted_count == 0
+        assert len(qdrant_store.search([0.1, 0.1, 0.1, 0.1], top_k=1)) == 1
+
+    def test_payload_indexes_created(self, qdrant_store: QdrantVectorStore):
+        """Test that the filtered payload fields are indexed on collection creation."""
+        # Act
+        schema = qdrant_store._client.get_collection(qdrant_store.collection_name).payload_schema
+
+        # Assert
+        assert "document_id" in schema
+        assert "workspace_id" in schema
+
     def test_clear_collection(self, qdrant_store: QdrantVectorStore):
         """Test clearing the entire collection."""
         # Arrange
@@ -144,3 +194,163 @@ class TestQdrantVectorStoreIntegration:
         assert len(results_filtered) == 2
         assert all(chunk.document_id == "doc_a" for chunk, _ in results_filtered)
         assert len(results_unfiltered) == 3
+
+    def test_scoped_search_skips_scope_filter(self, qdrant_container_instance: QdrantContainer):
+        """Test that a workspace-scoped store answers workspace-filtered searches."""
+        # Arrange
+        host = qdrant_container_instance.get_container_host_ip()
+        port = qdrant_container_instance.get_exposed_port(6333)
+        store = QdrantVectorStore(
+            url=f"http://{host}:{port}",
+            collection_name="workspace_1",
+            vector_size=4,
+            scope={"workspace_id": "1"},
+        )
+        payloads: list[MetadataDict] = [{"text": "scoped", "workspace_id": "1"}]
+        store.add([[0.1, 0.2, 0.3, 0.4]], ["scoped_1"], payloads)
+
+        # Act
+        results = store.search([0.1, 0.2, 0.3, 0.4], top_k=1, filters={"workspace_id": "1"})
+
+        # Assert
+        assert store._without_scope({"workspace_id": "1", "document_id": "d"}) == {
+            "document_id": "d"
+        }
+        assert [chunk.id for chunk, _ in results] == ["scoped_1"]
+
+    def test_shared_collection_tenant_index(self, qdrant_container_instance: QdrantContainer):
+        """Test that a shared collection indexes workspace_id as the tenant key."""
+        # Arrange
+        host = qdrant_container_instance.get_container_host_ip()
+        port = qdrant_container_instance.get_exposed_port(6333)
+        store = QdrantVectorStore(
+            url=f"http://{host}:{port}",
+            collection_name="shared",
+            vector_size=4,
+            tenant_field="workspace_id",
+        )
+        payloads: list[MetadataDict] = [
+            {"text": "first", "workspace_id": "1"},
+            {"text": "second", "workspace_id": "2"},
+        ]
+        store.add([[0.1, 0.2, 0.3, 0.4], [0.1, 0.2, 0.3, 0.4]], ["s_1", "s_2"], payloads)
+
+        # Act
+        collection = store._client.get_collection("shared")
+        results = store.search([0.1, 0.2, 0.3, 0.4], top_k=2, filters={"workspace_id": "2"})
+
+        # Assert
+        assert collection.payload_schema["workspace_id"].params.is_tenant is True
+        assert collection.config.hnsw_config.payload_m == 16
+        assert [chunk.id for chunk, _ in results] == ["s_2"]
+
+    def test_binary_quantized_search_rescores(self, qdrant_container_instance: QdrantContainer):
+        """Test that a binary-quantized collection is searched with rescoring."""
+        # Arrange
+        host = qdrant_container_instance.get_container_host_ip()
+        port = qdrant_container_instance.get_exposed_port(6333)
+        url = f"http://{host}:{port}"
+        client = QdrantClient(url=url)
+        client.create_collection(
+            collection_name="quantized",
+            vectors_config=qdrant_models.VectorParams(
+                size=4, distance=qdrant_models.Distance.COSINE, on_disk=True
+            ),
+            hnsw_config=collection_hnsw_config(m=32, ef_construct=200),
+            quantization_config=collection_quantization_config("binary"),
+        )
+        store = QdrantVectorStore(url=url, collection_name="quantized", vector_size=4)
+        payloads: list[MetadataDict] = [{"text": "near"}, {"text": "far"}]
+        store.add([[0.9, 0.1, 0.0, 0.0], [0.0, 0.0, 0.1, 0.9]], ["near", "far"], payloads)
+
+        # Act
+        results = store.search([1.0, 0.0, 0.0, 0.0], top_k=1, hnsw_ef=64)
+
+        # Assert
+        assert store._quantization_search is not None
+        assert store._quantization_search.rescore is True
+        assert [chunk.id for chunk, _ in results] == ["near"]
+
+    def test_store_creates_collection_with_index_settings(
+        self, qdrant_container_instance: QdrantContainer
+    ):
+        """Test that a store creating a missing collection applies its index settings."""
+        # Arrange
+        host = qdrant_container_instance.get_container_host_ip()
+        port = qdrant_container_instance.get_exposed_port(6333)
+        url = f"http://{host}:{port}"
+
+        # Act
+        store = QdrantVectorStore(
+            url=url,
+            collection_name="created_by_store",
+            vector_size=4,
+            quantization="binary",
+            hnsw_m=32,
+            on_disk_vectors=True,
+        )
+
+        # Assert
+        collection = QdrantClient(url=url).get_collection("created_by_store")
+        assert collection.config.hnsw_config.m == 32
+        assert collection.config.params.vectors.on_disk is True
+        assert isinstance(collection.config.quantization_config, qdrant_models.BinaryQuantization)
+        assert store._quantization_search is not None
+
+    def test_provisioning_updates_existing_collection_index(
+        self, qdrant_container_instance: QdrantContainer
+    ):
+        """Test that provisioning an existing collection applies changed index settings."""
+        # Arrange
+        host = qdrant_container_instance.get_container_host_ip()
+        port = qdrant_container_instance.get_exposed_port(6333)
+        url = f"http://{host}:{port}"
+        VectorRagCreateRagResourcesWorkflow(
+            qdrant_url=url, vector_size=4, collection_name="reconfigured"
+        ).execute("1")
+        workflow = VectorRagCreateRagResourcesWorkflow(
+            qdrant_url=url,
+            vector_size=4,
+            collection_name="reconfigured",
+            quantization="scalar",
+            hnsw_m=32,
+            on_disk_vectors=True,
+        )
+
+        # Act
+        result = workflow.execute("1")
+
+        # Assert
+        assert result.unwrap() is True
+        collection = QdrantClient(url=url).get_collection("reconfigured")
+        assert collection.config.hnsw_config.m == 32
+        assert collection.config.params.vectors.on_disk is True
+        assert isinstance(collection.config.quantization_config, qdrant_models.ScalarQuantization)
+
+    def test_search_returns_selected_payload_fields(
+        self, qdrant_container_instance: QdrantContainer
+    ):
+        """Test that payload_fields limits the payload returned by search."""
+        # Arrange
+        host = qdrant_container_instance.get_container_host_ip()
+        port = qdrant_container_instance.get_exposed_port(6333)
+        store = QdrantVectorStore(
+            url=f"http://{host}:{port}",
+            collection_name="slim",
+            vector_size=4,
+            payload_fields=["source"],
+        )
+        payloads: list[MetadataDict] = [
+            {"document_id": "d1", "text": "long text", "source": "a.txt", "extra": 1}
+        ]
+        store.add([[1.0, 0.0, 0.0, 0.0]], ["c1"], payloads)
+
+        # Act
+        results = store.search([1.0, 0.0, 0.0, 0.0], top_k=1)
+
+        # Assert
+        chunk, _ = results[0]
+        assert chunk.id == "c1"
+        assert chunk.document_id == "d1"
+        assert chunk.text == ""
+        assert chunk.metadata == {"source": "a.txt"}
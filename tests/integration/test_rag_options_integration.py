@@ -20,6 +20,7 @@ def test_get_all_options_returns_success_with_all_options():
     assert response.chunking_algorithms is not None
     assert response.embedding_algorithms is not None
     assert response.rerank_algorithms is not None
+    assert response.quantization_options is not None
     assert response.entity_extraction_algorithms is not None
     assert response.relationship_extraction_algorithms is not None
     assert response.clustering_algorithms is not None
@@ -29,6 +30,7 @@ def test_get_all_options_returns_success_with_all_options():
     assert len(response.chunking_algorithms) > 0
     assert len(response.embedding_algorithms) > 0
     assert len(response.rerank_algorithms) > 0
+    assert len(response.quantization_options) > 0
     assert len(response.entity_extraction_algorithms) > 0
     assert len(response.relationship_extraction_algorithms) > 0
     assert len(response.clustering_algorithms) > 0
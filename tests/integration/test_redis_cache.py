@@ -2,6 +2,7 @@
 
 import pytest
 
+from src.cache_keys import CacheKeys
 from src.infrastructure.cache.redis_cache import RedisCache
 
 
@@ -35,6 +36,40 @@ class TestRedisCacheIntegration:
         # Assert
         assert retrieved_value is None
 
+    def test_set_many_and_get_many(self, cache_instance: RedisCache):
+        """Test that several keys can be written and read in one batch."""
+        # Arrange
+        items = {"batch:1": "one", "batch:2": "two"}
+
+        # Act
+        cache_instance.set_many(items, ttl=60)
+        retrieved = cache_instance.get_many(["batch:1", "batch:missing", "batch:2"])
+
+        # Assert
+        assert retrieved == items
+
+    def test_models_round_trip(self, cache_instance: RedisCache):
+        """Test that dataclass models are stored encoded and read back typed."""
+        from src.domains.workspace.document.models import Document
+
+        # Arrange
+        document = Document(
+            id=1,
+            workspace_id=2,
+            filename="a.txt",
+            file_size=3,
+            mime_type="text/plain",
+            status="ready",
+            chunk_count=4,
+        )
+
+        # Act
+        cache_instance.set("model:document", document)
+
+        # Assert
+        assert cache_instance.get_model("model:document", Document) == document
+        assert cache_instance.delete_many(["model:document", "model:missing"]) == 1
+
     def test_delete(self, cache_instance: RedisCache):
         """Test that we can delete a key from the cache."""
         # Arrange
@@ -60,19 +95,35 @@ class TestRedisCacheIntegration:
         assert cache_instance.exists("nonexistent_key") is False
 
     def test_clear(self, cache_instance: RedisCache):
-        """Test that we can clear the entire cache."""
+        """Test that clear removes every key in the cache namespace and nothing else."""
         # Arrange
-        cache_instance.set("key1", "value1")
-        cache_instance.set("key2", "value2")
-        assert cache_instance.exists("key1") is True
-        assert cache_instance.exists("key2") is True
+        cache_instance.set(CacheKeys.document(1), "value1")
+        cache_instance.set(CacheKeys.chat_session(2), "value2")
+        cache_instance.set("other_app:key", "foreign")
 
         # Act
         cache_instance.clear()
 
         # Assert
-        assert cache_instance.exists("key1") is False
-        assert cache_instance.exists("key2") is False
+        assert cache_instance.exists(CacheKeys.document(1)) is False
+        assert cache_instance.exists(CacheKeys.chat_session(2)) is False
+        assert cache_instance.exists("other_app:key") is True
+        cache_instance.delete("other_app:key")
+
+    def test_generations(self, cache_instance: RedisCache):
+        """Test that a generation counter is stable until bumped."""
+        # Arrange
+        key = CacheKeys.workspace_generation(1)
+
+        # Act
+        first = cache_instance.get_generation(key)
+        again = cache_instance.get_generation(key)
+        bumped = cache_instance.bump_generation(key)
+
+        # Assert
+        assert first == again
+        assert bumped == first + 1
+        assert cache_instance.get_generation(key) == bumped
 
     def test_set_with_ttl(self, cache_instance: RedisCache):
         """Test that a key expires after its TTL."""
@@ -99,6 +150,10 @@ class TestRedisCacheIntegration:
         # Test that all methods handle the unavailable cache gracefully
         assert cache_instance.get("any_key") is None
         assert cache_instance.set("any_key", "any_value") is None
+        assert cache_instance.get_many(["any_key"]) == {}
+        assert cache_instance.set_many({"any_key": "any_value"}) is None
         assert cache_instance.delete("any_key") is False
         assert cache_instance.exists("any_key") is False
+        assert cache_instance.get_generation("any_key") == 0
+        assert cache_instance.bump_generation("any_key") == 0
         assert cache_instance.clear() is None
@@ -0,0 +1,42 @@
+"""Integration tests for the SqlChunkTextStore component."""
+
+import pytest
+
+from src.infrastructure.sql_database import SqlDatabase
+from src.infrastructure.vector_stores import SqlChunkTextStore
+
+
+@pytest.mark.integration
+class TestSqlChunkTextStoreIntegration:
+    """Integration tests for the SqlChunkTextStore component."""
+
+    @pytest.fixture(scope="function")
+    def store(self, db_session: SqlDatabase) -> SqlChunkTextStore:
+        """Fixture to create a SqlChunkTextStore."""
+        return SqlChunkTextStore(db_session)
+
+    def test_put_and_get_many(self, store: SqlChunkTextStore):
+        """Texts written for a document are returned by one bulk lookup."""
+        store.put("1", "d1", {"c1": "first", "c2": "second"})
+
+        assert store.get_many(["c1", "c2", "missing"]) == {"c1": "first", "c2": "second"}
+        assert store.get_many([]) == {}
+
+    def test_put_replaces_existing_text(self, store: SqlChunkTextStore):
+        """Re-indexing a chunk overwrites its text."""
+        store.put("1", "d1", {"c1": "old"})
+        store.put("1", "d1", {"c1": "new"})
+
+        assert store.get_many(["c1"]) == {"c1": "new"}
+
+    def test_delete_document_and_workspace(self, store: SqlChunkTextStore):
+        """Deletes are scoped to the document or workspace."""
+        store.put("1", "d1", {"c1": "a", "c2": "b"})
+        store.put("1", "d2", {"c3": "c"})
+        store.put("2", "d3", {"c4": "d"})
+
+        assert store.delete_document("1", "d1") == 2
+        assert store.get_many(["c1", "c2", "c3", "c4"]) == {"c3": "c", "c4": "d"}
+
+        assert store.delete_workspace("1") == 1
+        assert store.get_many(["c3", "c4"]) == {"c4": "d"}
@@ -11,7 +11,7 @@ class TestSqlDatabaseIntegration:
 
     def test_database_connection_and_health_check(self, db_instance: SqlDatabase):
         """Test that the database connection is established and the health check passes."""
-        assert db_instance.conn is not None
+        assert db_instance.pool is not None
         assert db_instance.health_check() is True
 
     def test_execute_and_fetch_operations(self, db_instance: SqlDatabase):
@@ -72,3 +72,77 @@ class TestSqlDatabaseIntegration:
         # Act & Assert
         results = db_instance.fetch_all("SELECT * FROM empty_table;")
         assert results == []
+
+    def test_concurrent_queries_share_the_pool(self, db_instance: SqlDatabase):
+        """Test that queries from several threads each get their own pooled connection."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Act: more concurrent callers than pooled connections, each holding one briefly
+        with ThreadPoolExecutor(max_workers=db_instance.max_connections * 2) as executor:
+            results = list(
+                executor.map(
+                    lambda i: db_instance.fetch_one("SELECT %s AS n, pg_sleep(0.05)", (i,)),
+                    range(db_instance.max_connections * 2),
+                )
+            )
+
+        # Assert
+        assert [row["n"] for row in results if row] == list(range(db_instance.max_connections * 2))
+        stats = db_instance.get_pool_stats()
+        assert stats["in_use"] == 0
+        assert stats["checkouts"] >= db_instance.max_connections * 2
+        assert stats["wait_time_max"] > 0
+
+    def test_broken_connection_is_replaced(self, db_instance: SqlDatabase):
+        """Test that a connection closed underneath the pool is replaced on checkout."""
+        # Arrange: close every idle pooled connection behind the pool's back
+        for conn in list(db_instance.pool._pool):
+            conn.close()
+
+        # Act & Assert
+        assert db_instance.health_check() is True
+        assert db_instance.get_pool_stats()["reconnects"] >= 1
+
+    def test_every_stale_connection_is_replaced(self, db_instance: SqlDatabase):
+        """Test that checkout keeps discarding stale connections until it finds a healthy one."""
+        # Arrange: leave two idle connections in the pool, then close both
+        with db_instance._connection(), db_instance._connection():
+            pass
+        idle = list(db_instance.pool._pool)
+        assert len(idle) >= 2
+        for conn in idle:
+            conn.close()
+        reconnects = db_instance.get_pool_stats()["reconnects"]
+
+        # Act & Assert
+        assert db_instance.health_check() is True
+        assert db_instance.get_pool_stats()["reconnects"] - reconnects == len(idle)
+
+    def test_transaction_commits_on_success(self, db_instance: SqlDatabase):
+        """Test that writes inside a transaction are visible after the block exits."""
+        db_instance.execute("CREATE TABLE IF NOT EXISTS tx_items (id INT);")
+        db_instance.execute("DELETE FROM tx_items;")
+
+        # Act
+        with db_instance.transaction() as tx:
+            tx.execute("INSERT INTO tx_items (id) VALUES (%s);", (1,))
+            tx.execute("INSERT INTO tx_items (id) VALUES (%s);", (2,))
+            assert tx.fetch_one("SELECT COUNT(*) AS count FROM tx_items;")["count"] == 2
+
+        # Assert
+        assert db_instance.fetch_one("SELECT COUNT(*) AS count FROM tx_items;")["count"] == 2
+        assert db_instance.get_pool_stats()["in_use"] == 0
+
+    def test_transaction_rolls_back_on_error(self, db_instance: SqlDatabase):
+        """Test that an exception inside a transaction discards all of its writes."""
+        db_instance.execute("CREATE TABLE IF NOT EXISTS tx_items (id INT);")
+        db_instance.execute("DELETE FROM tx_items;")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with db_instance.transaction():
+                db_instance.execute("INSERT INTO tx_items (id) VALUES (%s);", (1,))
+                raise RuntimeError("abort")
+
+        # Assert
+        assert db_instance.fetch_one("SELECT COUNT(*) AS count FROM tx_items;")["count"] == 0
@@ -2,6 +2,7 @@
 
 import pytest
 
+from src.cache_keys import CacheKeys
 from src.domains.state.data_access import StateDataAccess
 from src.domains.state.repositories import StateRepository
 from src.infrastructure.cache.redis_cache import RedisCache
@@ -71,7 +72,7 @@ class TestStateDataAccessIntegration:
         assert state is not None
         assert state.current_workspace_id == workspace_id
         assert data_access_with_cache.cache is not None
-        assert data_access_with_cache.cache.exists("cli_state:1")
+        assert data_access_with_cache.cache.exists(CacheKeys.cli_state())
 
     def test_set_and_get_session(
         self,
@@ -90,7 +91,7 @@ class TestStateDataAccessIntegration:
         assert state is not None
         assert state.current_session_id == session_id
         assert data_access_with_cache.cache is not None
-        assert data_access_with_cache.cache.exists("cli_state:1")
+        assert data_access_with_cache.cache.exists(CacheKeys.cli_state())
 
     def test_cache_invalidation_on_set(
         self,
@@ -102,14 +103,14 @@ class TestStateDataAccessIntegration:
         workspace_id = setup_workspace.id
         _ = data_access_with_cache.get()  # Populate cache
         assert data_access_with_cache.cache is not None
-        assert data_access_with_cache.cache.exists("cli_state:1")
+        assert data_access_with_cache.cache.exists(CacheKeys.cli_state())
 
         # Act
         data_access_with_cache.set_current_workspace(workspace_id)
 
         # Assert
         assert data_access_with_cache.cache is not None
-        assert not data_access_with_cache.cache.exists("cli_state:1")
+        assert not data_access_with_cache.cache.exists(CacheKeys.cli_state())
         state = data_access_with_cache.get()
         assert state is not None
         assert state.current_workspace_id == workspace_id
@@ -0,0 +1,92 @@
+"""Unit tests for ChatMessageService query workflow reuse."""
+
+from src.domains.workspace.chat.message import service as service_module
+from src.domains.workspace.chat.message.service import ChatMessageService
+from src.domains.workspace.data_access import WorkspaceDataAccess
+from src.domains.workspace.models import Workspace
+from src.infrastructure.cache.in_memory_cache import InMemoryCache
+from src.infrastructure.types.rag import ChunkData
+
+
+class StaticWorkspaceRepository:
+    """Dummy repository holding a single vector workspace."""
+
+    def get_by_id(self, workspace_id):
+        return Workspace(id=workspace_id, name="ws", rag_type="vector")
+
+
+class CountingProvider:
+    """Dummy config provider counting how often query settings are built."""
+
+    def __init__(self):
+        self.builds = 0
+
+    def build_query_settings(self, workspace_id):
+        self.builds += 1
+        return {"rag_type": "vector", "top_k": 2}
+
+
+class ProviderFactory:
+    def __init__(self, provider):
+        self.provider = provider
+
+    def get_provider(self, rag_type):
+        return self.provider
+
+
+class StaticWorkflow:
+    """Dummy query workflow returning one chunk."""
+
+    def execute(self, query_text, top_k=5, filters=None):
+        return [ChunkData(chunk_id="c1", document_id="d1", text="context", score=1.0, metadata={})]
+
+
+def make_service(monkeypatch, workspace_data_access):
+    provider = CountingProvider()
+    created = []
+
+    def create(rag_config, rag_store_manager):
+        created.append(rag_config)
+        return StaticWorkflow()
+
+    monkeypatch.setattr(service_module.QueryWorkflowFactory, "create", staticmethod(create))
+    service = ChatMessageService(
+        data_access=None,
+        session_data_access=None,
+        workspace_data_access=workspace_data_access,
+        llm_provider=None,
+        config_provider_factory=ProviderFactory(provider),
+        rag_store_manager=None,
+    )
+    return service, provider, created
+
+
+class TestQueryWorkflowReuse:
+    """Unit tests for per-workspace query workflow memoization."""
+
+    def test_workflow_is_reused_until_config_changes(self, monkeypatch):
+        """Settings and workflow are built once, and rebuilt after reconfiguration."""
+        data_access = WorkspaceDataAccess(StaticWorkspaceRepository(), InMemoryCache())
+        service, provider, created = make_service(monkeypatch, data_access)
+
+        first = service._retrieve_rag_context(1, "question")
+        service._retrieve_rag_context(1, "another question")
+        assert provider.builds == 1
+        assert len(created) == 1
+        assert "context" in first
+
+        data_access.invalidate_workspace_scope(1)
+        service._retrieve_rag_context(1, "question")
+
+        assert provider.builds == 2
+        assert len(created) == 2
+
+    def test_workflows_are_not_memoized_without_cache(self, monkeypatch):
+        """Without a cache there is no generation to invalidate against."""
+        data_access = WorkspaceDataAccess(StaticWorkspaceRepository())
+        service, provider, created = make_service(monkeypatch, data_access)
+
+        service._retrieve_rag_context(1, "question")
+        service._retrieve_rag_context(1, "question")
+
+        assert provider.builds == 2
@@ -0,0 +1,116 @@
+"""Unit tests for cache codecs and typed model round-trips."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Optional
+
+import pytest
+
+from src.infrastructure.cache.codecs import JsonCodec, create_codec, model_from_cache
+from src.infrastructure.cache.in_memory_cache import InMemoryCache
+
+
+@dataclass
+class Child:
+    """Nested model."""
+
+    name: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+@dataclass
+class Parent:
+    """Model with nested, optional and list-of-model fields."""
+
+    id: int
+    child: Child
+    backup: Optional[Child] = None
+    children: list[Child] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+
+
+PARENT = Parent(
+    id=1,
+    child=Child("a", datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)),
+    backup=Child("b", datetime(2024, 1, 2)),
+    children=[Child("c"), Child("d")],
+    tags=["x", "y"],
+)
+
+
+class TestJsonCodec:
+    """Unit tests for JsonCodec."""
+
+    def test_round_trips_plain_values_and_datetimes(self):
+        """Plain data and datetimes (naive and aware) decode to equal values."""
+        codec = JsonCodec()
+        value = {"ids": [1, 2], "text": "hi", "at": datetime(2024, 5, 6, tzinfo=UTC)}
+        naive = datetime(2024, 5, 6, 7, 8)
+
+        assert codec.decode(codec.encode(value)) == value
+        assert codec.decode(codec.encode(naive)) == naive
+
+    def test_round_trips_models(self):
+        """Models encode as field dicts and rebuild with model_from_cache."""
+        codec = JsonCodec()
+
+        decoded = codec.decode(codec.encode(PARENT))
+
+        assert isinstance(decoded, dict)
+        assert model_from_cache(Parent, decoded) == PARENT
+
+    def test_invalid_data_raises_value_error(self):
+        """Undecodable bytes raise ValueError."""
+        with pytest.raises(ValueError):
+            JsonCodec().decode(b"not json")
+
+    def test_unknown_codec_raises(self):
+        """create_codec rejects unknown names."""
+        with pytest.raises(ValueError):
+            create_codec("pickle")
+
+
+class TestMsgpackCodec:
+    """Unit tests for MsgpackCodec."""
+
+    def test_round_trips_models(self):
+        """Models and datetimes survive a msgpack round trip."""
+        pytest.importorskip("msgpack")
+        codec = create_codec("msgpack")
+
+        assert model_from_cache(Parent, codec.decode(codec.encode(PARENT))) == PARENT
+
+
+class TestModelFromCache:
+    """Unit tests for model_from_cache and Cache.get_model."""
+
+    def test_ignores_unknown_keys_and_uses_defaults(self):
+        """Extra keys are dropped and missing optional fields take their defaults."""
+        model = model_from_cache(Parent, {"id": 2, "child": {"name": "a"}, "old_field": 1})
+
+        assert model.id == 2
+        assert model.child.name == "a"
+        assert model.children == []
+
+    def test_missing_required_field_raises(self):
+        """A dict without a required field cannot be rebuilt."""
+        with pytest.raises(TypeError):
+            model_from_cache(Parent, {"child": {"name": "a"}})
+
+    def test_get_model_returns_copies_from_object_caches(self):
+        """Mutating a model read from InMemoryCache does not change the cached entry."""
+        cache = InMemoryCache()
+        cache.set("parent", PARENT)
+
+        model = cache.get_model("parent", Parent)
+        model.id = 99
+
+        assert cache.get_model("parent", Parent).id == 1
+
+    def test_get_model_treats_invalid_entries_as_missing(self):
+        """Entries that do not match the model come back as None."""
+        cache = InMemoryCache()
+        cache.set("bad", {"unexpected": True})
+
+        assert cache.get_model("bad", Parent) is None
+        assert cache.get_models(["bad", "missing"], Parent) == {}
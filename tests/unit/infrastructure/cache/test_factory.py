@@ -0,0 +1,39 @@
+"""Unit tests for the cache factory."""
+
+from src.infrastructure.cache.factory import create_cache
+from src.infrastructure.cache.in_memory_cache import InMemoryCache
+from src.infrastructure.cache.redis_cache import RedisCache
+
+
+class TestCreateCache:
+    """Unit tests for create_cache option handling."""
+
+    def test_redis_ignores_in_memory_capacity_options(self):
+        """Capacity options shared by all cache callers don't reach RedisCache."""
+        cache = create_cache(
+            cache_type="redis",
+            host="127.0.0.1",
+            port=1,  # Nothing listens here; RedisCache degrades to a no-op cache
+            default_ttl=60,
+            max_entries=10,
+            max_bytes=1024,
+        )
+
+        assert isinstance(cache, RedisCache)
+
+    def test_memory_ignores_redis_options(self):
+        """Connection options don't reach InMemoryCache; capacity options do."""
+        cache = create_cache(
+            cache_type="memory",
+            host="localhost",
+            port=6379,
+            codec="json",
+            max_entries=2,
+        )
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.set("c", "3")
+
+        assert isinstance(cache, InMemoryCache)
+        assert cache.get("a") is None
+        assert cache.get_stats()["evictions"] == 1
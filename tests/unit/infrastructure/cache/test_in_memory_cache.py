@@ -0,0 +1,109 @@
+"""Unit tests for the bounded InMemoryCache."""
+
+import time
+
+import pytest
+
+from src.infrastructure.cache.in_memory_cache import InMemoryCache
+
+
+class TestInMemoryCache:
+    """Unit tests for InMemoryCache eviction, expiry and stats."""
+
+    def test_evicts_least_recently_used_entry(self):
+        """The entry read least recently is evicted when max_entries is exceeded."""
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_evicts_to_stay_within_max_bytes(self):
+        """Entries are evicted until the approximate size fits max_bytes."""
+        cache = InMemoryCache(max_bytes=1000)
+
+        for i in range(20):
+            cache.set(f"key{i}", "x" * 100)
+
+        stats = cache.get_stats()
+        assert 0 < stats["bytes"] <= 1000
+        assert stats["entries"] < 20
+        assert cache.get("key19") == "x" * 100
+
+    def test_oversized_value_is_not_kept(self):
+        """A value larger than max_bytes is evicted immediately."""
+        cache = InMemoryCache(max_bytes=100)
+
+        cache.set("big", "x" * 1000)
+
+        assert cache.get("big") is None
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_sweep_drops_expired_entries(self):
+        """Expired entries are removed by the sweep without being read."""
+        cache = InMemoryCache(sweep_interval=0)
+        cache.set("short", "1", ttl=1)
+        cache.set("long", "2", ttl=60)
+        cache._cache["short"]["expires_at"] = time.time() - 1
+
+        cache.set("other", "3")
+
+        stats = cache.get_stats()
+        assert "short" not in cache._cache
+        assert stats["expirations"] == 1
+        assert stats["entries"] == 2
+
+    def test_stats_count_hits_and_misses(self):
+        """get and get_many record hits and misses."""
+        cache = InMemoryCache()
+        cache.set_many({"a": "1", "b": "2"})
+
+        cache.get("a")
+        cache.get("missing")
+        assert cache.get_many(["a", "b", "missing"]) == {"a": "1", "b": "2"}
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(0.6)
+
+    def test_overwrite_and_delete_keep_size_accurate(self):
+        """Replacing or deleting entries releases their accounted size."""
+        cache = InMemoryCache()
+        cache.set("a", "x" * 100)
+        cache.set("a", "y")
+
+        assert cache.delete("a") is True
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_rejects_invalid_bounds(self):
+        """Non-positive bounds raise ValueError."""
+        with pytest.raises(ValueError):
+            InMemoryCache(max_entries=0)
+        with pytest.raises(ValueError):
+            InMemoryCache(max_bytes=0)
+
+    def test_generation_is_stable_until_bumped(self):
+        """A generation counter keeps its value until bump_generation advances it."""
+        cache = InMemoryCache()
+
+        first = cache.get_generation("gen")
+        assert cache.get_generation("gen") == first
+        assert cache.bump_generation("gen") == first + 1
+        assert cache.get_generation("gen") == first + 1
+
+    def test_generation_survives_eviction(self):
+        """Generation counters are kept outside the LRU and are never evicted."""
+        cache = InMemoryCache(max_entries=2)
+        generation = cache.bump_generation("gen")
+
+        cache.set_many({"a": "1", "b": "2", "c": "3"})
+
+        assert cache.get_generation("gen") == generation
+        assert cache.get_stats()["entries"] == 2
@@ -0,0 +1,262 @@
+"""Unit tests for LeidenDetector incremental community detection."""
+
+from dataclasses import replace
+from typing import Optional
+
+from src.infrastructure.graph_stores.graph_store import GraphStore
+from src.infrastructure.rag.steps.graph_rag.clustering import refresh_communities
+from src.infrastructure.rag.steps.graph_rag.clustering.leiden_detector import LeidenDetector
+from src.infrastructure.types.graph import (
+    Community,
+    Entity,
+    EntityType,
+    GraphSubgraph,
+    Relationship,
+    RelationType,
+)
+
+
+class DummyGraphStore(GraphStore):
+    """In-memory graph store holding one workspace's entities, edges and communities."""
+
+    def __init__(self, edges: list[tuple[str, str]]):
+        names = sorted({name for edge in edges for name in edge})
+        self.entities = [
+            Entity(id=name, text=name, type=EntityType.CONCEPT, confidence=1.0, metadata={})
+            for name in names
+        ]
+        self.relationships = [
+            Relationship(
+                id=f"{source}-{target}",
+                source_entity_id=source,
+                target_entity_id=target,
+                relation_type=RelationType.RELATED_TO,
+                confidence=1.0,
+                context="",
+                metadata={},
+            )
+            for source, target in edges
+        ]
+        self.communities: list[Community] = []
+        self.community_lookups: list[list[str]] = []
+        self.exports: list[Optional[list[str]]] = []
+        self.cleared: list[Optional[list[str]]] = []
+        self.upserted: list[list[Community]] = []
+
+    def upsert_entities(self, entities: list[Entity], workspace_id: str) -> None:
+        self.entities.extend(entities)
+
+    def upsert_relationships(self, relationships: list[Relationship], workspace_id: str) -> None:
+        self.relationships.extend(relationships)
+
+    def upsert_communities(self, communities: list[Community], workspace_id: str) -> None:
+        self.upserted.append(communities)
+        stored = {c.id: c for c in self.communities}
+        for community in communities:
+            previous = stored.get(community.id)
+            entity_ids = set(previous.entity_ids) if previous else set()
+            stored[community.id] = replace(
+                community, entity_ids=sorted(entity_ids | set(community.entity_ids))
+            )
+        self.communities = list(stored.values())
+
+    def clear_communities(
+        self, workspace_id: str, community_ids: Optional[list[str]] = None
+    ) -> None:
+        self.cleared.append(community_ids)
+        if community_ids is None:
+            self.communities = []
+            return
+        self.communities = [c for c in self.communities if c.id not in community_ids]
+
+    def get_entity_by_id(self, entity_id: str, workspace_id: str) -> Optional[Entity]:
+        return next((e for e in self.entities if e.id == entity_id), None)
+
+    def find_entities(self, query: str, workspace_id: str, limit: int) -> list[Entity]:
+        return []
+
+    def traverse_graph(
+        self, entity_ids: list[str], workspace_id: str, max_depth: int
+    ) -> GraphSubgraph:
+        reached = set(entity_ids)
+        for _ in range(max_depth):
+            reached |= {
+                other
+                for rel in self.relationships
+                for node, other in (
+                    (rel.source_entity_id, rel.target_entity_id),
+                    (rel.target_entity_id, rel.source_entity_id),
+                )
+                if node in reached
+            }
+        entities, relationships = self._subgraph(reached)
+        return GraphSubgraph(
+            entities=entities, relationships=relationships, central_entities=entity_ids
+        )
+
+    def get_communities(self, entity_ids: list[str], workspace_id: str) -> list[Community]:
+        self.community_lookups.append(entity_ids)
+        wanted = set(entity_ids)
+        return [c for c in self.communities if wanted.intersection(c.entity_ids)]
+
+    def delete_document_graph(self, document_id: str, workspace_id: str) -> None:
+        pass
+
+    def delete_workspace_graph(self, workspace_id: str) -> None:
+        pass
+
+    def drop_constraint(self, label: str, property: str) -> None:
+        pass
+
+    def create_constraint(self, label: str, property: str) -> None:
+        pass
+
+    def create_index(self, label: str, properties: list[str]) -> None:
+        pass
+
+    def ensure_schema(self) -> None:
+        pass
+
+    def export_subgraph(
+        self, workspace_id: str, entity_ids: Optional[list[str]] = None
+    ) -> tuple[list[Entity], list[Relationship]]:
+        self.exports.append(entity_ids)
+        if entity_ids is None:
+            return self.entities, self.relationships
+        return self._subgraph(set(entity_ids))
+
+    def _subgraph(self, entity_ids: set[str]) -> tuple[list[Entity], list[Relationship]]:
+        entities = [e for e in self.entities if e.id in entity_ids]
+        relationships = [
+            r
+            for r in self.relationships
+            if r.source_entity_id in entity_ids and r.target_entity_id in entity_ids
+        ]
+        return entities, relationships
+
+    def close(self) -> None:
+        pass
+
+
+def clique(names: list[str]) -> list[tuple[str, str]]:
+    """All edges of a fully connected group."""
+    return [(a, b) for i, a in enumerate(names) for b in names[i + 1 :]]
+
+
+def add_entity(store: DummyGraphStore, name: str, neighbours: list[str]) -> None:
+    """Add an entity connected to existing entities of the store."""
+    new_edges = DummyGraphStore([(name, neighbour) for neighbour in neighbours])
+    store.upsert_entities([e for e in new_edges.entities if e.id == name], "ws1")
+    store.upsert_relationships(new_edges.relationships, "ws1")
+
+
+TWO_CLIQUES = clique(["a1", "a2", "a3", "a4"]) + clique(["b1", "b2", "b3", "b4"]) + [("a1", "b1")]
+
+
+class TestLeidenDetector:
+    """Unit tests for LeidenDetector."""
+
+    def test_full_detection_finds_dense_groups(self):
+        """Without stored communities each dense group becomes a community."""
+        store = DummyGraphStore(TWO_CLIQUES)
+        detector = LeidenDetector(min_community_size=3)
+
+        communities = detector.detect_communities(store, "ws1")
+
+        assert sorted(sorted(c.entity_ids) for c in communities) == [
+            ["a1", "a2", "a3", "a4"],
+            ["b1", "b2", "b3", "b4"],
+        ]
+        assert store.community_lookups == []
+
+    def test_incremental_detection_only_loads_changed_region(self):
+        """New entities join a neighbouring stored community; distant ones aren't loaded."""
+        store = DummyGraphStore(TWO_CLIQUES)
+        detector = LeidenDetector(min_community_size=3)
+        refresh_communities(detector, store, "ws1")
+        add_entity(store, "c1", ["b2", "b3", "b4"])
+        store.exports = []
+
+        communities = detector.detect_communities(store, "ws1", changed_entity_ids=["c1"])
+
+        assert store.community_lookups
+        assert store.exports == [["b1", "b2", "b3", "b4", "c1"]]
+        assert [sorted(c.entity_ids) for c in communities] == [["b1", "b2", "b3", "b4", "c1"]]
+
+    def test_refresh_communities_filters_by_min_size(self):
+        """Only communities meeting the minimum size are stored."""
+        store = DummyGraphStore(TWO_CLIQUES)
+        detector = LeidenDetector(min_community_size=1)
+
+        stored = refresh_communities(detector, store, "ws1", community_min_size=5)
+
+        assert stored == 0
+        assert store.communities == []
+
+    def test_full_refresh_replaces_stored_communities(self):
+        """A full refresh drops communities from the previous partition."""
+        store = DummyGraphStore(TWO_CLIQUES)
+        store.communities = [
+            Community(
+                id="stale",
+                workspace_id="ws1",
+                entity_ids=["a1", "b1"],
+                level=0,
+                summary="",
+                score=1.0,
+                metadata={},
+            )
+        ]
+        detector = LeidenDetector(min_community_size=3)
+
+        refresh_communities(detector, store, "ws1")
+
+        assert "stale" not in {c.id for c in store.communities}
+        assert sorted(sorted(c.entity_ids) for c in store.communities) == [
+            ["a1", "a2", "a3", "a4"],
+            ["b1", "b2", "b3", "b4"],
+        ]
+
+    def test_incremental_refresh_moves_entities_between_communities(self):
+        """An incremental refresh leaves every entity in exactly one community."""
+        store = DummyGraphStore(TWO_CLIQUES)
+        detector = LeidenDetector(min_community_size=3)
+        refresh_communities(detector, store, "ws1")
+        add_entity(store, "c1", ["b2", "b3", "b4"])
+
+        refresh_communities(detector, store, "ws1", changed_entity_ids=["c1"])
+
+        memberships = [e for c in store.communities for e in c.entity_ids]
+        assert sorted(memberships) == sorted(set(memberships))
+        assert sorted(sorted(c.entity_ids) for c in store.communities) == [
+            ["a1", "a2", "a3", "a4"],
+            ["b1", "b2", "b3", "b4", "c1"],
+        ]
+
+    def test_incremental_refresh_rewrites_only_changed_communities(self):
+        """Communities whose members didn't change are neither deleted nor stored again."""
+        store = DummyGraphStore(TWO_CLIQUES)
+        detector = LeidenDetector(min_community_size=3)
+        refresh_communities(detector, store, "ws1")
+        ids = {tuple(sorted(c.entity_ids)): c.id for c in store.communities}
+        add_entity(store, "c1", ["b2", "b3", "b4"])
+        store.cleared, store.upserted = [], []
+
+        stored = refresh_communities(detector, store, "ws1", changed_entity_ids=["c1"])
+
+        assert stored == 1
+        assert store.cleared == [[ids[("b1", "b2", "b3", "b4")]]]
+        assert [sorted(c.entity_ids) for c in store.upserted[0]] == [["b1", "b2", "b3", "b4", "c1"]]
+
+    def test_incremental_refresh_without_changes_writes_nothing(self):
+        """Re-running with an entity whose community is unchanged stores nothing."""
+        store = DummyGraphStore(TWO_CLIQUES)
+        detector = LeidenDetector(min_community_size=3)
+        refresh_communities(detector, store, "ws1")
+        store.cleared, store.upserted = [], []
+
+        stored = refresh_communities(detector, store, "ws1", changed_entity_ids=["a2"])
+
+        assert stored == 0
+        assert store.cleared == []
+        assert store.upserted == []
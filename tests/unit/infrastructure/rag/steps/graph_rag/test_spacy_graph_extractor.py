@@ -0,0 +1,121 @@
+"""Unit tests for SpacyGraphExtractor."""
+
+import pytest
+import spacy
+from spacy.tokens import Doc
+from spacy.vocab import Vocab
+
+from src.infrastructure.rag.steps.graph_rag.entity_extraction.spacy_entity_extractor import (
+    SpacyEntityExtractor,
+)
+from src.infrastructure.rag.steps.graph_rag.relationship_extraction.dependency_parser_extractor import (
+    DependencyParserExtractor,
+)
+from src.infrastructure.rag.steps.graph_rag.spacy_graph_extractor import SpacyGraphExtractor
+from src.infrastructure.rag.steps.graph_rag.spacy_models import clear_spacy_models
+
+# Pre-computed annotations per text: (word, pos, dep, head index, lemma, IOB entity)
+ANNOTATIONS = {
+    "Alice founded Acme.": [
+        ("Alice", "PROPN", "nsubj", 1, "Alice", "B-PERSON"),
+        ("founded", "VERB", "ROOT", 1, "found", "O"),
+        ("Acme", "PROPN", "dobj", 1, "Acme", "B-ORG"),
+        (".", "PUNCT", "punct", 1, ".", "O"),
+    ],
+    "Bob built Widget.": [
+        ("Bob", "PROPN", "nsubj", 1, "Bob", "B-PERSON"),
+        ("built", "VERB", "ROOT", 1, "build", "O"),
+        ("Widget", "PROPN", "dobj", 1, "Widget", "B-PRODUCT"),
+        (".", "PUNCT", "punct", 1, ".", "O"),
+    ],
+    "It rains.": [
+        ("It", "PRON", "nsubj", 1, "it", "O"),
+        ("rains", "VERB", "ROOT", 1, "rain", "O"),
+        (".", "PUNCT", "punct", 1, ".", "O"),
+    ],
+}
+
+TEXTS = list(ANNOTATIONS)
+
+
+class DummyPipeline:
+    """Language stand-in returning pre-annotated Docs and recording pipe calls."""
+
+    meta = {"lang": "en", "name": "core_web_sm"}
+
+    def __init__(self):
+        self.vocab = Vocab()
+        self.pipe_calls: list[tuple[list[str], dict]] = []
+
+    def __call__(self, text: str) -> Doc:
+        return self._annotate(text)
+
+    def pipe(self, texts, **kwargs):
+        texts = list(texts)
+        self.pipe_calls.append((texts, kwargs))
+        return (self._annotate(text) for text in texts)
+
+    def _annotate(self, text: str) -> Doc:
+        words, pos, deps, heads, lemmas, ents = zip(*ANNOTATIONS[text])
+        return Doc(
+            self.vocab,
+            words=list(words),
+            pos=list(pos),
+            deps=list(deps),
+            heads=list(heads),
+            lemmas=list(lemmas),
+            ents=list(ents),
+        )
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Load one DummyPipeline for every model name, with an empty registry."""
+    nlp = DummyPipeline()
+    monkeypatch.setattr(spacy, "load", lambda model_name, exclude: nlp)
+    clear_spacy_models()
+    yield nlp
+    clear_spacy_models()
+
+
+class TestSpacyGraphExtractor:
+    """Unit tests for SpacyGraphExtractor."""
+
+    def test_pipe_receives_all_texts_in_batches(self, pipeline):
+        """All texts go through one nlp.pipe call with the configured batching."""
+        extractor = SpacyGraphExtractor(
+            SpacyEntityExtractor(),
+            DependencyParserExtractor(),
+            n_process=2,
+            batch_size=8,
+        )
+
+        extractor.extract_batch(TEXTS)
+
+        assert pipeline.pipe_calls == [(TEXTS, {"n_process": 2, "batch_size": 8})]
+
+    def test_matches_separate_extractors(self, pipeline):
+        """One shared pass finds the same entities and relationships as two passes."""
+        entity_extractor = SpacyEntityExtractor()
+        relationship_extractor = DependencyParserExtractor()
+        separate_entities = entity_extractor.extract_entities_batch(TEXTS)
+        separate_relationships = relationship_extractor.extract_relationships_batch(
+            TEXTS, separate_entities
+        )
+
+        combined_entities, combined_relationships = SpacyGraphExtractor(
+            entity_extractor, relationship_extractor
+        ).extract_batch(TEXTS)
+
+        assert combined_entities == separate_entities
+        assert combined_relationships == separate_relationships
+        assert [len(relationships) for relationships in combined_relationships] == [1, 1, 0]
+
+    def test_rejects_extractors_with_different_pipelines(self, pipeline, monkeypatch):
+        """Extractors loaded from different pipelines can't share a pass."""
+        entity_extractor = SpacyEntityExtractor()
+        monkeypatch.setattr(spacy, "load", lambda model_name, exclude: DummyPipeline())
+        relationship_extractor = DependencyParserExtractor(model_name="en_core_web_md")
+
+        with pytest.raises(ValueError):
+            SpacyGraphExtractor(entity_extractor, relationship_extractor)
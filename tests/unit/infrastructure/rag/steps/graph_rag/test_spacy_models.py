@@ -0,0 +1,70 @@
+"""Unit tests for the shared spaCy pipeline registry."""
+
+import pytest
+import spacy
+
+from src.infrastructure.rag.steps.graph_rag.spacy_models import (
+    DEFAULT_SPACY_MODEL,
+    clear_spacy_models,
+    get_spacy_model,
+)
+
+
+class DummyPipeline:
+    """Language stand-in recording how it was loaded."""
+
+    def __init__(self, model_name: str, exclude: list[str]):
+        self.model_name = model_name
+        self.exclude = exclude
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace spacy.load with a loader that records each call."""
+    calls: list[tuple[str, list[str]]] = []
+
+    def fake_load(model_name: str, exclude: list[str]) -> DummyPipeline:
+        if model_name == "missing":
+            raise OSError(f"Can't find model '{model_name}'")
+        calls.append((model_name, exclude))
+        return DummyPipeline(model_name, exclude)
+
+    monkeypatch.setattr(spacy, "load", fake_load)
+    clear_spacy_models()
+    yield calls
+    clear_spacy_models()
+
+
+class TestGetSpacyModel:
+    """Unit tests for get_spacy_model."""
+
+    def test_same_name_and_components_load_once(self, loads):
+        """Every caller asking for the same model and components shares one pipeline."""
+        first = get_spacy_model("en_core_web_sm", exclude=["ner", "lemmatizer"])
+        second = get_spacy_model("en_core_web_sm", exclude=["lemmatizer", "ner"])
+
+        assert first is second
+        assert loads == [("en_core_web_sm", ["lemmatizer", "ner"])]
+
+    def test_different_name_or_components_load_separately(self, loads):
+        """A different model name or excluded component set loads a new pipeline."""
+        base = get_spacy_model("en_core_web_sm")
+        other_model = get_spacy_model("en_core_web_md")
+        other_components = get_spacy_model("en_core_web_sm", exclude=["ner"])
+
+        assert other_model is not base
+        assert other_components is not base
+        assert loads == [
+            ("en_core_web_sm", []),
+            ("en_core_web_md", []),
+            ("en_core_web_sm", ["ner"]),
+        ]
+
+    def test_missing_model_falls_back_to_default(self, loads):
+        """A model that isn't installed is replaced by the default, also loaded once."""
+        first = get_spacy_model("missing")
+        second = get_spacy_model("missing")
+
+        assert first is second
+        assert first.model_name == DEFAULT_SPACY_MODEL
+        assert loads == [(DEFAULT_SPACY_MODEL, [])]
@@ -0,0 +1,153 @@
+"""Unit tests for CachedEmbeddingEncoder and embedding cache stores."""
+
+from collections.abc import Iterable
+
+from returns.result import Failure, Result, Success
+
+from src.infrastructure.cache.in_memory_cache import InMemoryCache
+from src.infrastructure.rag.steps.vector_rag.embedding.cached_embedding_encoder import (
+    CachedEmbeddingEncoder,
+)
+from src.infrastructure.rag.steps.vector_rag.embedding.embedding_cache import (
+    KeyValueEmbeddingCacheStore,
+    SqliteEmbeddingCacheStore,
+    embedding_cache_key,
+)
+from src.infrastructure.rag.steps.vector_rag.embedding.vector_embedder import (
+    EmbeddingError,
+    PartialEmbeddings,
+    VectorEmbeddingEncoder,
+)
+
+
+class RecordingEncoder(VectorEmbeddingEncoder):
+    """Dummy encoder that embeds each text as [len(text), 0.5] and records its inputs."""
+
+    def __init__(self, model_name: str = "recording"):
+        self.calls: list[list[str]] = []
+        self._model_name = model_name
+
+    def encode(self, texts: Iterable[str]) -> Result[list[list[float]], EmbeddingError]:
+        texts_list = list(texts)
+        self.calls.append(texts_list)
+        return Success([[float(len(text)), 0.5] for text in texts_list])
+
+    def encode_one(self, text: str) -> Result[list[float], EmbeddingError]:
+        return self.encode([text]).map(lambda embeddings: embeddings[0])
+
+    def get_dimension(self) -> int:
+        return 2
+
+    def get_model_name(self) -> str:
+        return self._model_name
+
+
+class TestCachedEmbeddingEncoder:
+    """Unit tests for CachedEmbeddingEncoder."""
+
+    def test_only_misses_reach_provider(self):
+        """Texts embedded once are served from the cache afterwards."""
+        inner = RecordingEncoder()
+        encoder = CachedEmbeddingEncoder(inner, SqliteEmbeddingCacheStore(":memory:"))
+
+        first = encoder.encode(["alpha", "beta"])
+        second = encoder.encode(["beta", "gamma", "alpha"])
+
+        assert first == Success([[5.0, 0.5], [4.0, 0.5]])
+        assert second == Success([[4.0, 0.5], [5.0, 0.5], [5.0, 0.5]])
+        assert inner.calls == [["alpha", "beta"], ["gamma"]]
+        stats = encoder.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+
+    def test_duplicate_texts_are_embedded_once(self):
+        """Repeated and whitespace-variant texts in one call share one provider call."""
+        inner = RecordingEncoder()
+        encoder = CachedEmbeddingEncoder(inner, KeyValueEmbeddingCacheStore(InMemoryCache()))
+
+        result = encoder.encode(["same text", "same  text\n", "same text"])
+
+        assert isinstance(result, Success)
+        assert len(result.unwrap()) == 3
+        assert inner.calls == [["same text"]]
+
+    def test_cache_is_scoped_by_model(self):
+        """The same text under a different model is not a cache hit."""
+        store = SqliteEmbeddingCacheStore(":memory:")
+        CachedEmbeddingEncoder(RecordingEncoder("model-a"), store).encode(["text"])
+        other = RecordingEncoder("model-b")
+
+        CachedEmbeddingEncoder(other, store).encode(["text"])
+
+        assert other.calls == [["text"]]
+
+    def test_provider_failure_is_returned(self):
+        """Errors from the wrapped encoder are propagated unchanged."""
+
+        class FailingEncoder(RecordingEncoder):
+            def encode(self, texts):
+                return Failure(EmbeddingError("down", code="CONNECTION_ERROR"))
+
+        encoder = CachedEmbeddingEncoder(FailingEncoder(), SqliteEmbeddingCacheStore(":memory:"))
+
+        result = encoder.encode(["text"])
+
+        assert isinstance(result, Failure)
+        assert result.failure().code == "CONNECTION_ERROR"
+
+    def test_partial_failures_are_reported_and_not_cached(self):
+        """Rejected texts are reported at every index they occur and retried next time."""
+
+        class RejectingEncoder(RecordingEncoder):
+            def encode_partial(self, texts):
+                texts_list = list(texts)
+                self.calls.append(texts_list)
+                return Success(
+                    PartialEmbeddings(
+                        embeddings=[
+                            None if text == "bad" else [float(len(text)), 0.5]
+                            for text in texts_list
+                        ],
+                        failures={
+                            index: EmbeddingError("rejected", code="HTTP_ERROR")
+                            for index, text in enumerate(texts_list)
+                            if text == "bad"
+                        },
+                    )
+                )
+
+        inner = RejectingEncoder()
+        encoder = CachedEmbeddingEncoder(inner, SqliteEmbeddingCacheStore(":memory:"))
+
+        result = encoder.encode_partial(["good", "bad", "good", "bad"])
+        encoder.encode_partial(["good", "bad"])
+
+        partial = result.unwrap()
+        assert partial.embeddings == [[4.0, 0.5], None, [4.0, 0.5], None]
+        assert sorted(partial.failures) == [1, 3]
+        assert inner.calls == [["good", "bad"], ["bad"]]
+
+
+class TestSqliteEmbeddingCacheStore:
+    """Unit tests for SqliteEmbeddingCacheStore."""
+
+    def test_evicts_least_recently_used(self):
+        """Entries beyond max_entries are evicted oldest-use first."""
+        store = SqliteEmbeddingCacheStore(":memory:", max_entries=2)
+        store.set_many({"a": [1.0]})
+        store.set_many({"b": [2.0]})
+        store.get_many(["a"])
+
+        store.set_many({"c": [3.0]})
+
+        assert store.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+        assert store.get_stats()["evictions"] == 1
+
+    def test_round_trips_float32_vectors(self):
+        """Stored vectors come back with float32 precision."""
+        store = SqliteEmbeddingCacheStore(":memory:")
+        key = embedding_cache_key("model", "text")
+
+        store.set_many({key: [0.25, -1.5, 3.0]})
+
+        assert store.get_many([key]) == {key: [0.25, -1.5, 3.0]}
@@ -0,0 +1,91 @@
+"""Unit tests for ConcurrentEmbeddingEncoder."""
+
+import threading
+import time
+from collections.abc import Iterable
+
+from returns.result import Failure, Result, Success
+
+from src.infrastructure.rag.steps.vector_rag.embedding.concurrent_embedding_encoder import (
+    ConcurrentEmbeddingEncoder,
+)
+from src.infrastructure.rag.steps.vector_rag.embedding.vector_embedder import (
+    EmbeddingError,
+    VectorEmbeddingEncoder,
+)
+
+
+class SlowCountingEncoder(VectorEmbeddingEncoder):
+    """Dummy encoder that embeds each text as [len(text)] and records concurrency."""
+
+    def __init__(self, delay: float = 0.02, failing_text: str = ""):
+        self.batches: list[list[str]] = []
+        self.max_active = 0
+        self._active = 0
+        self._delay = delay
+        self._failing_text = failing_text
+        self._lock = threading.Lock()
+
+    def encode(self, texts: Iterable[str]) -> Result[list[list[float]], EmbeddingError]:
+        texts_list = list(texts)
+        with self._lock:
+            self.batches.append(texts_list)
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        time.sleep(self._delay)
+        with self._lock:
+            self._active -= 1
+        if self._failing_text in texts_list:
+            return Failure(EmbeddingError("bad text", code="HTTP_ERROR"))
+        return Success([[float(len(text))] for text in texts_list])
+
+    def encode_one(self, text: str) -> Result[list[float], EmbeddingError]:
+        return self.encode([text]).map(lambda embeddings: embeddings[0])
+
+    def get_dimension(self) -> int:
+        return 1
+
+    def get_model_name(self) -> str:
+        return "slow-dummy"
+
+
+class TestConcurrentEmbeddingEncoder:
+    """Unit tests for ConcurrentEmbeddingEncoder."""
+
+    def test_encode_preserves_input_order(self):
+        """Embeddings come back in input order even when batches run in parallel."""
+        inner = SlowCountingEncoder()
+        encoder = ConcurrentEmbeddingEncoder(inner, batch_size=2, max_concurrency=3)
+        texts = ["x" * i for i in range(1, 12)]
+
+        result = encoder.encode(texts)
+
+        assert result == Success([[float(i)] for i in range(1, 12)])
+        assert all(len(batch) <= 2 for batch in inner.batches)
+        assert len(inner.batches) == 6
+
+    def test_encode_bounds_batches_in_flight(self):
+        """No more than max_concurrency batches run at the same time."""
+        inner = SlowCountingEncoder()
+        encoder = ConcurrentEmbeddingEncoder(inner, batch_size=1, max_concurrency=2)
+
+        encoder.encode([str(i) for i in range(10)])
+
+        assert inner.max_active == 2
+
+    def test_encode_returns_first_failure(self):
+        """A failing batch fails the whole call."""
+        inner = SlowCountingEncoder(failing_text="bad")
+        encoder = ConcurrentEmbeddingEncoder(inner, batch_size=1, max_concurrency=2)
+
+        result = encoder.encode(["a", "bad", "c", "d"])
+
+        assert isinstance(result, Failure)
+        assert result.failure().code == "HTTP_ERROR"
+
+    def test_delegates_model_metadata(self):
+        """Dimension and model name come from the wrapped encoder."""
+        encoder = ConcurrentEmbeddingEncoder(SlowCountingEncoder())
+
+        assert encoder.get_dimension() == 1
+        assert encoder.get_model_name() == "slow-dummy"
@@ -0,0 +1,158 @@
+"""Unit tests for OllamaVectorEmbeddingEncoder batching."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from returns.result import Failure, Success
+
+from src.infrastructure.http_session import create_http_session
+from src.infrastructure.rag.steps.vector_rag.embedding.ollama_vector_embedder import (
+    OllamaVectorEmbeddingEncoder,
+)
+
+
+class DummyOllamaServer:
+    """Minimal in-process stand-in for the Ollama /api/embed endpoint.
+
+    Each text is embedded as [len(text), 1.0]. Any request whose input contains
+    a text in ``rejected_texts`` is answered with ``error_status`` and
+    ``error_body``.
+    """
+
+    def __init__(
+        self,
+        rejected_texts: tuple[str, ...] = (),
+        error_status: int = 400,
+        error_body: str = "",
+    ):
+        self.requests: list[list[str]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+                server.requests.append(texts)
+
+                if any(text in rejected_texts for text in texts):
+                    self.send_response(error_status)
+                    self.send_header("Content-Length", str(len(error_body)))
+                    self.end_headers()
+                    self.wfile.write(error_body.encode())
+                    return
+
+                payload = json.dumps({"embeddings": [[float(len(t)), 1.0] for t in texts]})
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(payload.encode())
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> "DummyOllamaServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class TestOllamaVectorEmbeddingEncoder:
+    """Unit tests for OllamaVectorEmbeddingEncoder."""
+
+    def test_encode_sends_one_request_per_batch(self):
+        """Texts are grouped into batch_size requests and returned in input order."""
+        texts = ["a" * i for i in range(1, 8)]
+        with DummyOllamaServer() as server:
+            encoder = OllamaVectorEmbeddingEncoder(
+                model="dummy", base_url=server.url, timeout=5, batch_size=3
+            )
+            result = encoder.encode(texts)
+
+        assert isinstance(result, Success)
+        assert [vector[0] for vector in result.unwrap()] == [float(i) for i in range(1, 8)]
+        assert [len(batch) for batch in server.requests] == [3, 3, 1]
+        assert encoder.get_dimension() == 2
+
+    def test_encode_splits_failing_batch(self):
+        """A rejected batch is split so the remaining texts are still embedded."""
+        texts = ["one", "two", "three", "four"]
+        with DummyOllamaServer(rejected_texts=("three",)) as server:
+            encoder = OllamaVectorEmbeddingEncoder(
+                model="dummy", base_url=server.url, timeout=5, batch_size=4
+            )
+            result = encoder.encode_partial(texts)
+
+        assert isinstance(result, Success)
+        partial = result.unwrap()
+        assert partial.embeddings == [[3.0, 1.0], [3.0, 1.0], None, [4.0, 1.0]]
+        assert list(partial.failures) == [2]
+        assert partial.failures[2].code == "INPUT_REJECTED"
+        assert ["one", "two"] in server.requests
+
+    def test_encode_reports_failing_text_index(self):
+        """encode() stays all-or-nothing and names the rejected text."""
+        texts = ["one", "two", "three", "four"]
+        with DummyOllamaServer(rejected_texts=("three",)) as server:
+            encoder = OllamaVectorEmbeddingEncoder(
+                model="dummy", base_url=server.url, timeout=5, batch_size=4
+            )
+            result = encoder.encode(texts)
+
+        assert isinstance(result, Failure)
+        assert result.failure().code == "INPUT_REJECTED"
+        assert "index 2" in result.failure().message
+
+    def test_encode_splits_on_context_length_error(self):
+        """A 500 naming the context length is a rejected input and is split too."""
+        texts = ["one", "two", "three", "four"]
+        error_body = '{"error":"the input length exceeds the context length"}'
+        with DummyOllamaServer(
+            rejected_texts=("three",), error_status=500, error_body=error_body
+        ) as server:
+            encoder = OllamaVectorEmbeddingEncoder(
+                model="dummy", base_url=server.url, timeout=5, batch_size=4
+            )
+            encoder._session = create_http_session(max_retries=0)
+            result = encoder.encode_partial(texts)
+
+        assert isinstance(result, Success)
+        assert list(result.unwrap().failures) == [2]
+
+    def test_encode_does_not_split_on_server_error(self):
+        """A plain 5xx fails the call without splitting the batch."""
+        texts = ["one", "two", "three", "four"]
+        with DummyOllamaServer(rejected_texts=("three",), error_status=503) as server:
+            encoder = OllamaVectorEmbeddingEncoder(
+                model="dummy", base_url=server.url, timeout=5, batch_size=4
+            )
+            encoder._session = create_http_session(max_retries=0)
+            result = encoder.encode_partial(texts)
+
+        assert isinstance(result, Failure)
+        assert result.failure().code == "HTTP_ERROR"
+        assert server.requests == [texts]
+
+    def test_encode_empty_input_makes_no_requests(self):
+        """Encoding nothing returns an empty list without contacting the server."""
+        with DummyOllamaServer() as server:
+            encoder = OllamaVectorEmbeddingEncoder(model="dummy", base_url=server.url, timeout=5)
+            result = encoder.encode([])
+
+        assert result == Success([])
+        assert server.requests == []
+
+    def test_invalid_batch_size_is_rejected(self):
+        """A non-positive batch size is a configuration error."""
+        with pytest.raises(ValueError):
+            OllamaVectorEmbeddingEncoder(
+                model="dummy", base_url="http://localhost", timeout=5, batch_size=0
+            )
@@ -0,0 +1,77 @@
+"""Unit tests for the shared cross-encoder model registry."""
+
+import pytest
+
+from src.infrastructure.rag.steps.vector_rag.reranking import cross_encoder_models
+from src.infrastructure.rag.steps.vector_rag.reranking.cross_encoder_models import (
+    clear_cross_encoder_models,
+    get_cross_encoder,
+)
+
+
+class DummyTokenizer:
+    """Tokenizer stand-in exposing the model's position limit."""
+
+    model_max_length = 256
+
+
+class DummyCrossEncoder:
+    """CrossEncoder stand-in that records how it was loaded."""
+
+    loads: list[tuple] = []
+
+    def __init__(self, model_name: str, max_length: int = 512, **kwargs):
+        DummyCrossEncoder.loads.append((model_name, max_length, kwargs))
+        self.model_name = model_name
+        self.max_length = max_length
+        self.tokenizer = DummyTokenizer()
+
+
+@pytest.fixture(autouse=True)
+def dummy_cross_encoder(monkeypatch):
+    """Load DummyCrossEncoder instead of a real model, with an empty registry."""
+    monkeypatch.setattr(cross_encoder_models, "CrossEncoder", DummyCrossEncoder)
+    monkeypatch.setattr(cross_encoder_models, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    DummyCrossEncoder.loads = []
+    clear_cross_encoder_models()
+    yield
+    clear_cross_encoder_models()
+
+
+class TestGetCrossEncoder:
+    """Unit tests for get_cross_encoder."""
+
+    def test_same_key_returns_shared_instance(self):
+        """A model is loaded once and shared by every caller with the same settings."""
+        first = get_cross_encoder("model-a", max_length=128)
+        second = get_cross_encoder("model-a", max_length=128)
+
+        assert first is second
+        assert len(DummyCrossEncoder.loads) == 1
+
+    def test_different_key_loads_new_model(self):
+        """A different model name or max_length loads a separate model."""
+        base = get_cross_encoder("model-a", max_length=128)
+        other_model = get_cross_encoder("model-b", max_length=128)
+        other_length = get_cross_encoder("model-a", max_length=64)
+
+        assert other_model is not base
+        assert other_length is not base
+        assert [load[:2] for load in DummyCrossEncoder.loads] == [
+            ("model-a", 128),
+            ("model-b", 128),
+            ("model-a", 64),
+        ]
+
+    def test_max_length_is_capped_at_tokenizer_limit(self):
+        """max_length never exceeds the positions the model was trained with."""
+        model = get_cross_encoder("model-a", max_length=1024)
+
+        assert model.max_length == DummyTokenizer.model_max_length
+
+    def test_unknown_backend_is_rejected(self):
+        """Only the torch and onnx backends are supported."""
+        with pytest.raises(ValueError):
+            get_cross_encoder("model-a", backend="tensorrt")
+
+        assert DummyCrossEncoder.loads == []
@@ -0,0 +1,82 @@
+"""Unit tests for CrossEncoderReranker."""
+
+import pytest
+from returns.result import Success
+
+from src.infrastructure.rag.steps.vector_rag.reranking import (
+    cross_encoder_models,
+    cross_encoder_reranker,
+)
+from src.infrastructure.rag.steps.vector_rag.reranking.cross_encoder_models import (
+    clear_cross_encoder_models,
+)
+from src.infrastructure.rag.steps.vector_rag.reranking.cross_encoder_reranker import (
+    CrossEncoderReranker,
+)
+
+
+class DummyTokenizer:
+    """Tokenizer stand-in with a large position limit."""
+
+    model_max_length = 100_000
+
+
+class DummyCrossEncoder:
+    """CrossEncoder stand-in that scores a pair by passage length."""
+
+    instances: list["DummyCrossEncoder"] = []
+
+    def __init__(self, model_name: str, max_length: int = 512, **kwargs):
+        self.max_length = max_length
+        self.tokenizer = DummyTokenizer()
+        self.predict_calls: list[tuple[list[list[str]], dict]] = []
+        DummyCrossEncoder.instances.append(self)
+
+    def predict(self, pairs: list[list[str]], **kwargs) -> list[float]:
+        self.predict_calls.append((pairs, kwargs))
+        return [float(len(passage)) for _, passage in pairs]
+
+
+@pytest.fixture(autouse=True)
+def dummy_cross_encoder(monkeypatch):
+    """Load DummyCrossEncoder instead of a real model, with an empty registry."""
+    monkeypatch.setattr(cross_encoder_models, "CrossEncoder", DummyCrossEncoder)
+    monkeypatch.setattr(cross_encoder_models, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(cross_encoder_reranker, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    DummyCrossEncoder.instances = []
+    clear_cross_encoder_models()
+    yield
+    clear_cross_encoder_models()
+
+
+class TestCrossEncoderReranker:
+    """Unit tests for CrossEncoderReranker."""
+
+    def test_predict_receives_batch_size_and_clipped_passages(self):
+        """Passages are clipped before scoring and scored in configured batches."""
+        reranker = CrossEncoderReranker(model_name="model-a", batch_size=4, max_length=2)
+        max_chars = 2 * cross_encoder_reranker._CHARS_PER_TOKEN
+
+        result = reranker.rerank("query", ["short", "x" * 100], [0.0, 0.0])
+
+        assert isinstance(result, Success)
+        (pairs, kwargs), *_ = DummyCrossEncoder.instances[0].predict_calls
+        assert pairs == [["query", "short"], ["query", "x" * max_chars]]
+        assert kwargs["batch_size"] == 4
+        assert [text for text, _ in result.unwrap()] == ["x" * 100, "short"]
+
+    def test_rerankers_share_loaded_model(self):
+        """Rerankers with the same settings reuse one loaded model."""
+        CrossEncoderReranker(model_name="model-a").rerank("q", ["a"], [0.0])
+        CrossEncoderReranker(model_name="model-a").rerank("q", ["b"], [0.0])
+
+        assert len(DummyCrossEncoder.instances) == 1
+
+    def test_rerank_empty_input(self):
+        """Nothing to rerank returns an empty result without loading a model."""
+        reranker = CrossEncoderReranker(model_name="model-a")
+
+        result = reranker.rerank("query", [], [])
+
+        assert result == Success([])
+        assert DummyCrossEncoder.instances == []
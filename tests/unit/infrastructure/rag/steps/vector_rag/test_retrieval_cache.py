@@ -0,0 +1,145 @@
+"""Unit tests for the retrieval cache and its use by the vector query workflow."""
+
+from typing import Optional
+
+from returns.result import Success
+
+from src.config import config
+
+from src.infrastructure.cache.in_memory_cache import InMemoryCache
+from src.infrastructure.rag.steps.vector_rag.embedding.dummy_embedding_provider import (
+    DummyEmbeddingProvider,
+)
+from src.infrastructure.rag.steps.vector_rag.reranking.bm25_reranker import BM25Reranker
+from src.infrastructure.rag.steps.vector_rag.reranking.reranker import Reranker
+from src.infrastructure.rag.steps.vector_rag.retrieval_cache import (
+    RetrievalCache,
+    create_retrieval_cache,
+    normalize_query,
+)
+from src.infrastructure.rag.workflows.query.vector_rag_query_workflow import VectorRagQueryWorkflow
+from src.infrastructure.rag.workflows.remove_document.vector_rag_remove_document_workflow import (
+    VectorRagRemoveDocumentWorkflow,
+)
+from src.infrastructure.types.document import Chunk
+from src.infrastructure.vector_stores.vector_store import VectorStore
+
+
+class CountingVectorStore(VectorStore):
+    """Dummy vector store that returns one fixed chunk and counts searches."""
+
+    def __init__(self):
+        self.searches = 0
+
+    def add(self, vectors, ids, payloads):
+        pass
+
+    def search(self, query_embedding, top_k=5, filters=None, hnsw_ef=None):
+        self.searches += 1
+        return [(Chunk(id="c1", document_id="d1", text="chunk text"), 0.9)]
+
+    def delete(self, filters):
+        return 1
+
+    def clear(self):
+        pass
+
+
+def make_workflow(
+    store: VectorStore, cache: RetrievalCache, reranker: Optional[Reranker] = None
+) -> VectorRagQueryWorkflow:
+    return VectorRagQueryWorkflow(
+        embedder=DummyEmbeddingProvider(),
+        vector_store=store,
+        reranker=reranker,
+        retrieval_cache=cache,
+    )
+
+
+class TestRetrievalCache:
+    """Unit tests for RetrievalCache."""
+
+    def test_uses_application_cache(self, monkeypatch):
+        """Results go to the application's cache; a zero TTL disables caching."""
+        cache = InMemoryCache()
+        monkeypatch.setattr(config, "retrieval_cache_ttl", 300)
+        retrieval_cache = create_retrieval_cache(cache)
+        assert retrieval_cache is not None
+
+        retrieval_cache.set("key", [])
+        assert cache.get("key") == []
+        assert create_retrieval_cache(None) is None
+
+        monkeypatch.setattr(config, "retrieval_cache_ttl", 0)
+        assert create_retrieval_cache(cache) is None
+
+    def test_normalize_query(self):
+        """Case and whitespace differences normalize to the same text."""
+        assert normalize_query("  What is   RAG?\n") == normalize_query("what is rag?")
+
+    def test_repeat_query_skips_search(self):
+        """A repeated query in the same workspace is served from the cache."""
+        store = CountingVectorStore()
+        workflow = make_workflow(store, RetrievalCache(InMemoryCache()))
+        filters = {"workspace_id": "1"}
+
+        first = workflow.execute("What is RAG?", top_k=3, filters=filters)
+        second = workflow.execute("what is  rag?", top_k=3, filters=filters)
+
+        assert store.searches == 1
+        assert second == first
+        assert second[0].text == "chunk text"
+
+    def test_key_includes_top_k_and_workspace(self):
+        """Different top_k or workspaces are separate cache entries."""
+        store = CountingVectorStore()
+        workflow = make_workflow(store, RetrievalCache(InMemoryCache()))
+
+        workflow.execute("query", top_k=3, filters={"workspace_id": "1"})
+        workflow.execute("query", top_k=5, filters={"workspace_id": "1"})
+        workflow.execute("query", top_k=3, filters={"workspace_id": "2"})
+
+        assert store.searches == 3
+
+    def test_key_includes_reranker_settings(self):
+        """Rerankers of the same type with different settings don't share entries."""
+        store = CountingVectorStore()
+        retrieval_cache = RetrievalCache(InMemoryCache())
+        filters = {"workspace_id": "1"}
+
+        make_workflow(store, retrieval_cache, BM25Reranker(k1=1.5)).execute(
+            "query", filters=filters
+        )
+        make_workflow(store, retrieval_cache, BM25Reranker(k1=1.5)).execute(
+            "query", filters=filters
+        )
+        make_workflow(store, retrieval_cache, BM25Reranker(k1=2.0)).execute(
+            "query", filters=filters
+        )
+
+        assert store.searches == 2
+
+    def test_unscoped_queries_are_not_cached(self):
+        """Queries without a workspace filter always search."""
+        store = CountingVectorStore()
+        workflow = make_workflow(store, RetrievalCache(InMemoryCache()))
+
+        workflow.execute("query")
+        workflow.execute("query")
+
+        assert store.searches == 2
+
+    def test_document_removal_invalidates_workspace(self):
+        """Removing a document bumps the index generation of its workspace only."""
+        store = CountingVectorStore()
+        retrieval_cache = RetrievalCache(InMemoryCache())
+        workflow = make_workflow(store, retrieval_cache)
+        workflow.execute("query", filters={"workspace_id": "1"})
+        workflow.execute("query", filters={"workspace_id": "2"})
+
+        result = VectorRagRemoveDocumentWorkflow(store, retrieval_cache).execute("d1", "1")
+        workflow.execute("query", filters={"workspace_id": "1"})
+        workflow.execute("query", filters={"workspace_id": "2"})
+
+        assert result == Success(1)
+        assert store.searches == 3
@@ -6,6 +6,7 @@ from src.infrastructure.rag.options import (
     get_default_clustering_algorithm,
     get_default_embedding_algorithm,
     get_default_entity_extraction_algorithm,
+    get_default_quantization,
     get_default_rag_type,
     get_default_relationship_extraction_algorithm,
     get_default_reranking_algorithm,
@@ -13,10 +14,12 @@ from src.infrastructure.rag.options import (
     get_graph_clustering_options,
     get_graph_entity_extraction_options,
     get_graph_relationship_extraction_options,
+    get_quantization_options,
     get_rag_type_options,
     get_reranking_options,
     get_valid_rag_types,
     is_valid_chunking_algorithm,
+    is_valid_quantization,
     is_valid_rag_type,
 )
 
@@ -154,6 +157,21 @@ def test_get_default_reranking_algorithm_returns_expected_default():
     assert default_reranking_algorithm == "none"
 
 
+def test_get_quantization_options_returns_expected_types():
+    options = get_quantization_options()
+
+    assert [opt["value"] for opt in options] == ["none", "scalar", "binary"]
+    for opt in options:
+        assert isinstance(opt["label"], str)
+        assert isinstance(opt["description"], str)
+
+
+def test_get_default_quantization_returns_expected_default():
+    default_quantization = get_default_quantization()
+    assert default_quantization == "none"
+    assert is_valid_quantization(default_quantization)
+
+
 def test_get_default_entity_extraction_algorithm_returns_expected_default():
     default_entity_extraction_algorithm = get_default_entity_extraction_algorithm()
     assert isinstance(default_entity_extraction_algorithm, str)
@@ -0,0 +1,90 @@
+"""Unit tests for shared HTTP sessions."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from src.infrastructure.http_session import create_http_session, get_http_session
+
+
+class FlakyServer:
+    """In-process HTTP server that answers 503 a fixed number of times, then 200."""
+
+    def __init__(self, failures: int):
+        self.attempts = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                server.attempts += 1
+                status = 503 if server.attempts <= failures else 200
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> "FlakyServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class TestHttpSession:
+    """Unit tests for the HTTP session helpers."""
+
+    def test_retries_server_errors(self):
+        """Transient 5xx responses to opted-in POSTs are retried until the server recovers."""
+        session = create_http_session(
+            max_retries=3, backoff_factor=0, backoff_jitter=0, retry_post=True
+        )
+        with FlakyServer(failures=2) as server:
+            response = session.post(f"{server.url}/api/embed", json={}, timeout=(1, 1))
+
+        assert response.status_code == 200
+        assert server.attempts == 3
+
+    def test_returns_last_response_when_retries_exhausted(self):
+        """After the final retry the error response is returned, not raised."""
+        session = create_http_session(
+            max_retries=1, backoff_factor=0, backoff_jitter=0, retry_post=True
+        )
+        with FlakyServer(failures=5) as server:
+            response = session.post(f"{server.url}/api/embed", json={}, timeout=(1, 1))
+
+        assert response.status_code == 503
+        assert server.attempts == 2
+
+    def test_post_not_retried_by_default(self):
+        """POST is only sent once unless the session opts in to retrying it."""
+        session = create_http_session(max_retries=3, backoff_factor=0, backoff_jitter=0)
+        with FlakyServer(failures=2) as server:
+            response = session.post(f"{server.url}/api/generate", json={}, timeout=(1, 1))
+
+        assert response.status_code == 503
+        assert server.attempts == 1
+
+    def test_sessions_are_shared_per_origin(self):
+        """Providers on the same server share one session."""
+        first = get_http_session("http://model-host:11434")
+        second = get_http_session("http://model-host:11434/api/embed")
+        other = get_http_session("http://other-host:11434")
+
+        assert first is second
+        assert first is not other
+
+    def test_retry_post_sessions_are_separate(self):
+        """Opting in to POST retries gives a separate session for the same server."""
+        default = get_http_session("http://model-host:11434")
+        retrying = get_http_session("http://model-host:11434", retry_post=True)
+
+        assert retrying is not default
+        assert retrying is get_http_session("http://model-host:11434/api/embed", retry_post=True)
@@ -0,0 +1,136 @@
+"""Unit tests for keeping chunk text in a chunk text store instead of vector payloads."""
+
+import io
+
+from returns.result import Success
+
+from src.infrastructure.rag.steps.general.chunking.character_document_chunker import (
+    CharacterDocumentChunker,
+)
+from src.infrastructure.rag.steps.general.parsing.factory import ParserFactory
+from src.infrastructure.rag.steps.vector_rag.embedding.dummy_embedding_provider import (
+    DummyEmbeddingProvider,
+)
+from src.infrastructure.rag.workflows.add_document.vector_rag_add_document_workflow import (
+    VectorRagAddDocumentWorkflow,
+)
+from src.infrastructure.rag.workflows.query.vector_rag_query_workflow import VectorRagQueryWorkflow
+from src.infrastructure.rag.workflows.remove_document.vector_rag_remove_document_workflow import (
+    VectorRagRemoveDocumentWorkflow,
+)
+from src.infrastructure.types.document import Chunk
+from src.infrastructure.vector_stores.chunk_text_store import ChunkTextStore
+from src.infrastructure.vector_stores.vector_store import VectorStore
+
+
+class DictChunkTextStore(ChunkTextStore):
+    """Dummy chunk text store backed by a dict that counts lookups."""
+
+    def __init__(self):
+        self.rows: dict[str, tuple[str, str, str]] = {}
+        self.lookups = 0
+
+    def put(self, workspace_id, document_id, texts):
+        for chunk_id, text in texts.items():
+            self.rows[chunk_id] = (workspace_id, document_id, text)
+
+    def get_many(self, chunk_ids):
+        self.lookups += 1
+        return {chunk_id: self.rows[chunk_id][2] for chunk_id in chunk_ids if chunk_id in self.rows}
+
+    def delete_document(self, workspace_id, document_id):
+        doomed = [k for k, v in self.rows.items() if v[:2] == (workspace_id, document_id)]
+        for chunk_id in doomed:
+            del self.rows[chunk_id]
+        return len(doomed)
+
+    def delete_workspace(self, workspace_id):
+        doomed = [k for k, v in self.rows.items() if v[0] == workspace_id]
+        for chunk_id in doomed:
+            del self.rows[chunk_id]
+        return len(doomed)
+
+
+class PayloadVectorStore(VectorStore):
+    """Dummy vector store that keeps payloads and returns them all from search."""
+
+    def __init__(self):
+        self.points: dict[str, dict] = {}
+
+    def add(self, vectors, ids, payloads):
+        self.points.update(zip(ids, payloads))
+
+    def search(self, query_embedding, top_k=5, filters=None, hnsw_ef=None):
+        return [
+            (
+                Chunk(
+                    id=chunk_id, document_id=payload["document_id"], text=payload.get("text", "")
+                ),
+                1.0,
+            )
+            for chunk_id, payload in list(self.points.items())[:top_k]
+        ]
+
+    def delete(self, filters):
+        doomed = [k for k, v in self.points.items() if v["document_id"] == filters["document_id"]]
+        for chunk_id in doomed:
+            del self.points[chunk_id]
+        return len(doomed)
+
+    def clear(self):
+        self.points.clear()
+
+
+def index_document(store: VectorStore, text_store: ChunkTextStore) -> int:
+    workflow = VectorRagAddDocumentWorkflow(
+        parser_factory=ParserFactory(),
+        chunker=CharacterDocumentChunker(chunk_size=20, overlap=0),
+        embedder=DummyEmbeddingProvider(),
+        vector_store=store,
+        chunk_text_store=text_store,
+    )
+    raw = io.BytesIO(b"First chunk of text. Second chunk of text.")
+    return workflow.execute(raw, "d1", "1", {"filename": "doc.txt"}).unwrap()
+
+
+class TestChunkTextStore:
+    """Unit tests for the chunk text store in the vector RAG workflows."""
+
+    def test_indexing_keeps_text_out_of_payloads(self):
+        """Chunk text is written to the text store and not to the vector payloads."""
+        store = PayloadVectorStore()
+        text_store = DictChunkTextStore()
+
+        indexed = index_document(store, text_store)
+
+        assert indexed == len(store.points) == len(text_store.rows)
+        assert all("text" not in payload for payload in store.points.values())
+        assert set(text_store.rows) == set(store.points)
+
+    def test_query_loads_text_in_one_lookup(self):
+        """Retrieved chunks get their text from a single bulk lookup."""
+        store = PayloadVectorStore()
+        text_store = DictChunkTextStore()
+        index_document(store, text_store)
+        workflow = VectorRagQueryWorkflow(
+            embedder=DummyEmbeddingProvider(), vector_store=store, chunk_text_store=text_store
+        )
+
+        results = workflow.execute("chunk", top_k=5)
+
+        assert text_store.lookups == 1
+        assert [r.text for r in results] == [text_store.rows[r.chunk_id][2] for r in results]
+        assert all(r.text for r in results)
+
+    def test_document_removal_deletes_text(self):
+        """Removing a document deletes its chunk text as well as its vectors."""
+        store = PayloadVectorStore()
+        text_store = DictChunkTextStore()
+        indexed = index_document(store, text_store)
+
+        result = VectorRagRemoveDocumentWorkflow(store, chunk_text_store=text_store).execute(
+            "d1", "1"
+        )
+
+        assert result == Success(indexed)
+        assert text_store.rows == {}